@@ -109,13 +109,18 @@ def create_app() -> FastAPI:
     
     logger.info("🛣️ Routers 추가 테스트 시작...")
     try:
+        from fastapi import Depends
         from nadle_backend.routers import auth, posts, comments, users, file_upload, content, health
+        from nadle_backend.dependencies.data_loaders import provide_request_loaders
+        
+        # 요청 범위 배치 로더 (작성자/게시글/반응 조회를 요청 단위로 묶음)
+        request_loaders = [Depends(provide_request_loaders)]
         
         # API 라우터들 추가
         app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
-        app.include_router(posts.router, prefix="/api/posts", tags=["posts"])
-        app.include_router(comments.router, prefix="/api/posts", tags=["comments"])
-        app.include_router(users.router, prefix="/api/users", tags=["users"])
+        app.include_router(posts.router, prefix="/api/posts", tags=["posts"], dependencies=request_loaders)
+        app.include_router(comments.router, prefix="/api/posts", tags=["comments"], dependencies=request_loaders)
+        app.include_router(users.router, prefix="/api/users", tags=["users"], dependencies=request_loaders)
         app.include_router(file_upload.router, prefix="/api/files", tags=["files"])
         app.include_router(content.router, prefix="/api/content", tags=["content"])
         app.include_router(health.router, tags=["health"])
@@ -138,16 +143,40 @@ def create_app() -> FastAPI:
             logger.info("🚀 App startup - Database 연결 시작...")
             try:
                 from nadle_backend.database.connection import database
-                from nadle_backend.models.core import User, Post, Comment, FileRecord, UserReaction, PostStats, Stats
+                from nadle_backend.models.core import User, Post, Comment, FileRecord, FileBlob, UserReaction, PostStats, Stats
                 
                 await database.connect()
                 logger.info("✅ Database 연결 성공!")
                 
                 # Beanie 모델 초기화
                 await database.init_beanie_models([
-                    User, Post, Comment, FileRecord, UserReaction, PostStats, Stats
+                    User, Post, Comment, FileRecord, FileBlob, UserReaction, PostStats, Stats
                 ])
                 logger.info("✅ Beanie 모델 초기화 성공!")
+
+                # 조회수 write-behind 버퍼 시작
+                from nadle_backend.services.view_count_buffer import view_count_buffer
+                await view_count_buffer.start()
+
+                # 인기 게시글 랭킹 이벤트 반영 시작 (조회/반응/댓글 → HOT/트렌딩/서비스별 보드)
+                from nadle_backend.services.popularity_ranking import popularity_ranking
+                await popularity_ranking.start()
+
+                # Redis 상태 프로브 시작 (캐시 명령마다 PING하지 않도록 상태를 백그라운드에서 추적)
+                from nadle_backend.database.redis_factory import get_redis_manager
+                (await get_redis_manager()).start_health_probe()
+
+                # 2단 캐시 무효화 구독 시작 (Redis 연결 포함)
+                from nadle_backend.database.layered_cache import layered_cache
+                await layered_cache.start()
+
+                # 토큰 폐기 필터 동기화 시작 (폐기되지 않은 토큰은 Redis 조회 없이 확인)
+                from nadle_backend.services.token_blacklist_service import token_blacklist_service
+                await token_blacklist_service.start()
+
+                # 이메일 발송 워커 시작 (SMTP 발송은 요청 처리와 분리)
+                from nadle_backend.services.email_queue import email_queue
+                email_queue.start()
             except Exception as e:
                 logger.error(f"❌ Database 연결 또는 모델 초기화 실패: {e}")
                 # 연결 실패해도 앱은 계속 실행 (디버깅 목적)
@@ -155,6 +184,45 @@ def create_app() -> FastAPI:
         @app.on_event("shutdown")
         async def shutdown_event():
             logger.info("🔌 App shutdown - Database 연결 해제 중...")
+            try:
+                # 연결 해제 전에 남은 조회수 반영
+                from nadle_backend.services.view_count_buffer import view_count_buffer
+                await view_count_buffer.stop()
+            except Exception as e:
+                logger.error(f"❌ 조회수 버퍼 반영 실패: {e}")
+            try:
+                from nadle_backend.services.popularity_ranking import popularity_ranking
+                await popularity_ranking.stop()
+            except Exception as e:
+                logger.error(f"❌ 인기 게시글 랭킹 반영 실패: {e}")
+            try:
+                # 대기 중인 이메일 발송 후 SMTP 연결 종료
+                from nadle_backend.services.email_queue import email_queue
+                await email_queue.stop()
+            except Exception as e:
+                logger.error(f"❌ 이메일 발송 대기열 종료 실패: {e}")
+            try:
+                from nadle_backend.utils import password_pool
+                if password_pool.password_pool is not None:
+                    password_pool.password_pool.shutdown()
+            except Exception as e:
+                logger.error(f"❌ 비밀번호 워커 풀 종료 실패: {e}")
+            try:
+                from nadle_backend.services import image_variants
+                if image_variants.variant_pool is not None:
+                    image_variants.variant_pool.shutdown()
+            except Exception as e:
+                logger.error(f"❌ 이미지 축소본 워커 풀 종료 실패: {e}")
+            try:
+                from nadle_backend.services.token_blacklist_service import token_blacklist_service
+                await token_blacklist_service.stop()
+            except Exception as e:
+                logger.error(f"❌ 토큰 폐기 필터 종료 실패: {e}")
+            try:
+                from nadle_backend.database.layered_cache import layered_cache
+                await layered_cache.disconnect()
+            except Exception as e:
+                logger.error(f"❌ Redis 연결 해제 실패: {e}")
             try:
                 from nadle_backend.database.connection import database
                 await database.disconnect()
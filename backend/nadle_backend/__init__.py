@@ -19,7 +19,7 @@ from .database.manager import IndexManager
 
 # Models
 from .models.core import (
-    User, Post, Comment, PostStats, UserReaction, Stats, FileRecord
+    User, Post, Comment, PostStats, UserReaction, Stats, FileRecord, FileBlob
 )
 
 # Note: Specific classes can be imported individually as needed
@@ -36,7 +36,7 @@ __all__ = [
     "database", "IndexManager",
     
     # Models
-    "User", "Post", "Comment", "PostStats", "UserReaction", "Stats", "FileRecord",
+    "User", "Post", "Comment", "PostStats", "UserReaction", "Stats", "FileRecord", "FileBlob",
     
     # Package info
     "get_package_info",
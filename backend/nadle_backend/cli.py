@@ -94,6 +94,110 @@ def check_health():
     sys.exit(0 if success else 1)
 
 
+def reindex_search(batch_size: int, rebuild: bool):
+    """Backfill post search fields and (re)create the post text index."""
+    import asyncio
+    
+    async def _reindex_search():
+        from .database.connection import database
+        from .database.backfill import backfill_post_search_terms
+        
+        await database.connect()
+        try:
+            result = await backfill_post_search_terms(
+                database.get_database(),
+                batch_size=batch_size,
+                rebuild=rebuild
+            )
+            print(f"✓ Search index backfill: {result['scanned']} scanned, {result['updated']} updated")
+        finally:
+            await database.disconnect()
+    
+    try:
+        asyncio.run(_reindex_search())
+    except Exception as e:
+        print(f"✗ Search index backfill failed: {e}")
+        sys.exit(1)
+
+
+def render_posts(batch_size: int, rebuild: bool):
+    """Render stored posts and persist content_rendered/content_text/word_count."""
+    import asyncio
+    
+    async def _render_posts():
+        from .database.connection import database
+        from .database.backfill import backfill_post_rendering
+        
+        await database.connect()
+        try:
+            result = await backfill_post_rendering(
+                database.get_database(),
+                batch_size=batch_size,
+                rebuild=rebuild
+            )
+            print(f"✓ Render backfill: {result['scanned']} scanned, {result['updated']} updated")
+        finally:
+            await database.disconnect()
+    
+    try:
+        asyncio.run(_render_posts())
+    except Exception as e:
+        print(f"✗ Render backfill failed: {e}")
+        sys.exit(1)
+
+
+def dedup_uploads(batch_size: int):
+    """Move existing uploads into the content-addressed blob store."""
+    import asyncio
+    
+    async def _dedup_uploads():
+        from .database.connection import database
+        from .database.backfill import migrate_uploads_to_blobs
+        
+        await database.connect()
+        try:
+            result = await migrate_uploads_to_blobs(database.get_database(), batch_size=batch_size)
+            print(
+                f"✓ Upload dedup: {result['scanned']} scanned, {result['migrated']} migrated, "
+                f"{result['deduplicated']} duplicates collapsed ({result['bytes_reclaimed']} bytes), "
+                f"{result['missing']} missing"
+            )
+        finally:
+            await database.disconnect()
+    
+    try:
+        asyncio.run(_dedup_uploads())
+    except Exception as e:
+        print(f"✗ Upload dedup failed: {e}")
+        sys.exit(1)
+
+
+def backfill_comment_tree(batch_size: int):
+    """Fill root_id/depth/path for comments written before the tree fields."""
+    import asyncio
+    
+    async def _backfill_comment_tree():
+        from .database.connection import database
+        from .database.backfill import backfill_comment_tree
+        
+        await database.connect()
+        try:
+            return await backfill_comment_tree(database.get_database(), batch_size=batch_size)
+        finally:
+            await database.disconnect()
+    
+    try:
+        result = asyncio.run(_backfill_comment_tree())
+    except Exception as e:
+        print(f"✗ Comment tree backfill failed: {e}")
+        sys.exit(1)
+    
+    print(f"✓ Comment tree backfill: {result['top_level']} top-level, {result['replies']} replies updated")
+    if result['unresolved']:
+        print(f"✗ {result['unresolved']} replies have no resolvable parent")
+        sys.exit(1)
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -130,6 +234,64 @@ def main():
     # Version command
     version_parser = subparsers.add_parser('version', help='Show version information')
     
+    # Search reindex command
+    reindex_parser = subparsers.add_parser(
+        'reindex-search',
+        help='Backfill post search terms and create the post text index'
+    )
+    reindex_parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=500,
+        help='Number of posts per bulk write (default: 500)'
+    )
+    reindex_parser.add_argument(
+        '--rebuild',
+        action='store_true',
+        help='Recompute search terms for all posts, not only missing ones'
+    )
+    
+    # Post render backfill command
+    render_parser = subparsers.add_parser(
+        'render-posts',
+        help='Render existing posts and store content_rendered/content_text/word_count'
+    )
+    render_parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=500,
+        help='Number of posts per bulk write (default: 500)'
+    )
+    render_parser.add_argument(
+        '--rebuild',
+        action='store_true',
+        help='Re-render all posts, not only posts without stored HTML'
+    )
+    
+    # Upload dedup migration command
+    dedup_parser = subparsers.add_parser(
+        'dedup-uploads',
+        help='Rehash existing uploads and collapse duplicates into shared blobs'
+    )
+    dedup_parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=200,
+        help='Number of files per bulk write (default: 200)'
+    )
+    
+    # Comment tree backfill command
+    comment_tree_parser = subparsers.add_parser(
+        'backfill-comment-tree',
+        help='Fill root_id/depth/path for comments written before the tree fields'
+    )
+    comment_tree_parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=500,
+        help='Number of replies per bulk write (default: 500)'
+    )
+    
     args = parser.parse_args()
     
     if args.command == 'start':
@@ -147,6 +309,18 @@ def main():
     elif args.command == 'health':
         check_health()
         
+    elif args.command == 'reindex-search':
+        reindex_search(args.batch_size, args.rebuild)
+        
+    elif args.command == 'render-posts':
+        render_posts(args.batch_size, args.rebuild)
+        
+    elif args.command == 'dedup-uploads':
+        dedup_uploads(args.batch_size)
+        
+    elif args.command == 'backfill-comment-tree':
+        backfill_comment_tree(args.batch_size)
+        
     elif args.command == 'version':
         from . import __version__
         print(f"nadle_backend version {__version__}")
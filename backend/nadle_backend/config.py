@@ -119,6 +119,10 @@ class Settings(BaseSettings):
         default="files",
         description="파일 메타데이터를 저장할 컬렉션 이름"
     )
+    file_blobs_collection: str = Field(
+        default="file_blobs",
+        description="콘텐츠 주소(SHA-256) 기반 공유 파일 blob과 참조 수를 저장할 컬렉션 이름"
+    )
     stats_collection: str = Field(
         default="stats",
         description="애플리케이션 통계를 저장할 컬렉션 이름"
@@ -302,6 +306,36 @@ class Settings(BaseSettings):
         if isinstance(v, str):
             return v.lower() in ('true', '1', 'yes', 'on')
         return bool(v)
+    smtp_timeout: float = Field(
+        default=10.0,
+        gt=0,
+        description="SMTP 연결/명령 제한 시간 (초 단위)"
+    )
+    smtp_idle_timeout: float = Field(
+        default=60.0,
+        gt=0,
+        description="재사용 SMTP 연결을 NOOP으로 확인하기 전 최대 유휴 시간 (초 단위)"
+    )
+    email_queue_workers: int = Field(
+        default=2,
+        ge=1,
+        description="이메일 발송 워커 수 (워커마다 SMTP 연결 하나를 재사용)"
+    )
+    email_queue_max_size: int = Field(
+        default=1000,
+        ge=1,
+        description="발송 대기열 최대 크기 (가득 차면 요청 거절)"
+    )
+    email_max_attempts: int = Field(
+        default=5,
+        ge=1,
+        description="이메일 발송 최대 시도 횟수"
+    )
+    email_retry_backoff: float = Field(
+        default=2.0,
+        gt=0,
+        description="발송 재시도 기본 대기 시간 (초 단위, 시도마다 2배, 최대 60초)"
+    )
     from_email: str = Field(
         default="noreply@example.com",
         description="Email address for sending emails"
@@ -362,17 +396,181 @@ class Settings(BaseSettings):
         default=None,
         description="Upstash Redis REST API 토큰 - staging/production환경용"
     )
-    
+    upstash_auto_batch: bool = Field(
+        default=True,
+        description="같은 이벤트 루프 틱에 발생한 Upstash 명령을 /pipeline 요청 하나로 합쳐 전송"
+    )
+    upstash_pool_size: int = Field(
+        default=20,
+        ge=1,
+        description="Upstash REST API 최대 동시 HTTP 연결 수"
+    )
+    upstash_keepalive_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Upstash REST API keep-alive 연결 유지 시간 (초 단위)"
+    )
+
     # Redis 캐시 설정
     cache_ttl_user: int = Field(
         default=3600,
         gt=0,
         description="사용자 정보 캐시 TTL (초 단위)"
     )
+    cache_ttl_principal: int = Field(
+        default=300,
+        gt=0,
+        description="인증 주체(권한 확인용 사용자 필드) 캐시 TTL (초 단위)"
+    )
     cache_enabled: bool = Field(
         default=True,
         description="Redis 캐시 활성화 여부"
     )
+    redis_breaker_failure_threshold: int = Field(
+        default=3,
+        ge=1,
+        description="Redis 서킷 브레이커를 여는 연속 실패 횟수"
+    )
+    redis_breaker_cooldown: float = Field(
+        default=30.0,
+        gt=0,
+        description="서킷이 열린 뒤 캐시 호출을 건너뛰는 시간 (초 단위)"
+    )
+    redis_health_probe_interval: float = Field(
+        default=10.0,
+        gt=0,
+        description="백그라운드 Redis 상태 프로브 주기 (초 단위)"
+    )
+    local_cache_max_entries: int = Field(
+        default=2000,
+        ge=0,
+        description="프로세스 내 로컬 캐시 최대 항목 수 (0이면 로컬 캐시 비활성화)"
+    )
+    local_cache_ttl: int = Field(
+        default=30,
+        gt=0,
+        description="로컬 캐시 TTL (초 단위) - 무효화 메시지를 받지 못한 경우의 최대 지연"
+    )
+
+    # === 조회수 write-behind 설정 ===
+    view_count_flush_interval: float = Field(
+        default=5.0,
+        gt=0,
+        description="버퍼링된 조회수를 MongoDB에 반영하는 주기 (초 단위)"
+    )
+    view_count_max_pending: int = Field(
+        default=1000,
+        gt=0,
+        description="주기와 관계없이 즉시 반영을 시작하는 버퍼 내 게시글 수"
+    )
+
+    # === 인기 게시글 랭킹 설정 ===
+    popularity_hot_half_life: float = Field(
+        default=6 * 3600,
+        gt=0,
+        description="실시간 HOT 보드 점수 반감기 (초 단위)"
+    )
+    popularity_trending_half_life: float = Field(
+        default=3 * 24 * 3600,
+        gt=0,
+        description="주간 트렌딩/서비스별 보드 점수 반감기 (초 단위)"
+    )
+    popularity_flush_interval: float = Field(
+        default=5.0,
+        gt=0,
+        description="버퍼링된 조회/반응/댓글 가중치를 랭킹 보드에 반영하는 주기 (초 단위)"
+    )
+    popularity_renormalize_interval: float = Field(
+        default=3600.0,
+        gt=0,
+        description="랭킹 점수를 현재 시각 기준으로 다시 맞추고 식은 게시글을 정리하는 주기 (초 단위)"
+    )
+    popularity_prune_score: float = Field(
+        default=0.05,
+        ge=0,
+        description="재정규화 후 이 점수 미만인 게시글은 보드에서 제거"
+    )
+    popularity_detail_ttl: int = Field(
+        default=7 * 24 * 3600,
+        gt=0,
+        description="랭킹 보드 게시글 요약 정보 TTL (초 단위, 이벤트마다 갱신)"
+    )
+
+    # === API 모니터링 설정 ===
+    monitoring_flush_interval: float = Field(
+        default=5.0,
+        gt=0,
+        description="요청 메트릭을 Redis에 기록하는 주기 (초 단위)"
+    )
+
+    # === 비밀번호 해시 워커 풀 설정 ===
+    password_pool_workers: int = Field(
+        default=2,
+        ge=1,
+        description="bcrypt 해시/검증을 실행하는 워커 프로세스 수"
+    )
+    password_pool_max_pending: int = Field(
+        default=32,
+        ge=1,
+        description="실행 중 + 대기 중인 비밀번호 작업 상한 (초과 시 즉시 503)"
+    )
+    password_pool_timeout: float = Field(
+        default=5.0,
+        gt=0,
+        description="비밀번호 작업 대기 제한 시간 (초 단위, 초과 시 503)"
+    )
+
+    # === 콘텐츠 렌더링 설정 ===
+    content_render_cache_max_entries: int = Field(
+        default=256,
+        ge=0,
+        description="렌더링 결과 캐시 최대 항목 수 (콘텐츠 해시 + 타입 기준, 0이면 비활성화)"
+    )
+    content_render_cache_max_length: int = Field(
+        default=1_000_000,
+        gt=0,
+        description="렌더링 결과를 캐시할 원본 콘텐츠 최대 길이 (문자 수)"
+    )
+
+    # === 파일 서빙 설정 ===
+    file_record_cache_max_entries: int = Field(
+        default=2048,
+        ge=0,
+        description="파일 메타데이터(FileRecord) 조회 결과 캐시 최대 항목 수 (워커별, 0이면 비활성화)"
+    )
+    file_record_cache_ttl: int = Field(
+        default=3600,
+        gt=0,
+        description="파일 메타데이터 캐시 TTL (초)"
+    )
+    file_accel_redirect_prefix: str = Field(
+        default="",
+        description="설정 시 파일 본문 전송을 nginx X-Accel-Redirect(sendfile)로 위임할 internal location 경로 (예: /_uploads/)"
+    )
+
+    # === 이미지 파생본 설정 ===
+    image_variant_widths: List[int] = Field(
+        default=[160, 320, 640, 1280],
+        description="업로드 이미지마다 생성하는 축소본 너비 목록 (?w= 요청은 이 중 가장 가까운 큰 너비로 맞춤)"
+    )
+    image_variant_quality: int = Field(
+        default=80,
+        ge=1,
+        le=100,
+        description="WebP/JPEG 축소본 인코딩 품질"
+    )
+    image_variant_workers: int = Field(
+        default=2,
+        ge=1,
+        description="이미지 축소본을 생성하는 워커 프로세스 수"
+    )
+
+    # === 세션 저장소 설정 ===
+    session_touch_interval: int = Field(
+        default=60,
+        ge=0,
+        description="세션 마지막 활동 시간 갱신 최소 간격 (초 단위, 간격 안의 조회는 쓰기 없음)"
+    )
     
     @property
     def use_upstash_redis(self) -> bool:
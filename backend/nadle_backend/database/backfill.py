@@ -0,0 +1,351 @@
+"""Data backfill jobs for existing documents.
+
+Each job is idempotent and resumable: documents that already have the target
+fields are skipped unless a full rebuild is requested, so an interrupted run
+can simply be started again. Jobs are exposed through the ``nadle-backend`` CLI.
+"""
+
+import asyncio
+import logging
+import os
+import re
+from typing import Dict, List, Tuple
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+from ..config import settings
+from ..services.content_service import ContentService
+from ..services.file_storage import BLOB_DIR, generate_blob_path, hash_file, link_into_place
+from ..utils.search_text import extract_search_text, build_search_terms
+from .manager import IndexManager
+
+logger = logging.getLogger(__name__)
+
+# Text index replaced by post_search_terms_idx (only one text index per collection)
+LEGACY_POST_TEXT_INDEX = "post_text_search_idx"
+POST_SEARCH_INDEX = "post_search_terms_idx"
+
+
+async def ensure_post_search_index(db: AsyncIOMotorDatabase) -> None:
+    """
+    Replace the legacy posts text index with the search_terms text index.
+
+    Args:
+        db: MongoDB database instance
+    """
+    collection = db[settings.posts_collection]
+    existing = await collection.index_information()
+
+    if LEGACY_POST_TEXT_INDEX in existing:
+        await collection.drop_index(LEGACY_POST_TEXT_INDEX)
+        logger.info(f"Dropped legacy text index {LEGACY_POST_TEXT_INDEX}")
+
+    if POST_SEARCH_INDEX not in existing:
+        index = next(
+            idx for idx in IndexManager.get_post_indexes()
+            if idx.document["name"] == POST_SEARCH_INDEX
+        )
+        await collection.create_indexes([index])
+        logger.info(f"Created text index {POST_SEARCH_INDEX}")
+
+
+async def backfill_post_search_terms(
+    db: AsyncIOMotorDatabase,
+    batch_size: int = 500,
+    rebuild: bool = False
+) -> Dict[str, int]:
+    """
+    Fill content_text and search_terms for posts, then ensure the text index.
+
+    Args:
+        db: MongoDB database instance
+        batch_size: Number of updates per unordered bulk_write
+        rebuild: Recompute every post instead of only posts missing search_terms
+
+    Returns:
+        Dictionary with scanned and updated document counts
+    """
+    collection = db[settings.posts_collection]
+    query = {} if rebuild else {"search_terms": {"$exists": False}}
+    projection = {"title": 1, "content": 1, "metadata.tags": 1}
+
+    scanned = 0
+    updated = 0
+    operations = []
+
+    async for doc in collection.find(query, projection).sort("_id", 1):
+        scanned += 1
+        content_text = extract_search_text(doc.get("content"))
+        tags = (doc.get("metadata") or {}).get("tags")
+        operations.append(UpdateOne(
+            {"_id": doc["_id"]},
+            {"$set": {
+                "content_text": content_text,
+                "search_terms": build_search_terms(doc.get("title", ""), content_text, tags)
+            }}
+        ))
+
+        if len(operations) >= batch_size:
+            result = await collection.bulk_write(operations, ordered=False)
+            updated += result.modified_count
+            operations = []
+            logger.info(f"Search backfill progress: {scanned} scanned, {updated} updated")
+
+    if operations:
+        result = await collection.bulk_write(operations, ordered=False)
+        updated += result.modified_count
+
+    await ensure_post_search_index(db)
+
+    return {"scanned": scanned, "updated": updated}
+
+
+async def backfill_post_rendering(
+    db: AsyncIOMotorDatabase,
+    batch_size: int = 500,
+    rebuild: bool = False
+) -> Dict[str, int]:
+    """
+    Render stored posts once and persist the render-on-write fields.
+
+    Fills content_type, content_rendered, content_text, word_count and
+    reading_time (and search_terms, which depend on content_text) so read
+    endpoints can serve the stored HTML. Posts are processed in _id order and
+    written per batch, so an interrupted run resumes where it stopped.
+
+    Args:
+        db: MongoDB database instance
+        batch_size: Number of updates per unordered bulk_write
+        rebuild: Re-render every post instead of only posts without content_rendered
+
+    Returns:
+        Dictionary with scanned and updated document counts
+    """
+    collection = db[settings.posts_collection]
+    # Post documents store content_rendered as null until rendered; None matches null and missing
+    query = {} if rebuild else {"content_rendered": None}
+    projection = {"title": 1, "content": 1, "content_type": 1, "metadata.tags": 1}
+    content_service = ContentService()
+
+    scanned = 0
+    updated = 0
+    operations = []
+
+    async for doc in collection.find(query, projection).sort("_id", 1):
+        scanned += 1
+        # Stored "text" is the model default, so only explicit types are kept
+        content_type = doc.get("content_type")
+        if content_type not in ("markdown", "html"):
+            content_type = None
+        rendered = content_service.render_for_storage(doc.get("content") or "", content_type)
+        tags = (doc.get("metadata") or {}).get("tags")
+        operations.append(UpdateOne(
+            {"_id": doc["_id"]},
+            {"$set": {
+                **rendered,
+                "search_terms": build_search_terms(doc.get("title", ""), rendered["content_text"], tags)
+            }}
+        ))
+
+        if len(operations) >= batch_size:
+            result = await collection.bulk_write(operations, ordered=False)
+            updated += result.modified_count
+            operations = []
+            logger.info(f"Render backfill progress: {scanned} scanned, {updated} updated")
+
+    if operations:
+        result = await collection.bulk_write(operations, ordered=False)
+        updated += result.modified_count
+
+    return {"scanned": scanned, "updated": updated}
+
+
+def _remove_file(file_path: str) -> None:
+    try:
+        os.unlink(file_path)
+    except FileNotFoundError:
+        pass
+
+
+async def _migrate_upload_batch(
+    db: AsyncIOMotorDatabase,
+    batch: List[Tuple[dict, str, int]],
+    stats: Dict[str, int]
+) -> None:
+    files = db[settings.files_collection]
+    blobs = db[settings.file_blobs_collection]
+
+    digests = list({sha256 for _, sha256, _ in batch})
+    blob_paths = {
+        blob["sha256"]: blob["file_path"]
+        async for blob in blobs.find({"sha256": {"$in": digests}}, {"sha256": 1, "file_path": 1})
+    }
+
+    references: Dict[str, dict] = {}
+    record_updates = []
+    for doc, sha256, size in batch:
+        blob_path = blob_paths.setdefault(sha256, generate_blob_path(sha256))
+        # Link (not move) so the original stays valid until the record points at the blob
+        if not await asyncio.to_thread(link_into_place, doc["file_path"], blob_path):
+            stats["deduplicated"] += 1
+            stats["bytes_reclaimed"] += size
+
+        reference = references.setdefault(sha256, {
+            "count": 0, "file_path": blob_path, "file_size": size,
+            "content_type": doc.get("content_type", "application/octet-stream")
+        })
+        reference["count"] += 1
+        record_updates.append(UpdateOne(
+            {"_id": doc["_id"]},
+            {"$set": {"file_path": blob_path, "sha256": sha256, "file_size": size}}
+        ))
+
+    # Reference counts first: a crash before the record update can only over-count
+    await blobs.bulk_write([
+        UpdateOne(
+            {"sha256": sha256},
+            {
+                "$inc": {"ref_count": reference["count"]},
+                "$setOnInsert": {
+                    "file_path": reference["file_path"],
+                    "file_size": reference["file_size"],
+                    "content_type": reference["content_type"]
+                }
+            },
+            upsert=True
+        )
+        for sha256, reference in references.items()
+    ], ordered=False)
+    result = await files.bulk_write(record_updates, ordered=False)
+    stats["migrated"] += result.modified_count
+
+    for doc, _, _ in batch:
+        await asyncio.to_thread(_remove_file, doc["file_path"])
+
+
+async def migrate_uploads_to_blobs(
+    db: AsyncIOMotorDatabase,
+    batch_size: int = 200
+) -> Dict[str, int]:
+    """
+    Move existing uploads into the content-addressed blob store.
+
+    Streams over file records whose file_path is outside uploads/blobs/,
+    rehashes each file in fixed-size chunks, links it to its blob path (or
+    finds the blob already there), then per batch increments blob reference
+    counts, repoints the records and removes the old files. Duplicates
+    collapse into one blob. Already migrated records are skipped, so an
+    interrupted run can be started again.
+
+    Args:
+        db: MongoDB database instance
+        batch_size: Number of records per blob/record bulk_write
+
+    Returns:
+        Dictionary with scanned, migrated, deduplicated, missing and
+        bytes_reclaimed counts
+    """
+    collection = db[settings.files_collection]
+    query = {"file_path": {"$not": re.compile(f"^{re.escape(BLOB_DIR + os.sep)}")}}
+    projection = {"file_path": 1, "content_type": 1}
+
+    stats = {"scanned": 0, "migrated": 0, "deduplicated": 0, "missing": 0, "bytes_reclaimed": 0}
+    batch: List[Tuple[dict, str, int]] = []
+
+    async for doc in collection.find(query, projection).sort("_id", 1):
+        stats["scanned"] += 1
+        try:
+            sha256, size = await asyncio.to_thread(hash_file, doc["file_path"])
+        except FileNotFoundError:
+            stats["missing"] += 1
+            logger.warning(f"Upload migration: file missing for record {doc['_id']}: {doc['file_path']}")
+            continue
+        batch.append((doc, sha256, size))
+
+        if len(batch) >= batch_size:
+            await _migrate_upload_batch(db, batch, stats)
+            batch = []
+            logger.info(f"Upload migration progress: {stats}")
+
+    if batch:
+        await _migrate_upload_batch(db, batch, stats)
+
+    return stats
+
+
+async def backfill_comment_tree(
+    db: AsyncIOMotorDatabase,
+    batch_size: int = 500
+) -> Dict[str, int]:
+    """
+    Fill root_id/depth/path for comments written before these fields existed.
+
+    Top-level comments are updated in one statement; replies are resolved
+    level by level from parents that already have tree fields. Safe to
+    re-run: only comments without root_id are touched.
+
+    Args:
+        db: MongoDB database instance
+        batch_size: Number of replies resolved per round trip
+
+    Returns:
+        Dictionary with top_level and replies update counts and the number
+        of replies whose parent chain could not be resolved (unresolved)
+    """
+    collection = db[settings.comments_collection]
+
+    top_level = await collection.update_many(
+        {"parent_comment_id": None, "root_id": None},
+        [{"$set": {"root_id": {"$toString": "$_id"}, "depth": 0, "path": []}}]
+    )
+    stats = {"top_level": top_level.modified_count, "replies": 0, "unresolved": 0}
+
+    skipped: set = set()
+    while True:
+        pending = await collection.find(
+            {"parent_comment_id": {"$ne": None}, "root_id": None, "_id": {"$nin": list(skipped)}},
+            {"parent_comment_id": 1}
+        ).limit(batch_size).to_list(length=batch_size)
+        if not pending:
+            break
+
+        parent_ids = list({
+            ObjectId(doc["parent_comment_id"])
+            for doc in pending if ObjectId.is_valid(doc["parent_comment_id"])
+        })
+        parents = {
+            str(doc["_id"]): doc
+            async for doc in collection.find(
+                {"_id": {"$in": parent_ids}, "root_id": {"$ne": None}},
+                {"root_id": 1, "path": 1}
+            )
+        }
+
+        operations = []
+        for doc in pending:
+            parent = parents.get(doc["parent_comment_id"])
+            if parent is None:
+                # Parent not resolved yet (or missing): retry after other levels
+                skipped.add(doc["_id"])
+                continue
+            path = list(parent.get("path") or []) + [doc["parent_comment_id"]]
+            operations.append(UpdateOne(
+                {"_id": doc["_id"]},
+                {"$set": {"root_id": parent["root_id"], "depth": len(path), "path": path}}
+            ))
+
+        if operations:
+            result = await collection.bulk_write(operations, ordered=False)
+            stats["replies"] += result.modified_count
+            logger.info(f"Comment tree backfill progress: {stats}")
+            # Newly resolved replies may unblock skipped children
+            skipped.clear()
+        elif len(pending) < batch_size:
+            break
+
+    stats["unresolved"] = await collection.count_documents(
+        {"parent_comment_id": {"$ne": None}, "root_id": None}
+    )
+    return stats
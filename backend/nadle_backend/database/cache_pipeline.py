@@ -0,0 +1,88 @@
+"""캐시 파이프라인 - 여러 캐시 명령을 한 번의 왕복으로 실행
+
+사용 예:
+    async with redis_manager.pipeline() as pipe:
+        pipe.get("a")
+        pipe.set("b", {"x": 1}, ttl=60)
+        pipe.delete("c")
+    value_a, set_ok, deleted = pipe.results
+
+블록 안에서는 명령을 큐에 모으기만 하고, 블록을 빠져나갈 때 백엔드별 실행기
+(redis-py 파이프라인, Upstash /pipeline)가 한 번에 전송합니다. 결과는 단일 키
+메서드(get/set/delete/exists)와 같은 형태로 변환됩니다.
+"""
+
+import json
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+# (명령 이름, 인자) - 명령 이름: "get", "set", "delete", "exists"
+CacheOp = Tuple[str, tuple]
+
+
+def encode_value(value: Any) -> Any:
+    """dict/list는 JSON 문자열로 직렬화"""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return value
+
+
+def decode_value(value: Any) -> Any:
+    """JSON 문자열이면 파싱, 아니면 그대로 반환"""
+    if value is None:
+        return None
+    try:
+        return json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return value
+
+
+def failure_value(name: str) -> Any:
+    """명령이 실패했을 때의 결과 (단일 키 메서드의 실패 반환값과 동일)"""
+    return None if name == "get" else False
+
+
+def convert_result(name: str, result: Any) -> Any:
+    """백엔드 원시 결과를 단일 키 메서드 반환 형태로 변환"""
+    if name == "get":
+        return decode_value(result)
+    if name in ("delete", "exists"):
+        return (result or 0) > 0
+    return bool(result)
+
+
+class CachePipeline:
+    """명령을 모았다가 블록 종료 시 한 번에 실행하는 비동기 컨텍스트 매니저"""
+
+    def __init__(self, executor: Callable[[List[CacheOp]], Awaitable[List[Any]]]):
+        self._executor = executor
+        self.ops: List[CacheOp] = []
+        self.results: Optional[List[Any]] = None
+
+    def get(self, key: str) -> "CachePipeline":
+        self.ops.append(("get", (key,)))
+        return self
+
+    def set(self, key: str, value: Any, ttl: int = 3600) -> "CachePipeline":
+        self.ops.append(("set", (key, value, ttl)))
+        return self
+
+    def delete(self, key: str) -> "CachePipeline":
+        self.ops.append(("delete", (key,)))
+        return self
+
+    def exists(self, key: str) -> "CachePipeline":
+        self.ops.append(("exists", (key,)))
+        return self
+
+    async def execute(self) -> List[Any]:
+        """큐에 모은 명령 실행 - 명령별 결과 목록 반환"""
+        ops, self.ops = self.ops, []
+        self.results = await self._executor(ops) if ops else []
+        return self.results
+
+    async def __aenter__(self) -> "CachePipeline":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            await self.execute()
@@ -0,0 +1,114 @@
+"""캐시 태그 - 태그 하나로 의존하는 캐시 항목을 한 번에 무효화
+
+캐시 항목을 저장할 때 태그(post:{id}, reactions:{id}, author:{id}, user:{id})별 Redis Set에 키를 등록해 두고,
+무효화는 Lua 스크립트 한 번으로 태그 Set의 멤버와 Set 자체를 삭제합니다.
+
+- KEYS/SCAN 없이 O(멤버 수)로 무효화
+- 태그 Set TTL은 등록된 항목 중 가장 긴 TTL까지 연장 (만료된 항목의 키는 Set과 함께 정리)
+- 태그 등록은 값 저장 뒤의 별도 왕복 - 등록에 실패한 항목은 자기 TTL로 만료
+- 로컬 캐시 무효화/전파는 LayeredCacheManager.invalidate_tags 참고
+- 무효화 스크립트는 태그 Set 멤버(KEYS로 선언하지 않은 키)를 삭제하므로 단일 노드 Redis와
+  Upstash 전제 (Redis Cluster에서는 키 슬롯이 달라 실패)
+"""
+
+from typing import Dict, Iterable, List
+
+from .redis_factory import RedisManagerProtocol, get_prefixed_key
+
+TAG_KEY_PREFIX = "cache_tag:"
+
+# 태그 Set에 키 등록 후 TTL 연장
+# KEYS: 태그 Set 키 / ARGV[1]: TTL, 이후 태그마다 멤버 수와 멤버 키
+TAG_KEYS_SCRIPT = """
+local ttl = tonumber(ARGV[1])
+local index = 2
+for i = 1, #KEYS do
+  local count = tonumber(ARGV[index])
+  for j = index + 1, index + count do
+    redis.call('SADD', KEYS[i], ARGV[j])
+  end
+  index = index + count + 1
+  if redis.call('TTL', KEYS[i]) < ttl then
+    redis.call('EXPIRE', KEYS[i], ttl)
+  end
+end
+return #KEYS
+"""
+
+# 태그 Set의 멤버 키와 Set 삭제 - 삭제 대상 키 목록 반환 (로컬 캐시 무효화용)
+# KEYS: 태그 Set 키 (멤버 키는 Set에서 읽는 미선언 키 - 단일 노드 Redis/Upstash 전용)
+INVALIDATE_TAGS_SCRIPT = """
+local dropped = {}
+for i = 1, #KEYS do
+  local members = redis.call('SMEMBERS', KEYS[i])
+  for j = 1, #members, 500 do
+    redis.call('DEL', unpack(members, j, math.min(j + 499, #members)))
+  end
+  for _, member in ipairs(members) do
+    dropped[#dropped + 1] = member
+  end
+  redis.call('DEL', KEYS[i])
+end
+return dropped
+"""
+
+
+def post_tag(post_id: str) -> str:
+    """게시글에 의존하는 항목 (상세, 댓글 배치)"""
+    return f"post:{post_id}"
+
+
+def post_reactions_tag(post_id: str) -> str:
+    """게시글에 대한 사용자별 반응 항목 - 게시글 삭제 시에만 무효화 (반응 변경은 해당 사용자 키만 삭제)"""
+    return f"reactions:{post_id}"
+
+
+def view_count_tag(post_id: str) -> str:
+    """게시글의 저장된 조회수를 담은 항목 (상세) - 조회수 버퍼 반영 시 무효화"""
+    return f"views:{post_id}"
+
+
+def author_tag(author_id: str) -> str:
+    """작성자 프로필에 의존하는 항목 (작성자 정보, 작성자 정보가 포함된 댓글 배치)"""
+    return f"author:{author_id}"
+
+
+def user_tag(user_id: str) -> str:
+    """사용자별 항목 (사용자 반응)"""
+    return f"user:{user_id}"
+
+
+def tag_key(tag: str) -> str:
+    """태그 Set 키 (환경별 프리픽스 적용)"""
+    return get_prefixed_key(f"{TAG_KEY_PREFIX}{tag}")
+
+
+async def tag_keys(manager: RedisManagerProtocol, keys_by_tag: Dict[str, Iterable[str]], ttl: int) -> bool:
+    """캐시 키를 태그에 등록 (Lua 스크립트 한 번)
+
+    Args:
+        manager: Redis 매니저
+        keys_by_tag: {태그: 캐시 키 목록}
+        ttl: 등록한 항목의 TTL (태그 Set은 이 시간 이상 유지)
+    """
+    tag_set_keys: List[str] = []
+    args: List = [ttl]
+    for tag, keys in keys_by_tag.items():
+        keys = list(dict.fromkeys(keys))
+        if keys:
+            tag_set_keys.append(tag_key(tag))
+            args.extend([len(keys), *keys])
+    if not tag_set_keys:
+        return True
+
+    return await manager.eval_script(TAG_KEYS_SCRIPT, tag_set_keys, args) is not None
+
+
+async def invalidate_tags(manager: RedisManagerProtocol, tags: Iterable[str]) -> List[str]:
+    """태그에 등록된 캐시 항목과 태그 Set 삭제 (Lua 스크립트 한 번) - 삭제 대상 키 반환"""
+    tag_set_keys = [tag_key(tag) for tag in dict.fromkeys(tags)]
+    if not tag_set_keys:
+        return []
+
+    dropped = await manager.eval_script(INVALIDATE_TAGS_SCRIPT, tag_set_keys, [])
+    return [key.decode() if isinstance(key, bytes) else key for key in dropped or []]
@@ -0,0 +1,393 @@
+"""2단 캐시 - 프로세스 내 LRU/TTL 캐시 + Redis
+
+RedisManagerProtocol과 같은 인터페이스로 Redis(또는 Upstash) 앞에 워커별 로컬 캐시를 둡니다.
+
+- 로컬 캐시 적중 시 네트워크 왕복 없이 반환 (값은 읽기 전용으로 취급)
+- 같은 키의 동시 캐시 미스는 single_flight()로 한 번의 로드로 합침
+- delete()는 Redis pub/sub으로 다른 워커의 로컬 캐시도 무효화
+- 구독을 지원하지 않는 클라이언트(Upstash REST)는 local_cache_ttl이 최대 지연을 보장
+- Redis에 연결되지 않은 상태에서는 로컬 캐시를 채우지 않음 (무효화 경로가 없으므로)
+- mget/mset_with_ttl/delete_many/pipeline은 로컬 미스분만 Redis 왕복 한 번으로 처리
+- set/mset_with_ttl에 태그를 주면 invalidate_tags()로 태그에 의존하는 항목을 한 번에 무효화
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..config import get_settings
+from . import cache_tags, redis_factory
+from .cache_pipeline import CacheOp, CachePipeline
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+
+class LocalCache:
+    """크기 제한이 있는 LRU + TTL 캐시"""
+
+    def __init__(self, max_entries: int, ttl: int):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """(적중 여부, 값) 반환 - 만료된 항목은 제거"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+
+        self._entries.move_to_end(key)
+        return True, value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        if self.max_entries <= 0:
+            return
+
+        ttl = min(ttl, self.ttl) if ttl else self.ttl
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _normalize(value: Any) -> Any:
+    """Redis 왕복과 같은 형태로 변환 (datetime 등은 문자열) - 계층에 따라 값이 달라지지 않도록"""
+    if isinstance(value, (dict, list)):
+        return json.loads(json.dumps(value, default=str))
+    return value
+
+
+class LayeredCacheManager:
+    """로컬 LRU/TTL 캐시 + Redis 2단 캐시 매니저"""
+
+    def __init__(self, max_entries: Optional[int] = None, local_ttl: Optional[int] = None):
+        settings = get_settings()
+        self.local = LocalCache(
+            settings.local_cache_max_entries if max_entries is None else max_entries,
+            local_ttl or settings.local_cache_ttl
+        )
+        self.instance_id = uuid.uuid4().hex
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._generation = 0
+        self._listener: Optional[asyncio.Task] = None
+        self._stats = {
+            "local_hits": 0,
+            "local_misses": 0,
+            "remote_hits": 0,
+            "remote_misses": 0,
+            "coalesced": 0,
+            "invalidations_sent": 0,
+            "invalidations_received": 0
+        }
+
+    @property
+    def channel(self) -> str:
+        return redis_factory.get_prefixed_key(INVALIDATION_CHANNEL)
+
+    async def _remote(self) -> redis_factory.RedisManagerProtocol:
+        return await redis_factory.get_redis_manager()
+
+    # === RedisManagerProtocol ===
+
+    async def connect(self) -> bool:
+        return await (await self._remote()).connect()
+
+    async def disconnect(self):
+        await self.stop()
+        await (await self._remote()).disconnect()
+
+    async def is_connected(self) -> bool:
+        return await (await self._remote()).is_connected()
+
+    async def get(self, key: str) -> Optional[Any]:
+        """로컬 → Redis 순으로 조회, Redis 적중 시 로컬 캐시 채움"""
+        hit, value = self.local.get(key)
+        if hit:
+            self._stats["local_hits"] += 1
+            return value
+        self._stats["local_misses"] += 1
+
+        generation = self._generation
+        remote = await self._remote()
+        value = await remote.get(key)
+
+        if value is None:
+            self._stats["remote_misses"] += 1
+            return None
+
+        self._stats["remote_hits"] += 1
+        # 조회 중 무효화가 도착했다면 이전 값일 수 있으므로 로컬에 저장하지 않음
+        if generation == self._generation:
+            self.local.set(key, value)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int = 3600, tags: Iterable[str] = ()) -> bool:
+        """Redis 저장 성공 시 로컬 캐시에도 저장하고 태그에 등록"""
+        remote = await self._remote()
+        success = await remote.set(key, value, ttl=ttl)
+        if success:
+            self.local.set(key, _normalize(value), ttl)
+            if tags:
+                await cache_tags.tag_keys(remote, {tag: [key] for tag in tags}, ttl)
+        return success
+
+    async def delete(self, key: str) -> bool:
+        """로컬/Redis에서 삭제하고 다른 워커에 무효화 전파"""
+        return await self.invalidate(key) > 0
+
+    async def exists(self, key: str) -> bool:
+        hit, _ = self.local.get(key)
+        return hit or await (await self._remote()).exists(key)
+
+    async def mget(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """로컬 적중분은 바로 반환하고 나머지는 Redis MGET 한 번으로 조회"""
+        found: Dict[str, Any] = {}
+        missing: List[str] = []
+        for key in dict.fromkeys(keys):
+            hit, value = self.local.get(key)
+            if hit:
+                found[key] = value
+            else:
+                missing.append(key)
+        self._stats["local_hits"] += len(found)
+        self._stats["local_misses"] += len(missing)
+        if not missing:
+            return found
+
+        generation = self._generation
+        fetched = await (await self._remote()).mget(missing)
+        self._stats["remote_hits"] += len(fetched)
+        self._stats["remote_misses"] += len(missing) - len(fetched)
+
+        if generation == self._generation:
+            for key, value in fetched.items():
+                self.local.set(key, value)
+        found.update(fetched)
+        return found
+
+    async def mset_with_ttl(
+        self,
+        items: Dict[str, Any],
+        ttl: int = 3600,
+        tags: Optional[Dict[str, Iterable[str]]] = None
+    ) -> bool:
+        """Redis 일괄 저장 성공 시 로컬 캐시에도 저장하고 태그에 등록 (tags: {태그: 키 목록})"""
+        remote = await self._remote()
+        success = await remote.mset_with_ttl(items, ttl=ttl)
+        if success:
+            for key, value in items.items():
+                self.local.set(key, _normalize(value), ttl)
+            if tags:
+                await cache_tags.tag_keys(remote, tags, ttl)
+        return success
+
+    async def delete_many(self, keys: Iterable[str]) -> int:
+        return await self.invalidate(*dict.fromkeys(keys))
+
+    def pipeline(self) -> CachePipeline:
+        """로컬 캐시를 반영하는 파이프라인 - 로컬에서 처리할 수 없는 명령만 Redis로 전송"""
+        return CachePipeline(self._execute_ops)
+
+    async def _execute_ops(self, ops: List[CacheOp]) -> List[Any]:
+        results: List[Any] = [None] * len(ops)
+        remote_pipe = (await self._remote()).pipeline()
+        remote_index: List[int] = []
+        for index, (name, args) in enumerate(ops):
+            if name == "get":
+                hit, value = self.local.get(args[0])
+                if hit:
+                    self._stats["local_hits"] += 1
+                    results[index] = value
+                    continue
+                self._stats["local_misses"] += 1
+            remote_pipe.ops.append((name, args))
+            remote_index.append(index)
+
+        deleted = [args[0] for name, args in ops if name == "delete"]
+        if deleted:
+            self._drop_local(deleted)
+
+        generation = self._generation
+        for index, result in zip(remote_index, await remote_pipe.execute()):
+            results[index] = result
+            name, args = ops[index]
+            if name == "get":
+                self._stats["remote_hits" if result is not None else "remote_misses"] += 1
+                if result is not None and generation == self._generation:
+                    self.local.set(args[0], result)
+            elif name == "set" and result:
+                key, value, ttl = args
+                self.local.set(key, _normalize(value), ttl)
+
+        if deleted:
+            await self._publish_invalidation(deleted)
+        return results
+
+    async def zadd(self, key: str, mapping: Dict[str, float]) -> int:
+        return await (await self._remote()).zadd(key, mapping)
+
+    async def zrangebyscore(self, key: str, min_score, max_score) -> List[Tuple[str, float]]:
+        return await (await self._remote()).zrangebyscore(key, min_score, max_score)
+
+    async def zremrangebyscore(self, key: str, min_score, max_score) -> int:
+        return await (await self._remote()).zremrangebyscore(key, min_score, max_score)
+
+    async def eval_script(self, script: str, keys: List[str], args: List[Any]) -> Any:
+        """스크립트가 건드린 키는 로컬 캐시를 거치지 않으므로 그대로 Redis에서 실행"""
+        return await (await self._remote()).eval_script(script, keys, args)
+
+    async def health_check(self) -> dict:
+        health = await (await self._remote()).health_check()
+        health["local_tier"] = self.stats()
+        return health
+
+    # === 2단 캐시 전용 ===
+
+    async def invalidate(self, *keys: str) -> int:
+        """키 무효화 - 삭제된 Redis 키 수 반환"""
+        if not keys:
+            return 0
+
+        self._drop_local(keys)
+        deleted = await (await self._remote()).delete_many(keys)
+        await self._publish_invalidation(keys)
+        return deleted
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """태그에 등록된 항목 무효화 (KEYS/SCAN 없이 Lua 스크립트 한 번) - 무효화한 키 수 반환"""
+        if not tags:
+            return 0
+
+        keys = await cache_tags.invalidate_tags(await self._remote(), tags)
+        if keys:
+            self._drop_local(keys)
+            await self._publish_invalidation(keys)
+        return len(keys)
+
+    async def _publish_invalidation(self, keys) -> None:
+        message = json.dumps({"origin": self.instance_id, "keys": list(keys)})
+        await (await self._remote()).publish(self.channel, message)
+        self._stats["invalidations_sent"] += 1
+
+    def _drop_local(self, keys) -> None:
+        self._generation += 1
+        for key in keys:
+            self.local.delete(key)
+
+    async def single_flight(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """같은 키의 동시 로드를 하나로 합침 - 후속 호출은 첫 호출의 결과(또는 예외)를 공유"""
+        future = self._inflight.get(key)
+        if future is not None:
+            self._stats["coalesced"] += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await loader()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 대기자가 없으면 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    def handle_invalidation(self, message: str) -> None:
+        """다른 워커가 보낸 무효화 메시지 처리"""
+        try:
+            payload = json.loads(message)
+        except (json.JSONDecodeError, TypeError):
+            logger.warning(f"잘못된 캐시 무효화 메시지: {message!r}")
+            return
+
+        if payload.get("origin") == self.instance_id:
+            return
+        self._drop_local(payload.get("keys", []))
+        self._stats["invalidations_received"] += 1
+
+    async def _listen(self) -> None:
+        while True:
+            remote = await self._remote()
+            try:
+                async for message in remote.subscribe(self.channel):
+                    self.handle_invalidation(message)
+            except NotImplementedError:
+                logger.info("캐시 무효화 구독 미지원 - 로컬 캐시 TTL로 지연을 제한합니다.")
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"캐시 무효화 구독 끊김, 재연결 대기: {e}")
+
+            # subscribe()는 유휴 시간 초과를 내부에서 처리하므로 여기 도달하면 실제로 구독이 끊긴 것
+            # 끊긴 동안의 무효화를 놓쳤을 수 있으므로 로컬 캐시 비움
+            self.local.clear()
+            await asyncio.sleep(1)
+
+    async def start(self) -> None:
+        """Redis 연결 확인 후 무효화 구독 시작"""
+        if self._listener is not None and not self._listener.done():
+            return
+        if not await redis_factory.ensure_redis_connection():
+            logger.warning("Redis 미연결 - 로컬 캐시 없이 동작합니다.")
+            return
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self.local.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """계층별 적중/미스 카운터"""
+        local_total = self._stats["local_hits"] + self._stats["local_misses"]
+        return {
+            **self._stats,
+            "local_hit_rate": round(self._stats["local_hits"] / local_total, 4) if local_total else 0.0,
+            "local_entries": len(self.local),
+            "local_evictions": self.local.evictions,
+            "subscribed": self._listener is not None and not self._listener.done()
+        }
+
+
+# 글로벌 2단 캐시 인스턴스 (워커 프로세스당 하나)
+layered_cache = LayeredCacheManager()
+
+
+async def get_layered_cache() -> LayeredCacheManager:
+    """2단 캐시 매니저 인스턴스 반환"""
+    return layered_cache
@@ -13,6 +13,14 @@ logger = logging.getLogger(__name__)
 class IndexManager:
     """Manages MongoDB collection indexes for performance optimization."""
     
+    # Indexes replaced by definitions with a changed key (MongoDB rejects a key
+    # change under an existing name), dropped before the replacements are created
+    SUPERSEDED_POST_INDEXES = (
+        "metadata_type_status_created_idx",
+        "metadata_type_status_views_idx",
+        "metadata_type_status_likes_idx"
+    )
+    
     @staticmethod
     def get_user_indexes() -> List[IndexModel]:
         """
@@ -73,11 +81,13 @@ class IndexManager:
                 [("service", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING)],
                 name="service_status_created_idx"
             ),
-            # Text search index for content
+            # Text search index over pre-tokenized terms (Korean n-grams, see utils/search_text)
+            # 컬렉션당 텍스트 인덱스는 하나만 허용되므로 기존 post_text_search_idx를 대체
             IndexModel(
-                [("title", TEXT), ("content", TEXT), ("tags", TEXT)],
-                name="post_text_search_idx",
-                weights={"title": 10, "tags": 5, "content": 3}
+                [("search_terms.title", TEXT), ("search_terms.tags", TEXT), ("search_terms.body", TEXT)],
+                name="post_search_terms_idx",
+                weights={"search_terms.title": 10, "search_terms.tags": 5, "search_terms.body": 3},
+                default_language="none"
             ),
             # Index for published posts
             IndexModel(
@@ -88,9 +98,10 @@ class IndexManager:
             
             # 🚀 SSR 페이지 최적화를 위한 메타데이터 타입별 인덱스
             # 정보/서비스/팁 페이지용 (metadata.type + status + created_at)
+            # _id는 커서 페이지네이션의 tie-breaker - 정렬 전체를 인덱스가 처리하도록 포함
             IndexModel(
-                [("metadata.type", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING)],
-                name="metadata_type_status_created_idx"
+                [("metadata.type", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+                name="metadata_type_status_created_id_idx"
             ),
             
             # 메타데이터 타입별 빠른 조회용 (metadata.type + created_at)
@@ -101,14 +112,20 @@ class IndexManager:
             
             # 메타데이터 타입별 view_count 정렬용 (인기순 정렬 지원)
             IndexModel(
-                [("metadata.type", ASCENDING), ("status", ASCENDING), ("view_count", DESCENDING)],
-                name="metadata_type_status_views_idx"
+                [("metadata.type", ASCENDING), ("status", ASCENDING), ("view_count", DESCENDING), ("_id", DESCENDING)],
+                name="metadata_type_status_views_id_idx"
             ),
             
             # 메타데이터 타입별 like_count 정렬용 (추천순 정렬 지원)
             IndexModel(
-                [("metadata.type", ASCENDING), ("status", ASCENDING), ("like_count", DESCENDING)],
-                name="metadata_type_status_likes_idx"
+                [("metadata.type", ASCENDING), ("status", ASCENDING), ("like_count", DESCENDING), ("_id", DESCENDING)],
+                name="metadata_type_status_likes_id_idx"
+            ),
+
+            # 타입 필터 없는 전체 목록용 (status + created_at, _id tie-breaker)
+            IndexModel(
+                [("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+                name="status_created_id_idx"
             )
         ]
     
@@ -137,6 +154,16 @@ class IndexManager:
                 sparse=True,
                 name="parent_comment_idx"
             ),
+            # Whole threads for a page of top-level comments in one query
+            IndexModel(
+                [("root_id", ASCENDING), ("status", ASCENDING), ("created_at", ASCENDING)],
+                name="comment_thread_idx"
+            ),
+            # Subtree of any comment via its ancestor path (multikey)
+            IndexModel(
+                [("path", ASCENDING)],
+                name="comment_path_idx"
+            ),
             # Text search for comment content
             IndexModel(
                 [("content", TEXT)],
@@ -217,6 +244,10 @@ class IndexManager:
             settings.stats_collection: IndexManager.get_stats_indexes()
         }
         
+        superseded_indexes = {
+            settings.posts_collection: IndexManager.SUPERSEDED_POST_INDEXES
+        }
+        
         created_indexes = {}
         
         for collection_name, indexes in index_definitions.items():
@@ -226,6 +257,10 @@ class IndexManager:
             collection = db[collection_name]
             
             try:
+                await IndexManager.drop_superseded_indexes(
+                    collection, superseded_indexes.get(collection_name, ())
+                )
+                
                 # Create indexes
                 created = await collection.create_indexes(indexes)
                 created_indexes[collection_name] = created
@@ -238,6 +273,30 @@ class IndexManager:
         
         return created_indexes
     
+    @staticmethod
+    async def drop_superseded_indexes(collection, names) -> List[str]:
+        """
+        Drop indexes that were replaced under a new name.
+        
+        Args:
+            collection: MongoDB collection
+            names: Names of superseded indexes
+            
+        Returns:
+            List of dropped index names
+        """
+        if not names:
+            return []
+        
+        existing = await collection.index_information()
+        dropped = []
+        for name in names:
+            if name in existing:
+                await collection.drop_index(name)
+                dropped.append(name)
+                logger.info(f"Dropped superseded index {name} from {collection.name} collection")
+        return dropped
+    
     @staticmethod
     async def drop_all_indexes(db: AsyncIOMotorDatabase) -> None:
         """
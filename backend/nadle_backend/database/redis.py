@@ -1,11 +1,18 @@
 import redis.asyncio as redis
-from typing import Optional, Any
+from typing import Optional, Any, AsyncIterator, Dict, Iterable, List, Tuple, Union
 import json
 import logging
 from ..config import get_settings
+from .redis_health import RedisHealth
+from .cache_pipeline import (
+    CacheOp, CachePipeline, convert_result, decode_value, encode_value, failure_value
+)
 
 logger = logging.getLogger(__name__)
 
+# 구독 대기 시 한 번에 기다리는 최대 시간 (유휴 시간 초과는 오류가 아님)
+SUBSCRIBE_POLL_TIMEOUT = 30.0
+
 class RedisManager:
     """Redis 연결 및 캐싱 관리 클래스"""
     
@@ -13,6 +20,8 @@ class RedisManager:
         self.redis_client: Optional[redis.Redis] = None
         self.settings = get_settings()
         self._connected = False
+        self.health = RedisHealth("local")
+        self._scripts: Dict[str, Any] = {}
     
     async def connect(self) -> bool:
         """Redis 서버에 연결"""
@@ -21,6 +30,7 @@ class RedisManager:
             return False
         
         try:
+            self._scripts.clear()
             self.redis_client = redis.from_url(
                 self.settings.redis_url,
                 db=self.settings.redis_db,
@@ -33,33 +43,53 @@ class RedisManager:
             # 연결 테스트
             await self.redis_client.ping()
             self._connected = True
+            self.health.record_success()
             logger.info(f"Redis 연결 성공: {self.settings.redis_url}")
             return True
             
         except Exception as e:
             logger.warning(f"Redis 연결 실패: {e}")
             self._connected = False
+            self.health.record_failure(e)
             return False
     
     async def disconnect(self):
         """Redis 연결 종료"""
+        await self.health.stop_probe()
         if self.redis_client:
             await self.redis_client.aclose()
             self._connected = False
             logger.info("Redis 연결 종료")
     
     async def is_connected(self) -> bool:
-        """Redis 연결 상태 확인"""
+        """Redis 사용 가능 여부 (PING 없이 연결 상태와 서킷 브레이커로 판단)"""
+        return self._connected and self.redis_client is not None and self.health.allow()
+    
+    async def ping(self) -> bool:
+        """PING으로 연결을 확인하고 결과를 상태에 기록 (백그라운드 프로브용)"""
         if not self._connected or not self.redis_client:
-            return False
+            return await self.connect()
         
         try:
             await self.redis_client.ping()
+            self.health.record_success()
             return True
-        except:
-            self._connected = False
+        except Exception as e:
+            self._record_error(e)
             return False
     
+    def start_health_probe(self) -> None:
+        """백그라운드 상태 프로브 시작"""
+        if self.settings.cache_enabled:
+            self.health.start_probe(self.ping)
+    
+    def _record_error(self, error: Exception) -> None:
+        """연결/타임아웃 오류만 서킷 브레이커 실패로 기록 (명령 오류는 서버가 응답한 것)"""
+        if isinstance(error, (redis.ConnectionError, redis.TimeoutError, OSError)):
+            self.health.record_failure(error)
+        else:
+            self.health.record_success()
+    
     async def get(self, key: str) -> Optional[Any]:
         """캐시에서 값 가져오기"""
         if not await self.is_connected():
@@ -67,6 +97,7 @@ class RedisManager:
         
         try:
             value = await self.redis_client.get(key)
+            self.health.record_success()
             if value is None:
                 return None
             
@@ -77,6 +108,7 @@ class RedisManager:
                 return value
                 
         except Exception as e:
+            self._record_error(e)
             logger.error(f"Redis GET 오류 - key: {key}, error: {e}")
             return None
     
@@ -91,9 +123,11 @@ class RedisManager:
                 value = json.dumps(value, default=str)
             
             await self.redis_client.setex(key, ttl, value)
+            self.health.record_success()
             return True
             
         except Exception as e:
+            self._record_error(e)
             logger.error(f"Redis SET 오류 - key: {key}, error: {e}")
             return False
     
@@ -104,9 +138,11 @@ class RedisManager:
         
         try:
             result = await self.redis_client.delete(key)
+            self.health.record_success()
             return result > 0
             
         except Exception as e:
+            self._record_error(e)
             logger.error(f"Redis DELETE 오류 - key: {key}, error: {e}")
             return False
     
@@ -117,12 +153,212 @@ class RedisManager:
         
         try:
             result = await self.redis_client.exists(key)
+            self.health.record_success()
             return result > 0
             
         except Exception as e:
+            self._record_error(e)
             logger.error(f"Redis EXISTS 오류 - key: {key}, error: {e}")
             return False
     
+    async def mget(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """여러 키를 한 번에 조회 - 존재하는 키만 {key: value}로 반환"""
+        keys = list(dict.fromkeys(keys))
+        if not keys or not await self.is_connected():
+            return {}
+        
+        try:
+            values = await self.redis_client.mget(keys)
+            self.health.record_success()
+            return {key: decode_value(value) for key, value in zip(keys, values) if value is not None}
+            
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Redis MGET 오류 - keys: {len(keys)}, error: {e}")
+            return {}
+    
+    async def mset_with_ttl(self, items: Dict[str, Any], ttl: int = 3600) -> bool:
+        """여러 키를 같은 TTL로 한 번에 저장 (MSET은 TTL을 지원하지 않아 SETEX 파이프라인 사용)"""
+        if not items:
+            return True
+        if not await self.is_connected():
+            return False
+        
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.setex(key, ttl, encode_value(value))
+            await pipe.execute()
+            self.health.record_success()
+            return True
+            
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Redis MSET 오류 - keys: {len(items)}, error: {e}")
+            return False
+    
+    async def delete_many(self, keys: Iterable[str]) -> int:
+        """여러 키를 한 번에 삭제 - 삭제된 키 수 반환"""
+        keys = list(dict.fromkeys(keys))
+        if not keys or not await self.is_connected():
+            return 0
+        
+        try:
+            result = await self.redis_client.delete(*keys)
+            self.health.record_success()
+            return result
+            
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Redis DELETE 오류 - keys: {len(keys)}, error: {e}")
+            return 0
+    
+    async def zadd(self, key: str, mapping: Dict[str, float]) -> int:
+        """정렬 집합에 멤버 추가 (이미 있으면 점수 갱신) - 새로 추가된 멤버 수 반환"""
+        if not mapping or not await self.is_connected():
+            return 0
+        
+        try:
+            result = await self.redis_client.zadd(key, mapping)
+            self.health.record_success()
+            return result
+            
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Redis ZADD 오류 - key: {key}, error: {e}")
+            return 0
+    
+    async def zrangebyscore(
+        self, key: str, min_score: Union[float, str], max_score: Union[float, str]
+    ) -> List[Tuple[str, float]]:
+        """점수 범위의 멤버를 (멤버, 점수) 목록으로 조회"""
+        if not await self.is_connected():
+            return []
+        
+        try:
+            result = await self.redis_client.zrangebyscore(key, min_score, max_score, withscores=True)
+            self.health.record_success()
+            return [(member, float(score)) for member, score in result]
+            
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Redis ZRANGEBYSCORE 오류 - key: {key}, error: {e}")
+            return []
+    
+    async def zremrangebyscore(
+        self, key: str, min_score: Union[float, str], max_score: Union[float, str]
+    ) -> int:
+        """점수 범위의 멤버 삭제 - 삭제된 멤버 수 반환"""
+        if not await self.is_connected():
+            return 0
+        
+        try:
+            result = await self.redis_client.zremrangebyscore(key, min_score, max_score)
+            self.health.record_success()
+            return result
+            
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Redis ZREMRANGEBYSCORE 오류 - key: {key}, error: {e}")
+            return 0
+    
+    async def zrevrange(self, key: str, start: int, stop: int) -> List[Tuple[str, float]]:
+        """점수 내림차순 순위 범위의 멤버를 (멤버, 점수) 목록으로 조회"""
+        if not await self.is_connected():
+            return []
+        
+        try:
+            result = await self.redis_client.zrevrange(key, start, stop, withscores=True)
+            self.health.record_success()
+            return [(member, float(score)) for member, score in result]
+            
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Redis ZREVRANGE 오류 - key: {key}, error: {e}")
+            return []
+    
+    async def eval_script(self, script: str, keys: List[str], args: List[Any]) -> Any:
+        """Lua 스크립트를 원자적으로 실행 (EVALSHA 우선, 캐시에 없으면 로드) - 실패 시 None"""
+        if not await self.is_connected():
+            return None
+        
+        try:
+            runner = self._scripts.get(script)
+            if runner is None:
+                runner = self._scripts[script] = self.redis_client.register_script(script)
+            result = await runner(keys=keys, args=args)
+            self.health.record_success()
+            return result
+            
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Redis EVAL 오류 - keys: {keys}, error: {e}")
+            return None
+    
+    def pipeline(self) -> CachePipeline:
+        """여러 캐시 명령을 한 번의 왕복으로 실행하는 파이프라인"""
+        return CachePipeline(self._execute_ops)
+    
+    async def _execute_ops(self, ops: List[CacheOp]) -> List[Any]:
+        """파이프라인 명령 실행 - 실패 시 단일 키 메서드의 실패 값으로 채움"""
+        failed = [failure_value(name) for name, _ in ops]
+        if not await self.is_connected():
+            return failed
+        
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for name, args in ops:
+                if name == "set":
+                    key, value, ttl = args
+                    pipe.setex(key, ttl, encode_value(value))
+                else:
+                    getattr(pipe, name)(*args)
+            raw = await pipe.execute(raise_on_error=False)
+            self.health.record_success()
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Redis PIPELINE 오류 - commands: {len(ops)}, error: {e}")
+            return failed
+        
+        return [
+            fallback if isinstance(result, Exception) else convert_result(name, result)
+            for (name, _), result, fallback in zip(ops, raw, failed)
+        ]
+    
+    async def publish(self, channel: str, message: str) -> int:
+        """채널에 메시지 발행 (수신한 구독자 수 반환)"""
+        if not await self.is_connected():
+            return 0
+        
+        try:
+            result = await self.redis_client.publish(channel, message)
+            self.health.record_success()
+            return result
+            
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Redis PUBLISH 오류 - channel: {channel}, error: {e}")
+            return 0
+    
+    async def subscribe(self, channel: str) -> AsyncIterator[str]:
+        """채널 구독 - 수신한 메시지를 차례로 반환 (연결이 끊기면 예외 발생)
+        
+        listen()은 클라이언트의 socket_timeout(5초)을 읽기 제한으로 쓰므로 조용한 채널에서
+        TimeoutError가 납니다. 명시적 timeout으로 get_message를 반복해 유휴 시간은 None으로
+        받고, 실제 연결 오류만 호출자에게 전달합니다.
+        """
+        pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(channel)
+        try:
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=SUBSCRIBE_POLL_TIMEOUT
+                )
+                if message is not None and message.get("type") == "message":
+                    yield message["data"]
+        finally:
+            await pubsub.aclose()
+    
     async def health_check(self) -> dict:
         """Redis 상태 확인"""
         if not self.settings.cache_enabled:
@@ -139,17 +375,21 @@ class RedisManager:
                     "redis_version": info.get("redis_version", "unknown"),
                     "used_memory": info.get("used_memory_human", "unknown"),
                     "connected_clients": info.get("connected_clients", 0),
-                    "total_commands_processed": info.get("total_commands_processed", 0)
+                    "total_commands_processed": info.get("total_commands_processed", 0),
+                    "circuit": self.health.snapshot()
                 }
             else:
                 return {
-                    "status": "disconnected",
-                    "message": "Redis 서버에 연결할 수 없습니다."
+                    "status": "circuit_open" if self._connected else "disconnected",
+                    "message": "Redis 서버에 연결할 수 없습니다.",
+                    "circuit": self.health.snapshot()
                 }
         except Exception as e:
+            self._record_error(e)
             return {
                 "status": "error",
-                "message": f"Redis 상태 확인 중 오류: {str(e)}"
+                "message": f"Redis 상태 확인 중 오류: {str(e)}",
+                "circuit": self.health.snapshot()
             }
 
 # 글로벌 Redis 매니저 인스턴스
@@ -1,8 +1,9 @@
 """Redis 팩토리 패턴 - 환경에 따른 Redis 클라이언트 자동 선택"""
 
 import logging
-from typing import Union, Protocol
+from typing import Union, Protocol, AsyncIterator, Any, Dict, Iterable, List, Tuple
 from ..config import get_settings
+from .cache_pipeline import CachePipeline
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +20,15 @@ class RedisManagerProtocol(Protocol):
         ...
     
     async def is_connected(self) -> bool:
-        """연결 상태 확인"""
+        """사용 가능 여부 (네트워크 호출 없이 연결 상태와 서킷 브레이커로 판단)"""
+        ...
+    
+    async def ping(self) -> bool:
+        """PING으로 연결 확인 후 상태 기록"""
+        ...
+    
+    def start_health_probe(self) -> None:
+        """백그라운드 상태 프로브 시작"""
         ...
     
     async def get(self, key: str):
@@ -38,6 +47,50 @@ class RedisManagerProtocol(Protocol):
         """키 존재 확인"""
         ...
     
+    async def mget(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """여러 키를 한 번에 조회 (존재하는 키만 반환)"""
+        ...
+    
+    async def mset_with_ttl(self, items: Dict[str, Any], ttl: int = 3600) -> bool:
+        """여러 키를 같은 TTL로 한 번에 저장"""
+        ...
+    
+    async def delete_many(self, keys: Iterable[str]) -> int:
+        """여러 키를 한 번에 삭제 (삭제된 키 수 반환)"""
+        ...
+    
+    async def zadd(self, key: str, mapping: Dict[str, float]) -> int:
+        """정렬 집합에 멤버 추가 (새로 추가된 멤버 수 반환)"""
+        ...
+    
+    async def zrangebyscore(self, key: str, min_score, max_score) -> List[Tuple[str, float]]:
+        """점수 범위의 (멤버, 점수) 목록 조회"""
+        ...
+    
+    async def zremrangebyscore(self, key: str, min_score, max_score) -> int:
+        """점수 범위의 멤버 삭제 (삭제된 멤버 수 반환)"""
+        ...
+    
+    async def zrevrange(self, key: str, start: int, stop: int) -> List[Tuple[str, float]]:
+        """점수 내림차순 순위 범위의 (멤버, 점수) 목록 조회"""
+        ...
+    
+    async def eval_script(self, script: str, keys: List[str], args: List[Any]) -> Any:
+        """Lua 스크립트 원자 실행 (실패 시 None)"""
+        ...
+    
+    def pipeline(self) -> CachePipeline:
+        """여러 명령을 한 번의 왕복으로 실행하는 파이프라인"""
+        ...
+    
+    async def publish(self, channel: str, message: str) -> int:
+        """채널에 메시지 발행"""
+        ...
+    
+    def subscribe(self, channel: str) -> AsyncIterator[str]:
+        """채널 구독 (지원하지 않는 클라이언트는 NotImplementedError)"""
+        ...
+    
     async def health_check(self) -> dict:
         """상태 확인"""
         ...
@@ -104,7 +157,8 @@ async def ensure_redis_connection() -> bool:
         return True
     
     logger.info("Redis 연결 시도 중...")
-    connected = await manager.connect()
+    # 연결되지 않았으면 connect, 연결된 상태(서킷 open)면 PING으로 재확인
+    connected = await manager.ping()
     
     if connected:
         logger.info("Redis 연결 성공")
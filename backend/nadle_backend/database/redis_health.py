@@ -0,0 +1,144 @@
+"""Redis 연결 상태 추적 및 서킷 브레이커
+
+캐시 명령마다 PING으로 연결을 확인하던 방식 대신, 실제 명령의 성공/실패와
+백그라운드 프로브 결과로 연결 상태를 추적합니다.
+
+상태 전이:
+    CLOSED    --(연속 실패 N회)--> OPEN
+    OPEN      --(쿨다운 경과)----> HALF_OPEN
+    HALF_OPEN --(성공)----------> CLOSED
+    HALF_OPEN --(실패)----------> OPEN
+
+OPEN 상태에서는 모든 캐시 호출을 즉시 건너뛰므로 Redis 장애가
+요청마다 소켓 타임아웃을 더하지 않습니다.
+"""
+
+import asyncio
+import logging
+import time
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from ..config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(Enum):
+    """서킷 브레이커 상태"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class RedisHealth:
+    """명령 결과 기반 Redis 상태 머신 + 서킷 브레이커"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: Optional[int] = None,
+        cooldown: Optional[float] = None,
+        probe_interval: Optional[float] = None
+    ):
+        settings = get_settings()
+        self.name = name
+        self.failure_threshold = failure_threshold or settings.redis_breaker_failure_threshold
+        self.cooldown = cooldown or settings.redis_breaker_cooldown
+        self.probe_interval = probe_interval or settings.redis_health_probe_interval
+
+        self._state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.last_failure_at: Optional[float] = None
+        self.last_success_at: Optional[float] = None
+        self.short_circuited = 0
+        self._probe_task: Optional[asyncio.Task] = None
+
+    @property
+    def state(self) -> CircuitState:
+        """현재 상태 (쿨다운이 지난 OPEN은 HALF_OPEN으로 전환)"""
+        if self._state is CircuitState.OPEN and time.monotonic() - self.opened_at >= self.cooldown:
+            self._state = CircuitState.HALF_OPEN
+            logger.info(f"{self.name} Redis 서킷 half-open - 재시도 허용")
+        return self._state
+
+    def allow(self) -> bool:
+        """캐시 호출 허용 여부 (OPEN이면 False, 건너뛴 횟수 기록)"""
+        if self.state is CircuitState.OPEN:
+            self.short_circuited += 1
+            return False
+        return True
+
+    def record_success(self) -> None:
+        self.last_success_at = time.time()
+        self.consecutive_failures = 0
+        if self._state is not CircuitState.CLOSED:
+            logger.info(f"{self.name} Redis 서킷 closed - 연결 복구")
+            self._state = CircuitState.CLOSED
+            self.opened_at = None
+
+    def record_failure(self, error: Any) -> None:
+        self.last_error = str(error)
+        self.last_failure_at = time.time()
+        self.consecutive_failures += 1
+
+        if self.state is CircuitState.HALF_OPEN or (
+            self._state is CircuitState.CLOSED and self.consecutive_failures >= self.failure_threshold
+        ):
+            self._open()
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self.opened_at = time.monotonic()
+        logger.warning(
+            f"{self.name} Redis 서킷 open - {self.cooldown}초 동안 캐시 호출 차단 (마지막 오류: {self.last_error})"
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """/health/cache 응답용 상태 정보"""
+        state = self.state
+        cooldown_remaining = 0.0
+        if state is CircuitState.OPEN:
+            cooldown_remaining = max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+        return {
+            "state": state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "cooldown_seconds": self.cooldown,
+            "cooldown_remaining": round(cooldown_remaining, 1),
+            "short_circuited": self.short_circuited,
+            "last_error": self.last_error,
+            "last_failure_at": self.last_failure_at,
+            "last_success_at": self.last_success_at,
+            "probe_running": self._probe_task is not None and not self._probe_task.done()
+        }
+
+    async def _run_probe(self, probe: Callable[[], Awaitable[bool]]) -> None:
+        while True:
+            await asyncio.sleep(self.probe_interval)
+            # OPEN 쿨다운 중에는 프로브도 보내지 않음
+            if self.state is CircuitState.OPEN:
+                continue
+            try:
+                await probe()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"{self.name} Redis 프로브 오류: {e}")
+
+    def start_probe(self, probe: Callable[[], Awaitable[bool]]) -> None:
+        """백그라운드 프로브 시작 - probe는 결과를 record_success/record_failure로 기록"""
+        if self._probe_task is not None and not self._probe_task.done():
+            return
+        self._probe_task = asyncio.create_task(self._run_probe(probe))
+
+    async def stop_probe(self) -> None:
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            try:
+                await self._probe_task
+            except asyncio.CancelledError:
+                pass
+            self._probe_task = None
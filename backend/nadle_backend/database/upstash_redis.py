@@ -1,13 +1,21 @@
 """Upstash Redis REST API 클라이언트"""
 
 import aiohttp
+import asyncio
 import json
 import logging
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Iterable, List, Tuple, Union, AsyncIterator
 from ..config import get_settings
+from .redis_health import RedisHealth
+from .cache_pipeline import (
+    CacheOp, CachePipeline, convert_result, decode_value, encode_value, failure_value
+)
 
 logger = logging.getLogger(__name__)
 
+# 한 번의 /pipeline 요청에 담는 최대 명령 수
+MAX_PIPELINE_COMMANDS = 100
+
 
 class UpstashRedisManager:
     """Upstash Redis REST API 기반 Redis 매니저
@@ -20,6 +28,12 @@ class UpstashRedisManager:
         self.settings = get_settings()
         self.session: Optional[aiohttp.ClientSession] = None
         self._connected = False
+        self.health = RedisHealth("upstash")
+        
+        # 같은 이벤트 루프 틱에 발생한 명령을 /pipeline 한 번으로 합쳐 전송
+        self.auto_batch = self.settings.upstash_auto_batch
+        self._batch: List[Tuple[list, asyncio.Future]] = []
+        self._batch_tasks: set = set()
         
         # 시작 시 한 번만 설정 로드 (운영 환경에서는 변경되지 않음)
         self.rest_url = getattr(self.settings, 'upstash_redis_rest_url', None)
@@ -36,13 +50,19 @@ class UpstashRedisManager:
             return False
         
         try:
-            # HTTP 세션 생성
+            # HTTP 세션 생성 (keep-alive 연결 재사용, 동시 연결 수 제한)
             self.session = aiohttp.ClientSession(
                 headers={
                     'Authorization': f'Bearer {self.rest_token}',
                     'Content-Type': 'application/json'
                 },
-                timeout=aiohttp.ClientTimeout(total=10)
+                timeout=aiohttp.ClientTimeout(total=10, connect=3),
+                connector=aiohttp.TCPConnector(
+                    limit=self.settings.upstash_pool_size,
+                    limit_per_host=self.settings.upstash_pool_size,
+                    keepalive_timeout=self.settings.upstash_keepalive_timeout,
+                    ttl_dns_cache=300
+                )
             )
             
             # 연결 테스트 (PING)
@@ -65,6 +85,7 @@ class UpstashRedisManager:
     
     async def disconnect(self):
         """Upstash Redis 연결 종료"""
+        await self.health.stop_probe()
         if self.session:
             await self.session.close()
             self.session = None
@@ -81,44 +102,124 @@ class UpstashRedisManager:
         await self.disconnect()
     
     async def is_connected(self) -> bool:
-        """Upstash Redis 연결 상태 확인"""
+        """Upstash Redis 사용 가능 여부 (PING 없이 연결 상태와 서킷 브레이커로 판단)"""
+        return self._connected and self.session is not None and self.health.allow()
+    
+    async def ping(self) -> bool:
+        """PING으로 연결을 확인하고 결과를 상태에 기록 (백그라운드 프로브용)"""
         if not self._connected or not self.session:
-            return False
+            return await self.connect()
         
         try:
             result = await self._request(["PING"])
-            is_ok = result.get("result") == "PONG"
-            if not is_ok:
-                self._connected = False
-            return is_ok
-        except:
-            self._connected = False
+            return result.get("result") == "PONG"
+        except Exception:
             return False
     
+    def start_health_probe(self) -> None:
+        """백그라운드 상태 프로브 시작"""
+        if self.settings.cache_enabled and self.rest_url and self.rest_token:
+            self.health.start_probe(self.ping)
+    
     async def _request(self, command: list) -> Dict[str, Any]:
-        """Upstash REST API 요청 수행"""
+        """Upstash REST API 요청 수행 (자동 배치 모드면 같은 틱의 명령과 합쳐 전송)"""
         if not self.session:
             raise RuntimeError("Upstash Redis 세션이 초기화되지 않았습니다. connect()를 먼저 호출하세요.")
         
-        url = self.rest_url.rstrip('/')
+        if self.auto_batch:
+            return await self._enqueue(command)
+        return await self._send("", command)
+    
+    async def _send(self, path: str, payload: list) -> Any:
+        """REST 엔드포인트로 POST 요청 (path: "" 단일 명령, "/pipeline", "/multi-exec")"""
+        url = self.rest_url.rstrip('/') + path
         
         try:
-            async with self.session.post(url, json=command) as response:
+            async with self.session.post(url, json=payload) as response:
                 result = await response.json()
                 
+                # 5xx는 서버 장애, 4xx는 명령 오류 (서버는 정상 응답)
+                if response.status >= 500:
+                    self.health.record_failure(f"HTTP {response.status}")
+                else:
+                    self.health.record_success()
+                
                 if response.status != 200:
                     logger.error(f"Upstash API Error: {response.status} - {result}")
                     raise Exception(f"Upstash API Error: {response.status} - {result}")
                     
                 return result
                 
-        except aiohttp.ClientError as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.health.record_failure(e)
             logger.error(f"Upstash 요청 오류: {e}")
             raise
         except Exception as e:
             logger.error(f"Upstash 요청 처리 오류: {e}")
             raise
     
+    async def execute_pipeline(self, commands: List[list], transaction: bool = False) -> List[Dict[str, Any]]:
+        """여러 명령을 한 번의 HTTP 요청으로 실행
+        
+        Args:
+            commands: Redis 명령 목록 (예: [["GET", "a"], ["GET", "b"]])
+            transaction: True면 /multi-exec (원자적 실행), False면 /pipeline
+            
+        Returns:
+            명령별 {"result": ...} 또는 {"error": ...} 목록 (요청 순서 유지)
+        """
+        if not commands:
+            return []
+        if not self.session:
+            raise RuntimeError("Upstash Redis 세션이 초기화되지 않았습니다. connect()를 먼저 호출하세요.")
+        
+        if transaction:
+            return await self._send("/multi-exec", commands)
+        
+        results: List[Dict[str, Any]] = []
+        for start in range(0, len(commands), MAX_PIPELINE_COMMANDS):
+            results.extend(await self._send("/pipeline", commands[start:start + MAX_PIPELINE_COMMANDS]))
+        return results
+    
+    async def multi_exec(self, commands: List[list]) -> List[Dict[str, Any]]:
+        """여러 명령을 트랜잭션(MULTI/EXEC)으로 실행"""
+        return await self.execute_pipeline(commands, transaction=True)
+    
+    def _enqueue(self, command: list) -> "asyncio.Future":
+        """명령을 배치 큐에 추가 - 현재 이벤트 루프 틱이 끝나면 한 번에 전송"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._batch.append((command, future))
+        if len(self._batch) == 1:
+            loop.call_soon(self._dispatch_batch)
+        return future
+    
+    def _dispatch_batch(self) -> None:
+        batch, self._batch = self._batch, []
+        task = asyncio.ensure_future(self._flush_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _flush_batch(self, batch: List[Tuple[list, "asyncio.Future"]]) -> None:
+        try:
+            if len(batch) == 1:
+                results = [await self._send("", batch[0][0])]
+            else:
+                results = await self.execute_pipeline([command for command, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, dict) and "error" in result:
+                future.set_exception(Exception(f"Upstash API Error: {result['error']}"))
+            else:
+                future.set_result(result)
+    
     async def get(self, key: str) -> Optional[Any]:
         """캐시에서 값 가져오기"""
         if not await self.is_connected():
@@ -189,6 +290,181 @@ class UpstashRedisManager:
             logger.error(f"Upstash EXISTS 오류 - key: {key}, error: {e}")
             return False
     
+    @staticmethod
+    def _set_command(key: str, value: Any, ttl: int) -> list:
+        command = ["SET", key, encode_value(value)]
+        if ttl and ttl > 0:
+            command.extend(["EX", str(ttl)])
+        return command
+    
+    async def mget(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """여러 키를 MGET 한 번으로 조회 - 존재하는 키만 {key: value}로 반환"""
+        keys = list(dict.fromkeys(keys))
+        if not keys or not await self.is_connected():
+            return {}
+        
+        try:
+            result = await self._request(["MGET", *keys])
+            values = result.get("result") or []
+            return {key: decode_value(value) for key, value in zip(keys, values) if value is not None}
+            
+        except Exception as e:
+            logger.error(f"Upstash MGET 오류 - keys: {len(keys)}, error: {e}")
+            return {}
+    
+    async def mset_with_ttl(self, items: Dict[str, Any], ttl: int = 3600) -> bool:
+        """여러 키를 같은 TTL로 저장 - SET EX 명령을 /pipeline 요청 하나로 전송"""
+        if not items:
+            return True
+        if not await self.is_connected():
+            return False
+        
+        try:
+            results = await self.execute_pipeline(
+                [self._set_command(key, value, ttl) for key, value in items.items()]
+            )
+            return all(result.get("result") == "OK" for result in results)
+            
+        except Exception as e:
+            logger.error(f"Upstash MSET 오류 - keys: {len(items)}, error: {e}")
+            return False
+    
+    async def delete_many(self, keys: Iterable[str]) -> int:
+        """여러 키를 DEL 한 번으로 삭제 - 삭제된 키 수 반환"""
+        keys = list(dict.fromkeys(keys))
+        if not keys or not await self.is_connected():
+            return 0
+        
+        try:
+            result = await self._request(["DEL", *keys])
+            return result.get("result", 0)
+            
+        except Exception as e:
+            logger.error(f"Upstash DELETE 오류 - keys: {len(keys)}, error: {e}")
+            return 0
+    
+    async def zadd(self, key: str, mapping: Dict[str, float]) -> int:
+        """정렬 집합에 멤버 추가 (이미 있으면 점수 갱신) - 새로 추가된 멤버 수 반환"""
+        if not mapping or not await self.is_connected():
+            return 0
+        
+        try:
+            command = ["ZADD", key]
+            for member, score in mapping.items():
+                command.extend([str(score), member])
+            result = await self._request(command)
+            return result.get("result", 0)
+            
+        except Exception as e:
+            logger.error(f"Upstash ZADD 오류 - key: {key}, error: {e}")
+            return 0
+    
+    async def zrangebyscore(
+        self, key: str, min_score: Union[float, str], max_score: Union[float, str]
+    ) -> List[Tuple[str, float]]:
+        """점수 범위의 멤버를 (멤버, 점수) 목록으로 조회"""
+        if not await self.is_connected():
+            return []
+        
+        try:
+            result = await self._request(["ZRANGEBYSCORE", key, str(min_score), str(max_score), "WITHSCORES"])
+            flat = result.get("result") or []
+            return [(flat[i], float(flat[i + 1])) for i in range(0, len(flat) - 1, 2)]
+            
+        except Exception as e:
+            logger.error(f"Upstash ZRANGEBYSCORE 오류 - key: {key}, error: {e}")
+            return []
+    
+    async def zremrangebyscore(
+        self, key: str, min_score: Union[float, str], max_score: Union[float, str]
+    ) -> int:
+        """점수 범위의 멤버 삭제 - 삭제된 멤버 수 반환"""
+        if not await self.is_connected():
+            return 0
+        
+        try:
+            result = await self._request(["ZREMRANGEBYSCORE", key, str(min_score), str(max_score)])
+            return result.get("result", 0)
+            
+        except Exception as e:
+            logger.error(f"Upstash ZREMRANGEBYSCORE 오류 - key: {key}, error: {e}")
+            return 0
+    
+    async def zrevrange(self, key: str, start: int, stop: int) -> List[Tuple[str, float]]:
+        """점수 내림차순 순위 범위의 멤버를 (멤버, 점수) 목록으로 조회"""
+        if not await self.is_connected():
+            return []
+        
+        try:
+            result = await self._request(["ZREVRANGE", key, str(start), str(stop), "WITHSCORES"])
+            flat = result.get("result") or []
+            return [(flat[i], float(flat[i + 1])) for i in range(0, len(flat) - 1, 2)]
+            
+        except Exception as e:
+            logger.error(f"Upstash ZREVRANGE 오류 - key: {key}, error: {e}")
+            return []
+    
+    async def eval_script(self, script: str, keys: List[str], args: List[Any]) -> Any:
+        """Lua 스크립트를 원자적으로 실행 - 실패 시 None"""
+        if not await self.is_connected():
+            return None
+        
+        try:
+            result = await self._request(["EVAL", script, str(len(keys)), *keys, *[str(arg) for arg in args]])
+            if "error" in result:
+                raise RuntimeError(result["error"])
+            return result.get("result")
+            
+        except Exception as e:
+            logger.error(f"Upstash EVAL 오류 - keys: {keys}, error: {e}")
+            return None
+    
+    def pipeline(self) -> CachePipeline:
+        """여러 캐시 명령을 /pipeline 요청 하나로 실행하는 파이프라인"""
+        return CachePipeline(self._execute_ops)
+    
+    async def _execute_ops(self, ops: List[CacheOp]) -> List[Any]:
+        """파이프라인 명령 실행 - 실패한 명령은 단일 키 메서드의 실패 값으로 채움"""
+        failed = [failure_value(name) for name, _ in ops]
+        if not await self.is_connected():
+            return failed
+        
+        commands = []
+        for name, args in ops:
+            if name == "set":
+                commands.append(self._set_command(*args))
+            else:
+                commands.append([{"get": "GET", "delete": "DEL", "exists": "EXISTS"}[name], *args])
+        
+        try:
+            raw = await self.execute_pipeline(commands)
+        except Exception as e:
+            logger.error(f"Upstash PIPELINE 오류 - commands: {len(ops)}, error: {e}")
+            return failed
+        
+        return [
+            fallback if "error" in result else convert_result(name, result.get("result"))
+            for (name, _), result, fallback in zip(ops, raw, failed)
+        ]
+    
+    async def publish(self, channel: str, message: str) -> int:
+        """채널에 메시지 발행 (수신한 구독자 수 반환)"""
+        if not await self.is_connected():
+            return 0
+        
+        try:
+            result = await self._request(["PUBLISH", channel, message])
+            return result.get("result", 0)
+            
+        except Exception as e:
+            logger.error(f"Upstash PUBLISH 오류 - channel: {channel}, error: {e}")
+            return 0
+    
+    async def subscribe(self, channel: str) -> AsyncIterator[str]:
+        """채널 구독 - REST 클라이언트는 장기 연결 구독을 지원하지 않음"""
+        raise NotImplementedError("Upstash REST 클라이언트는 SUBSCRIBE를 지원하지 않습니다.")
+        yield  # pragma: no cover - async generator 시그니처 유지
+    
     async def health_check(self) -> dict:
         """Upstash Redis 상태 확인"""
         if not self.settings.cache_enabled:
@@ -223,19 +499,22 @@ class UpstashRedisManager:
                     "used_memory": info_dict.get("used_memory_human", "unknown"),
                     "connected_clients": info_dict.get("connected_clients", "0"),
                     "total_commands_processed": info_dict.get("total_commands_processed", "0"),
-                    "uptime_in_seconds": info_dict.get("uptime_in_seconds", "0")
+                    "uptime_in_seconds": info_dict.get("uptime_in_seconds", "0"),
+                    "circuit": self.health.snapshot()
                 }
             else:
                 return {
-                    "status": "disconnected",
+                    "status": "circuit_open" if self._connected else "disconnected",
                     "provider": "upstash",
-                    "message": "Upstash Redis 서버에 연결할 수 없습니다."
+                    "message": "Upstash Redis 서버에 연결할 수 없습니다.",
+                    "circuit": self.health.snapshot()
                 }
         except Exception as e:
             return {
                 "status": "error",
                 "provider": "upstash",
-                "message": f"Upstash Redis 상태 확인 중 오류: {str(e)}"
+                "message": f"Upstash Redis 상태 확인 중 오류: {str(e)}",
+                "circuit": self.health.snapshot()
             }
 
 
@@ -10,6 +10,8 @@ from nadle_backend.repositories.user_repository import UserRepository
 from nadle_backend.exceptions.auth import InvalidTokenError, ExpiredTokenError, InvalidTokenTypeError
 from nadle_backend.exceptions.user import UserNotFoundError
 from nadle_backend.config import get_settings
+from nadle_backend.services.cache_service import get_cache_service
+from beanie import PydanticObjectId
 
 
 # Security scheme for Bearer token authentication
@@ -80,6 +82,33 @@ def extract_token_from_header(
     return credentials.credentials
 
 
+async def load_user_principal(user_id: str, user_repository: UserRepository) -> User:
+    """Load the authenticated principal, served from the principal cache when possible.
+    
+    A cache hit returns a User built from the cached authorization fields only
+    (id, email, handle, names, status, is_admin) without touching MongoDB.
+    Handlers that need the full document must load it through a repository.
+    
+    Args:
+        user_id: User ID from the token subject
+        user_repository: User repository used on cache miss
+        
+    Returns:
+        User instance (partial on cache hit)
+        
+    Raises:
+        UserNotFoundError: If user not found
+    """
+    cache_service = await get_cache_service()
+    principal = await cache_service.get_principal(user_id)
+    if principal:
+        return User.model_construct(**{**principal, "id": PydanticObjectId(principal["id"])})
+    
+    user = await user_repository.get_by_id(user_id)
+    await cache_service.set_principal(user)
+    return user
+
+
 async def get_current_user(
     token: str = Depends(extract_token_from_header),
     jwt_manager: JWTManager = Depends(get_jwt_manager),
@@ -132,9 +161,8 @@ async def get_current_user(
         )
     
     try:
-        # Get user from database
-        user = await user_repository.get_by_id(user_id)
-        return user
+        # Get user from principal cache or database
+        return await load_user_principal(user_id, user_repository)
         
     except UserNotFoundError:
         raise HTTPException(
@@ -217,9 +245,8 @@ async def get_optional_current_user(
         if user_id is None:
             return None
             
-        # Get user from database
-        user = await user_repository.get_by_id(user_id)
-        return user
+        # Get user from principal cache or database
+        return await load_user_principal(user_id, user_repository)
         
     except (InvalidTokenError, ExpiredTokenError, InvalidTokenTypeError, UserNotFoundError):
         # If any authentication error occurs, return None instead of raising
@@ -0,0 +1,24 @@
+"""Request-scoped data loader dependencies for FastAPI."""
+
+from typing import AsyncIterator
+from nadle_backend.repositories.data_loader import (
+    RequestLoaders,
+    bind_request_loaders,
+    unbind_request_loaders,
+)
+
+
+async def provide_request_loaders() -> AsyncIterator[RequestLoaders]:
+    """Bind a fresh set of batching loaders for the duration of one request.
+    
+    Services pick them up with ``get_request_loaders()``, so every id lookup
+    made while handling the request shares one batch queue and memo.
+    
+    Yields:
+        RequestLoaders instance for the current request
+    """
+    loaders, token = bind_request_loaders()
+    try:
+        yield loaders
+    finally:
+        unbind_request_loaders(token)
@@ -7,11 +7,12 @@ from .user import (
 )
 from .auth import (
     InvalidTokenError, ExpiredTokenError, InvalidTokenTypeError,
-    MissingTokenError, InsufficientPermissionsError, ResourceOwnershipError
+    MissingTokenError, InsufficientPermissionsError, ResourceOwnershipError,
+    PasswordServiceBusyError
 )
 from .post import (
     PostNotFoundError, PostPermissionError, PostSlugAlreadyExistsError,
-    PostValidationError, PostCreateError, PostUpdateError, PostDeleteError
+    PostValidationError, PostCursorError, PostCreateError, PostUpdateError, PostDeleteError
 )
 from .comment import (
     CommentNotFoundError,
@@ -44,12 +45,14 @@ __all__ = [
     "MissingTokenError",
     "InsufficientPermissionsError",
     "ResourceOwnershipError",
+    "PasswordServiceBusyError",
     
     # Post
     "PostNotFoundError",
     "PostPermissionError",
     "PostSlugAlreadyExistsError",
     "PostValidationError",
+    "PostCursorError",
     "PostCreateError",
     "PostUpdateError",
     "PostDeleteError",
@@ -1,6 +1,6 @@
 """Authentication and authorization related exceptions."""
 
-from nadle_backend.exceptions.base import AuthenticationError, AuthorizationError
+from nadle_backend.exceptions.base import BaseAppException, AuthenticationError, AuthorizationError
 
 
 class InvalidTokenError(AuthenticationError):
@@ -60,4 +60,12 @@ class InvalidCredentialsError(AuthenticationError):
     """Exception raised when login credentials are invalid."""
     
     def __init__(self, message: str = "Invalid email or password"):
-        super().__init__(message)
\ No newline at end of file
+        super().__init__(message)
+
+
+class PasswordServiceBusyError(BaseAppException):
+    """Exception raised when the password hashing pool is saturated or timed out."""
+    
+    def __init__(self, message: str = "Authentication service is busy, please retry shortly", retry_after: int = 1):
+        self.retry_after = retry_after
+        super().__init__(message, error_code="PASSWORD_SERVICE_BUSY", status_code=503)
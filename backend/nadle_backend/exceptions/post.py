@@ -38,6 +38,13 @@ class PostValidationError(BaseAppException):
         super().__init__(message)
 
 
+class PostCursorError(BaseAppException):
+    """Raised when a pagination cursor is malformed or doesn't match the request."""
+    
+    def __init__(self, message: str = "Invalid pagination cursor"):
+        super().__init__(message, error_code="INVALID_CURSOR", status_code=400)
+
+
 class PostCreateError(BaseAppException):
     """Raised when post creation fails."""
     
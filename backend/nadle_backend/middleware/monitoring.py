@@ -2,54 +2,98 @@
 API 성능 모니터링 미들웨어
 
 요청별 응답시간, 상태코드, 엔드포인트 통계 추적
+
+요청 경로에서는 프로세스 메모리의 카운터/응답시간 히스토그램만 갱신하고(네트워크 호출 없음),
+모아 둔 메트릭은 flush_interval마다 Redis 파이프라인 한 번으로 기록합니다.
+
+응답시간은 라우트별·분 단위 구간별 병합 가능 히스토그램(api:latency:{endpoint}:{window})으로
+저장하므로 워커 간 HINCRBY로 합쳐지고, 대시보드 조회 비용은 샘플 수가 아닌 버킷 수에 비례합니다.
 """
 import time
 import json
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+from collections import deque
+from typing import Dict, Any, Optional, List, Tuple, Deque
 from datetime import datetime, timedelta
 import asyncio
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import redis.asyncio as redis
 
+from nadle_backend.monitoring.latency_histogram import LatencyHistogram, SUM_FIELD
+
 logger = logging.getLogger(__name__)
 
+SLOW_REQUESTS_KEY = "api:alerts:slow_requests"
+# 라우트에 매칭되지 않은 요청(404, 스캐너 경로)의 엔드포인트 라벨 - 메트릭 키 수를 라우트 수로 제한
+UNMATCHED_ROUTE = "<unmatched>"
+MAX_SLOW_REQUESTS = 100
+# 응답시간 히스토그램 구간 길이 (초)
+LATENCY_WINDOW_SECONDS = 60
+
 
 class PerformanceTracker:
     """
     API 성능 추적 클래스
     
-    Redis를 사용하여 실시간 성능 메트릭을 저장하고 분석합니다.
+    요청마다 메모리의 엔드포인트/상태코드 카운터와 응답시간 버퍼를 갱신하고,
+    flush()에서 모아 둔 메트릭을 Redis 파이프라인 한 번으로 저장합니다.
     """
     
     def __init__(
         self,
-        redis_client: redis.Redis,
+        redis_client: Optional[redis.Redis] = None,
         slow_request_threshold: float = 2.0,  # 2초
         error_rate_threshold: float = 0.05,   # 5%
         max_data_points: int = 1000,
         retention_hours: int = 24,
-        enabled: bool = True
+        enabled: bool = True,
+        flush_interval: float = 5.0,
+        redis_manager: Optional[Any] = None
     ):
         """
         성능 추적기 초기화
         
         Args:
-            redis_client: Redis 클라이언트
+            redis_client: Redis 클라이언트 (없으면 redis_manager의 클라이언트 사용)
             slow_request_threshold: 느린 요청 임계값 (초)
             error_rate_threshold: 에러율 임계값
-            max_data_points: 최대 데이터 포인트 수
+            max_data_points: 응답시간 히스토그램의 최대 버킷 수
             retention_hours: 데이터 보존 시간 (시간)
             enabled: 추적 활성화 여부
+            flush_interval: 메트릭을 Redis에 기록하는 주기 (초)
+            redis_manager: 공유 Redis 매니저 (재연결 후에도 현재 클라이언트를 사용)
         """
-        self.redis_client = redis_client
+        self._redis_client = redis_client
+        self._redis_manager = redis_manager
         self.slow_request_threshold = slow_request_threshold
         self.error_rate_threshold = error_rate_threshold
         self.max_data_points = max_data_points
         self.retention_hours = retention_hours
         self.enabled = enabled
+        self.flush_interval = flush_interval
+        
+        # 다음 flush까지 모아 두는 메트릭
+        self._endpoint_counts: Dict[Tuple[str, str], int] = {}
+        self._status_counts: Dict[int, int] = {}
+        self._latencies: Dict[Tuple[str, str, int], LatencyHistogram] = {}
+        self._slow_requests: Deque[str] = deque(maxlen=MAX_SLOW_REQUESTS)
+        
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def redis_client(self) -> Optional[redis.Redis]:
+        """지정한 클라이언트, 없으면 공유 Redis 매니저의 현재 클라이언트"""
+        if self._redis_client is not None:
+            return self._redis_client
+        return getattr(self._redis_manager, "redis_client", None)
+    
+    @property
+    def is_running(self) -> bool:
+        """주기적 flush 작업 실행 여부"""
+        return self._task is not None and not self._task.done()
     
     async def start_tracking(self, request: Request) -> Dict[str, Any]:
         """
@@ -77,7 +121,7 @@ class PerformanceTracker:
     
     async def end_tracking(self, tracking_data: Dict[str, Any], status_code: int) -> bool:
         """
-        요청 추적 종료 및 메트릭 저장
+        요청 추적 종료 및 메트릭 기록 (Redis 기록은 다음 flush에서)
         
         Args:
             tracking_data: 추적 시작 시 반환된 데이터
@@ -89,97 +133,161 @@ class PerformanceTracker:
         if not self.enabled or not tracking_data:
             return False
         
-        end_time = time.time()
-        response_time = end_time - tracking_data["start_time"]
+        return self.record(
+            tracking_data["method"],
+            tracking_data["path"],
+            status_code,
+            time.time() - tracking_data["start_time"],
+            user_agent=tracking_data.get("user_agent"),
+            client_ip=tracking_data.get("client_ip")
+        )
+    
+    def record(
+        self,
+        method: str,
+        path: str,
+        status_code: int,
+        response_time: float,
+        user_agent: Optional[str] = None,
+        client_ip: Optional[str] = None
+    ) -> bool:
+        """
+        요청 하나의 메트릭을 메모리에 기록 (I/O 없음)
         
-        # 메트릭 데이터 구성
-        metric_data = {
-            "endpoint": tracking_data["endpoint"],
-            "method": tracking_data["method"],
-            "path": tracking_data["path"],
-            "status_code": status_code,
-            "response_time": response_time,
-            "timestamp": end_time,
-            "user_agent": tracking_data.get("user_agent"),
-            "client_ip": tracking_data.get("client_ip"),
-        }
+        Returns:
+            bool: 느린 요청 여부
+        """
+        if not self.enabled:
+            return False
         
-        # Redis에 메트릭 저장
-        await self._store_metrics(metric_data)
+        # 키 문자열 생성은 flush에서 (요청 경로에서는 dict/히스토그램 갱신만)
+        now = time.time()
+        route = (method, path)
+        self._endpoint_counts[route] = self._endpoint_counts.get(route, 0) + 1
+        self._status_counts[status_code] = self._status_counts.get(status_code, 0) + 1
+        
+        window_key = (method, path, int(now) // LATENCY_WINDOW_SECONDS * LATENCY_WINDOW_SECONDS)
+        histogram = self._latencies.get(window_key)
+        if histogram is None:
+            histogram = self._latencies[window_key] = LatencyHistogram(max_buckets=self.max_data_points)
+        histogram.add(response_time)
         
-        # 느린 요청 감지
         is_slow = response_time > self.slow_request_threshold
         if is_slow:
-            await self._store_slow_request(metric_data)
+            endpoint = self._generate_endpoint_key(method, path)
+            self._record_slow_request(endpoint, response_time, now, status_code, user_agent, client_ip)
         
         return is_slow
     
-    async def _store_metrics(self, metric_data: Dict[str, Any]) -> None:
-        """메트릭 데이터 저장"""
-        try:
-            # 엔드포인트별 요청 수 증가
-            endpoint_key = self._generate_endpoint_key(
-                metric_data["method"], 
-                metric_data["path"]
-            )
-            await self.redis_client.hincrby("api:metrics:endpoints", endpoint_key, 1)
-            
-            # 상태코드별 요청 수 증가
-            status_key = self._generate_status_key(metric_data["status_code"])
-            await self.redis_client.hincrby("api:metrics:status_codes", status_key, 1)
-            
-            # 응답시간 데이터 저장 (최근 데이터만 유지)
-            timing_key = self._generate_timing_key(
-                metric_data["method"], 
-                metric_data["path"]
-            )
-            timing_data = json.dumps({
-                "response_time": metric_data["response_time"],
-                "timestamp": metric_data["timestamp"],
-                "status_code": metric_data["status_code"]
-            })
-            
-            await self.redis_client.lpush(f"api:timing:{timing_key}", timing_data)
-            await self.redis_client.ltrim(f"api:timing:{timing_key}", 0, self.max_data_points - 1)
-            
-            # 데이터 만료 시간 설정
-            await self.redis_client.expire(f"api:timing:{timing_key}", self.retention_hours * 3600)
-            
-        except Exception as e:
-            logger.error(f"Failed to store metrics: {e}")
+    def _record_slow_request(
+        self,
+        endpoint: str,
+        response_time: float,
+        timestamp: float,
+        status_code: int,
+        user_agent: Optional[str],
+        client_ip: Optional[str]
+    ) -> None:
+        """느린 요청 데이터 기록"""
+        slow_request_data = {
+            "endpoint": endpoint,
+            "response_time": response_time,
+            "timestamp": timestamp,
+            "status_code": status_code,
+        }
+        
+        # user_agent와 client_ip가 실제 값이면 추가 (Mock 객체가 아닌 경우)
+        if user_agent and isinstance(user_agent, str):
+            slow_request_data["user_agent"] = user_agent
+        if client_ip and isinstance(client_ip, str):
+            slow_request_data["client_ip"] = client_ip
+        
+        self._slow_requests.append(json.dumps(slow_request_data))
+        logger.warning(f"Slow request detected: {endpoint} took {response_time:.3f}s")
     
-    async def _store_slow_request(self, metric_data: Dict[str, Any]) -> None:
-        """느린 요청 데이터 저장"""
-        try:
-            # JSON 직렬화 가능한 데이터만 저장 (Mock 객체 제외)
-            slow_request_data = {
-                "endpoint": metric_data["endpoint"],
-                "response_time": metric_data["response_time"],
-                "timestamp": metric_data["timestamp"],
-                "status_code": metric_data["status_code"],
-            }
-            
-            # user_agent와 client_ip가 실제 값이면 추가 (Mock 객체가 아닌 경우)
-            user_agent = metric_data.get("user_agent")
-            if user_agent and isinstance(user_agent, str):
-                slow_request_data["user_agent"] = user_agent
-            
-            client_ip = metric_data.get("client_ip")
-            if client_ip and isinstance(client_ip, str):
-                slow_request_data["client_ip"] = client_ip
-            
-            slow_request_json = json.dumps(slow_request_data)
-            
-            await self.redis_client.lpush("api:alerts:slow_requests", slow_request_json)
-            await self.redis_client.ltrim("api:alerts:slow_requests", 0, 99)  # 최근 100개만 유지
-            
-            logger.warning(
-                f"Slow request detected: {metric_data['endpoint']} "
-                f"took {metric_data['response_time']:.3f}s"
-            )
-            
-        except Exception as e:
-            logger.error(f"Failed to store slow request alert: {e}")
+    def pending(self) -> int:
+        """아직 Redis에 기록되지 않은 요청 수"""
+        return sum(self._endpoint_counts.values())
+    
+    async def flush(self) -> int:
+        """
+        모아 둔 메트릭을 Redis 파이프라인 한 번으로 기록
+        
+        Returns:
+            int: 기록한 요청 수 (실패 시 0 - 카운터는 다음 flush에 다시 포함)
+        """
+        async with self._flush_lock:
+            if not self._endpoint_counts:
+                return 0
+            
+            redis_client = self.redis_client
+            if redis_client is None:
+                # Redis 미연결 (캐시 비활성화, REST 클라이언트) - 메모리가 계속 늘지 않도록 버림
+                self._endpoint_counts.clear()
+                self._status_counts.clear()
+                self._latencies.clear()
+                self._slow_requests.clear()
+                return 0
+            
+            endpoint_counts, self._endpoint_counts = self._endpoint_counts, {}
+            status_counts, self._status_counts = self._status_counts, {}
+            latencies, self._latencies = self._latencies, {}
+            slow_requests = list(self._slow_requests)
+            self._slow_requests.clear()
+            
+            try:
+                pipe = redis_client.pipeline(transaction=False)
+                for (method, path), count in endpoint_counts.items():
+                    pipe.hincrby("api:metrics:endpoints", self._generate_endpoint_key(method, path), count)
+                for status_code, count in status_counts.items():
+                    pipe.hincrby("api:metrics:status_codes", self._generate_status_key(status_code), count)
+                for (method, path, window), histogram in latencies.items():
+                    latency_key = self._generate_latency_key(self._generate_endpoint_key(method, path), window)
+                    for field, count in histogram.to_fields().items():
+                        pipe.hincrby(latency_key, field, count)
+                    pipe.hincrbyfloat(latency_key, SUM_FIELD, histogram.sum)
+                    pipe.expire(latency_key, self.retention_hours * 3600)
+                if slow_requests:
+                    pipe.lpush(SLOW_REQUESTS_KEY, *slow_requests)
+                    pipe.ltrim(SLOW_REQUESTS_KEY, 0, MAX_SLOW_REQUESTS - 1)
+                await pipe.execute()
+                return sum(endpoint_counts.values())
+                
+            except Exception as e:
+                logger.error(f"Failed to flush metrics: {e}")
+                # 카운터와 히스토그램을 되돌림 (느린 요청 샘플은 버려도 통계가 어긋나지 않음)
+                for window_key, histogram in latencies.items():
+                    current = self._latencies.get(window_key)
+                    if current is None:
+                        self._latencies[window_key] = histogram
+                    else:
+                        current.merge(histogram)
+                for route, count in endpoint_counts.items():
+                    self._endpoint_counts[route] = self._endpoint_counts.get(route, 0) + count
+                for status_code, count in status_counts.items():
+                    self._status_counts[status_code] = self._status_counts.get(status_code, 0) + count
+                return 0
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+    
+    def start(self) -> None:
+        """주기적 flush 작업 시작 (이벤트 루프 안에서 호출)"""
+        if self.enabled and not self.is_running:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """flush 작업 중지 후 남은 메트릭 기록"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
     
     def _generate_endpoint_key(self, method: str, path: str) -> str:
         """엔드포인트 키 생성"""
@@ -189,9 +297,32 @@ class PerformanceTracker:
         """상태코드 키 생성"""
         return f"status:{status_code}"
     
-    def _generate_timing_key(self, method: str, path: str) -> str:
-        """타이밍 키 생성"""
-        return f"api:metrics:timing:{method}:{path}"
+    def _generate_latency_key(self, endpoint: str, window: int) -> str:
+        """응답시간 히스토그램 키 생성 (window: 구간 시작 epoch 초)"""
+        return f"api:latency:{endpoint}:{window}"
+    
+    def _window_starts(self, minutes: int) -> List[int]:
+        """최근 minutes분에 걸친 히스토그램 구간 시작 시각 (오래된 순)"""
+        now = int(time.time())
+        current = now // LATENCY_WINDOW_SECONDS * LATENCY_WINDOW_SECONDS
+        count = max(1, -(-minutes * 60 // LATENCY_WINDOW_SECONDS))
+        return [current - i * LATENCY_WINDOW_SECONDS for i in range(count - 1, -1, -1)]
+    
+    async def _load_histograms(self, endpoint: str, minutes: int) -> List[Tuple[int, LatencyHistogram]]:
+        """구간별 히스토그램을 파이프라인 한 번으로 조회 - 비어 있는 구간은 제외"""
+        windows = self._window_starts(minutes)
+        pipe = self.redis_client.pipeline(transaction=False)
+        for window in windows:
+            pipe.hgetall(self._generate_latency_key(endpoint, window))
+        results = await pipe.execute()
+        
+        histograms = []
+        for window, fields in zip(windows, results):
+            if fields:
+                histogram = LatencyHistogram.from_fields(fields, max_buckets=self.max_data_points)
+                if histogram.count:
+                    histograms.append((window, histogram))
+        return histograms
     
     async def get_metrics(self) -> Dict[str, Any]:
         """전체 메트릭 조회"""
@@ -232,53 +363,15 @@ class PerformanceTracker:
             logger.error(f"Failed to get metrics: {e}")
             return {"endpoints": {}, "status_codes": {}, "timestamp": time.time()}
     
-    async def get_realtime_stats(self, endpoint: str) -> Dict[str, Any]:
-        """실시간 통계 계산"""
+    async def get_realtime_stats(self, endpoint: str, minutes: int = 60) -> Dict[str, Any]:
+        """최근 minutes분 응답시간 통계 (구간별 히스토그램을 병합해 평균/분위수 계산)"""
         try:
-            timing_key = f"api:timing:{endpoint}"
-            raw_data = await self.redis_client.lrange(timing_key, 0, -1)
-            
-            if not raw_data:
-                return {
-                    "avg_response_time": 0,
-                    "min_response_time": 0,
-                    "max_response_time": 0,
-                    "request_count": 0
-                }
-            
-            response_times = []
-            for data in raw_data:
-                try:
-                    # data가 bytes인지 string인지 확인 (Mock vs Real Redis)
-                    data_str = data.decode() if hasattr(data, 'decode') else data
-                    parsed = json.loads(data_str)
-                    response_times.append(parsed["response_time"])
-                except (json.JSONDecodeError, KeyError):
-                    continue
-            
-            if not response_times:
-                return {
-                    "avg_response_time": 0,
-                    "min_response_time": 0,
-                    "max_response_time": 0,
-                    "request_count": 0
-                }
-            
-            return {
-                "avg_response_time": sum(response_times) / len(response_times),
-                "min_response_time": min(response_times),
-                "max_response_time": max(response_times),
-                "request_count": len(response_times)
-            }
+            histograms = await self._load_histograms(endpoint, minutes)
+            return LatencyHistogram.merged(h for _, h in histograms).summary()
             
         except Exception as e:
             logger.error(f"Failed to get realtime stats: {e}")
-            return {
-                "avg_response_time": 0,
-                "min_response_time": 0,
-                "max_response_time": 0,
-                "request_count": 0
-            }
+            return LatencyHistogram().summary()
     
     async def calculate_error_rate(self) -> float:
         """전체 에러율 계산"""
@@ -317,35 +410,20 @@ class PerformanceTracker:
             return 0.0
     
     async def get_time_series_metrics(self, endpoint: str, minutes: int = 60) -> Dict[str, List]:
-        """시간별 메트릭 조회"""
+        """시간별 메트릭 조회 - 분 단위 구간별 평균/p95 응답시간과 요청 수"""
+        empty = {"timestamps": [], "response_times": [], "p95_response_times": [], "request_counts": []}
         try:
-            timing_key = f"api:timing:{endpoint}"
-            raw_data = await self.redis_client.lrange(timing_key, 0, -1)
-            
-            timestamps = []
-            response_times = []
-            
-            cutoff_time = time.time() - (minutes * 60)
-            
-            for data in raw_data:
-                try:
-                    # data가 bytes인지 string인지 확인 (Mock vs Real Redis)
-                    data_str = data.decode() if hasattr(data, 'decode') else data
-                    parsed = json.loads(data_str)
-                    if parsed["timestamp"] >= cutoff_time:
-                        timestamps.append(parsed["timestamp"])
-                        response_times.append(parsed["response_time"])
-                except (json.JSONDecodeError, KeyError):
-                    continue
-            
+            histograms = await self._load_histograms(endpoint, minutes)
             return {
-                "timestamps": timestamps,
-                "response_times": response_times
+                "timestamps": [window for window, _ in histograms],
+                "response_times": [h.mean for _, h in histograms],
+                "p95_response_times": [h.quantile(0.95) for _, h in histograms],
+                "request_counts": [h.count for _, h in histograms]
             }
             
         except Exception as e:
             logger.error(f"Failed to get time series metrics: {e}")
-            return {"timestamps": [], "response_times": []}
+            return empty
     
     async def get_health_metrics(self) -> Dict[str, Any]:
         """헬스체크 메트릭 조회"""
@@ -428,74 +506,102 @@ class PerformanceTracker:
             return []
 
 
-class MonitoringMiddleware(BaseHTTPMiddleware):
+class MonitoringMiddleware:
     """
-    FastAPI 성능 모니터링 미들웨어
+    FastAPI 성능 모니터링 미들웨어 (순수 ASGI)
     
-    모든 요청에 대해 성능 메트릭을 수집합니다.
+    모든 HTTP 요청의 응답시간/상태코드를 메모리에 기록합니다.
+    Redis 기록은 PerformanceTracker의 주기적 flush가 담당하며,
+    lifespan 종료 시 남은 메트릭을 기록합니다.
     """
     
-    def __init__(self, app, redis_client: Optional[redis.Redis] = None):
+    def __init__(
+        self,
+        app: ASGIApp,
+        redis_client: Optional[redis.Redis] = None,
+        flush_interval: Optional[float] = None
+    ):
         """
         미들웨어 초기화
         
         Args:
-            app: FastAPI 애플리케이션
-            redis_client: Redis 클라이언트 (선택적)
+            app: ASGI 애플리케이션
+            redis_client: Redis 클라이언트 (선택적, 없으면 공유 Redis 매니저의 연결 사용)
+            flush_interval: 메트릭 기록 주기 (초, 기본값은 설정의 monitoring_flush_interval)
         """
-        super().__init__(app)
-        self.redis_client = redis_client or self._get_default_redis_client()
-        self.tracker = PerformanceTracker(self.redis_client) if self.redis_client else None
+        from nadle_backend.config import settings
+        from nadle_backend.database.redis_factory import redis_factory
+        
+        self.app = app
+        if flush_interval is None:
+            flush_interval = settings.monitoring_flush_interval
+        # 별도 연결을 만들지 않고 공유 매니저의 클라이언트를 flush 시점에 사용 (lifespan에서 연결됨)
+        redis_manager = None if redis_client is not None else redis_factory.get_redis_manager()
+        self.tracker = PerformanceTracker(
+            redis_client, flush_interval=flush_interval, redis_manager=redis_manager
+        )
     
-    def _get_default_redis_client(self) -> Optional[redis.Redis]:
-        """기본 Redis 클라이언트 생성"""
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self.app(scope, self._lifespan_receive(receive), send)
+            return
+        
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        if not self.tracker.is_running:
+            self.tracker.start()
+        
+        start_time = time.perf_counter()
+        # 응답 시작 전에 예외가 나면 500으로 기록
+        status_code = 500
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
         try:
-            from nadle_backend.config import settings
-            return redis.from_url(settings.redis_url)
-        except Exception as e:
-            logger.warning(f"Failed to create Redis client: {e}")
-            return None
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.tracker.record(
+                scope["method"],
+                self._route_path(scope),
+                status_code,
+                time.perf_counter() - start_time,
+                user_agent=self._header(scope, b"user-agent"),
+                client_ip=scope["client"][0] if scope.get("client") else None
+            )
     
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """
-        요청 처리 및 성능 추적
+    def _lifespan_receive(self, receive: Receive) -> Receive:
+        """lifespan 종료 메시지를 받으면 남은 메트릭을 기록"""
+        async def wrapped() -> Message:
+            message = await receive()
+            if message["type"] == "lifespan.shutdown":
+                await self.tracker.stop()
+            return message
+        return wrapped
+    
+    @staticmethod
+    def _route_path(scope: Scope) -> str:
+        """라우트 템플릿 경로 (예: /api/posts/{slug_or_id}) - 엔드포인트 수를 라우트 수로 제한
         
-        Args:
-            request: FastAPI 요청 객체
-            call_next: 다음 미들웨어/핸들러
-            
-        Returns:
-            Response: HTTP 응답
+        매칭된 라우트가 없으면 원래 경로 대신 UNMATCHED_ROUTE 하나로 기록합니다.
         """
-        # 추적 시작
-        tracking_data = {}
-        if self.tracker:
-            tracking_data = await self.tracker.start_tracking(request)
-        
-        try:
-            # 다음 미들웨어/핸들러 호출
-            response = await call_next(request)
-            
-            # 추적 종료
-            if self.tracker and tracking_data:
-                await self.tracker.end_tracking(tracking_data, response.status_code)
-            
-            return response
-            
-        except Exception as e:
-            # 에러 발생 시에도 추적
-            if self.tracker and tracking_data:
-                await self.tracker.end_tracking(tracking_data, 500)
-            
-            # 에러 재발생
-            raise
+        route = scope.get("route")
+        return getattr(route, "path_format", None) or UNMATCHED_ROUTE
+    
+    @staticmethod
+    def _header(scope: Scope, name: bytes) -> Optional[str]:
+        for key, value in scope.get("headers") or ():
+            if key == name:
+                return value.decode("latin-1")
+        return None
 
 
 def get_redis_client() -> Optional[redis.Redis]:
-    """Redis 클라이언트 팩토리 함수"""
-    try:
-        from nadle_backend.config import settings
-        return redis.from_url(settings.redis_url)
-    except Exception as e:
-        logger.warning(f"Failed to create Redis client: {e}")
-        return None
\ No newline at end of file
+    """공유 Redis 매니저의 클라이언트 반환 (연결 전이거나 REST 클라이언트면 None)"""
+    from nadle_backend.database.redis_factory import redis_factory
+    return getattr(redis_factory.get_redis_manager(), "redis_client", None)
\ No newline at end of file
@@ -141,6 +141,7 @@ class Post(Document, PostBase):
     content_type: ContentType = "text"
     content_rendered: Optional[str] = None  # Rendered HTML
     content_text: Optional[str] = None  # Plain text for search
+    search_terms: Optional[Dict[str, str]] = None  # Tokenized title/tags/body for text index
     word_count: Optional[int] = None
     reading_time: Optional[int] = None  # Minutes
     
@@ -197,6 +198,10 @@ class Comment(Document, CommentBase):
     dislike_count: int = 0  # Aggregated count from UserReaction
     reply_count: int = 0  # Count of replies to this comment
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict)
+    # Materialized ancestry, written on create (backfill: nadle-backend backfill-comment-tree)
+    root_id: Optional[str] = None  # Top-level comment ID (itself for top-level comments)
+    depth: int = 0  # 0 for top-level comments
+    path: List[str] = Field(default_factory=list)  # Ancestor IDs from root to direct parent
     
     class Settings:
         name = settings.comments_collection
@@ -204,6 +209,8 @@ class Comment(Document, CommentBase):
             [("parent_id", ASCENDING), ("created_at", ASCENDING)],
             [("author_id", ASCENDING), ("created_at", DESCENDING)],
             [("parent_comment_id", ASCENDING)],
+            [("root_id", ASCENDING), ("status", ASCENDING), ("created_at", ASCENDING)],  # 스레드 일괄 조회
+            [("path", ASCENDING)],  # 하위 답글 조회
             [("parent_id", ASCENDING), ("metadata.subtype", ASCENDING), ("status", ASCENDING)]  # 통계 집계 최적화
         ]
     
@@ -262,6 +269,8 @@ class FileRecord(Document):
     file_path: str
     file_size: int
     content_type: str
+    sha256: Optional[str] = None  # Shared blob reference (hex digest of the content)
+    variants: Dict[str, Dict[str, Any]] = Field(default_factory=dict)  # Resized images keyed by "<format>_<width>"
     attachment_type: Optional[str] = None
     attachment_id: Optional[str] = None
     uploaded_by: Optional[str] = None
@@ -274,10 +283,24 @@ class FileRecord(Document):
         indexes = [
             [("file_id", ASCENDING)],
             [("attachment_type", ASCENDING), ("attachment_id", ASCENDING)],
-            [("uploaded_by", ASCENDING), ("created_at", DESCENDING)]
+            [("uploaded_by", ASCENDING), ("created_at", DESCENDING)],
+            [("sha256", ASCENDING)]
         ]
 
 
+class FileBlob(Document):
+    """Content-addressed file blob shared by every FileRecord with the same content."""
+    sha256: str = Indexed(unique=True)
+    file_path: str
+    file_size: int
+    content_type: str
+    ref_count: int = 0  # Number of FileRecords referencing this blob
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    
+    class Settings:
+        name = settings.file_blobs_collection
+
+
 class Stats(Document):
     """Statistics document model for tracking metrics."""
     entity_id: str  # ID of user, post, etc.
@@ -345,7 +368,7 @@ class UserResponse(UserBase):
 
 class PostCreate(PostBase):
     """Model for creating a new post."""
-    pass
+    content_type: Optional[ContentType] = None  # Detected from content when omitted
 
 
 class PostUpdate(BaseModel):
@@ -355,6 +378,7 @@ class PostUpdate(BaseModel):
     service: Optional[ServiceType] = None
     metadata: Optional[PostMetadata] = None
     status: Optional[PostStatus] = None
+    content_type: Optional[ContentType] = None
 
 
 class PostListItem(BaseModel):
@@ -380,6 +404,10 @@ class PostDetailResponse(BaseModel):
     slug: str
     author_id: str
     content: str
+    content_type: ContentType = "text"
+    content_rendered: Optional[str] = None  # Sanitized HTML rendered on write
+    word_count: Optional[int] = None
+    reading_time: Optional[int] = None
     service: ServiceType
     metadata: PostMetadata
     stats: Dict[str, int]  # All stats including bookmark_count
@@ -397,6 +425,10 @@ class PostResponse(PostBase):
     slug: str
     author_id: str
     status: PostStatus
+    content_type: ContentType = "text"
+    content_rendered: Optional[str] = None
+    word_count: Optional[int] = None
+    reading_time: Optional[int] = None
     created_at: datetime
     updated_at: datetime
     published_at: Optional[datetime]
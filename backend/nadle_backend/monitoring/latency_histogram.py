@@ -0,0 +1,157 @@
+"""
+병합 가능한 응답시간 히스토그램 (DDSketch 방식 로그 버킷)
+
+값 v를 gamma = (1 + α) / (1 - α)의 거듭제곱 구간 ceil(log_gamma(v))에 세어 두면
+모든 분위수를 상대 오차 α 이내로 계산할 수 있습니다.
+
+- 버킷별 카운트만 저장하므로 같은 α의 히스토그램은 버킷별 합으로 병합 가능
+  (워커 간, 시간 구간 간 병합 모두 Redis HINCRBY로 처리)
+- 버킷 수가 max_buckets를 넘으면 가장 낮은 버킷들을 합쳐 메모리를 고정
+- 분위수/평균 계산은 O(버킷 수)이며 샘플 수와 무관
+"""
+import math
+from typing import Dict, Iterable, Mapping, Optional
+
+# 기본 상대 오차 1% (p99 100ms → 99~101ms)
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 2048
+# 1µs 미만은 같은 버킷으로 취급 (0초 응답 방지)
+MIN_TRACKED_VALUE = 1e-6
+
+COUNT_FIELD = "count"
+SUM_FIELD = "sum"
+
+
+class LatencyHistogram:
+    """로그 버킷 기반 응답시간 히스토그램 (단위: 초)"""
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_buckets: int = DEFAULT_MAX_BUCKETS
+    ):
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def bucket_index(self, value: float) -> int:
+        """값이 속하는 버킷 번호"""
+        return math.ceil(math.log(max(value, MIN_TRACKED_VALUE)) / self._log_gamma)
+
+    def bucket_value(self, index: int) -> float:
+        """버킷 대표값 (구간 (gamma^(i-1), gamma^i]의 상대 오차 최소 지점)"""
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """응답시간 기록"""
+        index = self.bucket_index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += count
+        self.sum += value * count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """다른 히스토그램을 합침 (같은 relative_accuracy여야 함)"""
+        if other.gamma != self.gamma:
+            raise ValueError("relative_accuracy가 다른 히스토그램은 병합할 수 없습니다.")
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.sum += other.sum
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def _collapse(self) -> None:
+        """가장 낮은 버킷들을 하나로 합쳐 버킷 수를 max_buckets로 제한"""
+        indices = sorted(self.buckets)
+        overflow = indices[:len(indices) - self.max_buckets + 1]
+        target = overflow[-1]
+        self.buckets[target] = sum(self.buckets.pop(index) for index in overflow[:-1]) + self.buckets[target]
+
+    def quantile(self, q: float) -> float:
+        """분위수 (0 <= q <= 1) - 비어 있으면 0"""
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                return self.bucket_value(index)
+        return self.bucket_value(max(self.buckets))
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    @property
+    def min(self) -> float:
+        return self.bucket_value(min(self.buckets)) if self.buckets else 0.0
+
+    @property
+    def max(self) -> float:
+        return self.bucket_value(max(self.buckets)) if self.buckets else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        """대시보드용 요약 통계"""
+        return {
+            "avg_response_time": self.mean,
+            "min_response_time": self.min,
+            "max_response_time": self.max,
+            "p50_response_time": self.quantile(0.5),
+            "p95_response_time": self.quantile(0.95),
+            "p99_response_time": self.quantile(0.99),
+            "request_count": self.count
+        }
+
+    # === Redis 해시 변환 ===
+
+    def to_fields(self) -> Dict[str, int]:
+        """Redis 해시 필드 (HINCRBY로 누적하면 병합됨) - 합계는 SUM_FIELD로 따로 기록"""
+        fields = {str(index): count for index, count in self.buckets.items()}
+        fields[COUNT_FIELD] = self.count
+        return fields
+
+    @classmethod
+    def from_fields(
+        cls,
+        fields: Mapping,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_buckets: int = DEFAULT_MAX_BUCKETS
+    ) -> "LatencyHistogram":
+        """Redis HGETALL 결과로 복원 (bytes/str 모두 허용)"""
+        histogram = cls(relative_accuracy, max_buckets)
+        for raw_key, raw_value in fields.items():
+            key = raw_key.decode() if hasattr(raw_key, "decode") else raw_key
+            value = raw_value.decode() if hasattr(raw_value, "decode") else raw_value
+            if key == COUNT_FIELD:
+                histogram.count += int(value)
+            elif key == SUM_FIELD:
+                histogram.sum += float(value)
+            else:
+                try:
+                    index = int(key)
+                except ValueError:
+                    continue
+                histogram.buckets[index] = histogram.buckets.get(index, 0) + int(value)
+        if len(histogram.buckets) > histogram.max_buckets:
+            histogram._collapse()
+        return histogram
+
+    @classmethod
+    def merged(cls, histograms: Iterable["LatencyHistogram"], **kwargs) -> "LatencyHistogram":
+        """여러 히스토그램을 병합한 새 히스토그램"""
+        result: Optional[LatencyHistogram] = None
+        for histogram in histograms:
+            if result is None:
+                result = cls(histogram.relative_accuracy, histogram.max_buckets)
+            result.merge(histogram)
+        return result if result is not None else cls(**kwargs)
@@ -1,5 +1,6 @@
 """Comment repository for data access layer."""
 
+import logging
 from typing import List, Dict, Optional, Tuple, Any, Literal
 from datetime import datetime
 from beanie import PydanticObjectId
@@ -14,17 +15,29 @@ COMMENT_SUBTYPES = {
     "service_review": "service_review"
 }
 
+logger = logging.getLogger(__name__)
+
 
 class CommentRepository:
     """Repository for comment data access operations."""
     
-    async def create(self, comment_data: CommentCreate, author_id: str, parent_id: str) -> Comment:
+    async def create(
+        self,
+        comment_data: CommentCreate,
+        author_id: str,
+        parent_id: str,
+        parent_comment: Optional[Comment] = None
+    ) -> Comment:
         """Create a new comment.
         
+        Root ID, depth and ancestor path are written with the comment so that
+        threads can be loaded in one query.
+        
         Args:
             comment_data: Comment creation data
             author_id: ID of the comment author
             parent_id: ID of the parent post
+            parent_comment: Parent comment if the caller already loaded it
             
         Returns:
             Created comment instance
@@ -32,13 +45,22 @@ class CommentRepository:
         Raises:
             CommentDepthExceededError: If reply depth exceeds limit
         """
+        comment_id = PydanticObjectId()
+        tree = {"root_id": str(comment_id), "depth": 0, "path": []}
+        
         # Check reply depth if this is a reply to another comment
         if comment_data.parent_comment_id:
             settings = get_settings()
-            await self._validate_reply_depth(comment_data.parent_comment_id, settings.max_comment_depth)
+            tree = await self._validate_reply_depth(
+                comment_data.parent_comment_id,
+                settings.max_comment_depth,
+                parent_comment=parent_comment
+            )
         
         # Create comment document
         comment = Comment(
+            id=comment_id,
+            **tree,
             content=comment_data.content,
             parent_type="post",
             parent_id=parent_id,
@@ -177,17 +199,14 @@ class CommentRepository:
             "status": status
         }
         
-        print(f"🔍 [DEBUG] get_replies 쿼리: parent_comment_id={parent_comment_id}, status={status}")
-        replies = await Comment.find(query).sort("created_at").to_list()
-        print(f"🔍 [DEBUG] get_replies 결과: {len(replies)}개 답글 발견")
-        for reply in replies:
-            print(f"    답글: id={reply.id}, content={reply.content[:30]}..., parent_comment_id={reply.parent_comment_id}")
-        
-        return replies
+        return await Comment.find(query).sort("created_at").to_list()
     
     async def get_replies_recursive(self, parent_comment_id: str, status: str = "active", max_depth: int = 3, current_depth: int = 0) -> List[Dict[str, Any]]:
         """Get replies to a comment recursively with nested structure.
         
+        The whole subtree is fetched with one query on the ancestor path and
+        assembled in memory.
+        
         Args:
             parent_comment_id: Parent comment ID
             status: Filter by status
@@ -199,27 +218,18 @@ class CommentRepository:
         """
         if current_depth >= max_depth:
             return []
-            
-        # Get direct replies to this comment
-        replies = await self.get_replies(parent_comment_id, status)
-        
-        replies_with_nested = []
-        for reply in replies:
-            # Get nested replies for each reply
-            nested_replies = await self.get_replies_recursive(
-                str(reply.id), 
-                status, 
-                max_depth, 
-                current_depth + 1
-            )
-            
-            reply_dict = {
-                "comment": reply,
-                "replies": nested_replies
-            }
-            replies_with_nested.append(reply_dict)
         
-        return replies_with_nested
+        query = {
+            "path": parent_comment_id,
+            "status": status
+        }
+        descendants = await Comment.find(query).sort("created_at").to_list()
+        
+        return self._build_reply_tree(
+            self._group_by_parent(descendants),
+            parent_comment_id,
+            max_depth - current_depth
+        )
     
     async def get_comments_with_replies(
         self,
@@ -231,6 +241,9 @@ class CommentRepository:
     ) -> Tuple[List[Dict[str, Any]], int]:
         """Get comments with their replies in hierarchical structure.
         
+        Replies for the whole page are fetched with a single query on root_id
+        and assembled into trees in memory.
+        
         Args:
             post_id: Post ID
             page: Page number
@@ -249,20 +262,52 @@ class CommentRepository:
             status=status
         )
         
-        comments_with_replies = []
+        if not top_comments or max_depth <= 0:
+            return [{"comment": comment, "replies": []} for comment in top_comments], total
         
-        for comment in top_comments:
-            # Get replies for this comment recursively
-            replies = await self.get_replies_recursive(str(comment.id), status=status, max_depth=max_depth)
-            
-            comment_dict = {
+        # Get every reply of every thread on this page at once
+        replies = await Comment.find({
+            "root_id": {"$in": [str(comment.id) for comment in top_comments]},
+            "status": status,
+            "depth": {"$gt": 0, "$lte": max_depth}
+        }).sort("created_at").to_list()
+        children = self._group_by_parent(replies)
+        
+        comments_with_replies = [
+            {
                 "comment": comment,
-                "replies": replies
+                "replies": self._build_reply_tree(children, str(comment.id), max_depth)
             }
-            comments_with_replies.append(comment_dict)
+            for comment in top_comments
+        ]
         
         return comments_with_replies, total
     
+    @staticmethod
+    def _group_by_parent(comments: List[Comment]) -> Dict[str, List[Comment]]:
+        """Group comments by parent comment ID, keeping query order."""
+        children: Dict[str, List[Comment]] = {}
+        for comment in comments:
+            children.setdefault(comment.parent_comment_id, []).append(comment)
+        return children
+    
+    def _build_reply_tree(
+        self,
+        children: Dict[str, List[Comment]],
+        parent_comment_id: str,
+        levels: int
+    ) -> List[Dict[str, Any]]:
+        """Build nested reply dictionaries down to the given number of levels."""
+        if levels <= 0:
+            return []
+        return [
+            {
+                "comment": reply,
+                "replies": self._build_reply_tree(children, str(reply.id), levels - 1)
+            }
+            for reply in children.get(parent_comment_id, [])
+        ]
+    
     async def count_by_post(self, post_id: str, status: str = "active") -> int:
         """Count comments for a post.
         
@@ -297,33 +342,48 @@ class CommentRepository:
         except Exception:
             return False
     
-    async def _validate_reply_depth(self, parent_comment_id: str, max_depth: int = 3) -> None:
+    async def _validate_reply_depth(
+        self,
+        parent_comment_id: str,
+        max_depth: int = 3,
+        parent_comment: Optional[Comment] = None
+    ) -> Dict[str, Any]:
         """Validate that reply depth doesn't exceed maximum.
         
+        Uses the parent's stored depth and path; only comments written before
+        the tree fields existed fall back to walking the parent chain.
+        
         Args:
             parent_comment_id: Parent comment ID
             max_depth: Maximum allowed depth
+            parent_comment: Parent comment if already loaded
+            
+        Returns:
+            Tree fields (root_id, depth, path) for the new reply
             
         Raises:
             CommentDepthExceededError: If depth exceeds limit
             CommentNotFoundError: If parent comment not found
         """
-        current_depth = 1
-        current_comment_id = parent_comment_id
-        
-        while current_comment_id and current_depth < max_depth:
-            parent_comment = await self.get_by_id(current_comment_id)
-            if parent_comment.parent_comment_id:
-                current_depth += 1
-                current_comment_id = parent_comment.parent_comment_id
-            else:
-                break
-        
-        if current_depth >= max_depth:
+        parent = parent_comment or await self.get_by_id(parent_comment_id)
+        
+        if parent.root_id:
+            path = list(parent.path) + [str(parent.id)]
+        else:
+            # Legacy comment without tree fields: walk up to the root
+            chain = [parent]
+            while chain[-1].parent_comment_id and len(chain) <= max_depth:
+                chain.append(await self.get_by_id(chain[-1].parent_comment_id))
+            path = [str(comment.id) for comment in reversed(chain)]
+        
+        depth = len(path)
+        if depth >= max_depth:
             raise CommentDepthExceededError(
                 max_depth=max_depth, 
-                current_depth=current_depth + 1
+                current_depth=depth + 1
             )
+        
+        return {"root_id": path[0], "depth": depth, "path": path}
     
     async def get_user_reactions(self, user_id: str, comment_ids: List[str]) -> Dict[str, Dict[str, bool]]:
         """Get user reactions for comments.
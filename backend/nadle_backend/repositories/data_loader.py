@@ -0,0 +1,243 @@
+"""요청 범위 배치 로더 (DataLoader)
+
+같은 이벤트 루프 틱 안에서 들어온 ID 조회를 모아 한 번의 `$in` 쿼리로 처리합니다.
+
+사용 예:
+    loaders = get_request_loaders()
+    authors = await asyncio.gather(*(loaders.users.load(c.author_id) for c in comments))
+    # → User.find({"_id": {"$in": [...]}}) 1회
+
+- load(key)는 키를 큐에 넣고 loop.call_soon으로 배치 실행을 예약한 뒤 Future를 반환
+- 배치 태스크는 완료될 때까지 로더가 참조를 보관
+- 같은 요청 안에서 같은 키는 메모이즈되어 두 번 조회하지 않음
+- 요청 범위는 ContextVar로 관리 (dependencies.data_loaders.provide_request_loaders)
+- 요청 범위 밖에서는 호출마다 새 로더를 만들어 배치만 적용하고 메모는 공유하지 않음
+"""
+
+import asyncio
+import logging
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Iterable, List, Optional, Set, Tuple, TypeVar
+
+from bson import ObjectId
+
+from nadle_backend.models.core import Post, User, UserReaction
+from nadle_backend.database.layered_cache import get_layered_cache
+from nadle_backend.database.cache_tags import author_tag
+from nadle_backend.database.redis_factory import get_prefixed_key
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# 작성자 정보 캐시 TTL (posts_service의 author_info 캐시와 동일)
+AUTHOR_INFO_TTL = 3600
+
+
+class DataLoader(Generic[K, V]):
+    """같은 틱의 load() 호출을 모아 batch_fn 한 번으로 처리하는 로더
+
+    batch_fn은 키 목록을 받아 {키: 값} 딕셔너리를 반환합니다.
+    결과에 없는 키는 None으로 해석됩니다.
+    """
+
+    def __init__(self, batch_fn: Callable[[List[K]], Awaitable[Dict[K, V]]], max_batch_size: int = 500):
+        self._batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self._cache: Dict[K, asyncio.Future] = {}
+        self._queue: List[K] = []
+        # 실행 중인 배치 태스크 - 참조를 유지해 완료 전에 GC되지 않게 함
+        self._tasks: Set[asyncio.Task] = set()
+        self.batch_count = 0
+
+    def load(self, key: K) -> "asyncio.Future[Optional[V]]":
+        """키 하나 조회 - 같은 틱에 들어온 키들과 함께 배치 실행"""
+        future = self._cache.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._cache[key] = future
+        if not self._queue:
+            loop.call_soon(self._dispatch)
+        self._queue.append(key)
+        return future
+
+    async def load_many(self, keys: Iterable[K]) -> Dict[K, Optional[V]]:
+        """여러 키 조회 - {키: 값 또는 None}"""
+        keys = list(dict.fromkeys(keys))
+        values = await asyncio.gather(*(self.load(key) for key in keys))
+        return dict(zip(keys, values))
+
+    def prime(self, key: K, value: V) -> None:
+        """이미 알고 있는 값을 메모에 등록 (다음 load는 조회하지 않음)"""
+        if key not in self._cache:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._cache[key] = future
+
+    def clear(self, key: Optional[K] = None) -> None:
+        """메모 삭제 (key가 없으면 전체)"""
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+
+    def _dispatch(self) -> None:
+        queue, self._queue = self._queue, []
+        for start in range(0, len(queue), self.max_batch_size):
+            task = asyncio.ensure_future(self._run_batch(queue[start:start + self.max_batch_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, keys: List[K]) -> None:
+        self.batch_count += 1
+        try:
+            results = await self._batch_fn(keys)
+        except Exception as e:
+            for key in keys:
+                # 실패한 키는 메모에서 지워 다음 요청에서 재시도 가능하게 함
+                future = self._cache.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            return
+
+        for key in keys:
+            future = self._cache.get(key)
+            if future is not None and not future.done():
+                future.set_result(results.get(key))
+
+
+def _to_object_ids(ids: Iterable[str]) -> Dict[ObjectId, str]:
+    """유효한 ObjectId 문자열만 변환 (ObjectId → 원래 문자열)"""
+    object_ids = {}
+    for raw_id in ids:
+        if raw_id and ObjectId.is_valid(str(raw_id)):
+            object_ids[ObjectId(str(raw_id))] = raw_id
+    return object_ids
+
+
+def author_info_key(author_id: str) -> str:
+    """작성자 정보 캐시 키 (PostsService._get_author_info_key와 동일)"""
+    return get_prefixed_key(f"author_info:{author_id}")
+
+
+def build_author_info(user: User) -> Dict[str, Any]:
+    """작성자 정보 캐시 형식"""
+    return {
+        "id": str(user.id),
+        "user_handle": user.user_handle,
+        "display_name": user.display_name,
+        "name": user.name,
+        "email": user.email if hasattr(user, 'email') else ""
+    }
+
+
+ReactionKey = Tuple[str, str, str]  # (user_id, target_type, target_id)
+
+
+class RequestLoaders:
+    """요청 하나에서 공유하는 로더 묶음"""
+
+    def __init__(self):
+        self.users: DataLoader[str, User] = DataLoader(self._batch_users)
+        self.posts: DataLoader[str, Post] = DataLoader(self._batch_posts)
+        self.authors: DataLoader[str, Dict[str, Any]] = DataLoader(self._batch_authors)
+        self.reactions: DataLoader[ReactionKey, UserReaction] = DataLoader(self._batch_reactions)
+
+    async def _batch_users(self, user_ids: List[str]) -> Dict[str, User]:
+        object_ids = _to_object_ids(user_ids)
+        if not object_ids:
+            return {}
+        users = await User.find({"_id": {"$in": list(object_ids)}}).to_list()
+        return {object_ids[user.id]: user for user in users if user.id in object_ids}
+
+    async def _batch_posts(self, post_ids: List[str]) -> Dict[str, Post]:
+        """삭제되지 않은 게시글만 반환 (PostRepository.get_by_id와 같은 기준)"""
+        object_ids = _to_object_ids(post_ids)
+        if not object_ids:
+            return {}
+        posts = await Post.find({
+            "_id": {"$in": list(object_ids)},
+            "status": {"$ne": "deleted"}
+        }).to_list()
+        return {object_ids[post.id]: post for post in posts if post.id in object_ids}
+
+    async def _batch_authors(self, author_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """작성자 정보 - author_info 캐시 mget 후 미스만 users 로더로 조회해 일괄 캐싱"""
+        result: Dict[str, Dict[str, Any]] = {}
+        cache = None
+        try:
+            cache = await get_layered_cache()
+            cached = await cache.mget([author_info_key(author_id) for author_id in author_ids])
+            for author_id in author_ids:
+                cached_author = cached.get(author_info_key(author_id))
+                if cached_author:
+                    result[author_id] = cached_author
+        except Exception as e:
+            logger.warning(f"작성자 정보 캐시 조회 실패 (DB 조회로 진행): {e}")
+
+        missing = [author_id for author_id in author_ids if author_id not in result]
+        if not missing:
+            return result
+
+        users = await self.users.load_many(missing)
+        to_cache = {}
+        for author_id, user in users.items():
+            if user is None:
+                continue
+            author_info = build_author_info(user)
+            result[author_id] = author_info
+            to_cache[author_info_key(author_id)] = author_info
+
+        if to_cache and cache is not None:
+            try:
+                await cache.mset_with_ttl(to_cache, ttl=AUTHOR_INFO_TTL, tags={
+                    author_tag(author_id): [author_info_key(author_id)] for author_id in users if users[author_id]
+                })
+            except Exception as e:
+                logger.warning(f"작성자 정보 캐시 저장 실패: {e}")
+        return result
+
+    async def _batch_reactions(self, keys: List[ReactionKey]) -> Dict[ReactionKey, UserReaction]:
+        """(사용자, 대상 타입)별로 묶어 target_id $in 조회"""
+        groups: Dict[Tuple[str, str], List[str]] = {}
+        for user_id, target_type, target_id in keys:
+            groups.setdefault((user_id, target_type), []).append(target_id)
+
+        result: Dict[ReactionKey, UserReaction] = {}
+        for (user_id, target_type), target_ids in groups.items():
+            reactions = await UserReaction.find({
+                "user_id": user_id,
+                "target_type": target_type,
+                "target_id": {"$in": target_ids}
+            }).to_list()
+            for reaction in reactions:
+                result[(user_id, target_type, reaction.target_id)] = reaction
+        return result
+
+
+_request_loaders: ContextVar[Optional[RequestLoaders]] = ContextVar("request_loaders", default=None)
+
+
+def get_request_loaders() -> RequestLoaders:
+    """현재 요청의 로더 (요청 범위 밖이면 새 로더)"""
+    loaders = _request_loaders.get()
+    return loaders if loaders is not None else RequestLoaders()
+
+
+def bind_request_loaders(loaders: Optional[RequestLoaders] = None):
+    """현재 컨텍스트에 로더를 바인딩하고 reset용 토큰 반환"""
+    loaders = loaders or RequestLoaders()
+    return loaders, _request_loaders.set(loaders)
+
+
+def unbind_request_loaders(token) -> None:
+    """bind_request_loaders로 바인딩한 로더 해제"""
+    try:
+        _request_loaders.reset(token)
+    except ValueError:
+        # 다른 컨텍스트에서 정리되는 경우 - 값만 비움
+        _request_loaders.set(None)
@@ -5,15 +5,24 @@ Provides data access layer for file operations including:
 - Saving file records to MongoDB
 - Retrieving file records by ID
 - Managing file metadata in database
+- Content-addressed blob lookup and reference counting
+- Recording derived image variants
 """
 
+from datetime import datetime
 from typing import Dict, Any, Optional
 import logging
+from pymongo import ReturnDocument
+from nadle_backend.config import get_settings
 from nadle_backend.database.connection import get_database
-from nadle_backend.models.core import FileRecord
+from nadle_backend.database.layered_cache import LocalCache
+from nadle_backend.models.core import FileBlob, FileRecord
 
 logger = logging.getLogger(__name__)
 
+# File ids are immutable UUIDs, so served file lookups are cached per worker
+_record_cache = LocalCache(get_settings().file_record_cache_max_entries, get_settings().file_record_cache_ttl)
+
 
 async def save_file_record(file_document: Dict[str, Any]) -> bool:
     """
@@ -81,6 +90,59 @@ async def get_file_record(file_id: str) -> Optional[Dict[str, Any]]:
     return await find_file_by_id(file_id)
 
 
+async def get_file_record_cached(file_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get file record through the in-process LRU cache
+    
+    Only found records are cached, so a file id looked up before its record
+    was saved is not stuck as missing.
+    
+    Args:
+        file_id: Unique file identifier
+        
+    Returns:
+        Optional[Dict]: File document if found, None otherwise
+    """
+    hit, file_record = _record_cache.get(file_id)
+    if hit:
+        return file_record
+    
+    file_record = await find_file_by_id(file_id)
+    if file_record:
+        _record_cache.set(file_id, file_record)
+    return file_record
+
+
+def invalidate_file_record(file_id: str) -> None:
+    """Drop a cached file record (e.g. after its file was moved)"""
+    _record_cache.delete(file_id)
+
+
+async def record_file_variants(file_id: str, variants: Dict[str, Dict[str, Any]]) -> bool:
+    """
+    Record generated image variants on a file record
+    
+    Args:
+        file_id: Unique file identifier
+        variants: Variant info keyed by "<format>_<width>"
+        
+    Returns:
+        bool: True if the record was updated, False otherwise
+    """
+    if not variants:
+        return False
+    try:
+        result = await FileRecord.get_motor_collection().update_one(
+            {"file_id": file_id},
+            {"$set": {f"variants.{key}": info for key, info in variants.items()}}
+        )
+        invalidate_file_record(file_id)
+        return result.matched_count > 0
+    except Exception as e:
+        logger.error(f"Error recording variants for file {file_id}: {e}")
+        return False
+
+
 async def find_files_by_attachment(attachment_type: str, attachment_id: str) -> list:
     """
     Find all files attached to a specific entity
@@ -110,4 +172,74 @@ async def find_files_by_attachment(attachment_type: str, attachment_id: str) ->
         
     except Exception as e:
         logger.error(f"Error finding files for {attachment_type}:{attachment_id}: {e}")
-        return []
\ No newline at end of file
+        return []
+
+
+async def find_blob(sha256: str) -> Optional[Dict[str, Any]]:
+    """
+    Find shared blob by content digest (unique sha256 index)
+    
+    Args:
+        sha256: Hex digest of the file content
+        
+    Returns:
+        Optional[Dict]: Blob document if found, None otherwise
+    """
+    return await FileBlob.get_motor_collection().find_one({"sha256": sha256})
+
+
+async def acquire_blob(sha256: str, file_path: str, file_size: int, content_type: str) -> Dict[str, Any]:
+    """
+    Add a reference to a blob, creating the blob document on first use
+    
+    Single atomic upsert, so concurrent uploads of the same content end up
+    with one blob and the correct reference count.
+    
+    Args:
+        sha256: Hex digest of the file content
+        file_path: Blob file path (used only when the blob is created)
+        file_size: Blob size in bytes
+        content_type: MIME type of the content
+        
+    Returns:
+        Dict: Blob document after the update
+    """
+    return await FileBlob.get_motor_collection().find_one_and_update(
+        {"sha256": sha256},
+        {
+            "$inc": {"ref_count": 1},
+            "$setOnInsert": {
+                "file_path": file_path,
+                "file_size": file_size,
+                "content_type": content_type,
+                "created_at": datetime.utcnow()
+            }
+        },
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+
+
+async def release_blob(sha256: str) -> Optional[int]:
+    """
+    Remove a reference from a blob
+    
+    Unreferenced blobs (ref_count 0) are kept so a concurrent or later upload
+    of the same content can reuse them without racing a file deletion.
+    
+    Args:
+        sha256: Hex digest of the file content
+        
+    Returns:
+        Optional[int]: Remaining reference count, None if the blob does not exist
+    """
+    try:
+        blob = await FileBlob.get_motor_collection().find_one_and_update(
+            {"sha256": sha256, "ref_count": {"$gt": 0}},
+            {"$inc": {"ref_count": -1}},
+            return_document=ReturnDocument.AFTER
+        )
+        return blob["ref_count"] if blob else None
+    except Exception as e:
+        logger.error(f"Error releasing blob {sha256}: {e}")
+        return None
@@ -0,0 +1,176 @@
+"""Aggregation pipeline builder for post read paths.
+
+조인($lookup)은 항상 $match/$sort/$skip/$limit 뒤에 배치하여 실제로 반환될 문서에만
+적용되도록 하고, 조인 전에 불필요한 필드를 제거합니다. 문자열로 저장된 참조 ID는
+조인 전에 대상 타입으로 변환하여 localField/foreignField 조인(대상 컬렉션의 인덱스
+사용 가능)으로 처리합니다.
+"""
+
+from typing import Any, Dict, List, Optional
+
+
+# 작성자 요약 정보로 조인할 사용자 필드 (공개 응답에 쓰이므로 email, password_hash 등 제외)
+AUTHOR_SUMMARY_FIELDS = {
+    "user_handle": 1,
+    "display_name": 1,
+    "name": 1,
+    "created_at": 1,
+    "updated_at": 1
+}
+
+
+def lookup_stages(
+    from_collection: str,
+    local_field: str,
+    foreign_field: str,
+    as_field: str,
+    *,
+    convert_to: Optional[str] = None,
+    pipeline: Optional[List[Dict[str, Any]]] = None,
+    single: bool = False
+) -> List[Dict[str, Any]]:
+    """localField/foreignField 기반 $lookup 스테이지 생성.
+
+    Args:
+        from_collection: 조인 대상 컬렉션
+        local_field: 현재 문서의 참조 필드
+        foreign_field: 대상 컬렉션의 매칭 필드 (인덱스가 있어야 함)
+        as_field: 결과를 저장할 필드
+        convert_to: 조인 전 local_field 변환 타입 ("objectId", "string")
+        pipeline: 매칭된 대상 문서에 적용할 추가 스테이지 (필드 제한, 정렬 등)
+        single: True면 배열 대신 첫 번째 문서(없으면 필드 없음)로 변환
+
+    Returns:
+        $lookup 및 부수 스테이지 리스트
+    """
+    stages: List[Dict[str, Any]] = []
+    join_field = local_field
+
+    if convert_to:
+        # $expr 안에서 변환하면 대상 인덱스를 쓰지 못하므로 조인 전에 변환
+        join_field = f"_join_{as_field}"
+        stages.append({"$addFields": {join_field: {"$convert": {
+            "input": f"${local_field}",
+            "to": convert_to,
+            "onError": None,
+            "onNull": None
+        }}}})
+
+    lookup: Dict[str, Any] = {
+        "from": from_collection,
+        "localField": join_field,
+        "foreignField": foreign_field,
+        "as": as_field
+    }
+    if pipeline:
+        lookup["pipeline"] = pipeline
+    stages.append({"$lookup": lookup})
+
+    if single:
+        stages.append({"$addFields": {as_field: {"$arrayElemAt": [f"${as_field}", 0]}}})
+    if convert_to:
+        stages.append({"$unset": join_field})
+
+    return stages
+
+
+class PipelineBuilder:
+    """Late-join aggregation pipeline builder.
+
+    메서드 호출 순서와 관계없이 항상 다음 순서로 파이프라인을 생성합니다:
+
+        $match → $sort → $skip → $limit → $project(조인 전) → $lookup... → 후처리 스테이지
+
+    전체 개수는 $facet 대신 별도의 count_documents로 계산해야 합니다. $facet은 매칭되는
+    모든 문서를 읽어 들이므로 페이지 크기와 무관하게 docsExamined가 커집니다.
+
+    Example:
+        pipeline = (
+            PipelineBuilder({"slug": slug})
+            .limit(1)
+            .join("users", "author_id", "_id", "author", convert_to="objectId",
+                  fields=AUTHOR_SUMMARY_FIELDS, single=True)
+            .build()
+        )
+    """
+
+    def __init__(self, match: Dict[str, Any]):
+        self._match = match
+        self._sort: Optional[Dict[str, int]] = None
+        self._skip = 0
+        self._limit: Optional[int] = None
+        self._projection: Optional[Dict[str, Any]] = None
+        self._joins: List[Dict[str, Any]] = []
+        self._stages: List[Dict[str, Any]] = []
+
+    def sort(self, spec: Dict[str, int]) -> "PipelineBuilder":
+        """정렬 조건 설정 (인덱스 순서와 맞춰야 메모리 정렬을 피함)."""
+        self._sort = dict(spec)
+        return self
+
+    def skip(self, count: int) -> "PipelineBuilder":
+        """건너뛸 문서 수 설정."""
+        self._skip = max(count, 0)
+        return self
+
+    def limit(self, count: int) -> "PipelineBuilder":
+        """반환할 최대 문서 수 설정."""
+        self._limit = count
+        return self
+
+    def project(self, spec: Dict[str, Any]) -> "PipelineBuilder":
+        """조인 전에 적용할 필드 제한 설정."""
+        self._projection = dict(spec)
+        return self
+
+    def join(
+        self,
+        from_collection: str,
+        local_field: str,
+        foreign_field: str,
+        as_field: str,
+        *,
+        convert_to: Optional[str] = None,
+        fields: Optional[Dict[str, Any]] = None,
+        pipeline: Optional[List[Dict[str, Any]]] = None,
+        single: bool = False
+    ) -> "PipelineBuilder":
+        """페이지 문서에 적용할 $lookup 추가.
+
+        Args:
+            fields: 대상 문서에서 가져올 필드 ($project). pipeline 뒤에 적용
+            그 외 인자는 lookup_stages() 참조
+        """
+        inner = list(pipeline or [])
+        if fields:
+            inner.append({"$project": dict(fields)})
+        self._joins.extend(lookup_stages(
+            from_collection,
+            local_field,
+            foreign_field,
+            as_field,
+            convert_to=convert_to,
+            pipeline=inner or None,
+            single=single
+        ))
+        return self
+
+    def then(self, stage: Dict[str, Any]) -> "PipelineBuilder":
+        """조인 이후에 실행할 스테이지 추가."""
+        self._stages.append(stage)
+        return self
+
+    def build(self) -> List[Dict[str, Any]]:
+        """파이프라인 리스트 생성."""
+        pipeline: List[Dict[str, Any]] = [{"$match": self._match}]
+        if self._sort:
+            pipeline.append({"$sort": self._sort})
+        if self._skip:
+            pipeline.append({"$skip": self._skip})
+        if self._limit is not None:
+            pipeline.append({"$limit": self._limit})
+        if self._projection:
+            pipeline.append({"$project": self._projection})
+        pipeline.extend(self._joins)
+        pipeline.extend(self._stages)
+        return pipeline
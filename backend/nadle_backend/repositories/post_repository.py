@@ -1,17 +1,72 @@
 """Post repository for data access layer."""
 
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, get_args
 from datetime import datetime
+import asyncio
+import logging
 import re
 import uuid
 from beanie import PydanticObjectId
-from nadle_backend.models.core import Post, PostCreate, PostUpdate, PaginationParams, User
-from nadle_backend.exceptions.post import PostNotFoundError, PostSlugAlreadyExistsError
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import OperationFailure
+from nadle_backend.config import settings
+from nadle_backend.models.core import Post, PostCreate, PostUpdate, PaginationParams, User, PostStatus
+from nadle_backend.exceptions.post import PostNotFoundError, PostSlugAlreadyExistsError, PostCursorError
+from nadle_backend.repositories.pipeline_builder import PipelineBuilder, AUTHOR_SUMMARY_FIELDS
+from nadle_backend.utils.cursor import CURSOR_SORT_FIELDS, encode_cursor, decode_cursor
+from nadle_backend.services.content_service import ContentService
+from nadle_backend.utils.search_text import build_search_terms, build_text_query
+
+logger = logging.getLogger(__name__)
+
+# "deleted"를 제외한 상태 목록 ($ne 대신 $in을 써야 인덱스가 정렬까지 처리)
+VISIBLE_POST_STATUSES = [status for status in get_args(PostStatus) if status != "deleted"]
+
+# 목록 응답에 필요한 게시글 필드 (조인 전에 content_rendered 등 큰 필드 제거)
+POST_LIST_FIELDS = {
+    "title": 1,
+    "content": 1,
+    "slug": 1,
+    "author_id": 1,
+    "status": 1,
+    "metadata": 1,
+    "created_at": 1,
+    "updated_at": 1,
+    "view_count": 1,
+    "like_count": 1,
+    "dislike_count": 1,
+    "comment_count": 1,
+    "bookmark_count": 1
+}
+
+# 검색 결과에서 관련도 대신 사용할 수 있는 정렬 필드 (모두 내림차순)
+SEARCH_SORT_FIELDS = ("created_at", "updated_at", "view_count", "like_count")
+
+# MongoDB IndexNotFound - $text 쿼리에 필요한 텍스트 인덱스가 없는 경우
+TEXT_INDEX_NOT_FOUND = 27
+
+# 상세 조회(aggregation)에 필요한 게시글 필드 (저장 시 렌더링된 HTML 포함)
+POST_DETAIL_FIELDS = {
+    **POST_LIST_FIELDS,
+    "service": 1,
+    "published_at": 1,
+    "content_type": 1,
+    "content_rendered": 1,
+    "word_count": 1,
+    "reading_time": 1
+}
+
+# 렌더링 결과에 영향을 주는 콘텐츠 타입 (text는 추정 결과와 같으므로 수정 시 다시 추정)
+EXPLICIT_CONTENT_TYPES = ("markdown", "html")
 
 
 class PostRepository:
     """Repository for post data access operations."""
     
+    def __init__(self):
+        self.content_service = ContentService()
+    
     async def create(self, post_data: PostCreate, author_id: str) -> Post:
         """Create a new post.
         
@@ -28,11 +83,18 @@ class PostRepository:
         # Create post document first with temporary slug
         temp_slug = "temp-" + str(uuid.uuid4())[:8]
         
+        # 본문은 작성 시 한 번만 렌더링/새니타이징하고 조회 시에는 저장된 HTML 사용
+        rendered = self.content_service.render_for_storage(post_data.content, post_data.content_type)
+        
         post = Post(
             title=post_data.title,
             content=post_data.content,
             service=post_data.service,
             metadata=post_data.metadata,
+            **rendered,
+            search_terms=build_search_terms(
+                post_data.title, rendered["content_text"], post_data.metadata.tags if post_data.metadata else None
+            ),
             slug=temp_slug,  # Temporary slug
             author_id=author_id,
             status="published",
@@ -127,6 +189,31 @@ class PostRepository:
                 if new_slug != post.slug:
                     update_dict["slug"] = new_slug
             
+            # 본문/타입이 바뀌면 다시 렌더링 (렌더링 필드가 없는 기존 게시글은 검색 필드 갱신 시 함께 채움)
+            search_fields_changed = bool({"title", "content", "content_type", "metadata"} & update_dict.keys())
+            if {"content", "content_type"} & update_dict.keys() or (
+                search_fields_changed and post.content_rendered is None
+            ):
+                content_type = update_dict.get("content_type")
+                if content_type is None and post.content_type in EXPLICIT_CONTENT_TYPES:
+                    content_type = post.content_type
+                update_dict.update(self.content_service.render_for_storage(
+                    update_dict.get("content", post.content), content_type
+                ))
+            
+            # 검색 대상 필드가 바뀌면 검색 텍스트/토큰 재생성
+            if search_fields_changed:
+                content_text = update_dict.get("content_text", post.content_text)
+                metadata = update_dict.get("metadata")
+                if metadata is not None:
+                    tags = metadata.get("tags")
+                else:
+                    tags = post.metadata.tags if post.metadata else None
+                update_dict["content_text"] = content_text
+                update_dict["search_terms"] = build_search_terms(
+                    update_dict.get("title", post.title), content_text, tags
+                )
+            
             # Update post
             await post.update({"$set": update_dict})
             
@@ -218,63 +305,100 @@ class PostRepository:
         query: str,
         service_type: Optional[str] = None,
         metadata_type: Optional[str] = None,
-        sort_by: str = "created_at",
+        sort_by: str = "relevance",
         page: int = 1,
         page_size: int = 20
     ) -> Tuple[List[Post], int]:
         """Search posts by text query.
         
+        search_terms 텍스트 인덱스(post_search_terms_idx)로 검색하고 기본적으로
+        관련도(textScore) 순으로 정렬합니다. 텍스트 인덱스가 아직 생성되지 않은 경우
+        이스케이프된 정규식 검색으로 대체합니다.
+        
         Args:
             query: Search query string
             service_type: Filter by service type
-            sort_by: Sort field
+            metadata_type: Filter by metadata type
+            sort_by: "relevance" or a sort field (created_at, updated_at, view_count, like_count)
             page: Page number
             page_size: Number of items per page
             
         Returns:
             Tuple of (posts list, total count)
         """
-        # Build search query - exclude deleted posts
-        search_filter = {
-            "status": {"$ne": "deleted"},
-            "$or": [
-                {"title": {"$regex": query, "$options": "i"}},
-                {"content": {"$regex": query, "$options": "i"}},
-                {"metadata.tags": {"$in": [re.compile(query, re.IGNORECASE)]}}
-            ]
-        }
+        base_filter = self._build_search_filter(service_type, metadata_type)
+        
+        text_query = build_text_query(query)
+        if text_query is None:
+            # 검색 가능한 토큰이 없는 검색어 (공백/기호만 입력)
+            return [], 0
+        
+        search_filter = {"$text": {"$search": text_query}, **base_filter}
+        
+        if sort_by in SEARCH_SORT_FIELDS:
+            sort_stage = {sort_by: -1, "_id": -1}
+        else:
+            sort_stage = {"score": {"$meta": "textScore"}, "_id": -1}
+        
+        pipeline = [
+            {"$match": search_filter},
+            {"$sort": sort_stage},
+            {"$skip": (page - 1) * page_size},
+            {"$limit": page_size}
+        ]
         
+        try:
+            posts, total = await asyncio.gather(
+                Post.aggregate(pipeline, projection_model=Post).to_list(),
+                Post.find(search_filter).count()
+            )
+        except OperationFailure as e:
+            if e.code != TEXT_INDEX_NOT_FOUND:
+                raise
+            logger.warning("post_search_terms_idx 없음 - 정규식 검색으로 대체 (nadle-backend reindex-search 실행 필요)")
+            return await self._search_posts_regex(query, base_filter, sort_by, page, page_size)
+        
+        return posts, total
+    
+    def _build_search_filter(self, service_type: Optional[str], metadata_type: Optional[str]) -> Dict[str, Any]:
+        """검색 공통 필터 (삭제 제외, 서비스/메타데이터 타입)."""
+        search_filter: Dict[str, Any] = {"status": {"$in": VISIBLE_POST_STATUSES}}
         if service_type:
             search_filter["service"] = service_type
-        
         if metadata_type == "board":
             # 게시판: metadata.type이 없거나 null이거나 "board"인 경우
-            # 기존 검색 조건($or)을 보존하고 새로운 조건 추가
-            existing_or = search_filter.get("$or", [])
-            search_filter = {
-                "status": {"$ne": "deleted"},
-                "$and": [
-                    {"$or": existing_or},  # 기존 제목/내용/태그 검색 조건
-                    {
-                        "$or": [
-                            {"metadata.type": {"$exists": False}},
-                            {"metadata.type": None},
-                            {"metadata.type": "board"}
-                        ]
-                    }
-                ]
-            }
+            search_filter["metadata.type"] = {"$in": [None, "board"]}
         elif metadata_type:
             search_filter["metadata.type"] = metadata_type
+        return search_filter
+    
+    async def _search_posts_regex(
+        self,
+        query: str,
+        base_filter: Dict[str, Any],
+        sort_by: str,
+        page: int,
+        page_size: int
+    ) -> Tuple[List[Post], int]:
+        """정규식 기반 검색 (텍스트 인덱스가 없을 때의 대체 경로).
         
-        # Count total
-        total = await Post.find(search_filter).count()
+        사용자 입력은 re.escape로 이스케이프하여 정규식 연산자로 해석되지 않도록 합니다.
+        """
+        pattern = re.escape(query.strip())
+        search_filter = {
+            **base_filter,
+            "$or": [
+                {"title": {"$regex": pattern, "$options": "i"}},
+                {"content": {"$regex": pattern, "$options": "i"}},
+                {"metadata.tags": {"$regex": pattern, "$options": "i"}}
+            ]
+        }
         
-        # Get posts with pagination
+        sort_field = sort_by if sort_by in SEARCH_SORT_FIELDS else "created_at"
         skip = (page - 1) * page_size
-        sort_field = f"-{sort_by}" if sort_by in ["created_at", "updated_at", "view_count", "like_count"] else sort_by
         
-        posts = await Post.find(search_filter).sort(sort_field).skip(skip).limit(page_size).to_list()
+        total = await Post.find(search_filter).count()
+        posts = await Post.find(search_filter).sort(f"-{sort_field}").skip(skip).limit(page_size).to_list()
         
         return posts, total
     
@@ -294,6 +418,30 @@ class PostRepository:
             print(f"Error incrementing view count for post {post_id}: {e}")
             return False
     
+    async def apply_view_count_deltas(self, deltas: Dict[str, int]) -> int:
+        """Apply buffered view count increments in a single unordered bulk write.
+        
+        Args:
+            deltas: Mapping of post ID to pending view increment
+            
+        Returns:
+            Number of posts modified
+            
+        Raises:
+            BulkWriteError: If some updates failed; the other updates are already applied
+                and each entry in details["writeErrors"] carries its failed "op"
+        """
+        operations = [
+            UpdateOne({"_id": ObjectId(post_id)}, {"$inc": {"view_count": delta}})
+            for post_id, delta in deltas.items()
+            if delta and ObjectId.is_valid(post_id)
+        ]
+        if not operations:
+            return 0
+        
+        result = await Post.get_motor_collection().bulk_write(operations, ordered=False)
+        return result.modified_count
+    
     async def increment_bookmark_count(self, post_id: str) -> bool:
         """Increment post bookmark count.
         
@@ -506,82 +654,37 @@ class PostRepository:
         Returns:
             Tuple of (게시글 리스트, 총 개수)
         """
-        # 기본 매치 조건
-        match_stage = {"status": {"$ne": "deleted"}}
+        # 기본 매치 조건 (list_posts_cursor와 동일하게 인덱스 친화적인 등호/$in 조건 사용)
+        match_stage: Dict[str, Any] = {"status": {"$in": VISIBLE_POST_STATUSES}}
         if metadata_type == "board":
             # 게시판: metadata.type이 없거나 null이거나 "board"인 경우
-            match_stage["$or"] = [
-                {"metadata.type": {"$exists": False}},
-                {"metadata.type": None},
-                {"metadata.type": "board"}
-            ]
+            match_stage["metadata.type"] = {"$in": [None, "board"]}
         elif metadata_type:
             match_stage["metadata.type"] = metadata_type
             
-        print(f"🔍 Repository match_stage: {match_stage}")
         print(f"📊 Searching for metadata_type: '{metadata_type}'")
         
-        # 정렬 필드 설정 (내림차순)
-        sort_field = sort_by
-        sort_direction = -1  # 내림차순
-        
-        # Aggregation 파이프라인 구성
-        pipeline = [
-            # 1. 매치 조건으로 필터링
-            {"$match": match_stage},
-            
-            # 2. 정렬
-            {"$sort": {sort_field: sort_direction}},
-            
-            # 3. 작성자 정보 조회 (User 컬렉션과 조인)
-            # author_id는 문자열이므로 ObjectId로 변환하여 조인
-            {"$lookup": {
-                "from": "users",
-                "let": {"author_id": {"$toObjectId": "$author_id"}},
-                "pipeline": [
-                    {"$match": {"$expr": {"$eq": ["$_id", "$$author_id"]}}}
-                ],
-                "as": "author_info"
-            }},
-            
-            # 4. 작성자 정보 처리 (배열을 객체로 변환)
-            {"$addFields": {
-                "author": {"$arrayElemAt": ["$author_info", 0]}
-            }},
-            
-            # 5. 불필요한 필드 제거
-            {"$project": {
-                "author_info": 0,
-                "author.password": 0,
-                "author.email": 0
-            }},
-            
-            # 6. 페이지네이션과 총 개수를 동시에 처리 ($facet)
-            {"$facet": {
-                "posts": [
-                    {"$skip": (page - 1) * page_size},
-                    {"$limit": page_size}
-                ],
-                "total": [
-                    {"$count": "count"}
-                ]
-            }}
-        ]
+        # 정렬 → 페이지 자르기 → 필드 축소 → 작성자 조인 순서 (조인은 페이지 항목에만 적용)
+        pipeline = (
+            PipelineBuilder(match_stage)
+            .sort({sort_by: -1, "_id": -1})
+            .skip((page - 1) * page_size)
+            .limit(page_size)
+            .project(POST_LIST_FIELDS)
+            .join(
+                settings.users_collection, "author_id", "_id", "author",
+                convert_to="objectId", fields=AUTHOR_SUMMARY_FIELDS, single=True
+            )
+            .build()
+        )
         
         try:
-            # 디버깅을 위한 매치 스테이지 로깅
-            print(f"🔍 Aggregation match_stage: {match_stage}")
-            
-            # Aggregation 실행
-            result = await Post.aggregate(pipeline).to_list()
-            
-            if not result:
-                return [], 0
-            
-            # 결과 추출
-            posts = result[0].get("posts", [])
-            total_result = result[0].get("total", [])
-            total = total_result[0]["count"] if total_result else 0
+            # 페이지 조회와 개수 계산을 동시에 실행
+            # ($facet 개수 집계는 매칭 문서 전체를 읽지만 count_documents는 인덱스 키만 스캔)
+            posts, total = await asyncio.gather(
+                Post.aggregate(pipeline).to_list(),
+                Post.get_motor_collection().count_documents(match_stage)
+            )
             
             print(f"✅ Repository query result - total: {total}, posts: {len(posts)}")
             if posts:
@@ -594,7 +697,86 @@ class PostRepository:
             import traceback
             print(f"Traceback: {traceback.format_exc()}")
             return [], 0
-    
+
+    async def list_posts_cursor(
+        self,
+        page_size: int = 20,
+        metadata_type: Optional[str] = None,
+        sort_by: str = "created_at",
+        after: Optional[str] = None,
+        include_total: bool = False
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[int]]:
+        """Keyset(커서) 페이지네이션으로 게시글 조회.
+
+        $skip 대신 마지막 항목의 (정렬값, _id)를 기준으로 다음 페이지를 조회하므로
+        페이지 깊이와 무관하게 metadata_type_status_*_id 인덱스 범위 스캔만 수행합니다.
+        작성자 $lookup은 잘라낸 페이지에만 적용되고, 총 개수는 요청 시에만 계산합니다.
+
+        Args:
+            page_size: 페이지당 항목 수
+            metadata_type: 메타데이터 타입 필터
+            sort_by: 정렬 필드 (created_at, view_count, like_count)
+            after: 이전 페이지의 next_cursor 값 (첫 페이지는 None)
+            include_total: 필터 조건의 전체 개수 계산 여부
+
+        Returns:
+            Tuple of (게시글 리스트, 다음 페이지 커서 또는 None, 총 개수 또는 None)
+
+        Raises:
+            PostCursorError: 정렬 필드가 지원되지 않거나 커서가 잘못된 경우
+        """
+        if sort_by not in CURSOR_SORT_FIELDS:
+            raise PostCursorError(f"Cursor pagination does not support sort_by='{sort_by}'")
+
+        # 등호 조건만 사용해야 (metadata.type, status, sort_field) 인덱스가 정렬까지 처리
+        base_match: Dict[str, Any] = {"status": {"$in": VISIBLE_POST_STATUSES}}
+        if metadata_type == "board":
+            # $in [None, ...]은 필드가 없거나 null인 문서도 매칭
+            base_match["metadata.type"] = {"$in": [None, "board"]}
+        elif metadata_type:
+            base_match["metadata.type"] = metadata_type
+
+        page_match = dict(base_match)
+        if after:
+            last_value, last_id = decode_cursor(after, sort_by)
+            if last_value is None:
+                # 내림차순에서 null/누락 값은 맨 뒤 - 같은 null 구간 안에서 _id로만 이어감
+                page_match["$or"] = [{sort_by: None, "_id": {"$lt": last_id}}]
+            else:
+                page_match["$or"] = [
+                    {sort_by: {"$lt": last_value}},
+                    {sort_by: last_value, "_id": {"$lt": last_id}},
+                    # $lt는 다른 타입(null)과 비교하지 않으므로 뒤따르는 null/누락 값은 별도 조건
+                    {sort_by: None}
+                ]
+
+        pipeline = (
+            PipelineBuilder(page_match)
+            .sort({sort_by: -1, "_id": -1})
+            # 다음 페이지 존재 여부 확인용으로 1개 더 조회
+            .limit(page_size + 1)
+            .project(POST_LIST_FIELDS)
+            .join(
+                settings.users_collection, "author_id", "_id", "author",
+                convert_to="objectId", fields=AUTHOR_SUMMARY_FIELDS, single=True
+            )
+            .build()
+        )
+
+        posts = await Post.aggregate(pipeline).to_list()
+
+        next_cursor = None
+        if len(posts) > page_size:
+            posts = posts[:page_size]
+            last = posts[-1]
+            next_cursor = encode_cursor(sort_by, last.get(sort_by), last["_id"])
+
+        total = None
+        if include_total:
+            total = await Post.get_motor_collection().count_documents(base_match)
+
+        return posts, next_cursor, total
+
     async def update_post_counts(self, post_id: str, count_updates: Dict[str, int]) -> bool:
         """Post 모델의 카운트 필드들을 업데이트.
         
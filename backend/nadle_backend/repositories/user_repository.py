@@ -2,6 +2,7 @@
 
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+from beanie import PydanticObjectId
 from beanie.operators import In
 from nadle_backend.models.core import User, UserCreate, UserUpdate
 from nadle_backend.exceptions.user import UserNotFoundError, DuplicateUserError
@@ -280,6 +281,25 @@ class UserRepository:
         await user.save()
         return user
     
+    async def replace_password_hash(self, user_id: str, old_hash: str, new_hash: str) -> bool:
+        """Swap a password hash only if it has not changed since it was read.
+        
+        Used for background hash upgrades so a concurrent password change is never overwritten.
+        
+        Args:
+            user_id: User ID
+            old_hash: Hash the upgrade was computed from
+            new_hash: Upgraded hash
+            
+        Returns:
+            True if the hash was replaced
+        """
+        result = await User.get_motor_collection().update_one(
+            {"_id": PydanticObjectId(user_id), "password_hash": old_hash},
+            {"$set": {"password_hash": new_hash}}
+        )
+        return result.modified_count > 0
+    
     async def list_all(self) -> List[User]:
         """List all users (admin operation).
         
@@ -23,7 +23,7 @@ from nadle_backend.dependencies.auth import (
     get_user_repository,
     get_current_token
 )
-from nadle_backend.exceptions.auth import InvalidCredentialsError, InvalidTokenError, ExpiredTokenError
+from nadle_backend.exceptions.auth import InvalidCredentialsError, InvalidTokenError, ExpiredTokenError, PasswordServiceBusyError
 from nadle_backend.exceptions.user import (
     UserNotFoundError,
     EmailAlreadyExistsError,
@@ -137,6 +137,12 @@ async def register_user(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except PasswordServiceBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
 
 
 @router.post("/login", response_model=LoginResponse)
@@ -175,6 +181,12 @@ async def login_user(
             detail=str(e),
             headers={"WWW-Authenticate": "Bearer"}
         )
+    except PasswordServiceBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
 
 
 @router.post("/refresh", response_model=RefreshTokenResponse)
@@ -311,6 +323,12 @@ async def change_password(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
+    except PasswordServiceBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
 
 
 @router.post("/deactivate", response_model=MessageResponse)
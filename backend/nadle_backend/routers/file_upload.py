@@ -4,35 +4,136 @@ File Upload API Router
 Provides REST API endpoints for file upload functionality including:
 - Single file upload with validation
 - Request validation and error handling
+- Cache-friendly file serving (immutable caching, strong ETag / 304, byte ranges)
+- Resized WebP/JPEG image variants (?w=), created after upload or on first request
 """
 
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, status
-from typing import Dict, Any, Optional
+from fastapi import APIRouter, BackgroundTasks, UploadFile, File, Form, HTTPException, Query, Request, Response, status
+from fastapi.responses import FileResponse
+from fastapi.routing import APIRoute
+from typing import Callable, Dict, Any, Optional
+import asyncio
 import logging
+import os
 from datetime import datetime
 
+from nadle_backend.config import settings
+
 # Import all required services
 from nadle_backend.services.file_validator import (
+    MAX_FILE_SIZE,
     validate_file_type,
     validate_file_size, 
     validate_file_extension
 )
 from nadle_backend.services.file_storage import (
-    generate_file_path,
-    save_file_to_disk
+    UPLOAD_BASE_DIR,
+    FileTooLargeError,
+    FileSignatureError
+)
+from nadle_backend.services.blob_store import store_upload
+from nadle_backend.services.image_variants import (
+    generate_variants,
+    get_variant,
+    select_variant_format,
+    select_variant_width,
+    variant_key
 )
 from nadle_backend.services.file_metadata import (
     extract_file_metadata,
     create_file_document
 )
-from nadle_backend.repositories.file_repository import save_file_record
+from nadle_backend.repositories.file_repository import (
+    save_file_record,
+    release_blob,
+    find_file_by_id,
+    get_file_record_cached,
+    invalidate_file_record
+)
 
 logger = logging.getLogger(__name__)
-router = APIRouter(tags=["files"])
+
+# File ids never change content, so clients and CDNs may cache responses forever
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Room for multipart boundaries and the form fields sent with the file
+UPLOAD_FORM_OVERHEAD = 64 * 1024
+
+
+class UploadSizeLimitRoute(APIRoute):
+    """
+    Reject oversized request bodies from Content-Length before the form is parsed
+    
+    Starlette spools the whole multipart body (memory, then a temporary file)
+    before the handler runs, so the checks in store_upload cannot stop a large
+    body from being received. Bodies sent without Content-Length (chunked)
+    are bounded by nginx client_max_body_size.
+    """
+    
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        
+        async def size_limited_handler(request: Request) -> Response:
+            content_length = request.headers.get("content-length", "")
+            if content_length.isdigit() and int(content_length) > MAX_FILE_SIZE + UPLOAD_FORM_OVERHEAD:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail="File size too large. Maximum size is 5MB."
+                )
+            return await handler(request)
+        
+        return size_limited_handler
+
+
+router = APIRouter(tags=["files"], route_class=UploadSizeLimitRoute)
+
+
+def file_etag(file_record: Dict[str, Any]) -> str:
+    """Strong ETag from the stored content digest (file id for records without one)"""
+    return f'"{file_record.get("sha256") or file_record["file_id"]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check If-None-Match against an ETag (weak comparison, as RFC 9110 requires)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+def _serve_file(file_path: str, media_type: str, headers: Dict[str, str], stat_result: os.stat_result) -> Response:
+    """Send a stored file directly or through nginx"""
+    if settings.file_accel_redirect_prefix:
+        # nginx serves the body (sendfile, ranges); paths are relative to the uploads root
+        relative_path = os.path.relpath(file_path, UPLOAD_BASE_DIR).replace(os.sep, "/")
+        headers["X-Accel-Redirect"] = settings.file_accel_redirect_prefix.rstrip("/") + "/" + relative_path
+        return Response(media_type=media_type, headers=headers)
+    
+    # FileResponse handles Range/If-Range and uses the ASGI pathsend extension when available
+    return FileResponse(file_path, media_type=media_type, headers=headers, stat_result=stat_result)
+
+
+async def _stat_served_file(file_id: str, file_record: Dict[str, Any]):
+    """Stat the record's file, reloading the record once if a cached path went stale"""
+    try:
+        return file_record, await asyncio.to_thread(os.stat, file_record["file_path"])
+    except FileNotFoundError:
+        # The file may have been moved (e.g. into the blob store) after caching
+        invalidate_file_record(file_id)
+        file_record = await find_file_by_id(file_id)
+        if not file_record:
+            return None, None
+        try:
+            return file_record, await asyncio.to_thread(os.stat, file_record["file_path"])
+        except FileNotFoundError:
+            return file_record, None
 
 
 @router.post("/upload")
 async def upload_file(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     attachment_type: Optional[str] = Form(None),
     attachment_id: Optional[str] = Form(None)
@@ -58,7 +159,7 @@ async def upload_file(
                 detail="Invalid file type. Only image files (jpg, jpeg, png, gif, webp) are allowed."
             )
         
-        # Validate file size
+        # Validate declared file size (enforced again while streaming)
         if not validate_file_size(file):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -72,21 +173,31 @@ async def upload_file(
                 detail="File extension does not match the file type."
             )
         
-        # Generate unique file path
-        file_path = generate_file_path(file.filename)
-        
-        # Read file content
-        file_content = await file.read()
-        
-        # Save file to disk
-        if not save_file_to_disk(file_content, file_path):
+        # Copy the spooled upload into the content-addressed store in chunks (actual size,
+        # hash and magic bytes checked in the same pass; identical content reuses the blob)
+        try:
+            stored = await store_upload(file, file.content_type)
+        except FileTooLargeError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="File size too large. Maximum size is 5MB."
+            )
+        except FileSignatureError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="File content does not match the file type."
+            )
+        except OSError as e:
+            logger.error(f"Failed to save file {file.filename}: {e}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to save file to disk."
             )
         
-        # Extract metadata
-        metadata = extract_file_metadata(file, file_path)
+        # Extract metadata (actual streamed size, not the client-declared size)
+        metadata = extract_file_metadata(file, stored.file_path)
+        metadata["file_size"] = stored.size
+        metadata["sha256"] = stored.sha256
         
         # Create document for database
         file_document = create_file_document(
@@ -101,6 +212,7 @@ async def upload_file(
         logger.info(f"Database save result: {saved}")
         
         if not saved:
+            await release_blob(stored.sha256)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to save file record to database."
@@ -108,6 +220,9 @@ async def upload_file(
         
         logger.info(f"File uploaded successfully: {file_document['file_id']}")
         
+        # Resized variants are created in the image pool after the response is sent
+        background_tasks.add_task(generate_variants, file_document["file_id"], stored.file_path, stored.sha256)
+        
         # API 명세에 맞는 응답 형식
         return {
             "file_id": file_document["file_id"],
@@ -133,26 +248,61 @@ async def upload_file(
 
 
 @router.get("/{file_id}")
-async def get_file(file_id: str):
-    """Get file by ID"""
+async def get_file(
+    file_id: str,
+    request: Request,
+    w: Optional[int] = Query(None, gt=0, le=10000, description="Resized image width")
+):
+    """
+    Get file by ID
+    
+    Responses carry a strong ETag and immutable Cache-Control; If-None-Match
+    returns 304 without touching the file, and Range requests are answered
+    with 206 partial content. With file_accel_redirect_prefix configured the
+    body is handed to nginx (X-Accel-Redirect) for zero-copy sendfile.
+    
+    With w, images are served as the closest configured variant (WebP when
+    the client accepts it, JPEG otherwise), created on first request. The
+    original is served if it cannot be resized.
+    """
     try:
-        from fastapi.responses import FileResponse
-        from nadle_backend.repositories.file_repository import get_file_record
-        
-        # Get file record from database
-        file_record = await get_file_record(file_id)
+        # Get file record (per-worker LRU, then database)
+        file_record = await get_file_record_cached(file_id)
         if not file_record:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="File not found"
             )
         
-        # Return file
-        return FileResponse(
-            file_record["file_path"],
-            media_type=file_record["content_type"],
-            headers={"Cache-Control": "public, max-age=31536000"}
-        )
+        if w and file_record["content_type"].startswith("image/"):
+            width = select_variant_width(w)
+            image_format = select_variant_format(request.headers.get("accept"))
+            etag = f'{file_etag(file_record)[:-1]}-{variant_key(width, image_format)}"'
+            headers = {"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL, "Vary": "Accept"}
+            
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+            
+            variant = await get_variant(file_record, width, image_format)
+            if variant:
+                stat_result = await asyncio.to_thread(os.stat, variant["file_path"])
+                return _serve_file(variant["file_path"], variant["content_type"], headers, stat_result)
+        
+        etag = file_etag(file_record)
+        headers = {"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+        
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        
+        file_record, stat_result = await _stat_served_file(file_id, file_record)
+        if stat_result is None:
+            logger.error(f"File missing on disk for record {file_id}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="File not found"
+            )
+        
+        return _serve_file(file_record["file_path"], file_record["content_type"], headers, stat_result)
     except HTTPException:
         raise
     except Exception as e:
@@ -167,10 +317,8 @@ async def get_file(file_id: str):
 async def get_file_info(file_id: str):
     """Get file metadata"""
     try:
-        from nadle_backend.repositories.file_repository import get_file_record
-        
-        # Get file record from database
-        file_record = await get_file_record(file_id)
+        # Get file record (per-worker LRU, then database)
+        file_record = await get_file_record_cached(file_id)
         if not file_record:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends
 from typing import Dict, Any
 import os
 from ..services.cache_service import get_cache_service, CacheService
+from ..services.email_queue import get_email_queue, EmailDeliveryQueue
 
 router = APIRouter(tags=["health"])
 
@@ -23,6 +24,15 @@ async def cache_health_check(
         "cache": cache_stats
     }
 
+@router.get("/health/email")
+async def email_queue_health_check(
+    email_queue: EmailDeliveryQueue = Depends(get_email_queue)
+) -> Dict[str, Any]:
+    """이메일 발송 대기열 상태 확인 (대기열 길이, 처리량, 실패 수)"""
+    return {
+        "email_queue": email_queue.stats()
+    }
+
 @router.get("/health/full")
 async def full_health_check(
     cache_service: CacheService = Depends(get_cache_service)
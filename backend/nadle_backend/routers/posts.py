@@ -9,7 +9,7 @@ from nadle_backend.services.posts_service import PostsService
 from nadle_backend.dependencies.auth import (
     get_current_active_user, get_optional_current_active_user
 )
-from nadle_backend.exceptions.post import PostNotFoundError, PostPermissionError
+from nadle_backend.exceptions.post import PostNotFoundError, PostPermissionError, PostCursorError
 
 
 # Create router
@@ -32,13 +32,13 @@ async def search_posts(
     q: str = Query(..., description="Search query"),
     service_type: Optional[str] = Query(None, description="Filter by service type"),
     metadata_type: Optional[str] = Query(None, description="Filter by metadata type"),
-    sort_by: str = Query("created_at", description="Sort field"),
+    sort_by: str = Query("relevance", description="relevance (default) or sort field: created_at, updated_at, view_count, like_count"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     current_user: Optional[User] = Depends(get_optional_current_active_user),
     posts_service: PostsService = Depends(get_posts_service)
 ):
-    """Search posts with filters."""
+    """Search posts with filters (ranked by relevance unless sort_by is given)."""
     try:
         result = await posts_service.search_posts(
             query=q,
@@ -79,20 +79,33 @@ async def list_posts(
     metadata_type: Optional[str] = Query(None, description="Filter by metadata type"),
     author_id: Optional[str] = Query(None, description="Filter by author ID"),
     sort_by: str = Query("created_at", description="Sort field"),
+    cursor: bool = Query(False, description="Use cursor (keyset) pagination instead of page numbers"),
+    after: Optional[str] = Query(None, description="next_cursor value from the previous page (implies cursor mode)"),
+    include_total: bool = Query(False, description="Include total count in cursor mode"),
     current_user: Optional[User] = Depends(get_optional_current_active_user),
     posts_service: PostsService = Depends(get_posts_service)
 ):
     """List posts with pagination and filters."""
     try:
-        result = await posts_service.list_posts(
-            page=page,
-            page_size=page_size,
-            service_type=service_type,
-            metadata_type=metadata_type,
-            author_id=author_id,
-            sort_by=sort_by,
-            current_user=current_user
-        )
+        if cursor or after:
+            result = await posts_service.list_posts_cursor(
+                page_size=page_size,
+                metadata_type=metadata_type,
+                sort_by=sort_by,
+                after=after,
+                include_total=include_total,
+                current_user=current_user
+            )
+        else:
+            result = await posts_service.list_posts(
+                page=page,
+                page_size=page_size,
+                service_type=service_type,
+                metadata_type=metadata_type,
+                author_id=author_id,
+                sort_by=sort_by,
+                current_user=current_user
+            )
         
         # Convert ObjectIds to strings in the response
         if "items" in result:
@@ -108,6 +121,11 @@ async def list_posts(
                     item["file_ids"] = item["metadata"].get("file_ids", [])
         
         return result
+    except PostCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -198,6 +216,10 @@ async def get_post(
             "_id": str(post.id),
             "title": post.title,
             "content": post.content,
+            "content_type": post.content_type,
+            "content_rendered": post.content_rendered,
+            "word_count": post.word_count,
+            "reading_time": post.reading_time,
             "slug": post.slug,
             "service": post.service,
             "metadata": post.metadata,
@@ -256,6 +278,10 @@ async def create_post(
             metadata=post.metadata,
             author_id=str(post.author_id),
             status=post.status,
+            content_type=post.content_type,
+            content_rendered=post.content_rendered,
+            word_count=post.word_count,
+            reading_time=post.reading_time,
             created_at=post.created_at,
             updated_at=post.updated_at,
             published_at=post.published_at
@@ -292,6 +318,10 @@ async def update_post(
             metadata=post.metadata,
             author_id=str(post.author_id),
             status=post.status,
+            content_type=post.content_type,
+            content_rendered=post.content_rendered,
+            word_count=post.word_count,
+            reading_time=post.reading_time,
             created_at=post.created_at,
             updated_at=post.updated_at,
             published_at=post.published_at
@@ -6,7 +6,7 @@ from nadle_backend.models.core import User, UserCreate, UserUpdate
 from nadle_backend.repositories.user_repository import UserRepository
 from nadle_backend.utils.jwt import JWTManager, TokenType
 from nadle_backend.utils.password import PasswordManager
-from nadle_backend.exceptions.auth import InvalidCredentialsError
+from nadle_backend.exceptions.auth import InvalidCredentialsError, PasswordServiceBusyError
 from nadle_backend.exceptions.user import (
     UserNotFoundError, 
     EmailAlreadyExistsError, 
@@ -19,10 +19,14 @@ from nadle_backend.services.cache_service import get_cache_service
 from nadle_backend.services.session_service import get_session_service, SessionData
 from nadle_backend.services.token_blacklist_service import get_token_blacklist_service
 from nadle_backend.config import get_settings
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Keeps fire-and-forget hash upgrades alive until they finish
+_background_tasks = set()
+
 
 class AuthService:
     """Authentication service for handling user authentication and management."""
@@ -60,6 +64,7 @@ class AuthService:
         Raises:
             EmailAlreadyExistsError: If email already exists
             HandleAlreadyExistsError: If handle already exists
+            PasswordServiceBusyError: If the password worker pool is saturated
         """
         # Check if email already exists
         existing_user = await self.user_repository.get_by_email(user_data.email)
@@ -71,8 +76,8 @@ class AuthService:
         if existing_user:
             raise HandleAlreadyExistsError(user_data.user_handle)
         
-        # Hash password
-        password_hash = self.password_manager.hash_password(user_data.password)
+        # Hash password (worker pool - does not block the event loop)
+        password_hash = await self.password_manager.hash_password_async(user_data.password)
         
         # Create user using repository
         user = await self.user_repository.create(user_data, password_hash)
@@ -99,6 +104,7 @@ class AuthService:
             
         Raises:
             InvalidCredentialsError: If authentication fails
+            PasswordServiceBusyError: If the password worker pool is saturated
         """
         try:
             user = await self.user_repository.get_by_email(email)
@@ -108,15 +114,43 @@ class AuthService:
         # Verify password
         if not user.password_hash:
             raise InvalidCredentialsError("Account requires password reset")
-        if not self.password_manager.verify_password(password, user.password_hash):
+        if not await self.password_manager.verify_password_async(password, user.password_hash):
             raise InvalidCredentialsError()
         
         # Check user status
         if user.status != "active":
             raise InvalidCredentialsError("Account is not active")
         
+        # Upgrade outdated hashes (e.g. fewer rounds) without delaying the login
+        if self.password_manager.needs_rehash(user.password_hash):
+            self._schedule_password_rehash(str(user.id), password, user.password_hash)
+        
         return user
     
+    def _schedule_password_rehash(self, user_id: str, password: str, old_hash: str) -> None:
+        """Start a background hash upgrade for a user who just logged in.
+        
+        Args:
+            user_id: User ID
+            password: Verified plain text password
+            old_hash: Current (outdated) hash
+        """
+        task = asyncio.create_task(self._rehash_password(user_id, password, old_hash))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+    
+    async def _rehash_password(self, user_id: str, password: str, old_hash: str) -> None:
+        """Re-hash a password with current settings and store it if unchanged meanwhile."""
+        try:
+            new_hash = await self.password_manager.hash_password_async(password)
+            if await self.user_repository.replace_password_hash(user_id, old_hash, new_hash):
+                logger.info(f"Password hash upgraded for user {user_id}")
+        except PasswordServiceBusyError:
+            # Pool is saturated - retry on the next login
+            logger.info(f"Password hash upgrade deferred for user {user_id} (pool busy)")
+        except Exception as e:
+            logger.warning(f"Password hash upgrade failed for user {user_id}: {e}")
+    
     async def create_access_token(self, user: User) -> str:
         """Create access token for user.
         
@@ -262,8 +296,7 @@ class AuthService:
         updated_user = await self.user_repository.update(user_id, user_update)
         
         # 캐시 무효화
-        cache_service = await get_cache_service()
-        await cache_service.delete_user_cache(user_id)
+        await self._invalidate_user_caches(user_id)
         
         return updated_user
     
@@ -281,19 +314,22 @@ class AuthService:
         Raises:
             UserNotFoundError: If user not found
             InvalidCredentialsError: If old password is wrong
+            PasswordServiceBusyError: If the password worker pool is saturated
         """
         # Get user
         user = await self.user_repository.get_by_id(user_id)
         
         # Verify old password
-        if not self.password_manager.verify_password(old_password, user.password_hash):
+        if not await self.password_manager.verify_password_async(old_password, user.password_hash):
             raise InvalidCredentialsError("Current password is incorrect")
         
         # Hash new password
-        new_password_hash = self.password_manager.hash_password(new_password)
+        new_password_hash = await self.password_manager.hash_password_async(new_password)
         
         # Update password
-        return await self.user_repository.update_password(user_id, new_password_hash)
+        updated_user = await self.user_repository.update_password(user_id, new_password_hash)
+        await self._invalidate_user_caches(user_id)
+        return updated_user
     
     async def deactivate_user(self, user_id: str) -> User:
         """Deactivate user account.
@@ -311,7 +347,9 @@ class AuthService:
         await self.user_repository.get_by_id(user_id)
         
         # Update status
-        return await self.user_repository.update_status(user_id, "inactive")
+        updated_user = await self.user_repository.update_status(user_id, "inactive")
+        await self._invalidate_user_caches(user_id)
+        return updated_user
     
     async def activate_user(self, user_id: str) -> User:
         """Activate user account.
@@ -329,7 +367,9 @@ class AuthService:
         await self.user_repository.get_by_id(user_id)
         
         # Update status
-        return await self.user_repository.update_status(user_id, "active")
+        updated_user = await self.user_repository.update_status(user_id, "active")
+        await self._invalidate_user_caches(user_id)
+        return updated_user
     
     async def suspend_user(self, user_id: str) -> User:
         """Suspend user account (admin operation).
@@ -347,7 +387,9 @@ class AuthService:
         await self.user_repository.get_by_id(user_id)
         
         # Update status
-        return await self.user_repository.update_status(user_id, "suspended")
+        updated_user = await self.user_repository.update_status(user_id, "suspended")
+        await self._invalidate_user_caches(user_id)
+        return updated_user
     
     async def delete_user(self, user_id: str) -> bool:
         """Delete user account (admin operation).
@@ -366,8 +408,18 @@ class AuthService:
         
         # Delete user
         await self.user_repository.delete(user_id)
+        await self._invalidate_user_caches(user_id)
         return True
     
+    async def _invalidate_user_caches(self, user_id: str) -> None:
+        """Drop cached profile and auth principal so the next request sees the change.
+        
+        Args:
+            user_id: User ID
+        """
+        cache_service = await get_cache_service()
+        await cache_service.delete_user_cache(str(user_id))
+    
     async def list_users(self) -> List[User]:
         """List all users (admin operation).
         
@@ -625,10 +677,12 @@ class AuthService:
                 logger.debug(f"토큰이 블랙리스트에 있음: {token[:20]}...")
                 return False
             
-            # 사용자 전체 블랙리스트 확인
+            # 사용자 전체 블랙리스트 확인 (폐기 시각 이전에 발급된 토큰만 무효)
             user_id = payload.get("sub")
             if user_id:
-                is_user_blacklisted = await blacklist_service.is_user_blacklisted(user_id)
+                is_user_blacklisted = await blacklist_service.is_user_blacklisted(
+                    user_id, issued_at=payload.get("iat")
+                )
                 if is_user_blacklisted:
                     logger.debug(f"사용자 전체 블랙리스트: {user_id}")
                     return False
@@ -0,0 +1,85 @@
+"""
+Blob Store Module
+
+Content-addressed storage for uploaded files:
+- Uploads are streamed to a temporary file and hashed in the same pass
+- The SHA-256 digest is looked up in the file_blobs collection (unique index)
+  before anything is written to the blob tree
+- Identical content is stored once at uploads/blobs/ab/cd/<sha256> and shared
+  by every FileRecord through the blob's reference count
+"""
+
+import asyncio
+import os
+from dataclasses import dataclass
+from typing import Any
+import logging
+
+from nadle_backend.repositories.file_repository import acquire_blob, find_blob
+from nadle_backend.services.file_storage import (
+    BLOB_TEMP_DIR,
+    MAX_FILE_SIZE,
+    commit_temp_file,
+    discard_temp_file,
+    generate_blob_path,
+    stream_upload_to_temp
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BlobUpload:
+    """Result of a deduplicated upload"""
+    file_path: str
+    size: int
+    sha256: str
+    deduplicated: bool  # True if an existing blob was reused
+
+
+async def store_upload(
+    upload: Any,
+    content_type: str,
+    max_size: int = MAX_FILE_SIZE
+) -> BlobUpload:
+    """
+    Store an upload in the content-addressed blob tree
+    
+    Args:
+        upload: Object with an async read(size) method (e.g. UploadFile)
+        content_type: Declared MIME type (verified against the magic bytes)
+        max_size: Maximum accepted size in bytes
+        
+    Returns:
+        BlobUpload: Blob path, size, digest and whether content was deduplicated
+        
+    Raises:
+        FileTooLargeError: If the upload reaches max_size
+        FileSignatureError: If the content does not match content_type
+        OSError: If the file cannot be written
+    """
+    stored = await stream_upload_to_temp(upload, BLOB_TEMP_DIR, max_size, content_type)
+    
+    try:
+        blob = await find_blob(stored.sha256)
+        if blob and await asyncio.to_thread(os.path.exists, blob["file_path"]):
+            # Same content already stored - drop the new copy
+            file_path = blob["file_path"]
+            deduplicated = True
+            await asyncio.to_thread(discard_temp_file, stored.file_path)
+        else:
+            # Content-addressed path, so replacing a concurrent identical write is harmless
+            file_path = blob["file_path"] if blob else generate_blob_path(stored.sha256)
+            deduplicated = False
+            await asyncio.to_thread(commit_temp_file, stored.file_path, file_path)
+        
+        await acquire_blob(stored.sha256, file_path, stored.size, content_type)
+    except BaseException:
+        discard_temp_file(stored.file_path)
+        raise
+    
+    logger.info(
+        f"Upload stored as blob {stored.sha256[:12]} ({stored.size} bytes, "
+        f"{'deduplicated' if deduplicated else 'new'})"
+    )
+    return BlobUpload(file_path=file_path, size=stored.size, sha256=stored.sha256, deduplicated=deduplicated)
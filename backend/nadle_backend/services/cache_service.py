@@ -1,10 +1,15 @@
 from typing import Optional, Dict, Any
 import logging
 from ..database.redis_factory import get_redis_manager, get_prefixed_key
+from ..database.layered_cache import layered_cache
+from ..database.cache_tags import author_tag, user_tag
 from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# 인증 주체 캐시에 저장하는 필드 (권한 확인에 필요한 것만, 비밀번호 해시 등은 제외)
+PRINCIPAL_FIELDS = ("id", "email", "user_handle", "display_name", "name", "status", "is_admin")
+
 class CacheService:
     """Redis 캐싱 서비스"""
     
@@ -64,10 +69,13 @@ class CacheService:
             return False
     
     async def delete_user_cache(self, user_id: str) -> bool:
-        """사용자 캐시 삭제"""
+        """사용자 캐시 삭제 (인증 주체 캐시와 사용자/작성자 태그 캐시도 함께 무효화)"""
         redis_manager = await get_redis_manager()
         cache_key = get_prefixed_key(f"user:{user_id}")
         
+        await self.invalidate_principal(user_id)
+        await self.invalidate_user_tags(user_id)
+        
         try:
             result = await redis_manager.delete(cache_key)
             if result:
@@ -81,6 +89,45 @@ class CacheService:
             logger.error(f"사용자 캐시 삭제 오류: {e}")
             return False
     
+    def _principal_key(self, user_id: str) -> str:
+        return get_prefixed_key(f"principal:{user_id}")
+    
+    async def get_principal(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """인증 주체를 캐시에서 가져오기 (워커 로컬 → Redis)"""
+        try:
+            return await layered_cache.get(self._principal_key(user_id))
+        except Exception as e:
+            logger.error(f"인증 주체 캐시 조회 오류: {e}")
+            return None
+    
+    async def set_principal(self, user: Any) -> bool:
+        """사용자 객체에서 권한 확인용 필드만 골라 캐시에 저장"""
+        try:
+            principal = {field: getattr(user, field, None) for field in PRINCIPAL_FIELDS}
+            principal["id"] = str(principal["id"])
+            return await layered_cache.set(
+                self._principal_key(principal["id"]),
+                principal,
+                ttl=self.settings.cache_ttl_principal
+            )
+        except Exception as e:
+            logger.error(f"인증 주체 캐시 저장 오류: {e}")
+            return False
+    
+    async def invalidate_principal(self, user_id: str) -> None:
+        """인증 주체 캐시 무효화 (다른 워커의 로컬 캐시까지 전파)"""
+        try:
+            await layered_cache.invalidate(self._principal_key(str(user_id)))
+        except Exception as e:
+            logger.error(f"인증 주체 캐시 무효화 오류: {e}")
+    
+    async def invalidate_user_tags(self, user_id: str) -> None:
+        """사용자/작성자 태그에 등록된 캐시 무효화 (작성자 정보, 댓글 배치, 사용자 반응)"""
+        try:
+            await layered_cache.invalidate_tags(author_tag(str(user_id)), user_tag(str(user_id)))
+        except Exception as e:
+            logger.error(f"사용자 태그 캐시 무효화 오류: {e}")
+    
     async def get_cache_stats(self) -> Dict[str, Any]:
         """캐시 통계 정보 반환"""
         redis_manager = await get_redis_manager()
@@ -90,7 +137,9 @@ class CacheService:
             return {
                 "cache_enabled": self.settings.cache_enabled,
                 "redis_status": stats.get("status"),
-                "redis_info": stats
+                "redis_circuit": stats.get("circuit", {}).get("state"),
+                "redis_info": stats,
+                "local_tier": layered_cache.stats()
             }
             
         except Exception as e:
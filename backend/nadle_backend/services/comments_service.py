@@ -4,9 +4,13 @@ from typing import List, Dict, Optional, Tuple, Any
 from nadle_backend.models.core import Comment, CommentCreate, CommentDetail, User, UserReaction
 from nadle_backend.repositories.comment_repository import CommentRepository
 from nadle_backend.repositories.post_repository import PostRepository
+from nadle_backend.repositories.data_loader import RequestLoaders, get_request_loaders
 from nadle_backend.exceptions.comment import CommentNotFoundError, CommentPermissionError, CommentValidationError
 from nadle_backend.exceptions.post import PostNotFoundError
 from nadle_backend.services.user_activity_service import normalize_post_type
+from nadle_backend.services.popularity_ranking import popularity_ranking
+from nadle_backend.database.layered_cache import get_layered_cache
+from nadle_backend.database.cache_tags import post_tag
 from beanie import PydanticObjectId
 
 
@@ -62,6 +66,7 @@ class CommentsService:
         
         # Increment post comment count
         await self._increment_post_comment_count(str(post.id))
+        popularity_ranking.record(post, "comment")
         
         # Convert to response format
         comment_detail = await self._convert_to_comment_detail(comment)
@@ -104,35 +109,23 @@ class CommentsService:
             max_depth=settings.max_comment_depth
         )
         
-        # 🔍 디버깅: 댓글 구조 확인
-        print(f"🔍 [DEBUG] 댓글 조회 - post_slug: {post_slug}")
-        print(f"🔍 [DEBUG] comments_with_replies 수: {len(comments_with_replies)}")
-        for i, item in enumerate(comments_with_replies):
-            comment = item["comment"]
-            replies = item["replies"]
-            print(f"🔍 [DEBUG] 댓글 {i+1}: id={comment.id}, content={comment.content[:30]}..., replies={len(replies)}")
-            for j, reply_item in enumerate(replies):
-                reply_comment = reply_item["comment"]
-                print(f"    답글 {j+1}: id={reply_comment.id}, content={reply_comment.content[:30]}...")
-        
         # Convert to comment details with user reactions
         comment_details = []
-        all_comment_ids = []
         
-        # Collect all comment IDs for batch reaction lookup (recursive)
-        def collect_comment_ids(item):
-            """Recursively collect comment IDs from nested structure."""
-            comment = item["comment"]
-            replies = item["replies"]
-            ids = [str(comment.id)]
+        # Collect all comments for batch reaction/author lookup (recursive)
+        def collect_comments(item):
+            """Recursively collect comments from nested structure."""
+            comments = [item["comment"]]
             
-            for reply_item in replies:
-                ids.extend(collect_comment_ids(reply_item))
+            for reply_item in item["replies"]:
+                comments.extend(collect_comments(reply_item))
             
-            return ids
+            return comments
         
+        all_comments = []
         for item in comments_with_replies:
-            all_comment_ids.extend(collect_comment_ids(item))
+            all_comments.extend(collect_comments(item))
+        all_comment_ids = [str(comment.id) for comment in all_comments]
         
         # Get user reactions if authenticated
         user_reactions = {}
@@ -152,6 +145,12 @@ class CommentsService:
                 for reaction in reactions
             }
         
+        # Load every author in the tree with one $in query; conversions below hit the loader memo
+        loaders = get_request_loaders()
+        await loaders.users.load_many(
+            {comment.author_id for comment in all_comments if comment.author_id}
+        )
+        
         # Convert to response format (recursive)
         async def convert_comment_item(item):
             """Recursively convert comment item with nested replies."""
@@ -166,7 +165,7 @@ class CommentsService:
             
             # Convert main comment
             comment_detail = await self._convert_to_comment_detail(
-                comment, user_reactions.get(str(comment.id))
+                comment, user_reactions.get(str(comment.id)), loaders
             )
             comment_detail.replies = reply_details
             
@@ -221,7 +220,8 @@ class CommentsService:
         reply = await self.comment_repo.create(
             comment_data=reply_data,
             author_id=str(current_user.id),
-            parent_id=str(post.id)
+            parent_id=str(post.id),
+            parent_comment=parent_comment
         )
         print(f"🔍 [DEBUG] 답글 생성 완료: reply_id={reply.id}, parent_comment_id={reply.parent_comment_id}")
         
@@ -230,6 +230,7 @@ class CommentsService:
         
         # Increment post comment count
         await self._increment_post_comment_count(str(post.id))
+        popularity_ranking.record(post, "comment")
         
         # Convert to response format
         reply_detail = await self._convert_to_comment_detail(reply)
@@ -270,6 +271,7 @@ class CommentsService:
         
         # Update comment
         updated_comment = await self.comment_repo.update(comment_id, content)
+        await self._invalidate_post_caches(comment.parent_id)
         
         # Convert to response format
         comment_detail = await self._convert_to_comment_detail(updated_comment)
@@ -340,6 +342,7 @@ class CommentsService:
         
         # Update comment aggregate counts
         await self._update_comment_reaction_counts(comment_id)
+        await self._invalidate_post_caches(comment.parent_id)
         
         # Get updated comment for response
         updated_comment = await self.comment_repo.get_by_id(comment_id)
@@ -470,24 +473,25 @@ class CommentsService:
     async def _convert_to_comment_detail(
         self, 
         comment: Comment, 
-        user_reaction: Optional[Dict[str, bool]] = None
+        user_reaction: Optional[Dict[str, bool]] = None,
+        loaders: Optional[RequestLoaders] = None
     ) -> CommentDetail:
         """Convert Comment to CommentDetail.
         
         Args:
             comment: Comment instance
             user_reaction: User reaction data
+            loaders: Request-scoped batching loaders (defaults to the current request's)
             
         Returns:
             CommentDetail instance
         """
-        # Get author information
+        # Get author information (batched with other lookups in the same tick)
         author = None
         if comment.author_id:
             try:
-                from nadle_backend.models.core import User
-                from beanie import PydanticObjectId
-                user = await User.get(PydanticObjectId(comment.author_id))
+                loaders = loaders or get_request_loaders()
+                user = await loaders.users.load(comment.author_id)
                 if user:
                     from nadle_backend.models.core import UserResponse
                     author = UserResponse(
@@ -541,6 +545,7 @@ class CommentsService:
         except Exception:
             # Log error but don't fail the comment creation
             pass
+        await self._invalidate_post_caches(post_id)
     
     async def _decrement_post_comment_count(self, post_id: str) -> None:
         """Decrement comment count for a post.
@@ -559,6 +564,20 @@ class CommentsService:
         except Exception:
             # Log error but don't fail the comment deletion
             pass
+        await self._invalidate_post_caches(post_id)
+    
+    async def _invalidate_post_caches(self, post_id: str) -> None:
+        """Drop cached post detail and comment batch registered under the post tag.
+        
+        Args:
+            post_id: Post ID
+        """
+        try:
+            post_cache = await get_layered_cache()
+            await post_cache.invalidate_tags(post_tag(str(post_id)))
+        except Exception:
+            # Stale entries expire with their TTL; don't fail the comment operation
+            pass
     
     def _generate_route_path(self, page_type: str, slug: str) -> str:
         """Generate route path based on page type and slug.
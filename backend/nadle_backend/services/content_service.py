@@ -1,16 +1,87 @@
 """
 콘텐츠 처리 서비스
+
+process_content는 렌더링된 HTML을 한 번만 파싱합니다. bleach 새니타이저의 토큰
+스트림에 필터를 연결해 이미지 URL 검증과 순수 텍스트 수집을 같은 패스에서 처리하고,
+결과는 (콘텐츠 해시, 콘텐츠 타입) 기준으로 크기 제한 LRU 캐시에 보관합니다.
+
+content_text는 텍스트 노드를 공백으로 연결합니다. 노드를 붙여 쓰던 이전 get_text(strip=True)
+결과와 다르므로, 저장된 값은 `nadle-backend render-posts --rebuild`로 다시 계산합니다.
 """
 import re
 import html
-from typing import List, Optional
+import hashlib
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 from markdown import markdown
-import bleach
+from bleach.html5lib_shim import Filter
+from bleach.sanitizer import Cleaner
 from bs4 import BeautifulSoup
 
+from nadle_backend.config import get_settings
+from nadle_backend.database.layered_cache import LocalCache
 from nadle_backend.models.content import ContentMetadata, ProcessedContent
 from nadle_backend.models.core import ContentType
 
+RENDER_CACHE_TTL = 3600
+
+_WHITESPACE = re.compile(r"\s+")
+# 태그가 하나라도 있으면 HTML 본문으로 판단
+_HTML_TAG_PATTERN = re.compile(r"</?[a-zA-Z][a-zA-Z0-9]*(\s[^>]*)?/?>")
+
+# 렌더링 결과 캐시 (워커 프로세스당 하나, 같은 입력이면 결과가 같으므로 TTL은 메모리 회수용)
+_render_cache = LocalCache(get_settings().content_render_cache_max_entries, RENDER_CACHE_TTL)
+
+
+class _ContentScan:
+    """한 번의 새니타이징 패스에서 수집한 텍스트 조각"""
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self._buffer: List[str] = []
+
+    def add_text(self, text: str) -> None:
+        self._buffer.append(text)
+
+    def end_text_node(self) -> None:
+        # 텍스트 노드별로 앞뒤 공백 제거 후 저장
+        if self._buffer:
+            text = "".join(self._buffer).strip()
+            if text:
+                self.parts.append(text)
+            self._buffer = []
+
+    @property
+    def text(self) -> str:
+        """검색용 텍스트 (텍스트 노드 경계에서 단어가 붙지 않도록 공백으로 연결, 공백 정규화)"""
+        self.end_text_node()
+        return _WHITESPACE.sub(" ", " ".join(self.parts))
+
+
+class _ContentScanFilter(Filter):
+    """새니타이징된 토큰 스트림에서 허용되지 않은 이미지를 제거하고 텍스트 수집"""
+
+    def __init__(self, source, scan: _ContentScan, image_pattern: "re.Pattern"):
+        super().__init__(source)
+        self.scan = scan
+        self.image_pattern = image_pattern
+
+    def __iter__(self):
+        for token in super().__iter__():
+            token_type = token["type"]
+            if token_type in ("Characters", "SpaceCharacters"):
+                self.scan.add_text(token["data"])
+            elif token_type == "Entity":
+                self.scan.add_text(html.unescape(f"&{token['name']};"))
+            else:
+                self.scan.end_text_node()
+                if token.get("name") == "img" and token_type in ("StartTag", "EmptyTag"):
+                    src = token["data"].get((None, "src"), "")
+                    if src and not self.image_pattern.match(src):
+                        # 외부 URL이나 위험한 패턴 제거
+                        continue
+            yield token
+
 
 class ContentService:
     """콘텐츠 처리 서비스"""
@@ -31,6 +102,12 @@ class ContentService:
     
     # 이미지 URL 패턴 검증
     ALLOWED_IMAGE_PATTERN = r'^/api/files/[a-f0-9-]+$'
+    _IMAGE_PATTERN = re.compile(ALLOWED_IMAGE_PATTERN)
+    
+    @staticmethod
+    def detect_content_type(content: str) -> ContentType:
+        """콘텐츠 타입이 지정되지 않은 본문의 타입 추정 (HTML 태그 포함 여부)"""
+        return "html" if content and _HTML_TAG_PATTERN.search(content) else "text"
     
     def render_markdown(self, content: str) -> str:
         """
@@ -68,33 +145,26 @@ class ContentService:
         Returns:
             str: 새니타이징된 안전한 HTML
         """
+        return self._sanitize_and_scan(html_content)[0]
+    
+    def _sanitize_and_scan(self, html_content: str) -> Tuple[str, _ContentScan]:
+        """새니타이징 + 이미지 URL 검증 + 순수 텍스트 추출을 한 번의 파싱으로 처리
+        
+        Returns:
+            (새니타이징된 HTML, 수집된 텍스트)
+        """
+        scan = _ContentScan()
         if not html_content:
-            return ""
+            return "", scan
         
-        # bleach를 사용한 HTML 새니타이징
-        cleaned_html = bleach.clean(
-            html_content,
+        cleaner = Cleaner(
             tags=self.ALLOWED_TAGS,
             attributes=self.ALLOWED_ATTRIBUTES,
-            strip=True
+            strip=True,
+            filters=[partial(_ContentScanFilter, scan=scan, image_pattern=self._IMAGE_PATTERN)]
         )
-        
-        # 이미지 URL 패턴 추가 검증
-        cleaned_html = self._validate_image_urls(cleaned_html)
-        
-        return cleaned_html
-    
-    def _validate_image_urls(self, html_content: str) -> str:
-        """이미지 URL 패턴 검증"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        for img in soup.find_all('img'):
-            src = img.get('src', '')
-            if src and not re.match(self.ALLOWED_IMAGE_PATTERN, src):
-                # 외부 URL이나 위험한 패턴 제거
-                img.decompose()
-        
-        return str(soup)
+        cleaned_html = cleaner.clean(html_content)
+        return cleaned_html, scan
     
     def extract_metadata(self, content: str) -> ContentMetadata:
         """
@@ -163,7 +233,7 @@ class ContentService:
     
     def process_content(self, content: str, content_type: ContentType) -> ProcessedContent:
         """
-        전체 콘텐츠 처리 플로우
+        전체 콘텐츠 처리 플로우 (같은 콘텐츠/타입은 캐시된 결과 반환)
         
         Args:
             content: 원본 콘텐츠
@@ -172,6 +242,43 @@ class ContentService:
         Returns:
             ProcessedContent: 처리된 콘텐츠
         """
+        settings = get_settings()
+        cacheable = len(content or "") <= settings.content_render_cache_max_length
+        cache_key = None
+        if cacheable:
+            digest = hashlib.sha256((content or "").encode("utf-8")).hexdigest()
+            cache_key = f"{content_type}:{digest}"
+            hit, processed = _render_cache.get(cache_key)
+            if hit:
+                return processed.model_copy(deep=True)
+        
+        processed = self._process_content_uncached(content, content_type)
+        if cacheable:
+            _render_cache.set(cache_key, processed.model_copy(deep=True))
+        return processed
+    
+    def render_for_storage(self, content: str, content_type: Optional[ContentType] = None) -> Dict[str, Any]:
+        """
+        게시글 저장용 렌더링 필드 생성 (작성/수정 시 한 번만 실행, 조회 시에는 저장된 값 사용)
+        
+        Args:
+            content: 원본 콘텐츠
+            content_type: 콘텐츠 타입 (없으면 본문으로 추정)
+            
+        Returns:
+            Dict: content_type, content_rendered, content_text, word_count, reading_time
+        """
+        content_type = content_type or self.detect_content_type(content)
+        processed = self.process_content(content, content_type)
+        return {
+            "content_type": content_type,
+            "content_rendered": processed.rendered_html,
+            "content_text": processed.content_text,
+            "word_count": processed.metadata.word_count,
+            "reading_time": processed.metadata.reading_time
+        }
+    
+    def _process_content_uncached(self, content: str, content_type: ContentType) -> ProcessedContent:
         # 1. 콘텐츠 타입에 따른 렌더링
         if content_type == "markdown":
             rendered_html = self.render_markdown(content)
@@ -180,14 +287,17 @@ class ContentService:
         else:  # text
             rendered_html = html.escape(content).replace('\n', '<br>')
         
-        # 2. HTML 새니타이징
-        safe_html = self.sanitize_html(rendered_html)
-        
-        # 3. 검색용 순수 텍스트 추출
-        content_text = self._extract_text_from_html(safe_html)
+        # 2. 새니타이징 + 이미지 URL 검증 + 검색용 순수 텍스트 추출 (한 번의 파싱)
+        safe_html, scan = self._sanitize_and_scan(rendered_html)
+        content_text = scan.text
         
-        # 4. 메타데이터 추출
-        metadata = self.extract_metadata(content)
+        # 3. 메타데이터 (단어 수는 렌더링된 텍스트 기준, 인라인 이미지는 원본 기준)
+        word_count = self._count_words(content_text)
+        metadata = ContentMetadata(
+            word_count=word_count,
+            reading_time=max(1, word_count // 200),
+            inline_images=self._extract_inline_images(content)
+        )
         
         return ProcessedContent(
             original_content=content,
@@ -195,4 +305,4 @@ class ContentService:
             rendered_html=safe_html,
             content_text=content_text,
             metadata=metadata
-        )
\ No newline at end of file
+        )
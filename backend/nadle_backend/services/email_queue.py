@@ -0,0 +1,269 @@
+"""이메일 발송 대기열 (백그라운드 워커 + SMTP 연결 재사용)
+
+API 핸들러는 메시지를 대기열에 넣고 바로 반환하며, 실제 발송은 백그라운드 워커가 합니다.
+
+- 워커마다 SMTP 연결 하나를 유지해 TLS 핸드셰이크/로그인을 메시지마다 반복하지 않음
+- 블로킹 smtplib 호출은 스레드에서 실행되어 이벤트 루프를 막지 않음
+- 유휴 시간이 smtp_idle_timeout을 넘은 연결은 NOOP으로 확인 후 필요하면 재연결
+- 발송 실패 시 지수 백오프(email_retry_backoff * 2^n, 최대 60초)로 email_max_attempts까지 재시도
+- 대기열이 가득 차면 enqueue가 False를 반환 (호출자가 실패로 응답)
+- 대기열은 프로세스 메모리에 있으므로 비정상 종료 시 미발송 메시지는 유실 (인증 코드는 재요청 가능)
+"""
+
+import asyncio
+import logging
+import smtplib
+import time
+from dataclasses import dataclass, field
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from ..config import get_settings
+
+logger = logging.getLogger(__name__)
+
+MAX_RETRY_DELAY = 60.0
+
+
+@dataclass
+class EmailMessage:
+    """발송 대기 메시지"""
+    to_email: str
+    subject: str
+    html_content: str
+    attempts: int = 0
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+def build_mime_message(message: EmailMessage) -> MIMEMultipart:
+    """HTML 본문 MIME 메시지 생성"""
+    settings = get_settings()
+    mime = MIMEMultipart('alternative')
+    mime['Subject'] = message.subject
+    mime['From'] = f"{settings.from_name} <{settings.from_email}>"
+    mime['To'] = message.to_email
+    mime.attach(MIMEText(message.html_content, 'html', 'utf-8'))
+    return mime
+
+
+class SMTPConnection:
+    """재사용 SMTP 연결 (한 워커 전용, 워커 스레드에서만 호출)"""
+
+    def __init__(self, smtp_factory: Callable[..., smtplib.SMTP] = smtplib.SMTP):
+        self.settings = get_settings()
+        self._smtp_factory = smtp_factory
+        self._server: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+        self.connects = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        server = self._smtp_factory(
+            self.settings.smtp_server, self.settings.smtp_port, timeout=self.settings.smtp_timeout
+        )
+        try:
+            if self.settings.smtp_use_tls:
+                server.starttls()
+            if self.settings.smtp_username and self.settings.smtp_password:
+                server.login(self.settings.smtp_username, self.settings.smtp_password)
+        except Exception:
+            self._quietly_close(server)
+            raise
+        self.connects += 1
+        return server
+
+    def _is_alive(self) -> bool:
+        if self._server is None:
+            return False
+        if time.monotonic() - self._last_used < self.settings.smtp_idle_timeout:
+            return True
+        try:
+            return self._server.noop()[0] == 250
+        except smtplib.SMTPException:
+            return False
+        except OSError:
+            return False
+
+    def _send_once(self, mime: MIMEMultipart) -> None:
+        if not self._is_alive():
+            self.close()
+            self._server = self._connect()
+        try:
+            self._server.send_message(mime)
+        except Exception:
+            # 연결 상태를 알 수 없으므로 다음 발송에서 새로 연결
+            self.close()
+            raise
+        self._last_used = time.monotonic()
+
+    def send(self, mime: MIMEMultipart) -> None:
+        """메시지 발송 - 서버가 재사용 연결을 끊었으면 한 번 재연결"""
+        try:
+            self._send_once(mime)
+        except smtplib.SMTPServerDisconnected:
+            self._send_once(mime)
+
+    @staticmethod
+    def _quietly_close(server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._quietly_close(self._server)
+            self._server = None
+
+
+class EmailDeliveryQueue:
+    """백그라운드 이메일 발송 대기열"""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_size: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        retry_backoff: Optional[float] = None,
+        connection_factory: Callable[[], SMTPConnection] = SMTPConnection
+    ):
+        settings = get_settings()
+        self.workers = workers or settings.email_queue_workers
+        self.max_size = max_size or settings.email_queue_max_size
+        self.max_attempts = max_attempts or settings.email_max_attempts
+        self.retry_backoff = retry_backoff or settings.email_retry_backoff
+        self._connection_factory = connection_factory
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._connections: List[SMTPConnection] = []
+        self._retries: Set[asyncio.Task] = set()
+        self._started_at: Optional[float] = None
+        self._stats = {
+            "enqueued": 0,
+            "sent": 0,
+            "failed": 0,
+            "retried": 0,
+            "rejected": 0
+        }
+        self._last_error: Optional[str] = None
+        self._total_latency = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    @property
+    def depth(self) -> int:
+        """발송 대기 중인 메시지 수 (재시도 대기 포함)"""
+        return (self._queue.qsize() if self._queue else 0) + len(self._retries)
+
+    def enqueue(self, to_email: str, subject: str, html_content: str) -> bool:
+        """메시지를 대기열에 추가 (발송은 백그라운드) - 대기열이 가득 차면 False"""
+        if not self.is_running:
+            self.start()
+        try:
+            self._queue.put_nowait(EmailMessage(to_email, subject, html_content))
+        except asyncio.QueueFull:
+            self._stats["rejected"] += 1
+            logger.warning(f"이메일 대기열 가득 참 ({self.max_size}) - 발송 거절: {to_email}")
+            return False
+        self._stats["enqueued"] += 1
+        return True
+
+    async def _deliver(self, connection: SMTPConnection, message: EmailMessage) -> None:
+        message.attempts += 1
+        try:
+            await asyncio.to_thread(connection.send, build_mime_message(message))
+        except Exception as e:
+            self._last_error = str(e)
+            if message.attempts >= self.max_attempts:
+                self._stats["failed"] += 1
+                logger.error(f"이메일 발송 실패 ({message.attempts}회 시도): {message.to_email} - {e}")
+                return
+            delay = min(self.retry_backoff * 2 ** (message.attempts - 1), MAX_RETRY_DELAY)
+            self._stats["retried"] += 1
+            logger.warning(f"이메일 발송 실패, {delay:.1f}초 후 재시도 ({message.attempts}/{self.max_attempts}): {e}")
+            task = asyncio.create_task(self._requeue_after(message, delay))
+            self._retries.add(task)
+            task.add_done_callback(self._retries.discard)
+            return
+
+        self._stats["sent"] += 1
+        self._total_latency += time.monotonic() - message.enqueued_at
+        logger.info(f"이메일 발송 완료: {message.to_email}")
+
+    async def _requeue_after(self, message: EmailMessage, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self._queue.put(message)
+
+    async def _worker(self, connection: SMTPConnection) -> None:
+        while True:
+            message = await self._queue.get()
+            try:
+                await self._deliver(connection, message)
+            finally:
+                self._queue.task_done()
+
+    def start(self) -> None:
+        """발송 워커 시작 (실행 중인 이벤트 루프 필요)"""
+        if self.is_running:
+            return
+        if self._queue is None or self._queue.empty():
+            # 대기열은 생성된 이벤트 루프에 묶이므로 비어 있으면 현재 루프에서 새로 생성
+            self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._connections = [self._connection_factory() for _ in range(self.workers)]
+        self._tasks = [asyncio.create_task(self._worker(connection)) for connection in self._connections]
+        self._started_at = time.monotonic()
+        logger.info(f"이메일 발송 대기열 시작 (워커 {self.workers}개)")
+
+    async def drain(self) -> None:
+        """대기열과 재시도 대기 메시지가 모두 처리될 때까지 대기"""
+        while self._queue is not None:
+            await self._queue.join()
+            if not self._retries:
+                return
+            await asyncio.gather(*list(self._retries), return_exceptions=True)
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """남은 메시지 발송을 timeout까지 기다린 뒤 워커와 SMTP 연결 종료"""
+        if self.is_running:
+            try:
+                await asyncio.wait_for(self.drain(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"이메일 대기열 종료 - 미발송 {self.depth}건 폐기")
+
+        for task in [*self._tasks, *self._retries]:
+            task.cancel()
+        await asyncio.gather(*self._tasks, *self._retries, return_exceptions=True)
+        self._tasks = []
+        self._retries.clear()
+        for connection in self._connections:
+            await asyncio.to_thread(connection.close)
+        self._connections = []
+
+    def stats(self) -> Dict[str, Any]:
+        """처리량/대기열 지표"""
+        uptime = time.monotonic() - self._started_at if self._started_at else 0.0
+        sent = self._stats["sent"]
+        return {
+            **self._stats,
+            "queue_depth": self.depth,
+            "workers": len(self._tasks),
+            "smtp_connects": sum(connection.connects for connection in self._connections),
+            "throughput_per_min": round(sent / uptime * 60, 2) if uptime else 0.0,
+            "avg_delivery_seconds": round(self._total_latency / sent, 3) if sent else 0.0,
+            "last_error": self._last_error,
+            "running": self.is_running
+        }
+
+
+# 글로벌 이메일 발송 대기열 (워커 프로세스당 하나, 첫 enqueue 또는 startup에서 시작)
+email_queue = EmailDeliveryQueue()
+
+
+async def get_email_queue() -> EmailDeliveryQueue:
+    """이메일 발송 대기열 인스턴스 반환"""
+    return email_queue
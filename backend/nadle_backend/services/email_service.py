@@ -1,15 +1,13 @@
-import smtplib
 import secrets
 import string
 from datetime import datetime, timedelta
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from typing import Optional
 import logging
 
 from ..config import settings
 from ..models.core import User
 from ..repositories.user_repository import UserRepository
+from .email_queue import get_email_queue
 
 logger = logging.getLogger(__name__)
 
@@ -129,32 +127,13 @@ class EmailService:
             return False, f"인증 코드 확인 중 오류가 발생했습니다: {str(e)}"
     
     async def _send_email(self, to_email: str, subject: str, html_content: str) -> bool:
-        """Send email using SMTP."""
+        """Queue email for background SMTP delivery (returns False if the queue is full)."""
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = f"{settings.from_name} <{settings.from_email}>"
-            msg['To'] = to_email
-            
-            # Attach HTML content
-            html_part = MIMEText(html_content, 'html', 'utf-8')
-            msg.attach(html_part)
-            
-            # Connect to SMTP server and send
-            with smtplib.SMTP(settings.smtp_server, settings.smtp_port) as server:
-                if settings.smtp_use_tls:
-                    server.starttls()
-                
-                if settings.smtp_username and settings.smtp_password:
-                    server.login(settings.smtp_username, settings.smtp_password)
-                
-                server.send_message(msg)
-            
-            return True
+            queue = await get_email_queue()
+            return queue.enqueue(to_email, subject, html_content)
             
         except Exception as e:
-            logger.error(f"SMTP error when sending email to {to_email}: {str(e)}")
+            logger.error(f"Failed to queue email to {to_email}: {str(e)}")
             return False
     
     async def is_email_verified(self, email: str) -> bool:
@@ -1,11 +1,8 @@
 """Service for email verification during signup process."""
 
-import smtplib
 import secrets
 import string
 from datetime import datetime, timedelta
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from typing import Optional, Tuple
 import logging
 
@@ -19,6 +16,7 @@ from ..models.email_verification import (
     EmailVerificationCodeResponse
 )
 from ..repositories.email_verification_repository import EmailVerificationRepository
+from .email_queue import get_email_queue
 
 logger = logging.getLogger(__name__)
 
@@ -227,30 +225,11 @@ class EmailVerificationService:
         return subject, html_content
     
     async def _send_email_smtp(self, to_email: str, subject: str, html_content: str) -> bool:
-        """Send email using SMTP."""
+        """Queue email for background SMTP delivery (returns False if the queue is full)."""
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = f"{settings.from_name} <{settings.from_email}>"
-            msg['To'] = to_email
-            
-            # Attach HTML content
-            html_part = MIMEText(html_content, 'html', 'utf-8')
-            msg.attach(html_part)
-            
-            # Connect to SMTP server and send
-            with smtplib.SMTP(settings.smtp_server, settings.smtp_port) as server:
-                if settings.smtp_use_tls:
-                    server.starttls()
-                
-                if settings.smtp_username and settings.smtp_password:
-                    server.login(settings.smtp_username, settings.smtp_password)
-                
-                server.send_message(msg)
-            
-            return True
+            queue = await get_email_queue()
+            return queue.enqueue(to_email, subject, html_content)
             
         except Exception as e:
-            logger.error(f"SMTP error when sending email to {to_email}: {str(e)}")
+            logger.error(f"Failed to queue email to {to_email}: {str(e)}")
             return False
\ No newline at end of file
@@ -61,6 +61,10 @@ def create_file_document(metadata: Dict[str, Any],
         "status": "active"
     }
     
+    # Content digest computed while the upload was streamed
+    if metadata.get("sha256"):
+        document["sha256"] = metadata["sha256"]
+    
     # Add attachment information if provided
     if attachment_type:
         document["attachment_type"] = attachment_type
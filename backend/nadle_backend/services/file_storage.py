@@ -4,19 +4,62 @@ File Storage Module
 Provides file storage functions including:
 - UUID-based file path generation with date structure
 - File saving to disk with error handling
+- Chunked copies of uploads to disk (size limit, SHA-256 and magic-byte
+  check in the same pass, atomic rename into place)
+- Content-addressed blob paths (uploads/blobs/ab/cd/<sha256>) for deduplication
+- Derived image variant paths (uploads/variants/ab/cd/<sha256>_<width>.<format>)
 - Directory structure creation and management
 """
 
+import asyncio
+import hashlib
 import os
+import shutil
+import tempfile
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Union
+from typing import Any, BinaryIO, Optional, Tuple, Union
 import logging
 
+from nadle_backend.services.file_validator import (
+    MAX_FILE_SIZE,
+    SIGNATURE_LENGTH,
+    validate_file_signature
+)
+
 logger = logging.getLogger(__name__)
 
 # Configuration
 UPLOAD_BASE_DIR = "uploads"
+BLOB_DIR = os.path.join(UPLOAD_BASE_DIR, "blobs")
+BLOB_TEMP_DIR = os.path.join(BLOB_DIR, ".incoming")  # Same filesystem as BLOB_DIR
+VARIANT_DIR = os.path.join(UPLOAD_BASE_DIR, "variants")
+UPLOAD_CHUNK_SIZE = 64 * 1024  # Bytes read from the request per chunk
+TEMP_FILE_SUFFIX = ".part"
+
+
+class UploadRejectedError(Exception):
+    """Raised when a streamed upload is rejected before it is stored"""
+    pass
+
+
+class FileTooLargeError(UploadRejectedError):
+    """Raised when the streamed upload exceeds the size limit"""
+    pass
+
+
+class FileSignatureError(UploadRejectedError):
+    """Raised when the file content does not match the declared type"""
+    pass
+
+
+@dataclass
+class StoredUpload:
+    """Result of a streamed upload"""
+    file_path: str
+    size: int
+    sha256: str
 
 
 def generate_file_path(filename: str) -> str:
@@ -84,6 +127,223 @@ def save_file_to_disk(file_content: bytes, file_path: str) -> bool:
         return False
 
 
+def generate_blob_path(sha256: str) -> str:
+    """
+    Generate content-addressed blob path for a SHA-256 digest
+    
+    Args:
+        sha256: Hex digest of the file content
+        
+    Returns:
+        str: Path in format: uploads/blobs/ab/cd/<sha256>
+    """
+    return os.path.join(BLOB_DIR, sha256[:2], sha256[2:4], sha256)
+
+
+def generate_variant_path(content_key: str, width: int, image_format: str) -> str:
+    """
+    Generate path of a resized image variant
+    
+    Variants are derived from the content, so records sharing a blob share
+    their variants as well.
+    
+    Args:
+        content_key: SHA-256 digest of the original (file id for records without one)
+        width: Variant width in pixels
+        image_format: Variant format (webp, jpeg)
+        
+    Returns:
+        str: Path in format: uploads/variants/ab/cd/<content_key>_<width>.<format>
+    """
+    return os.path.join(VARIANT_DIR, content_key[:2], content_key[2:4], f"{content_key}_{width}.{image_format}")
+
+
+def _open_temp_file(directory: str) -> BinaryIO:
+    os.makedirs(directory, exist_ok=True)
+    return tempfile.NamedTemporaryFile(dir=directory, suffix=TEMP_FILE_SUFFIX, delete=False)
+
+
+def _write_chunk(temp_file: BinaryIO, digest: Any, chunk: bytes) -> None:
+    temp_file.write(chunk)
+    digest.update(chunk)
+
+
+def _close_temp_file(temp_file: BinaryIO) -> None:
+    temp_file.flush()
+    os.fsync(temp_file.fileno())
+    temp_file.close()
+
+
+def commit_temp_file(temp_path: str, file_path: str) -> None:
+    """
+    Move a completed temporary file into place
+    
+    Temporary files live under UPLOAD_BASE_DIR (same filesystem), so the
+    rename is atomic and readers never see a partial file.
+    
+    Args:
+        temp_path: Completed temporary file
+        file_path: Target file path
+    """
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    os.replace(temp_path, file_path)
+
+
+def discard_temp_file(temp_path: str) -> None:
+    """Remove a temporary upload file if it still exists"""
+    try:
+        os.unlink(temp_path)
+    except FileNotFoundError:
+        pass
+
+
+def hash_file(file_path: str, chunk_size: int = UPLOAD_CHUNK_SIZE) -> Tuple[str, int]:
+    """
+    Compute SHA-256 digest and size of a stored file in fixed-size chunks
+    
+    Args:
+        file_path: File to hash
+        chunk_size: Bytes read per chunk
+        
+    Returns:
+        Tuple[str, int]: Hex digest and file size in bytes
+    """
+    digest = hashlib.sha256()
+    size = 0
+    with open(file_path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def link_into_place(source_path: str, file_path: str) -> bool:
+    """
+    Make an existing file available at file_path without touching the source
+    
+    Uses a hard link when possible and falls back to copying through a
+    temporary file, so file_path only ever appears complete.
+    
+    Args:
+        source_path: Existing file
+        file_path: Target file path
+        
+    Returns:
+        bool: True if file_path was created, False if it already existed
+    """
+    if os.path.exists(file_path):
+        return False
+    
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    try:
+        os.link(source_path, file_path)
+    except FileExistsError:
+        return False
+    except OSError:
+        with tempfile.NamedTemporaryFile(dir=directory or ".", suffix=TEMP_FILE_SUFFIX, delete=False) as temp_file:
+            with open(source_path, 'rb') as source:
+                shutil.copyfileobj(source, temp_file, UPLOAD_CHUNK_SIZE)
+        commit_temp_file(temp_file.name, file_path)
+    return True
+
+
+async def stream_upload_to_temp(
+    upload: Any,
+    directory: str,
+    max_size: int = MAX_FILE_SIZE,
+    expected_type: Optional[str] = None,
+    chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> StoredUpload:
+    """
+    Copy an upload to a temporary file in fixed-size chunks
+    
+    Chunks are written in a worker thread while the byte limit, SHA-256 digest
+    and magic-byte check are applied in the same pass, so this copy holds one
+    chunk at a time. An UploadFile has already been spooled in full by
+    Starlette before the handler runs; the request body itself is bounded
+    earlier by Content-Length (UploadSizeLimitRoute) and nginx
+    client_max_body_size. Rejected uploads leave no file behind.
+    
+    Args:
+        upload: Object with an async read(size) method (e.g. UploadFile)
+        directory: Directory for the temporary file (same filesystem as the target)
+        max_size: Maximum accepted size in bytes (uploads must be smaller)
+        expected_type: Declared MIME type to verify against the magic bytes
+        chunk_size: Bytes read per chunk
+        
+    Returns:
+        StoredUpload: Temporary file path, actual size and SHA-256 hex digest
+        
+    Raises:
+        FileTooLargeError: If the upload reaches max_size
+        FileSignatureError: If the content does not match expected_type
+        OSError: If the file cannot be written
+    """
+    temp_file = await asyncio.to_thread(_open_temp_file, directory)
+    digest = hashlib.sha256()
+    header = b""
+    size = 0
+    
+    try:
+        while chunk := await upload.read(chunk_size):
+            size += len(chunk)
+            if size >= max_size:
+                raise FileTooLargeError(f"File size exceeds {max_size} bytes")
+            
+            if expected_type and len(header) < SIGNATURE_LENGTH:
+                header += chunk[:SIGNATURE_LENGTH - len(header)]
+                if len(header) >= SIGNATURE_LENGTH and not validate_file_signature(header, expected_type):
+                    raise FileSignatureError(f"File content does not match {expected_type}")
+            
+            await asyncio.to_thread(_write_chunk, temp_file, digest, chunk)
+        
+        # Files shorter than the signature length are checked once at the end
+        if expected_type and len(header) < SIGNATURE_LENGTH and not validate_file_signature(header, expected_type):
+            raise FileSignatureError(f"File content does not match {expected_type}")
+        
+        await asyncio.to_thread(_close_temp_file, temp_file)
+    except BaseException:
+        # Also runs on cancellation (client disconnect), so no await here
+        temp_file.close()
+        discard_temp_file(temp_file.name)
+        raise
+    
+    return StoredUpload(file_path=temp_file.name, size=size, sha256=digest.hexdigest())
+
+
+async def stream_upload_to_disk(
+    upload: Any,
+    file_path: str,
+    max_size: int = MAX_FILE_SIZE,
+    expected_type: Optional[str] = None,
+    chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> StoredUpload:
+    """
+    Stream an upload to file_path (see stream_upload_to_temp)
+    
+    The temporary file is created next to the target and renamed into place
+    only after the whole upload passed validation.
+    
+    Returns:
+        StoredUpload: Stored path, actual size and SHA-256 hex digest
+    """
+    stored = await stream_upload_to_temp(
+        upload, os.path.dirname(file_path) or ".", max_size, expected_type, chunk_size
+    )
+    try:
+        await asyncio.to_thread(commit_temp_file, stored.file_path, file_path)
+    except BaseException:
+        discard_temp_file(stored.file_path)
+        raise
+    
+    logger.info(f"File streamed successfully: {file_path} ({stored.size} bytes)")
+    return StoredUpload(file_path=file_path, size=stored.size, sha256=stored.sha256)
+
+
 def create_directory_structure(path: str) -> bool:
     """
     Create directory structure for given path
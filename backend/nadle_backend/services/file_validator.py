@@ -8,7 +8,7 @@ Provides validation functions for file uploads including:
 """
 
 import os
-from typing import Any, Protocol
+from typing import Any, Optional, Protocol
 
 
 class FileProtocol(Protocol):
@@ -28,6 +28,9 @@ ALLOWED_MIME_TYPES = frozenset({
     'image/webp'
 })
 
+# Number of leading bytes needed to identify every allowed image format
+SIGNATURE_LENGTH = 12
+
 # Extension to MIME type mapping
 EXTENSION_MIME_MAP = {
     '.jpg': 'image/jpeg',
@@ -58,6 +61,10 @@ def validate_file_size(file: Any) -> bool:
     """
     Validate if file size is within allowed limit (5MB)
     
+    The declared size comes from the client, so an unknown size is accepted
+    here and the limit is enforced again on the actual bytes when the upload
+    is copied to storage.
+    
     Args:
         file: File object with size attribute
         
@@ -65,11 +72,53 @@ def validate_file_size(file: Any) -> bool:
         bool: True if file size is acceptable, False otherwise
     """
     try:
+        if file.size is None:
+            return True
         return file.size < MAX_FILE_SIZE
     except AttributeError:
         return False
 
 
+def detect_image_type(header: bytes) -> Optional[str]:
+    """
+    Detect image MIME type from magic bytes
+    
+    Args:
+        header: Leading bytes of the file (at least SIGNATURE_LENGTH for WebP)
+        
+    Returns:
+        Optional[str]: Detected MIME type, or None if not an allowed image
+    """
+    if header.startswith(b'\xff\xd8\xff'):
+        return 'image/jpeg'
+    if header.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'image/png'
+    if header.startswith((b'GIF87a', b'GIF89a')):
+        return 'image/gif'
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return 'image/webp'
+    return None
+
+
+def validate_file_signature(header: bytes, content_type: str) -> bool:
+    """
+    Validate if file content (magic bytes) matches the declared MIME type
+    
+    Args:
+        header: Leading bytes of the file
+        content_type: MIME type declared by the client
+        
+    Returns:
+        bool: True if content matches the declared type, False otherwise
+    """
+    detected = detect_image_type(header)
+    if detected is None:
+        return False
+    # image/jpg is a common non-standard alias of image/jpeg
+    declared = 'image/jpeg' if content_type == 'image/jpg' else content_type
+    return detected == declared
+
+
 def validate_file_extension(file: Any) -> bool:
     """
     Validate if file extension matches MIME type
@@ -0,0 +1,224 @@
+"""
+Image Variants Module
+
+Resized WebP/JPEG derivatives of uploaded images:
+- A fixed set of widths (image_variant_widths); requested widths are snapped
+  to the nearest configured width so the number of variants stays bounded
+- Decoding and encoding run in a process pool, never on the event loop
+- JPEG sources are decoded at reduced scale (Pillow draft mode) and EXIF
+  orientation is applied before the metadata is dropped
+- Variants are written atomically next to the blob tree and recorded on the
+  FileRecord; concurrent requests for a missing variant share one job
+"""
+
+import asyncio
+import os
+import tempfile
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterable, Optional
+import logging
+
+from PIL import Image, ImageOps
+
+from nadle_backend.config import get_settings
+from nadle_backend.repositories.file_repository import record_file_variants
+from nadle_backend.services.file_storage import TEMP_FILE_SUFFIX, generate_variant_path
+
+logger = logging.getLogger(__name__)
+
+VARIANT_CONTENT_TYPES = {"webp": "image/webp", "jpeg": "image/jpeg"}
+ROTATED_ORIENTATIONS = {5, 6, 7, 8}  # EXIF orientations that swap width and height
+EXIF_ORIENTATION_TAG = 0x0112
+
+
+def select_variant_width(width: int, widths: Optional[Iterable[int]] = None) -> int:
+    """Snap a requested width to the smallest configured width that covers it"""
+    widths = sorted(widths or get_settings().image_variant_widths)
+    return next((candidate for candidate in widths if candidate >= width), widths[-1])
+
+
+def select_variant_format(accept: Optional[str]) -> str:
+    """WebP for clients that accept it, JPEG otherwise"""
+    return "webp" if accept and "image/webp" in accept else "jpeg"
+
+
+def variant_key(width: int, image_format: str) -> str:
+    """Key of a variant in FileRecord.variants"""
+    return f"{image_format}_{width}"
+
+
+def variant_path(file_record: Dict[str, Any], width: int, image_format: str) -> str:
+    """Variant file path for a record (shared by records with the same content)"""
+    return generate_variant_path(file_record.get("sha256") or file_record["file_id"], width, image_format)
+
+
+def _variant_info(file_path: str, size: tuple, image_format: str) -> Dict[str, Any]:
+    return {
+        "file_path": file_path,
+        "width": size[0],
+        "height": size[1],
+        "file_size": os.path.getsize(file_path),
+        "content_type": VARIANT_CONTENT_TYPES[image_format]
+    }
+
+
+def render_variant(source_path: str, dest_path: str, width: int, image_format: str, quality: int) -> Dict[str, Any]:
+    """
+    Resize an image and write it as WebP/JPEG without metadata (runs in a worker process)
+
+    Images are never upscaled; animated images keep their first frame.
+
+    Args:
+        source_path: Original image file
+        dest_path: Variant file path (reused if it already exists)
+        width: Maximum variant width in pixels
+        image_format: webp or jpeg
+        quality: Encoder quality
+
+    Returns:
+        Dict: Variant path, dimensions, size and content type
+    """
+    if os.path.exists(dest_path):
+        with Image.open(dest_path) as existing:
+            return _variant_info(dest_path, existing.size, image_format)
+
+    with Image.open(source_path) as image:
+        # Bound the stored axis that becomes the width once orientation is applied
+        rotated = image.getexif().get(EXIF_ORIENTATION_TAG) in ROTATED_ORIENTATIONS
+        box = (image.width, width) if rotated else (width, image.height)
+        # thumbnail() lets the JPEG decoder skip detail it would throw away (draft mode)
+        image.thumbnail(box, Image.Resampling.LANCZOS)
+        image = ImageOps.exif_transpose(image)
+
+    if image_format == "jpeg" or image.mode not in ("RGB", "RGBA"):
+        has_alpha = image_format == "webp" and (image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info)
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+    directory = os.path.dirname(dest_path)
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=directory, suffix=TEMP_FILE_SUFFIX, delete=False) as temp_file:
+        # No exif/icc arguments, so camera metadata (GPS, serial numbers) is not copied
+        image.save(temp_file, format=image_format.upper(), quality=quality, optimize=image_format == "jpeg")
+    os.replace(temp_file.name, dest_path)
+    return _variant_info(dest_path, image.size, image_format)
+
+
+class ImageVariantPool:
+    """Process pool for image resizing"""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        executor_factory: Optional[Callable[[int], Executor]] = None
+    ):
+        self.max_workers = max_workers or get_settings().image_variant_workers
+        self._executor_factory = executor_factory or ProcessPoolExecutor
+        self._executor: Optional[Executor] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = self._executor_factory(self.max_workers)
+        return self._executor
+
+    async def _run(self, *args: Any) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._get_executor(), render_variant, *args)
+        except BrokenProcessPool:
+            logger.warning("Image variant pool broken, recreating")
+            self._executor = None
+            return await loop.run_in_executor(self._get_executor(), render_variant, *args)
+
+    async def render(self, source_path: str, dest_path: str, width: int, image_format: str) -> Dict[str, Any]:
+        """
+        Render a variant, sharing the job with concurrent callers for the same path
+
+        Raises:
+            OSError / PIL errors: If the source cannot be decoded or the variant written
+        """
+        future = self._inflight.get(dest_path)
+        if future is None:
+            quality = get_settings().image_variant_quality
+            future = asyncio.ensure_future(self._run(source_path, dest_path, width, image_format, quality))
+            self._inflight[dest_path] = future
+            future.add_done_callback(lambda _: self._inflight.pop(dest_path, None))
+        # A disconnecting client must not cancel the job other requests wait for
+        return await asyncio.shield(future)
+
+    def shutdown(self) -> None:
+        """Stop worker processes (pending jobs are cancelled)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Global variant pool (worker processes start on the first job)
+variant_pool: Optional[ImageVariantPool] = None
+
+
+def get_variant_pool() -> ImageVariantPool:
+    """Image variant pool instance"""
+    global variant_pool
+    if variant_pool is None:
+        variant_pool = ImageVariantPool()
+    return variant_pool
+
+
+async def get_variant(file_record: Dict[str, Any], width: int, image_format: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a variant of a stored image, creating it on first request
+
+    Args:
+        file_record: FileRecord document of the original
+        width: Configured variant width (see select_variant_width)
+        image_format: webp or jpeg
+
+    Returns:
+        Optional[Dict]: Variant info, None if the original cannot be resized
+    """
+    key = variant_key(width, image_format)
+    recorded = (file_record.get("variants") or {}).get(key)
+    if recorded and await asyncio.to_thread(os.path.exists, recorded["file_path"]):
+        return recorded
+
+    dest_path = variant_path(file_record, width, image_format)
+    try:
+        info = await get_variant_pool().render(file_record["file_path"], dest_path, width, image_format)
+    except Exception as e:
+        logger.warning(f"Could not create variant {key} of file {file_record['file_id']}: {e}")
+        return None
+
+    await record_file_variants(file_record["file_id"], {key: info})
+    return info
+
+
+async def generate_variants(file_id: str, file_path: str, sha256: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Create the configured WebP variants of a new upload (run after the response is sent)
+
+    Args:
+        file_id: Unique file identifier
+        file_path: Stored original
+        sha256: Content digest of the original
+
+    Returns:
+        Dict: Variant info keyed by "<format>_<width>"
+    """
+    file_record = {"file_id": file_id, "file_path": file_path, "sha256": sha256}
+    pool = get_variant_pool()
+    variants = {}
+    for width in sorted(get_settings().image_variant_widths):
+        try:
+            variants[variant_key(width, "webp")] = await pool.render(
+                file_path, variant_path(file_record, width, "webp"), width, "webp"
+            )
+        except Exception as e:
+            logger.warning(f"Could not create {width}px variant of file {file_id}: {e}")
+            break
+
+    if variants:
+        await record_file_variants(file_id, variants)
+        logger.info(f"Created {len(variants)} image variants for file {file_id}")
+    return variants
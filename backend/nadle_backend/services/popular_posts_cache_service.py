@@ -1,13 +1,123 @@
-from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
+"""인기 게시글 캐시 및 시간 감쇠 랭킹 보드
+
+HOT(`hot:realtime`), 주간 트렌딩(`trending:weekly`), 서비스별(`popular:service:*`) 보드는
+조회/반응/댓글 이벤트가 들어올 때마다 점진적으로 갱신됩니다 (PopularityRanking 참고).
+
+- forward decay: 시각 t의 이벤트는 가중치 × 2^((t - 기준 시각) / 반감기)만큼 ZINCRBY
+  → 기존 멤버를 다시 쓰지 않아도 최근 이벤트가 오래된 이벤트보다 반감기마다 두 배 무겁게 반영
+- 주기적 재정규화가 점수를 현재 시각 기준으로 맞추고(ZUNIONSTORE WEIGHTS) 식은 게시글을 정리
+- 세 보드와 게시글 요약은 Lua 스크립트 한 번(왕복 한 번)으로 함께 갱신
+- 조회는 ZREVRANGE 한 번 + 요약 MGET 한 번
+- 게시글 요약 키는 캐시 태그(popular:detail)에 등록 - 전체 삭제 시 KEYS 스캔 없음
+- 랭킹 스크립트는 보드/요약 키를 ARGV 프리픽스와 보드 레지스트리에서 만들어 KEYS로 선언하지 않음
+  → 단일 노드 Redis와 Upstash 전제 (Redis Cluster에서는 키 슬롯이 달라 실패)
+"""
+
+from typing import Optional, Iterable, List, Dict, Any
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from pydantic import BaseModel, Field
 import json
 import logging
+import time
 from ..database.redis_factory import get_redis_manager, get_prefixed_key
+from ..database import cache_tags
 from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# 이벤트 종류별 랭킹 가중치
+EVENT_WEIGHTS = {
+    "view": 1.0,
+    "like": 5.0,
+    "comment": 3.0,
+    "bookmark": 4.0
+}
+
+# 게시글 요약 키를 등록하는 캐시 태그
+POPULAR_DETAIL_TAG = "popular:detail"
+
+# 이벤트를 HOT/트렌딩/서비스 보드에 반영하고 게시글 요약을 저장 (원자적, 왕복 한 번)
+# KEYS[1]: 기준 시각 키, KEYS[2]: 보드 레지스트리 (보드 키 -> 반감기, 재정규화 대상),
+# KEYS[3]: 요약 키 태그 Set
+# ARGV[1]: incr (가중치 누적) | seed (없는 멤버만 추가, 초기 적재용), ARGV[2]: 현재 시각, ARGV[3]: 요약 TTL
+# ARGV[4..5]: HOT 보드 키/반감기, ARGV[6..7]: 트렌딩 보드 키/반감기,
+# ARGV[8..9]: 서비스 보드 키 프리픽스/반감기 (보드 키/프리픽스가 "" 이면 해당 보드 생략), ARGV[10]: 요약 키 프리픽스
+# ARGV[11..]: 게시글마다 post_id, 가중치, 서비스, 발생 시각, 요약 JSON("" 이면 생략)
+# 보드 키와 요약 키는 ARGV로 받아 스크립트 안에서 만드는 미선언 키 - 단일 노드 Redis/Upstash 전용
+RECORD_RANKING_SCRIPT = """
+local epoch = tonumber(redis.call('GET', KEYS[1]))
+if not epoch then
+  epoch = tonumber(ARGV[2])
+  redis.call('SET', KEYS[1], ARGV[2])
+end
+local function apply(board, half_life, weight, at, member)
+  if board == '' then
+    return
+  end
+  local score = weight * math.exp((at - epoch) * 0.6931471805599453 / tonumber(half_life))
+  if ARGV[1] == 'seed' then
+    redis.call('ZADD', board, 'NX', score, member)
+  else
+    redis.call('ZINCRBY', board, score, member)
+  end
+  redis.call('HSET', KEYS[2], board, half_life)
+end
+for i = 11, #ARGV, 5 do
+  local post_id, weight, at = ARGV[i], tonumber(ARGV[i + 1]), tonumber(ARGV[i + 3])
+  apply(ARGV[4], ARGV[5], weight, at, post_id)
+  apply(ARGV[6], ARGV[7], weight, at, post_id)
+  if ARGV[8] ~= '' and ARGV[i + 2] ~= '' then
+    apply(ARGV[8] .. ARGV[i + 2], ARGV[9], weight, at, post_id)
+  end
+  if ARGV[i + 4] ~= '' then
+    redis.call('SET', ARGV[10] .. post_id, ARGV[i + 4], 'EX', ARGV[3])
+    redis.call('SADD', KEYS[3], ARGV[10] .. post_id)
+  end
+end
+if redis.call('TTL', KEYS[3]) < tonumber(ARGV[3]) then
+  redis.call('EXPIRE', KEYS[3], ARGV[3])
+end
+return (#ARGV - 10) / 5
+"""
+
+# 모든 보드 점수를 현재 시각 기준으로 다시 맞추고 (기준 시각 이동) 정리 기준 미만 멤버 삭제
+# KEYS[1]: 기준 시각 키, KEYS[2]: 보드 레지스트리 / ARGV[1]: 현재 시각, ARGV[2]: 정리 기준 점수
+# 보드 키는 레지스트리에서 읽는 미선언 키 - 단일 노드 Redis/Upstash 전용
+RENORMALIZE_RANKING_SCRIPT = """
+local epoch = tonumber(redis.call('GET', KEYS[1]))
+if not epoch then
+  return 0
+end
+local boards = redis.call('HGETALL', KEYS[2])
+for i = 1, #boards, 2 do
+  local board = boards[i]
+  local factor = math.exp((epoch - tonumber(ARGV[1])) * 0.6931471805599453 / tonumber(boards[i + 1]))
+  redis.call('ZUNIONSTORE', board, 1, board, 'WEIGHTS', factor)
+  redis.call('ZREMRANGEBYSCORE', board, '-inf', '(' .. ARGV[2])
+  if redis.call('EXISTS', board) == 0 then
+    redis.call('HDEL', KEYS[2], board)
+  end
+end
+redis.call('SET', KEYS[1], ARGV[1])
+return #boards / 2
+"""
+
+# 레지스트리에 등록된 모든 보드와 레지스트리 삭제 - KEYS[1]: 보드 레지스트리
+# 보드 키는 레지스트리에서 읽는 미선언 키 - 단일 노드 Redis/Upstash 전용
+CLEAR_RANKING_SCRIPT = """
+local boards = redis.call('HKEYS', KEYS[1])
+for _, board in ipairs(boards) do
+  redis.call('DEL', board)
+end
+redis.call('DEL', KEYS[1])
+return #boards
+"""
+
+# 랭킹 보드 이름 (apply_ranking_events/seed_rankings의 boards 인자)
+RANKING_BOARDS = ("hot", "trending", "service")
+
+
 class PopularPostData(BaseModel):
     """인기 게시글 데이터 모델"""
     post_id: str
@@ -21,21 +131,49 @@ class PopularPostData(BaseModel):
     created_at: datetime
     score: float = 0.0  # 인기도 점수
     
+    @classmethod
+    def from_post(cls, post: Any) -> "PopularPostData":
+        """게시글 문서로부터 랭킹 보드 요약 생성 (서비스 = metadata.type)"""
+        return cls(
+            post_id=str(post.id),
+            title=post.title,
+            author_id=str(post.author_id),
+            service_type=getattr(post.metadata, "type", None) or "board",
+            view_count=post.view_count or 0,
+            like_count=post.like_count or 0,
+            comment_count=post.comment_count or 0,
+            bookmark_count=post.bookmark_count or 0,
+            created_at=post.created_at
+        )
+    
+    def interaction_score(self) -> float:
+        """상호작용 가중치 합 (랭킹 이벤트 가중치와 동일한 비율)"""
+        return sum(getattr(self, f"{event}_count") * weight for event, weight in EVENT_WEIGHTS.items())
+    
     def calculate_score(self) -> float:
         """인기도 점수 계산"""
         # 시간 가중치 (최근 글일수록 높은 점수)
         days_old = (datetime.now() - self.created_at).days
         time_weight = max(0.1, 1.0 - (days_old * 0.1))
         
-        # 상호작용 점수 계산
-        interaction_score = (
-            self.view_count * 1.0 +
-            self.like_count * 5.0 +
-            self.comment_count * 3.0 +
-            self.bookmark_count * 4.0
-        )
-        
-        return interaction_score * time_weight
+        return self.interaction_score() * time_weight
+
+
+@dataclass
+class RankingEvent:
+    """랭킹 보드에 반영할 한 게시글의 가중치"""
+    post_id: str
+    weight: float
+    service_type: str
+    occurred_at: float  # Unix 시각
+    detail: Optional[Dict[str, Any]] = None  # 게시글 요약 (있으면 함께 저장)
+
+
+def unix_time(value: datetime) -> float:
+    """datetime을 Unix 시각으로 변환 (tz 없는 값은 UTC로 간주 - 모델 기본값이 utcnow)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
 
 class PopularPostsCacheService:
     """Redis 기반 인기 게시글 캐싱 서비스"""
@@ -49,6 +187,9 @@ class PopularPostsCacheService:
         self._hot_posts_key = "hot:realtime"
         self._trending_weekly_key = "trending:weekly"
         self._popular_authors_key = "popular:authors"
+        self._popular_detail_prefix = "popular:detail:"
+        self._ranking_epoch_key = "popular:ranking:epoch"
+        self._ranking_boards_key = "popular:ranking:boards"
         self.default_ttl = 1800  # 30분
     
     @property
@@ -76,11 +217,30 @@ class PopularPostsCacheService:
         """인기 작성자 키 (환경별 프리픽스 적용)"""
         return get_prefixed_key(self._popular_authors_key)
     
+    @property
+    def ranking_epoch_key(self) -> str:
+        """랭킹 점수 기준 시각 키 (환경별 프리픽스 적용)"""
+        return get_prefixed_key(self._ranking_epoch_key)
+    
+    @property
+    def ranking_boards_key(self) -> str:
+        """재정규화 대상 보드 레지스트리 키 (환경별 프리픽스 적용)"""
+        return get_prefixed_key(self._ranking_boards_key)
+    
+    @property
+    def detail_tag_key(self) -> str:
+        """게시글 요약 키 태그 Set 키 (환경별 프리픽스 적용)"""
+        return cache_tags.tag_key(POPULAR_DETAIL_TAG)
+    
     def _get_service_key(self, service_type: str) -> str:
         """서비스별 인기 게시글 키 생성 (환경별 프리픽스 적용)"""
         key = f"{self._popular_service_prefix}{service_type}"
         return get_prefixed_key(key)
     
+    def _get_detail_key(self, post_id: str) -> str:
+        """인기 게시글 요약 키 생성 (환경별 프리픽스 적용, 게시글 상세 캐시와 별도)"""
+        return get_prefixed_key(f"{self._popular_detail_prefix}{post_id}")
+    
     async def cache_popular_posts_by_views(self, posts: List[PopularPostData], ttl: Optional[int] = None) -> bool:
         """조회수 기준 인기 게시글 캐싱"""
         redis_manager = await get_redis_manager()
@@ -96,15 +256,17 @@ class PopularPostsCacheService:
             
             for post in posts:
                 post_scores[post.post_id] = post.view_count
-                post_details[f"post_detail:{post.post_id}"] = post.model_dump(mode='json')
+                post_details[self._get_detail_key(post.post_id)] = post.model_dump(mode='json')
             
             # Sorted Set에 점수와 함께 저장
             if post_scores:
                 await redis_manager.redis_client.zadd(self.popular_views_key, post_scores)
                 
                 # 각 게시글의 상세 정보 저장
-                for detail_key, detail_data in post_details.items():
-                    await redis_manager.set(detail_key, detail_data, ttl=ttl or self.default_ttl)
+                await redis_manager.mset_with_ttl(post_details, ttl=ttl or self.default_ttl)
+                await cache_tags.tag_keys(
+                    redis_manager, {POPULAR_DETAIL_TAG: post_details}, ttl or self.default_ttl
+                )
                 
                 # TTL 설정
                 await redis_manager.redis_client.expire(
@@ -132,15 +294,17 @@ class PopularPostsCacheService:
             
             for post in posts:
                 post_scores[post.post_id] = post.like_count
-                post_details[f"post_detail:{post.post_id}"] = post.model_dump(mode='json')
+                post_details[self._get_detail_key(post.post_id)] = post.model_dump(mode='json')
             
             # Sorted Set에 점수와 함께 저장
             if post_scores:
                 await redis_manager.redis_client.zadd(self.popular_likes_key, post_scores)
                 
                 # 각 게시글의 상세 정보 저장
-                for detail_key, detail_data in post_details.items():
-                    await redis_manager.set(detail_key, detail_data, ttl=ttl or self.default_ttl)
+                await redis_manager.mset_with_ttl(post_details, ttl=ttl or self.default_ttl)
+                await cache_tags.tag_keys(
+                    redis_manager, {POPULAR_DETAIL_TAG: post_details}, ttl or self.default_ttl
+                )
                 
                 # TTL 설정
                 await redis_manager.redis_client.expire(
@@ -154,121 +318,103 @@ class PopularPostsCacheService:
             logger.error(f"좋아요 기준 인기 게시글 캐싱 오류: {e}")
             return False
     
-    async def cache_popular_posts_by_service(self, service_type: str, posts: List[PopularPostData], ttl: Optional[int] = None) -> bool:
-        """서비스별 인기 게시글 캐싱"""
+    async def apply_ranking_events(
+        self,
+        events: List[RankingEvent],
+        mode: str = "incr",
+        detail_ttl: Optional[int] = None,
+        boards: Iterable[str] = RANKING_BOARDS
+    ) -> bool:
+        """이벤트 가중치를 HOT/트렌딩/서비스 보드에 반영 (Lua 스크립트 한 번)
+        
+        Args:
+            events: 게시글별 가중치
+            mode: "incr"이면 기존 점수에 누적, "seed"면 보드에 없는 게시글만 추가 (초기 적재 -
+                이벤트로 쌓인 점수는 덮어쓰지 않음)
+            detail_ttl: 게시글 요약 TTL (기본 settings.popularity_detail_ttl)
+            boards: 반영할 보드 ("hot", "trending", "service")
+        """
         redis_manager = await get_redis_manager()
         
-        if not await redis_manager.is_connected():
+        if not events or not await redis_manager.is_connected():
             return False
         
-        try:
-            service_key = self._get_service_key(service_type)
-            
-            # 점수 계산 후 저장
-            post_scores = {}
-            post_details = {}
-            
-            for post in posts:
-                score = post.calculate_score()
-                post_scores[post.post_id] = score
-                post_details[f"post_detail:{post.post_id}"] = post.model_dump(mode='json')
-            
-            if post_scores:
-                await redis_manager.redis_client.zadd(service_key, post_scores)
-                
-                # 상세 정보 저장
-                for detail_key, detail_data in post_details.items():
-                    await redis_manager.set(detail_key, detail_data, ttl=ttl or self.default_ttl)
-                
-                # TTL 설정
-                await redis_manager.redis_client.expire(service_key, ttl or self.default_ttl)
-            
-            logger.info(f"서비스 '{service_type}' 인기 게시글 캐싱 완료: {len(posts)}개")
-            return True
-            
-        except Exception as e:
-            logger.error(f"서비스별 인기 게시글 캐싱 오류: {e}")
-            return False
+        boards = set(boards)
+        args = [
+            mode, time.time(), detail_ttl or self.settings.popularity_detail_ttl,
+            self.hot_posts_key if "hot" in boards else "", self.settings.popularity_hot_half_life,
+            self.trending_weekly_key if "trending" in boards else "", self.settings.popularity_trending_half_life,
+            self._get_service_key("") if "service" in boards else "", self.settings.popularity_trending_half_life,
+            self._get_detail_key("")
+        ]
+        for event in events:
+            detail = json.dumps(event.detail, default=str) if event.detail else ""
+            args.extend([event.post_id, event.weight, event.service_type or "", event.occurred_at, detail])
+        
+        result = await redis_manager.eval_script(
+            RECORD_RANKING_SCRIPT,
+            [self.ranking_epoch_key, self.ranking_boards_key, self.detail_tag_key],
+            args
+        )
+        return result is not None
     
-    async def cache_hot_posts_realtime(self, posts: List[PopularPostData], ttl: int = 900) -> bool:
-        """실시간 HOT 게시글 캐싱 (15분 TTL)"""
+    async def renormalize_rankings(self) -> int:
+        """보드 점수를 현재 시각 기준으로 다시 맞추고 식은 게시글 정리 - 처리한 보드 수 반환"""
         redis_manager = await get_redis_manager()
         
         if not await redis_manager.is_connected():
-            return False
+            return 0
         
-        try:
-            # 실시간 점수 계산 (최근성과 상호작용 중심)
-            post_scores = {}
-            post_details = {}
-            
-            for post in posts:
-                # 실시간 점수: 최근 24시간 내 게시글에 가중치 부여
-                hours_old = (datetime.now() - post.created_at).total_seconds() / 3600
-                recency_weight = max(0.1, 1.0 - (hours_old / 24))
-                
-                hot_score = (
-                    post.view_count * 1.0 +
-                    post.like_count * 10.0 +  # 좋아요에 높은 가중치
-                    post.comment_count * 5.0
-                ) * recency_weight
-                
-                post_scores[post.post_id] = hot_score
-                post_details[f"post_detail:{post.post_id}"] = post.model_dump(mode='json')
-            
-            if post_scores:
-                await redis_manager.redis_client.zadd(self.hot_posts_key, post_scores)
-                
-                # 상세 정보 저장
-                for detail_key, detail_data in post_details.items():
-                    await redis_manager.set(detail_key, detail_data, ttl=ttl)
-                
-                # 짧은 TTL 설정 (실시간)
-                await redis_manager.redis_client.expire(self.hot_posts_key, ttl)
-            
-            logger.info(f"실시간 HOT 게시글 캐싱 완료: {len(posts)}개")
-            return True
-            
-        except Exception as e:
-            logger.error(f"실시간 HOT 게시글 캐싱 오류: {e}")
-            return False
+        result = await redis_manager.eval_script(
+            RENORMALIZE_RANKING_SCRIPT,
+            [self.ranking_epoch_key, self.ranking_boards_key],
+            [time.time(), self.settings.popularity_prune_score]
+        )
+        return int(result or 0)
     
-    async def cache_trending_posts_weekly(self, posts: List[PopularPostData], ttl: int = 3600) -> bool:
-        """주간 트렌딩 게시글 캐싱 (1시간 TTL)"""
-        redis_manager = await get_redis_manager()
-        
-        if not await redis_manager.is_connected():
-            return False
+    async def seed_rankings(
+        self,
+        posts: List[PopularPostData],
+        boards: Iterable[str],
+        service_type: Optional[str] = None,
+        ttl: Optional[int] = None
+    ) -> bool:
+        """누적 카운트로 지정한 랭킹 보드 초기 적재 (상호작용이 작성 시각에 발생한 것으로 간주)
         
-        try:
-            # 주간 트렌딩 점수 계산
-            post_scores = {}
-            post_details = {}
-            
-            for post in posts:
-                # 지난 7일 내 게시글만 고려
-                days_old = (datetime.now() - post.created_at).days
-                if days_old <= 7:
-                    trending_score = post.calculate_score()
-                    post_scores[post.post_id] = trending_score
-                    post_details[f"post_detail:{post.post_id}"] = post.model_dump(mode='json')
-            
-            if post_scores:
-                await redis_manager.redis_client.zadd(self.trending_weekly_key, post_scores)
-                
-                # 상세 정보 저장
-                for detail_key, detail_data in post_details.items():
-                    await redis_manager.set(detail_key, detail_data, ttl=ttl)
-                
-                # TTL 설정
-                await redis_manager.redis_client.expire(self.trending_weekly_key, ttl)
-            
-            logger.info(f"주간 트렌딩 게시글 캐싱 완료: {len(post_scores)}개")
-            return True
-            
-        except Exception as e:
-            logger.error(f"주간 트렌딩 게시글 캐싱 오류: {e}")
-            return False
+        이미 보드에 있는 게시글의 점수는 그대로 둡니다 (ZADD NX).
+        """
+        events = [
+            RankingEvent(
+                post_id=post.post_id,
+                weight=post.interaction_score(),
+                service_type=service_type or post.service_type,
+                occurred_at=unix_time(post.created_at),
+                detail=post.model_dump(mode='json')
+            )
+            for post in posts
+        ]
+        return await self.apply_ranking_events(events, mode="seed", detail_ttl=ttl, boards=boards)
+    
+    async def cache_popular_posts_by_service(self, service_type: str, posts: List[PopularPostData], ttl: Optional[int] = None) -> bool:
+        """서비스별 인기 게시글 초기 적재 (이후 갱신은 이벤트로)"""
+        success = await self.seed_rankings(posts, ["service"], service_type=service_type, ttl=ttl)
+        if success:
+            logger.info(f"서비스 '{service_type}' 인기 게시글 적재 완료: {len(posts)}개")
+        return success
+    
+    async def cache_hot_posts_realtime(self, posts: List[PopularPostData], ttl: Optional[int] = None) -> bool:
+        """실시간 HOT 게시글 초기 적재 (이후 갱신은 이벤트로)"""
+        success = await self.seed_rankings(posts, ["hot"], ttl=ttl)
+        if success:
+            logger.info(f"실시간 HOT 게시글 적재 완료: {len(posts)}개")
+        return success
+    
+    async def cache_trending_posts_weekly(self, posts: List[PopularPostData], ttl: Optional[int] = None) -> bool:
+        """주간 트렌딩 게시글 초기 적재 (이후 갱신은 이벤트로)"""
+        success = await self.seed_rankings(posts, ["trending"], ttl=ttl)
+        if success:
+            logger.info(f"주간 트렌딩 게시글 적재 완료: {len(posts)}개")
+        return success
     
     async def get_popular_posts_by_views(self, limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
         """조회수 기준 인기 게시글 조회"""
@@ -305,15 +451,14 @@ class PopularPostsCacheService:
         try:
             # Redis ZREVRANGE로 높은 점수 순으로 조회 (페이지네이션 지원)
             end_index = offset + limit - 1
-            popular_posts = await redis_manager.redis_client.zrevrange(
-                key, offset, end_index, withscores=True
-            )
+            popular_posts = await redis_manager.zrevrange(key, offset, end_index)
+            
+            # 상세 정보 일괄 조회 (MGET 한 번)
+            details = await redis_manager.mget(self._get_detail_key(post_id) for post_id, _ in popular_posts)
             
             result = []
             for post_id, score in popular_posts:
-                # 상세 정보 조회
-                detail_key = f"post_detail:{post_id}"
-                post_detail = await redis_manager.get(detail_key)
+                post_detail = details.get(self._get_detail_key(post_id))
                 
                 if post_detail:
                     post_data = dict(post_detail)
@@ -334,20 +479,13 @@ class PopularPostsCacheService:
             return False
         
         try:
-            # 모든 관련 Sorted Set에서 업데이트
+            # 누적 카운트 보드 갱신 (시간 감쇠 보드는 점수가 없을 때만 추가하고 요약만 갱신)
             tasks = [
                 redis_manager.redis_client.zadd(self.popular_views_key, {post.post_id: post.view_count}),
                 redis_manager.redis_client.zadd(self.popular_likes_key, {post.post_id: post.like_count}),
-                redis_manager.redis_client.zadd(
-                    self._get_service_key(post.service_type), 
-                    {post.post_id: post.calculate_score()}
-                )
+                self.seed_rankings([post], RANKING_BOARDS, ttl=self.default_ttl)
             ]
             
-            # 상세 정보 업데이트
-            detail_key = f"post_detail:{post.post_id}"
-            await redis_manager.set(detail_key, post.model_dump(mode='json'), ttl=self.default_ttl)
-            
             # 병렬 실행
             await asyncio.gather(*tasks)
             
@@ -379,7 +517,7 @@ class PopularPostsCacheService:
                 tasks.append(redis_manager.redis_client.zrem(key, post_id))
             
             # 상세 정보 삭제
-            detail_key = f"post_detail:{post_id}"
+            detail_key = self._get_detail_key(post_id)
             tasks.append(redis_manager.delete(detail_key))
             
             # 병렬 실행
@@ -405,13 +543,12 @@ class PopularPostsCacheService:
             author_post_counts = {}
             
             # 조회수 기준 인기 게시글에서 작성자 정보 수집
-            popular_posts = await redis_manager.redis_client.zrevrange(
-                self.popular_views_key, 0, 99, withscores=True
-            )
+            popular_posts = await redis_manager.zrevrange(self.popular_views_key, 0, 99)
+            
+            details = await redis_manager.mget(self._get_detail_key(post_id) for post_id, _ in popular_posts)
             
             for post_id, score in popular_posts:
-                detail_key = f"post_detail:{post_id}"
-                post_detail = await redis_manager.get(detail_key)
+                post_detail = details.get(self._get_detail_key(post_id))
                 
                 if post_detail:
                     author_id = post_detail.get("author_id")
@@ -502,28 +639,20 @@ class PopularPostsCacheService:
                 self.popular_likes_key,
                 self.hot_posts_key,
                 self.trending_weekly_key,
-                self.popular_authors_key
+                self.popular_authors_key,
+                self.ranking_epoch_key
             ]
             
-            # 서비스별 키들도 삭제
-            service_keys = [
-                f"{self.popular_service_prefix}community",
-                f"{self.popular_service_prefix}tips",
-                f"{self.popular_service_prefix}info"
-            ]
-            keys_to_delete.extend(service_keys)
+            deleted_count = await redis_manager.delete_many(keys_to_delete)
             
-            deleted_count = 0
-            for key in keys_to_delete:
-                if await redis_manager.delete(key):
-                    deleted_count += 1
+            # 재정규화 레지스트리에 등록된 감쇠 보드 전체 (서비스별 보드 포함) 와 레지스트리 삭제
+            deleted_count += int(await redis_manager.eval_script(
+                CLEAR_RANKING_SCRIPT, [self.ranking_boards_key], []
+            ) or 0)
             
-            # 게시글 상세 정보 캐시도 삭제
+            # 게시글 요약 정보도 삭제 (태그에 등록된 키만 - KEYS 스캔 없음)
             try:
-                keys = await redis_manager.redis_client.keys("post_detail:*")
-                for key in keys:
-                    await redis_manager.delete(key)
-                    deleted_count += 1
+                deleted_count += len(await cache_tags.invalidate_tags(redis_manager, [POPULAR_DETAIL_TAG]))
             except Exception as e:
                 logger.warning(f"게시글 상세 정보 캐시 삭제 중 오류: {e}")
             
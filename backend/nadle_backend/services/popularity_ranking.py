@@ -0,0 +1,165 @@
+"""인기 게시글 랭킹 이벤트 버퍼.
+
+조회/좋아요/북마크/댓글이 발생할 때마다 Redis를 호출하는 대신 워커 프로세스 메모리에
+게시글별 가중치를 모아 두었다가 주기적으로 Lua 스크립트 한 번으로 HOT/트렌딩/서비스별
+보드에 반영합니다 (점수 계산은 PopularPostsCacheService.apply_ranking_events 참고).
+
+- 반영 주기: settings.popularity_flush_interval (기본 5초), 발생 시각은 반영 시각으로 근사
+- 재정규화 주기: settings.popularity_renormalize_interval (기본 1시간) - 여러 워커가 실행해도
+  기준 시각만 앞당겨지므로 결과는 같음
+- 취소(좋아요 해제 등)는 반영하지 않음 - 음수 가중치는 현재 시각 기준으로 커져 감쇠된 원래
+  이벤트보다 많이 빠지므로 점수가 음수가 되어 정리될 수 있음 (원래 이벤트는 감쇠로 사라짐)
+- 대신 좋아요/북마크는 사용자·게시글별로 처음 한 번만 기록 (PostsService.toggle_post_reaction
+  에서 UserReaction.metadata["ranked_events"]로 추적) - 토글 반복으로 점수를 올릴 수 없음
+- 반영 작업이 실행 중이 아니면(스크립트, 테스트) 기록하지 않음
+- 반영 실패 시 가중치를 버퍼로 되돌려 다음 주기에 재시도
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from ..config import get_settings
+from .popular_posts_cache_service import (
+    EVENT_WEIGHTS,
+    PopularPostData,
+    PopularPostsCacheService,
+    RankingEvent,
+    popular_posts_cache_service,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingScore:
+    weight: float
+    service_type: str
+    detail: Dict[str, Any]
+
+
+class PopularityRanking:
+    """프로세스 내 랭킹 이벤트 버퍼 + 주기적 반영/재정규화"""
+
+    def __init__(
+        self,
+        cache_service: Optional[PopularPostsCacheService] = None,
+        flush_interval: Optional[float] = None,
+        renormalize_interval: Optional[float] = None
+    ):
+        settings = get_settings()
+        self.cache_service = cache_service or popular_posts_cache_service
+        self.flush_interval = flush_interval or settings.popularity_flush_interval
+        self.renormalize_interval = renormalize_interval or settings.popularity_renormalize_interval
+        self._pending: Dict[str, _PendingScore] = {}
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._last_renormalized = time.monotonic()
+
+    @property
+    def is_running(self) -> bool:
+        """주기적 반영 작업 실행 여부"""
+        return self._task is not None and not self._task.done()
+
+    def record(self, post: Any, event: str, count: int = 1) -> None:
+        """게시글 이벤트 가중치 기록 (Redis 호출 없음, 반영 작업이 없으면 무시)
+
+        Args:
+            post: 게시글 문서 (요약 정보는 마지막 이벤트 시점 값으로 저장)
+            event: "view", "like", "comment", "bookmark"
+            count: 이벤트 수 (취소는 음수 - 무시)
+        """
+        weight = EVENT_WEIGHTS.get(event, 0.0) * count
+        if weight <= 0 or not self.is_running:
+            return
+        try:
+            summary = PopularPostData.from_post(post)
+        except Exception as e:
+            logger.debug(f"랭킹 이벤트 무시 - 게시글 요약 생성 실패: {e}")
+            return
+
+        pending = self._pending.get(summary.post_id)
+        if pending:
+            pending.weight += weight
+            pending.detail = summary.model_dump(mode="json")
+        else:
+            self._pending[summary.post_id] = _PendingScore(
+                weight, summary.service_type, summary.model_dump(mode="json")
+            )
+
+    async def flush(self) -> int:
+        """버퍼의 가중치를 랭킹 보드에 반영
+
+        Returns:
+            반영한 게시글 수
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            pending, self._pending = self._pending, {}
+            now = time.time()
+            events = [
+                RankingEvent(post_id, score.weight, score.service_type, now, score.detail)
+                for post_id, score in pending.items()
+            ]
+            if await self.cache_service.apply_ranking_events(events):
+                return len(events)
+
+            logger.warning(f"랭킹 반영 실패 ({len(events)}개 게시글) - 다음 주기에 재시도")
+            for post_id, score in pending.items():
+                current = self._pending.get(post_id)
+                if current:
+                    current.weight += score.weight
+                else:
+                    self._pending[post_id] = score
+            return 0
+
+    async def renormalize(self) -> int:
+        """보드 점수 재정규화 - 처리한 보드 수 반환"""
+        self._last_renormalized = time.monotonic()
+        boards = await self.cache_service.renormalize_rankings()
+        logger.info(f"인기 게시글 랭킹 재정규화 완료 (보드 {boards}개)")
+        return boards
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+                if time.monotonic() - self._last_renormalized >= self.renormalize_interval:
+                    await self.renormalize()
+            except Exception as e:
+                logger.error(f"인기 게시글 랭킹 갱신 오류: {e}")
+
+    async def start(self) -> None:
+        """주기적 반영 작업 시작"""
+        if self.is_running:
+            return
+        self._last_renormalized = time.monotonic()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"인기 게시글 랭킹 버퍼 시작 (주기 {self.flush_interval}초)")
+
+    async def stop(self) -> None:
+        """반영 작업 중지 후 남은 가중치 반영"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        flushed = await self.flush()
+        logger.info(f"인기 게시글 랭킹 버퍼 중지 - 남은 {flushed}개 게시글 반영")
+
+
+# 글로벌 랭킹 이벤트 버퍼 (워커 프로세스당 하나)
+popularity_ranking = PopularityRanking()
+
+
+async def get_popularity_ranking() -> PopularityRanking:
+    """랭킹 이벤트 버퍼 인스턴스 반환"""
+    return popularity_ranking
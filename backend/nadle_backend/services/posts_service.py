@@ -1,13 +1,62 @@
 """Posts service layer for business logic."""
 
+import logging
 from typing import List, Dict, Any, Optional
 from nadle_backend.models.core import User, Post, PostCreate, PostUpdate, PostResponse, PaginatedResponse, PostMetadata, UserReaction, Comment
-from nadle_backend.repositories.post_repository import PostRepository
+from nadle_backend.repositories.post_repository import PostRepository, POST_DETAIL_FIELDS
+from nadle_backend.repositories.pipeline_builder import PipelineBuilder, AUTHOR_SUMMARY_FIELDS, lookup_stages
 from nadle_backend.repositories.comment_repository import CommentRepository
+from nadle_backend.repositories.data_loader import author_info_key, get_request_loaders
 from nadle_backend.exceptions.post import PostNotFoundError, PostPermissionError
 from nadle_backend.utils.permissions import check_post_permission
 from nadle_backend.database.redis_factory import get_prefixed_key
+from nadle_backend.database.layered_cache import get_layered_cache
+from nadle_backend.database.cache_tags import author_tag, post_reactions_tag, post_tag, user_tag, view_count_tag
+from nadle_backend.services.view_count_buffer import view_count_buffer
+from nadle_backend.services.popularity_ranking import popularity_ranking
 
+logger = logging.getLogger(__name__)
+
+
+# 상세 조회 캐시에 저장하는 게시글 필드 (검색용 파생 필드 제외, 저장 시 렌더링된 HTML 포함)
+POST_DETAIL_CACHE_FIELDS = {
+    "id", "title", "content", "slug", "author_id", "service", "metadata", "status",
+    "content_type", "content_rendered", "word_count", "reading_time",
+    "view_count", "like_count", "dislike_count", "comment_count", "bookmark_count",
+    "created_at", "updated_at", "published_at"
+}
+
+# Aggregation 상세 조회 응답 형태 (작성자는 $lookup으로 조인된 "author" 필드 사용 -
+# 조인은 AUTHOR_SUMMARY_FIELDS만 가져오므로 이메일은 응답에 포함하지 않음)
+POST_DETAIL_OUTPUT = {
+    "_id": {"$toString": "$_id"},
+    "id": {"$toString": "$_id"},
+    "title": 1,
+    "content": 1,
+    "content_type": 1,
+    "content_rendered": 1,
+    "word_count": 1,
+    "reading_time": 1,
+    "slug": 1,
+    "service": 1,
+    "metadata": 1,
+    "author_id": {"$toString": "$author_id"},
+    "author": {
+        "id": {"$toString": "$author._id"},
+        "user_handle": "$author.user_handle",
+        "display_name": "$author.display_name",
+        "name": "$author.name"
+    },
+    "status": 1,
+    "created_at": 1,
+    "updated_at": 1,
+    "published_at": 1,
+    "view_count": 1,
+    "like_count": 1,
+    "dislike_count": 1,
+    "comment_count": 1,
+    "bookmark_count": 1
+}
 
 class PostsService:
     """Service layer for post-related business logic."""
@@ -27,8 +76,8 @@ class PostsService:
         return get_prefixed_key(f"post_detail:{slug_or_id}")
     
     def _get_author_info_key(self, author_id: str) -> str:
-        """작성자 정보 캐시 키 생성 (환경별 프리픽스 적용)"""
-        return get_prefixed_key(f"author_info:{author_id}")
+        """작성자 정보 캐시 키 생성 (환경별 프리픽스 적용, 요청 범위 로더와 공유)"""
+        return author_info_key(author_id)
     
     def _get_user_reaction_key(self, user_id: str, post_id: str) -> str:
         """사용자 반응 캐시 키 생성 (환경별 프리픽스 적용)"""
@@ -60,6 +109,26 @@ class PostsService:
         post = await self.post_repository.create(post_data, str(current_user.id))
         return post
     
+    async def _record_view(self, post_id: str, view_count: Optional[int]) -> int:
+        """Record a post view and return the view count to display.
+        
+        write-behind 버퍼가 실행 중이면 DB 쓰기 없이 버퍼에 기록하고 미반영 증가분을 더한 값을
+        반환합니다. 버퍼가 없는 환경(스크립트, 테스트)에서는 즉시 $inc로 반영합니다.
+        
+        Args:
+            post_id: Post ID
+            view_count: Stored view count of the post
+            
+        Returns:
+            View count including this view
+        """
+        if view_count_buffer.is_running:
+            view_count_buffer.record(post_id)
+            return view_count_buffer.overlay(post_id, view_count)
+        
+        await self.post_repository.increment_view_count(post_id)
+        return (view_count or 0) + 1
+    
     async def get_post(self, slug_or_id: str, current_user: Optional[User] = None) -> Post:
         """Get post by slug or post ID with Redis caching.
         
@@ -73,103 +142,96 @@ class PostsService:
         Raises:
             PostNotFoundError: If post not found
         """
-        # 🚀 Redis 캐시 확인
-        from nadle_backend.database.redis_factory import get_redis_manager
-        redis_manager = await get_redis_manager()
+        # 🚀 2단 캐시 확인 (로컬 → Redis)
+        post_cache = await get_layered_cache()
         
         cache_key = self._get_post_detail_key(slug_or_id)
-        cached_post = await redis_manager.get(cache_key)
+        cached_post = await post_cache.get(cache_key)
         
         if cached_post:
-            print(f"📦 Redis 캐시 적중 - {slug_or_id}")
-            # 캐시된 데이터에서 Post 객체 재구성
+            logger.debug(f"📦 캐시 적중 - {slug_or_id}")
             try:
-                from nadle_backend.models.core import Post, PostMetadata, PostStatus, ServiceType
-                from datetime import datetime
-                from bson import ObjectId
-                
                 # 캐시된 딕셔너리에서 Post 객체 재구성
-                metadata = None
-                if cached_post.get("metadata"):
-                    metadata = PostMetadata(**cached_post["metadata"])
-                
-                post = Post(
-                    id=ObjectId(cached_post["id"]),
-                    title=cached_post["title"],
-                    content=cached_post["content"],
-                    slug=cached_post["slug"],
-                    author_id=ObjectId(cached_post["author_id"]),
-                    service=ServiceType(cached_post["service"]),
-                    metadata=metadata,
-                    status=PostStatus(cached_post["status"]),
-                    view_count=cached_post["view_count"],
-                    like_count=cached_post["like_count"],
-                    dislike_count=cached_post["dislike_count"],
-                    comment_count=cached_post["comment_count"],
-                    bookmark_count=cached_post["bookmark_count"],
-                    created_at=datetime.fromisoformat(cached_post["created_at"]),
-                    updated_at=datetime.fromisoformat(cached_post["updated_at"]) if cached_post.get("updated_at") else None,
-                    published_at=datetime.fromisoformat(cached_post["published_at"]) if cached_post.get("published_at") else None
-                )
+                post = Post(**cached_post)
                 
                 # 조회수만 증가 (캐시는 유지)
-                await self.post_repository.increment_view_count(str(post.id))
-                post.view_count += 1  # 메모리상 객체도 업데이트
+                post.view_count = await self._record_view(str(post.id), post.view_count)
+                popularity_ranking.record(post, "view")
                 
                 return post
                 
             except Exception as e:
-                print(f"⚠️ 캐시 데이터 파싱 실패: {e}, DB에서 조회")
+                logger.warning(f"⚠️ 캐시 데이터 파싱 실패: {e}, DB에서 조회")
                 # 캐시 파싱 실패 시 캐시 삭제하고 DB에서 조회
-                await redis_manager.delete(cache_key)
+                await post_cache.delete(cache_key)
+        
+        # 캐시 미스 - 같은 게시글의 동시 미스는 한 번만 DB에서 조회
+        loaded: List[Post] = []
+        
+        async def load() -> Optional[Dict[str, Any]]:
+            post = await self._find_post(slug_or_id)
+            loaded.append(post)
+            return await self._cache_post_detail(post_cache, cache_key, post)
         
-        # 캐시 미스 - DB에서 조회
-        print(f"💾 DB에서 조회 - {slug_or_id}")
+        cache_data = await post_cache.single_flight(cache_key, load)
+        
+        if loaded:
+            post = loaded[0]
+        elif cache_data:
+            # 다른 요청이 조회한 결과를 공유 - 요청마다 별도 객체 사용
+            post = Post(**cache_data)
+        else:
+            post = await self._find_post(slug_or_id)
+        
+        # 캐시에는 저장된 조회수를 두고, 응답에는 미반영 증가분을 더해 반환
+        post.view_count = await self._record_view(str(post.id), post.view_count)
+        popularity_ranking.record(post, "view")
+        
+        return post
+    
+    async def _find_post(self, slug_or_id: str) -> Post:
+        """Find post by slug, falling back to post ID."""
+        logger.debug(f"💾 DB에서 조회 - {slug_or_id}")
         try:
-            post = await self.post_repository.get_by_slug(slug_or_id)
+            return await self.post_repository.get_by_slug(slug_or_id)
         except PostNotFoundError:
             # If slug lookup fails, try by ID
             try:
-                post = await self.post_repository.get_by_id(slug_or_id)
+                return await self.post_repository.get_by_id(slug_or_id)
             except PostNotFoundError:
                 raise PostNotFoundError(f"Post not found with slug or ID: {slug_or_id}")
-        
-        # Increment view count
-        print(f"Incrementing view count for post {post.id}")
-        result = await self.post_repository.increment_view_count(str(post.id))
-        print(f"View count increment result: {result}")
-        
-        # 🚀 Redis에 캐싱 (5분 TTL)
+    
+    async def _cache_post_detail(self, post_cache, cache_key: str, post: Post) -> Optional[Dict[str, Any]]:
+        """Store post detail in cache (10분 TTL) and return the cached data."""
         try:
-            cache_data = {
-                "id": str(post.id),
-                "title": post.title,
-                "content": post.content,
-                "slug": post.slug,
-                "author_id": str(post.author_id),
-                "service": post.service.value if post.service else "content",
-                "metadata": post.metadata.model_dump() if post.metadata else {},
-                "status": post.status.value if post.status else "published",
-                "view_count": post.view_count + 1,  # 증가된 조회수 반영
-                "like_count": post.like_count,
-                "dislike_count": post.dislike_count,
-                "comment_count": post.comment_count,
-                "bookmark_count": post.bookmark_count,
-                "created_at": post.created_at.isoformat() if post.created_at else None,
-                "updated_at": post.updated_at.isoformat() if post.updated_at else None,
-                "published_at": post.published_at.isoformat() if post.published_at else None
-            }
+            cache_data = post.model_dump(mode="json", include=POST_DETAIL_CACHE_FIELDS)
             
-            success = await redis_manager.set(cache_key, cache_data, ttl=600)  # 10분 캐시 (Phase 2 개선)
+            success = await post_cache.set(
+                cache_key, cache_data, ttl=600, tags=[post_tag(str(post.id)), view_count_tag(str(post.id))]
+            )  # 10분 캐시 (Phase 2 개선)
             if success:
-                print(f"📦 Redis 캐시 저장 성공 - {slug_or_id}")
+                logger.debug(f"📦 캐시 저장 성공 - {post.slug}")
             else:
-                print(f"⚠️ Redis 캐시 저장 실패 - {slug_or_id}")
+                logger.warning(f"⚠️ 캐시 저장 실패 - {post.slug}")
+            return cache_data
                 
         except Exception as e:
-            print(f"⚠️ Redis 캐시 저장 오류: {e}")
-        
-        return post
+            logger.warning(f"⚠️ 캐시 저장 오류: {e}")
+            return None
+    
+    async def invalidate_post_cache(self, post: Post, include_reactions: bool = False) -> None:
+        """게시글 태그에 등록된 캐시 무효화 (slug/ID 상세, 댓글 배치 - 모든 워커의 로컬 캐시 포함)
+
+        include_reactions이면 모든 사용자의 반응 캐시까지 무효화 (게시글 삭제용)
+        """
+        try:
+            post_cache = await get_layered_cache()
+            tags = [post_tag(str(post.id))]
+            if include_reactions:
+                tags.append(post_reactions_tag(str(post.id)))
+            await post_cache.invalidate_tags(*tags)
+        except Exception as e:
+            logger.warning(f"⚠️ 게시글 캐시 무효화 실패: {e}")
     
     async def list_posts(
         self,
@@ -224,90 +286,9 @@ class PostsService:
         # ✅ 최적화된 데이터 변환 (이미 조인된 데이터 활용)
         formatted_posts = []
         for post_data in posts_data:
-            print(f"📋 처리 중인 게시글: {post_data.get('title', 'Unknown')}")
-            if "author" in post_data:
-                print(f"👤 작성자 정보 있음: {post_data['author']}")
-            else:
-                print(f"❌ 작성자 정보 없음 - author_id: {post_data.get('author_id')}")
-            # 기본 데이터 변환
-            post_dict = {
-                "_id": str(post_data["_id"]),
-                "title": post_data["title"],
-                "content": post_data["content"],
-                "slug": post_data["slug"],
-                "author_id": str(post_data["author_id"]),
-                "created_at": post_data["created_at"].isoformat() if post_data.get("created_at") else None,
-                "updated_at": post_data["updated_at"].isoformat() if post_data.get("updated_at") else None,
-                "metadata": post_data.get("metadata", {}),
-            }
-            
-            # ✅ Post 모델의 기존 통계 데이터 사용 (별도 계산 없음)
-            post_dict["stats"] = {
-                "view_count": post_data.get("view_count", 0),
-                "like_count": post_data.get("like_count", 0),
-                "dislike_count": post_data.get("dislike_count", 0),
-                "comment_count": post_data.get("comment_count", 0),
-                "bookmark_count": post_data.get("bookmark_count", 0)
-            }
-            
-            # 🚀 moving services 타입의 경우 문의/후기 통계 추가
-            if metadata_type == "moving services":
-                try:
-                    comment_stats = await self.comment_repository.get_comment_stats_by_post(str(post_data["_id"]))
-                    post_dict["service_stats"] = {
-                        "views": post_data.get("view_count", 0),
-                        "bookmarks": post_data.get("bookmark_count", 0),
-                        "inquiries": comment_stats.get("service_inquiry", 0),
-                        "reviews": comment_stats.get("service_review", 0)
-                    }
-                    print(f"📊 Service stats for {post_data.get('title')}: {post_dict['service_stats']}")
-                except Exception as e:
-                    print(f"⚠️ Error getting comment stats: {e}")
-                    # 에러 발생 시 기본값 사용
-                    post_dict["service_stats"] = {
-                        "views": post_data.get("view_count", 0),
-                        "bookmarks": post_data.get("bookmark_count", 0),
-                        "inquiries": 0,
-                        "reviews": 0
-                    }
-            
-            # ✅ 이미 $lookup으로 조인된 작성자 정보 사용 (별도 쿼리 없음)
-            if "author" in post_data and post_data["author"]:
-                author = post_data["author"]
-                # 작성자 정보에서 표시명을 우선순위에 따라 결정
-                display_name = author.get("display_name") or author.get("name") or author.get("user_handle") or "익명 사용자"
-                user_handle = author.get("user_handle") or "익명"
-                name = author.get("name") or "익명"
-                
-                post_dict["author"] = {
-                    "id": str(author["_id"]),
-                    "email": author.get("email", ""),
-                    "user_handle": user_handle,
-                    "display_name": display_name,
-                    "name": name,
-                    "created_at": author["created_at"].isoformat() if author.get("created_at") else None,
-                    "updated_at": author["updated_at"].isoformat() if author.get("updated_at") else None
-                }
-                print(f"✅ 작성자 정보 설정됨: {display_name} ({user_handle})")
-            else:
-                # 작성자 정보가 없는 경우 기본 정보 제공
-                print(f"⚠️ 작성자 정보 없음 - author_id: {post_data.get('author_id')}")
-                post_dict["author"] = {
-                    "id": str(post_data.get("author_id", "")),
-                    "email": "",
-                    "user_handle": "익명",
-                    "display_name": "익명 사용자",
-                    "name": "익명",
-                    "created_at": None,
-                    "updated_at": None
-                }
-            
-            # 사용자 반응 추가 (있는 경우)
-            post_id = str(post_data["_id"])
-            if post_id in user_reactions:
-                post_dict["user_reaction"] = user_reactions[post_id]
-                
-            formatted_posts.append(post_dict)
+            formatted_posts.append(
+                await self._format_post_list_item(post_data, metadata_type, user_reactions)
+            )
         
         # 페이지네이션 정보 계산
         total_pages = (total + page_size - 1) // page_size
@@ -320,6 +301,166 @@ class PostsService:
             "total_pages": total_pages
         }
     
+    async def list_posts_cursor(
+        self,
+        page_size: int = 20,
+        metadata_type: Optional[str] = None,
+        sort_by: str = "created_at",
+        after: Optional[str] = None,
+        include_total: bool = False,
+        current_user: Optional[User] = None
+    ) -> Dict[str, Any]:
+        """커서(keyset) 기반 게시글 목록 조회.
+        
+        페이지 깊이와 관계없이 일정한 비용으로 다음 페이지를 조회합니다.
+        
+        Args:
+            page_size: Items per page
+            metadata_type: Filter by metadata type
+            sort_by: Sort field (created_at, view_count, like_count)
+            after: 이전 응답의 next_cursor (첫 페이지는 None)
+            include_total: 총 개수 포함 여부 (추가 count 쿼리 발생)
+            current_user: Current user (optional, 사용자 반응 조회용)
+            
+        Returns:
+            Cursor paginated response with posts
+            
+        Raises:
+            PostCursorError: If cursor is invalid or sort field is unsupported
+        """
+        posts_data, next_cursor, total = await self.post_repository.list_posts_cursor(
+            page_size=page_size,
+            metadata_type=metadata_type,
+            sort_by=sort_by,
+            after=after,
+            include_total=include_total
+        )
+        
+        user_reactions = {}
+        if current_user and posts_data:
+            post_ids = [str(post_data["_id"]) for post_data in posts_data]
+            user_reactions = await self.post_repository.get_user_reactions(
+                str(current_user.id), post_ids
+            )
+        
+        formatted_posts = []
+        for post_data in posts_data:
+            formatted_posts.append(
+                await self._format_post_list_item(post_data, metadata_type, user_reactions)
+            )
+        
+        result = {
+            "items": formatted_posts,
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None
+        }
+        if total is not None:
+            result["total"] = total
+        
+        return result
+    
+    async def _format_post_list_item(
+        self,
+        post_data: Dict[str, Any],
+        metadata_type: Optional[str],
+        user_reactions: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Aggregation 결과 문서를 목록 응답 항목으로 변환.
+        
+        Args:
+            post_data: 작성자 정보($lookup)가 조인된 게시글 문서
+            metadata_type: 요청한 메타데이터 타입 (moving services 통계 추가 여부 판단)
+            user_reactions: {post_id: reaction} 사용자 반응 맵
+            
+        Returns:
+            목록 응답용 게시글 딕셔너리
+        """
+        print(f"📋 처리 중인 게시글: {post_data.get('title', 'Unknown')}")
+        if "author" in post_data:
+            print(f"👤 작성자 정보 있음: {post_data['author']}")
+        else:
+            print(f"❌ 작성자 정보 없음 - author_id: {post_data.get('author_id')}")
+        # 기본 데이터 변환
+        post_dict = {
+            "_id": str(post_data["_id"]),
+            "title": post_data["title"],
+            "content": post_data["content"],
+            "slug": post_data["slug"],
+            "author_id": str(post_data["author_id"]),
+            "created_at": post_data["created_at"].isoformat() if post_data.get("created_at") else None,
+            "updated_at": post_data["updated_at"].isoformat() if post_data.get("updated_at") else None,
+            "metadata": post_data.get("metadata", {}),
+        }
+        
+        # ✅ Post 모델의 기존 통계 데이터 사용 (별도 계산 없음)
+        post_dict["stats"] = {
+            "view_count": post_data.get("view_count", 0),
+            "like_count": post_data.get("like_count", 0),
+            "dislike_count": post_data.get("dislike_count", 0),
+            "comment_count": post_data.get("comment_count", 0),
+            "bookmark_count": post_data.get("bookmark_count", 0)
+        }
+        
+        # 🚀 moving services 타입의 경우 문의/후기 통계 추가
+        if metadata_type == "moving services":
+            try:
+                comment_stats = await self.comment_repository.get_comment_stats_by_post(str(post_data["_id"]))
+                post_dict["service_stats"] = {
+                    "views": post_data.get("view_count", 0),
+                    "bookmarks": post_data.get("bookmark_count", 0),
+                    "inquiries": comment_stats.get("service_inquiry", 0),
+                    "reviews": comment_stats.get("service_review", 0)
+                }
+                print(f"📊 Service stats for {post_data.get('title')}: {post_dict['service_stats']}")
+            except Exception as e:
+                print(f"⚠️ Error getting comment stats: {e}")
+                # 에러 발생 시 기본값 사용
+                post_dict["service_stats"] = {
+                    "views": post_data.get("view_count", 0),
+                    "bookmarks": post_data.get("bookmark_count", 0),
+                    "inquiries": 0,
+                    "reviews": 0
+                }
+        
+        # ✅ 이미 $lookup으로 조인된 작성자 정보 사용 (별도 쿼리 없음)
+        if "author" in post_data and post_data["author"]:
+            author = post_data["author"]
+            # 작성자 정보에서 표시명을 우선순위에 따라 결정
+            display_name = author.get("display_name") or author.get("name") or author.get("user_handle") or "익명 사용자"
+            user_handle = author.get("user_handle") or "익명"
+            name = author.get("name") or "익명"
+            
+            post_dict["author"] = {
+                "id": str(author["_id"]),
+                "email": author.get("email", ""),
+                "user_handle": user_handle,
+                "display_name": display_name,
+                "name": name,
+                "created_at": author["created_at"].isoformat() if author.get("created_at") else None,
+                "updated_at": author["updated_at"].isoformat() if author.get("updated_at") else None
+            }
+            print(f"✅ 작성자 정보 설정됨: {display_name} ({user_handle})")
+        else:
+            # 작성자 정보가 없는 경우 기본 정보 제공
+            print(f"⚠️ 작성자 정보 없음 - author_id: {post_data.get('author_id')}")
+            post_dict["author"] = {
+                "id": str(post_data.get("author_id", "")),
+                "email": "",
+                "user_handle": "익명",
+                "display_name": "익명 사용자",
+                "name": "익명",
+                "created_at": None,
+                "updated_at": None
+            }
+        
+        # 사용자 반응 추가 (있는 경우)
+        post_id = str(post_data["_id"])
+        if post_id in user_reactions:
+            post_dict["user_reaction"] = user_reactions[post_id]
+            
+        return post_dict
+    
     async def update_post(
         self, 
         slug: str, 
@@ -349,6 +490,7 @@ class PostsService:
         
         # Update post
         updated_post = await self.post_repository.update(str(post.id), update_data)
+        await self.invalidate_post_cache(post)
         return updated_post
     
     async def delete_post(self, slug: str, current_user: User) -> bool:
@@ -374,6 +516,7 @@ class PostsService:
         
         # Delete post
         result = await self.post_repository.delete(str(post.id))
+        await self.invalidate_post_cache(post, include_reactions=True)
         return result
     
     async def search_posts(
@@ -381,7 +524,7 @@ class PostsService:
         query: str,
         service_type: Optional[str] = None,
         metadata_type: Optional[str] = None,
-        sort_by: str = "created_at",
+        sort_by: str = "relevance",
         page: int = 1,
         page_size: int = 20,
         current_user: Optional[User] = None
@@ -391,7 +534,7 @@ class PostsService:
         Args:
             query: Search query
             service_type: Filter by service type
-            sort_by: Sort field
+            sort_by: "relevance" (text score) or a sort field
             page: Page number
             page_size: Items per page
             current_user: Current user (optional)
@@ -417,7 +560,8 @@ class PostsService:
         # Format posts with stats
         formatted_posts = []
         for post in posts:
-            post_dict = post.model_dump()
+            # 검색 인덱스용 토큰은 응답에서 제외
+            post_dict = post.model_dump(exclude={"search_terms"})
             
             # Convert ObjectIds to strings
             post_dict["_id"] = str(post.id)
@@ -523,8 +667,20 @@ class PostsService:
             # Toggle bookmark (independent of like/dislike)
             user_reaction.bookmarked = not user_reaction.bookmarked
         
+        # 인기 랭킹에는 사용자별 첫 좋아요/북마크만 반영 (토글 반복으로 점수를 올릴 수 없도록)
+        ranked_events = []
+        metadata = user_reaction.metadata if user_reaction.metadata is not None else {}
+        already_ranked = set(metadata.get("ranked_events", []))
+        for event, active in (("like", user_reaction.liked), ("bookmark", user_reaction.bookmarked)):
+            if active and event not in already_ranked:
+                ranked_events.append(event)
+        if ranked_events:
+            metadata["ranked_events"] = sorted(already_ranked.union(ranked_events))
+            user_reaction.metadata = metadata
+        
         # Save user reaction
         await user_reaction.save()
+        await self.invalidate_user_reaction_cache(str(current_user.id), post_id)
         
         # Post 모델의 카운트 필드 업데이트
         count_updates = {}
@@ -544,10 +700,15 @@ class PostsService:
         # Post 모델의 카운트 필드 업데이트
         if count_updates:
             await self.post_repository.update_post_counts(post_id, count_updates)
+            await self.invalidate_post_cache(post)
         
         # 업데이트된 Post 데이터 다시 조회
         updated_post = await self.post_repository.get_by_id(post_id)
         
+        # 첫 좋아요/북마크를 인기 랭킹에 반영 (취소와 재설정은 랭킹에서 무시)
+        for event in ranked_events:
+            popularity_ranking.record(updated_post, event)
+        
         return {
             "like_count": updated_post.like_count or 0,
             "dislike_count": updated_post.dislike_count or 0,
@@ -645,15 +806,14 @@ class PostsService:
             "general_comment_count": comment_stats["general"]
         }
         
+        # 사용자 반응과 작성자 정보는 요청 범위 로더로 조회
+        # (목록에서 여러 게시글을 동시에 변환하면 한 번의 $in 쿼리로 묶임)
+        loaders = get_request_loaders()
+        
         # Get user reaction if authenticated
         user_reaction = None
         if current_user:
-            from nadle_backend.models.core import UserReaction
-            reaction = await UserReaction.find_one({
-                "user_id": str(current_user.id),
-                "target_type": "post",
-                "target_id": str(post.id)
-            })
+            reaction = await loaders.reactions.load((str(current_user.id), "post", str(post.id)))
             if reaction:
                 user_reaction = {
                     "liked": reaction.liked,
@@ -661,16 +821,16 @@ class PostsService:
                     "bookmarked": reaction.bookmarked
                 }
 
-        # Get author information
+        # Get author information (author_info 캐시 우선)
         author_info = None
         try:
-            author = await User.get(post.author_id)
+            author = await loaders.authors.load(str(post.author_id))
             if author:
                 author_info = {
-                    "id": str(author.id),
-                    "user_handle": author.user_handle,
-                    "display_name": author.display_name,
-                    "name": author.name
+                    "id": author["id"],
+                    "user_handle": author["user_handle"],
+                    "display_name": author["display_name"],
+                    "name": author["name"]
                 }
         except Exception as e:
             print(f"Failed to get author info: {e}")
@@ -687,6 +847,10 @@ class PostsService:
             "id": str(post.id),  # 프론트엔드 호환성을 위한 id 필드 추가
             "title": post.title,
             "content": post.content,
+            "content_type": post.content_type,
+            "content_rendered": post.content_rendered,
+            "word_count": post.word_count,
+            "reading_time": post.reading_time,
             "slug": post.slug,
             "service": post.service,
             "metadata": post.metadata.model_dump() if post.metadata else None,
@@ -798,16 +962,15 @@ class PostsService:
         Returns:
             작성자 정보 딕셔너리 또는 None
         """
-        from nadle_backend.database.redis_factory import get_redis_manager
         from nadle_backend.models.core import User
         
-        redis_manager = await get_redis_manager()
+        post_cache = await get_layered_cache()
         cache_key = self._get_author_info_key(author_id)
         
         # 캐시에서 조회
-        cached_author = await redis_manager.get(cache_key)
+        cached_author = await post_cache.get(cache_key)
         if cached_author:
-            print(f"📦 작성자 정보 캐시 적중 - {author_id}")
+            logger.debug(f"📦 작성자 정보 캐시 적중 - {author_id}")
             return cached_author
         
         # DB에서 조회 후 캐싱
@@ -829,11 +992,11 @@ class PostsService:
                 }
                 
                 # 캐시에 저장 (TTL: 1시간)
-                await redis_manager.set(cache_key, author_info, ttl=3600)
-                print(f"💾 작성자 정보 캐시 저장 - {author_id}")
+                await post_cache.set(cache_key, author_info, ttl=3600, tags=[author_tag(str(author.id))])
+                logger.debug(f"💾 작성자 정보 캐시 저장 - {author_id}")
                 return author_info
         except Exception as e:
-            print(f"❌ 작성자 정보 조회 실패: {e}")
+            logger.warning(f"❌ 작성자 정보 조회 실패: {e}")
             # 기본값 반환
             return {
                 "id": str(author_id),
@@ -855,16 +1018,15 @@ class PostsService:
         Returns:
             사용자 반응 정보 딕셔너리 또는 None
         """
-        from nadle_backend.database.redis_factory import get_redis_manager
         from nadle_backend.models.core import UserReaction
         
-        redis_manager = await get_redis_manager()
+        post_cache = await get_layered_cache()
         cache_key = self._get_user_reaction_key(user_id, post_id)
         
         # 캐시에서 조회
-        cached_reaction = await redis_manager.get(cache_key)
+        cached_reaction = await post_cache.get(cache_key)
         if cached_reaction:
-            print(f"📦 사용자 반응 캐시 적중 - {user_id}:{post_id}")
+            logger.debug(f"📦 사용자 반응 캐시 적중 - {user_id}:{post_id}")
             return cached_reaction
         
         # DB에서 조회 후 캐싱
@@ -889,12 +1051,12 @@ class PostsService:
                 }
             
             # 캐시에 저장 (TTL: 30분)
-            await redis_manager.set(cache_key, reaction_info, ttl=1800)
-            print(f"💾 사용자 반응 캐시 저장 - {user_id}:{post_id}")
+            await post_cache.set(cache_key, reaction_info, ttl=1800, tags=[post_reactions_tag(post_id), user_tag(user_id)])
+            logger.debug(f"💾 사용자 반응 캐시 저장 - {user_id}:{post_id}")
             return reaction_info
             
         except Exception as e:
-            print(f"❌ 사용자 반응 조회 실패: {e}")
+            logger.warning(f"❌ 사용자 반응 조회 실패: {e}")
             return {
                 "liked": False,
                 "disliked": False,
@@ -902,18 +1064,14 @@ class PostsService:
             }
     
     async def invalidate_author_cache(self, author_id: str) -> None:
-        """작성자 정보 캐시 무효화
+        """작성자 태그에 등록된 캐시 무효화 (작성자 정보, 작성자 정보가 포함된 댓글 배치)
         
         Args:
             author_id: 작성자 ID
         """
-        from nadle_backend.database.redis_factory import get_redis_manager
-        
-        redis_manager = await get_redis_manager()
-        cache_key = self._get_author_info_key(author_id)
-        
-        await redis_manager.delete(cache_key)
-        print(f"🗑️ 작성자 정보 캐시 무효화 - {author_id}")
+        post_cache = await get_layered_cache()
+        await post_cache.invalidate_tags(author_tag(author_id))
+        logger.debug(f"🗑️ 작성자 정보 캐시 무효화 - {author_id}")
     
     async def invalidate_user_reaction_cache(self, user_id: str, post_id: str) -> None:
         """사용자 반응 캐시 무효화
@@ -922,13 +1080,11 @@ class PostsService:
             user_id: 사용자 ID
             post_id: 게시글 ID
         """
-        from nadle_backend.database.redis_factory import get_redis_manager
-        
-        redis_manager = await get_redis_manager()
+        post_cache = await get_layered_cache()
         cache_key = self._get_user_reaction_key(user_id, post_id)
         
-        await redis_manager.delete(cache_key)
-        print(f"🗑️ 사용자 반응 캐시 무효화 - {user_id}:{post_id}")
+        await post_cache.delete(cache_key)
+        logger.debug(f"🗑️ 사용자 반응 캐시 무효화 - {user_id}:{post_id}")
     
     # ================================
     # 🚀 2단계: 배치 조회 메서드들
@@ -943,24 +1099,23 @@ class PostsService:
         Returns:
             {author_id: author_info} 딕셔너리
         """
-        from nadle_backend.database.redis_factory import get_redis_manager
         from nadle_backend.models.core import User
         from bson import ObjectId
         
-        redis_manager = await get_redis_manager()
+        post_cache = await get_layered_cache()
         result = {}
         uncached_ids = []
         
-        # 1. 캐시에서 먼저 조회
-        for author_id in author_ids:
-            cache_key = self._get_author_info_key(author_id)
-            cached_author = await redis_manager.get(cache_key)
-            
+        # 1. 캐시에서 먼저 조회 (MGET 한 번)
+        key_by_id = {author_id: self._get_author_info_key(author_id) for author_id in author_ids}
+        cached = await post_cache.mget(key_by_id.values())
+        for author_id, cache_key in key_by_id.items():
+            cached_author = cached.get(cache_key)
             if cached_author:
                 result[author_id] = cached_author
-                print(f"📦 작성자 정보 캐시 적중 - {author_id}")
             else:
                 uncached_ids.append(author_id)
+        logger.debug(f"📦 작성자 정보 캐시 적중 - {len(result)}/{len(key_by_id)}")
         
         # 2. 캐시되지 않은 것들을 배치로 DB 조회
         if uncached_ids:
@@ -972,15 +1127,16 @@ class PostsService:
                         try:
                             object_ids.append(ObjectId(author_id))
                         except:
-                            print(f"❌ 잘못된 ObjectId 형식: {author_id}")
+                            logger.warning(f"❌ 잘못된 ObjectId 형식: {author_id}")
                             continue
                 
                 if object_ids:
                     # 배치 조회
                     authors = await User.find({"_id": {"$in": object_ids}}).to_list()
-                    print(f"🔄 배치 조회: {len(object_ids)}개 요청 → {len(authors)}개 결과")
+                    logger.debug(f"🔄 배치 조회: {len(object_ids)}개 요청 → {len(authors)}개 결과")
                     
                     # 결과 처리 및 캐싱
+                    to_cache = {}
                     for author in authors:
                         author_id = str(author.id)
                         author_info = {
@@ -992,14 +1148,17 @@ class PostsService:
                         }
                         
                         result[author_id] = author_info
-                        
-                        # 개별 캐싱 (TTL: 1시간)
-                        cache_key = self._get_author_info_key(author_id)
-                        await redis_manager.set(cache_key, author_info, ttl=3600)
-                        print(f"💾 작성자 정보 캐시 저장 - {author_id}")
+                        to_cache[self._get_author_info_key(author_id)] = author_info
+                    
+                    # 일괄 캐싱 (TTL: 1시간)
+                    if to_cache:
+                        await post_cache.mset_with_ttl(to_cache, ttl=3600, tags={
+                            author_tag(info["id"]): [cache_key] for cache_key, info in to_cache.items()
+                        })
+                        logger.debug(f"💾 작성자 정보 캐시 저장 - {len(to_cache)}개")
                 
             except Exception as e:
-                print(f"❌ 배치 작성자 조회 실패: {e}")
+                logger.warning(f"❌ 배치 작성자 조회 실패: {e}")
         
         return result
     
@@ -1013,23 +1172,22 @@ class PostsService:
         Returns:
             {post_id: reaction_info} 딕셔너리
         """
-        from nadle_backend.database.redis_factory import get_redis_manager
         from nadle_backend.models.core import UserReaction
         
-        redis_manager = await get_redis_manager()
+        post_cache = await get_layered_cache()
         result = {}
         uncached_post_ids = []
         
-        # 1. 캐시에서 먼저 조회
-        for post_id in post_ids:
-            cache_key = self._get_user_reaction_key(user_id, post_id)
-            cached_reaction = await redis_manager.get(cache_key)
-            
+        # 1. 캐시에서 먼저 조회 (MGET 한 번)
+        key_by_id = {post_id: self._get_user_reaction_key(user_id, post_id) for post_id in post_ids}
+        cached = await post_cache.mget(key_by_id.values())
+        for post_id, cache_key in key_by_id.items():
+            cached_reaction = cached.get(cache_key)
             if cached_reaction:
                 result[post_id] = cached_reaction
-                print(f"📦 사용자 반응 캐시 적중 - {user_id}:{post_id}")
             else:
                 uncached_post_ids.append(post_id)
+        logger.debug(f"📦 사용자 반응 캐시 적중 - {user_id}: {len(result)}/{len(key_by_id)}")
         
         # 2. 캐시되지 않은 것들을 배치로 DB 조회
         if uncached_post_ids:
@@ -1041,10 +1199,11 @@ class PostsService:
                     "target_id": {"$in": uncached_post_ids}
                 }).to_list()
                 
-                print(f"🔄 사용자 반응 배치 조회: {len(uncached_post_ids)}개 요청 → {len(reactions)}개 결과")
+                logger.debug(f"🔄 사용자 반응 배치 조회: {len(uncached_post_ids)}개 요청 → {len(reactions)}개 결과")
                 
                 # 존재하는 반응들 처리
                 found_post_ids = set()
+                to_cache = {}
                 for reaction in reactions:
                     post_id = reaction.target_id
                     reaction_info = {
@@ -1055,11 +1214,7 @@ class PostsService:
                     
                     result[post_id] = reaction_info
                     found_post_ids.add(post_id)
-                    
-                    # 캐싱 (TTL: 30분)
-                    cache_key = self._get_user_reaction_key(user_id, post_id)
-                    await redis_manager.set(cache_key, reaction_info, ttl=1800)
-                    print(f"💾 사용자 반응 캐시 저장 - {user_id}:{post_id}")
+                    to_cache[self._get_user_reaction_key(user_id, post_id)] = reaction_info
                 
                 # 반응이 없는 게시글들은 기본값으로 처리
                 for post_id in uncached_post_ids:
@@ -1070,14 +1225,20 @@ class PostsService:
                             "bookmarked": False
                         }
                         result[post_id] = default_reaction
-                        
-                        # 기본값도 캐싱 (TTL: 30분)
-                        cache_key = self._get_user_reaction_key(user_id, post_id)
-                        await redis_manager.set(cache_key, default_reaction, ttl=1800)
-                        print(f"💾 기본 사용자 반응 캐시 저장 - {user_id}:{post_id}")
+                        # 기본값도 캐싱
+                        to_cache[self._get_user_reaction_key(user_id, post_id)] = default_reaction
+                
+                # 일괄 캐싱 (TTL: 30분) - 게시글별 태그와 사용자 태그에 등록
+                tags = {
+                    post_reactions_tag(post_id): [self._get_user_reaction_key(user_id, post_id)]
+                    for post_id in uncached_post_ids
+                }
+                tags[user_tag(user_id)] = list(to_cache)
+                await post_cache.mset_with_ttl(to_cache, ttl=1800, tags=tags)
+                logger.debug(f"💾 사용자 반응 캐시 저장 - {user_id}: {len(to_cache)}개")
                 
             except Exception as e:
-                print(f"❌ 배치 사용자 반응 조회 실패: {e}")
+                logger.warning(f"❌ 배치 사용자 반응 조회 실패: {e}")
                 # 실패 시 기본값으로 채우기
                 for post_id in uncached_post_ids:
                     result[post_id] = {
@@ -1098,14 +1259,13 @@ class PostsService:
             작성자 정보가 포함된 댓글 목록
         """
         from nadle_backend.repositories.comment_repository import CommentRepository
-        from nadle_backend.database.redis_factory import get_redis_manager
         
         # 🚀 Phase 2: 댓글 캐싱 확인
-        redis_manager = await get_redis_manager()
+        post_cache = await get_layered_cache()
         cache_key = self._get_comments_batch_key(post_slug)  # 캐시 키 버전 업
         
         # 캐시에서 조회 시도
-        cached_comments = await redis_manager.get(cache_key)
+        cached_comments = await post_cache.get(cache_key)
         if cached_comments:
             print(f"📦 댓글 캐시 적중 - {post_slug}")
             return cached_comments
@@ -1183,7 +1343,9 @@ class PostsService:
         
         # 🚀 Phase 2: 댓글 결과를 캐시에 저장 (TTL: 5분)
         try:
-            await redis_manager.set(cache_key, result, ttl=300)  # 5분 TTL
+            # 게시글 변경과 댓글 작성자 프로필 변경 모두에 무효화되도록 태그 등록
+            tags = [post_tag(str(post.id)), *(author_tag(author_id) for author_id in author_ids)]
+            await post_cache.set(cache_key, result, ttl=300, tags=tags)  # 5분 TTL
             print(f"💾 댓글 배치 결과 캐시 저장 완료 - {post_slug}")
         except Exception as cache_error:
             print(f"⚠️ 댓글 캐시 저장 실패 (계속 진행): {cache_error}")
@@ -1210,55 +1372,18 @@ class PostsService:
         try:
             settings = get_settings()
             
-            # MongoDB Aggregation Pipeline - 단순화된 버전
-            pipeline = [
-                # 1. 해당 slug의 게시글 매칭
-                {"$match": {"slug": post_slug, "status": {"$ne": "deleted"}}},
-                
-                # 2. author_id를 ObjectId로 변환 후 작성자 정보 JOIN (단순 조인)
-                {"$lookup": {
-                    "from": settings.users_collection,
-                    "localField": "author_id", 
-                    "foreignField": "_id",
-                    "as": "author_info"
-                }},
-                
-                # 3. 작성자 정보 단일 객체로 변환
-                {"$addFields": {
-                    "author": {"$arrayElemAt": ["$author_info", 0]}
-                }},
-                
-                # 4. 필요한 필드만 선택 (단순화)
-                {"$project": {
-                    "_id": {"$toString": "$_id"},
-                    "id": {"$toString": "$_id"},
-                    "title": 1,
-                    "content": 1,
-                    "slug": 1,
-                    "service": 1,
-                    "metadata": 1,
-                    "author_id": {"$toString": "$author_id"},
-                    "author": {
-                        "id": {"$toString": "$author._id"},
-                        "user_handle": "$author.user_handle",
-                        "display_name": "$author.display_name", 
-                        "name": "$author.name",
-                        "email": "$author.email"
-                    },
-                    "status": 1,
-                    "created_at": 1,
-                    "updated_at": 1,
-                    "published_at": 1,
-                    "view_count": 1,
-                    "like_count": 1,
-                    "dislike_count": 1,
-                    "comment_count": 1,
-                    "bookmark_count": 1
-                }},
-                
-                # 5. 불필요한 필드 제거
-                {"$unset": "author_info"}
-            ]
+            # slug(unique 인덱스)로 1건만 자른 뒤 필요한 필드만 남기고 작성자 조인
+            pipeline = (
+                PipelineBuilder({"slug": post_slug, "status": {"$ne": "deleted"}})
+                .limit(1)
+                .project(POST_DETAIL_FIELDS)
+                .join(
+                    settings.users_collection, "author_id", "_id", "author",
+                    convert_to="objectId", fields=AUTHOR_SUMMARY_FIELDS, single=True
+                )
+                .then({"$project": POST_DETAIL_OUTPUT})
+                .build()
+            )
             
             print(f"🔍 Aggregation Pipeline 실행 중: {post_slug}")
             
@@ -1327,71 +1452,47 @@ class PostsService:
             
             print(f"🚀 완전 통합 Aggregation 파이프라인 실행 중: {post_slug}")
             
-            # MongoDB Aggregation Pipeline - 기본 파이프라인
-            pipeline = [
-                # 1. 해당 slug의 게시글 매칭
-                {"$match": {"slug": post_slug, "status": {"$ne": "deleted"}}},
-                
-                # 2. 게시글 작성자 정보 JOIN (author_id를 ObjectId로 변환 후 매칭)
-                {"$lookup": {
-                    "from": settings.users_collection,
-                    "let": {"author_id": {"$toObjectId": "$author_id"}},
-                    "pipeline": [
-                        {"$match": {"$expr": {"$eq": ["$_id", "$$author_id"]}}}
-                    ],
-                    "as": "author_info"
-                }},
-                
-                # 3. 해당 게시글의 댓글들 JOIN
-                {"$lookup": {
-                    "from": settings.comments_collection,
-                    "let": {"post_id": "$_id"},
-                    "pipeline": [
-                        {"$match": {
-                            "$expr": {"$eq": ["$post_id", "$$post_id"]},
-                            "status": {"$ne": "deleted"}
-                        }},
-                        {"$sort": {"created_at": 1}}  # 댓글을 생성일순으로 정렬
-                    ],
-                    "as": "comments_raw"
-                }},
-                
-                # 4. 각 댓글의 작성자 정보 JOIN
-                {"$lookup": {
-                    "from": settings.users_collection,
-                    "localField": "comments_raw.author_id",
-                    "foreignField": "_id",
-                    "as": "comment_authors"
-                }}
-            ]
+            # 게시글 1건을 먼저 확정한 뒤 작성자/댓글/사용자 반응을 조인
+            builder = (
+                PipelineBuilder({"slug": post_slug, "status": {"$ne": "deleted"}})
+                .limit(1)
+                .project(POST_DETAIL_FIELDS)
+                .join(
+                    settings.users_collection, "author_id", "_id", "author",
+                    convert_to="objectId", fields=AUTHOR_SUMMARY_FIELDS, single=True
+                )
+                # 댓글은 parent_id(문자열 게시글 ID)로 조인 → parent_comments_idx 사용
+                # 댓글 작성자는 댓글 lookup 내부에서 댓글마다 _id로 조인
+                .join(
+                    settings.comments_collection, "_id", "parent_id", "comments_raw",
+                    convert_to="string",
+                    pipeline=[
+                        {"$match": {"status": {"$ne": "deleted"}}},
+                        {"$sort": {"created_at": 1}},  # 댓글을 생성일순으로 정렬
+                        *lookup_stages(
+                            settings.users_collection, "author_id", "_id", "author",
+                            convert_to="objectId",
+                            pipeline=[{"$project": AUTHOR_SUMMARY_FIELDS}],
+                            single=True
+                        )
+                    ]
+                )
+            )
             
-            # 5. 사용자 반응 정보 JOIN (현재 사용자가 있는 경우만)
+            # 사용자 반응 정보 JOIN (현재 사용자가 있는 경우만)
             if current_user_id:
-                pipeline.append({
-                    "$lookup": {
-                        "from": "user_reactions",  # UserReaction 컬렉션
-                        "let": {"post_id": "$_id"},
-                        "pipeline": [
-                            {"$match": {
-                                "$expr": {
-                                    "$and": [
-                                        {"$eq": ["$target_id", {"$toString": "$$post_id"}]},
-                                        {"$eq": ["$target_type", "post"]},
-                                        {"$eq": ["$user_id", current_user_id]}
-                                    ]
-                                }
-                            }}
-                        ],
-                        "as": "user_reaction_raw"
-                    }
-                })
+                builder.join(
+                    settings.user_reactions_collection, "_id", "target_id", "user_reaction_raw",
+                    convert_to="string",
+                    pipeline=[
+                        {"$match": {"target_type": "post", "user_id": current_user_id}},
+                        {"$limit": 1}
+                    ]
+                )
             
             # 6. 데이터 정리 및 구조화
             addfields_stage = {
                 "$addFields": {
-                    # 게시글 작성자 정보
-                    "author": {"$arrayElemAt": ["$author_info", 0]},
-                    
                     # 댓글과 댓글 작성자 정보 매핑
                     "comments": {
                         "$map": {
@@ -1402,36 +1503,19 @@ class PostsService:
                                 "_id": {"$toString": "$$comment._id"},
                                 "content": "$$comment.content", 
                                 "author_id": {"$toString": "$$comment.author_id"},
-                                "post_id": {"$toString": "$$comment.post_id"},
+                                "post_id": "$$comment.parent_id",
                                 "parent_id": {"$toString": "$$comment.parent_id"},
                                 "status": "$$comment.status",
                                 "created_at": "$$comment.created_at",
                                 "updated_at": "$$comment.updated_at",
                                 "like_count": "$$comment.like_count",
                                 "dislike_count": "$$comment.dislike_count",
-                                # 댓글 작성자 정보 매핑
+                                # 댓글 작성자 정보 (댓글 lookup 내부에서 조인됨)
                                 "author": {
-                                    "$let": {
-                                        "vars": {
-                                            "author": {
-                                                "$arrayElemAt": [
-                                                    {
-                                                        "$filter": {
-                                                            "input": "$comment_authors",
-                                                            "cond": {"$eq": ["$$this._id", "$$comment.author_id"]}
-                                                        }
-                                                    }, 0
-                                                ]
-                                            }
-                                        },
-                                        "in": {
-                                            "id": {"$toString": "$$author._id"},
-                                            "user_handle": "$$author.user_handle",
-                                            "display_name": "$$author.display_name",
-                                            "name": "$$author.name",
-                                            "email": "$$author.email"
-                                        }
-                                    }
+                                    "id": {"$toString": "$$comment.author._id"},
+                                    "user_handle": "$$comment.author.user_handle",
+                                    "display_name": "$$comment.author.display_name",
+                                    "name": "$$comment.author.name"
                                 }
                             }
                         }
@@ -1462,35 +1546,12 @@ class PostsService:
                     }
                 }
             
-            pipeline.append(addfields_stage)
+            builder.then(addfields_stage)
             
-            # 7. 최종 출력 형태 정리
+            # 7. 최종 출력 형태 정리 (comments_raw, user_reaction_raw 등 중간 필드는 제외됨)
             project_stage = {
                 "$project": {
-                    "_id": {"$toString": "$_id"},
-                    "id": {"$toString": "$_id"},
-                    "title": 1,
-                    "content": 1,
-                    "slug": 1,
-                    "service": 1,
-                    "metadata": 1,
-                    "author_id": {"$toString": "$author_id"},
-                    "author": {
-                        "id": {"$toString": "$author._id"},
-                        "user_handle": "$author.user_handle",
-                        "display_name": "$author.display_name", 
-                        "name": "$author.name",
-                        "email": "$author.email"
-                    },
-                    "status": 1,
-                    "created_at": 1,
-                    "updated_at": 1,
-                    "published_at": 1,
-                    "view_count": 1,
-                    "like_count": 1,
-                    "dislike_count": 1,
-                    "comment_count": 1,
-                    "bookmark_count": 1,
+                    **POST_DETAIL_OUTPUT,
                     "stats": {
                         "view_count": "$view_count",
                         "like_count": "$like_count",
@@ -1506,10 +1567,7 @@ class PostsService:
             if current_user_id:
                 project_stage["$project"]["user_reaction"] = 1
             
-            pipeline.append(project_stage)
-            
-            # 8. 불필요한 필드 제거
-            pipeline.append({"$unset": ["author_info", "comments_raw", "comment_authors", "user_reaction_raw"]})
+            pipeline = builder.then(project_stage).build()
             
             print(f"🔍 완전 통합 Aggregation Pipeline 단계 수: {len(pipeline)}")
             
@@ -1525,8 +1583,7 @@ class PostsService:
                 
                 # 조회수 증가 (별도 처리)
                 try:
-                    await self.post_repository.increment_view_count(str(result["id"]))
-                    result["view_count"] = result.get("view_count", 0) + 1
+                    result["view_count"] = await self._record_view(str(result["id"]), result.get("view_count", 0))
                     # stats 필드도 동시에 업데이트
                     if "stats" in result:
                         result["stats"]["view_count"] = result["view_count"]
@@ -1,6 +1,20 @@
+"""Redis 세션 저장소 - 세션별 해시 + 사용자별 정렬 집합
+
+- session:v2:{id}        세션 필드 해시 (TTL = 세션 만료)
+- user_sessions:v2:{uid} 세션 ID 정렬 집합 (점수 = 마지막 활동 시각)
+
+이전 형식(session:{id} JSON 문자열, user_sessions:{uid} JSON 목록)과 키가 겹치면 해시/정렬 집합
+명령이 WRONGTYPE으로 실패하므로 버전 네임스페이스를 사용합니다. 이전 키는 읽지 않고 TTL로 만료됩니다.
+
+생성(동시 세션 제한, 사라진 세션 정리 포함), 조회+활동 갱신, 삭제는 각각 Lua 스크립트
+하나로 원자적으로 실행되어 동시 로그인이 서로의 세션 목록을 덮어쓰지 않고 왕복도 한 번입니다.
+마지막 활동 시간은 session_touch_interval마다 한 번만 기록합니다.
+"""
+
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 from pydantic import BaseModel, Field
+import time
 import uuid
 import json
 import logging
@@ -9,6 +23,116 @@ from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# 키 형식 버전 (이전 형식의 문자열 키와 분리)
+SESSION_KEY_VERSION = "v2"
+
+# 세션 목록 응답에 포함하는 필드
+SESSION_SUMMARY_FIELDS = ("created_at", "last_activity", "ip_address", "user_agent")
+
+# KEYS: 세션 키, 사용자 세션 키 / ARGV: 세션 ID, TTL, 현재 시각, 최대 세션 수, 세션 키 프리픽스, 필드/값...
+# 반환: 제한 초과로 삭제된 세션 ID 목록
+CREATE_SESSION_SCRIPT = """
+local session_key, user_key = KEYS[1], KEYS[2]
+local session_id, ttl, now = ARGV[1], tonumber(ARGV[2]), tonumber(ARGV[3])
+local max_sessions, session_prefix = tonumber(ARGV[4]), ARGV[5]
+redis.call('HSET', session_key, unpack(ARGV, 6))
+redis.call('EXPIRE', session_key, ttl)
+for _, sid in ipairs(redis.call('ZRANGE', user_key, 0, -1)) do
+    if redis.call('EXISTS', session_prefix .. sid) == 0 then
+        redis.call('ZREM', user_key, sid)
+    end
+end
+redis.call('ZADD', user_key, now, session_id)
+local removed = {}
+if max_sessions > 0 then
+    local excess = redis.call('ZCARD', user_key) - max_sessions
+    if excess > 0 then
+        removed = redis.call('ZRANGE', user_key, 0, excess - 1)
+        for _, sid in ipairs(removed) do
+            redis.call('DEL', session_prefix .. sid)
+        end
+        redis.call('ZREMRANGEBYRANK', user_key, 0, excess - 1)
+    end
+end
+if redis.call('TTL', user_key) < ttl then
+    redis.call('EXPIRE', user_key, ttl)
+end
+return removed
+"""
+
+# KEYS: 세션 키 / ARGV: 세션 ID, 현재 시각, 현재 시각(ISO), 갱신 간격, 사용자 세션 키 프리픽스
+# 반환: 세션 해시 (HGETALL 형식, 없으면 빈 목록) - 간격이 지났을 때만 활동 시간 기록
+GET_SESSION_SCRIPT = """
+local session_key = KEYS[1]
+local session_id, now, now_iso = ARGV[1], tonumber(ARGV[2]), ARGV[3]
+local interval, user_prefix = tonumber(ARGV[4]), ARGV[5]
+local fields = redis.call('HGETALL', session_key)
+if #fields == 0 then
+    return fields
+end
+local last_seen = tonumber(redis.call('HGET', session_key, 'last_seen') or '0')
+if now - last_seen >= interval then
+    redis.call('HSET', session_key, 'last_seen', now, 'last_activity', now_iso)
+    local user_id = redis.call('HGET', session_key, 'user_id')
+    redis.call('ZADD', user_prefix .. user_id, 'XX', now, session_id)
+end
+return fields
+"""
+
+# KEYS: 세션 키 / ARGV: 세션 ID, TTL, 사용자 세션 키 프리픽스, 현재 시각, 필드/값...
+# 반환: 1 (갱신) / 0 (세션 없음)
+UPDATE_SESSION_SCRIPT = """
+local session_key = KEYS[1]
+if redis.call('EXISTS', session_key) == 0 then
+    return 0
+end
+redis.call('HSET', session_key, unpack(ARGV, 5))
+redis.call('EXPIRE', session_key, tonumber(ARGV[2]))
+local user_id = redis.call('HGET', session_key, 'user_id')
+redis.call('ZADD', ARGV[3] .. user_id, 'XX', tonumber(ARGV[4]), ARGV[1])
+return 1
+"""
+
+# KEYS: 세션 키 / ARGV: 세션 ID, 사용자 세션 키 프리픽스
+# 반환: 삭제된 세션 수 (0 또는 1)
+DELETE_SESSION_SCRIPT = """
+local session_key = KEYS[1]
+local user_id = redis.call('HGET', session_key, 'user_id')
+if user_id then
+    redis.call('ZREM', ARGV[2] .. user_id, ARGV[1])
+end
+return redis.call('DEL', session_key)
+"""
+
+# KEYS: 사용자 세션 키 / ARGV: 세션 키 프리픽스
+# 반환: 삭제된 세션 수
+DELETE_USER_SESSIONS_SCRIPT = """
+local user_key, session_prefix = KEYS[1], ARGV[1]
+local deleted = 0
+for _, sid in ipairs(redis.call('ZRANGE', user_key, 0, -1)) do
+    deleted = deleted + redis.call('DEL', session_prefix .. sid)
+end
+redis.call('DEL', user_key)
+return deleted
+"""
+
+# KEYS: 사용자 세션 키 / ARGV: 세션 키 프리픽스, 조회 필드...
+# 반환: [세션 ID, 필드값...] 목록 (최근 활동 순) - 사라진 세션은 정리
+LIST_USER_SESSIONS_SCRIPT = """
+local user_key, session_prefix = KEYS[1], ARGV[1]
+local result = {}
+for _, sid in ipairs(redis.call('ZREVRANGE', user_key, 0, -1)) do
+    local values = redis.call('HMGET', session_prefix .. sid, unpack(ARGV, 2))
+    if values[1] then
+        table.insert(values, 1, sid)
+        table.insert(result, values)
+    else
+        redis.call('ZREM', user_key, sid)
+    end
+end
+return result
+"""
+
 class SessionData(BaseModel):
     """세션 데이터 모델"""
     user_id: str
@@ -26,8 +150,8 @@ class SessionService:
     
     def __init__(self):
         self.settings = get_settings()
-        self.session_prefix = "session:"
-        self.user_sessions_prefix = "user_sessions:"
+        self.session_prefix = f"session:{SESSION_KEY_VERSION}:"
+        self.user_sessions_prefix = f"user_sessions:{SESSION_KEY_VERSION}:"
     
     def _generate_session_id(self) -> str:
         """세션 ID 생성"""
@@ -41,13 +165,26 @@ class SessionService:
         """사용자 세션 목록 Redis 키 생성"""
         return get_prefixed_key(f"{self.user_sessions_prefix}{user_id}")
     
+    @staticmethod
+    def _flatten(fields: Dict[str, Any]) -> List[str]:
+        """해시 필드를 HSET 인자 목록으로 변환"""
+        flat: List[str] = []
+        for field, value in fields.items():
+            flat.extend([field, "" if value is None else str(value)])
+        return flat
+    
+    @staticmethod
+    def _to_session_data(fields: List[str]) -> SessionData:
+        """HGETALL 형식 목록을 세션 모델로 변환"""
+        return SessionData(**dict(zip(fields[::2], fields[1::2])))
+    
     async def create_session(
         self, 
         session_data: SessionData, 
         ttl: Optional[int] = None,
         max_concurrent_sessions: Optional[int] = None
     ) -> str:
-        """세션 생성"""
+        """세션 생성 (동시 세션 제한 초과 시 활동이 가장 오래된 세션부터 삭제)"""
         redis_manager = await get_redis_manager()
         
         if not await redis_manager.is_connected():
@@ -56,8 +193,6 @@ class SessionService:
         
         try:
             session_id = self._generate_session_id()
-            session_key = self._get_session_key(session_id)
-            user_sessions_key = self._get_user_sessions_key(session_data.user_id)
             
             # TTL 설정 (기본값: refresh token 만료 시간)
             if ttl is None:
@@ -65,41 +200,21 @@ class SessionService:
                 if ttl <= 0:
                     ttl = self.settings.refresh_token_expire_days * 24 * 3600
             
-            # 세션 데이터 저장
-            session_dict = session_data.model_dump(mode='json')
-            success = await redis_manager.set(session_key, session_dict, ttl=ttl)
+            now = time.time()
+            fields = {**session_data.model_dump(mode='json'), "last_seen": now}
+            removed = await redis_manager.eval_script(
+                CREATE_SESSION_SCRIPT,
+                [self._get_session_key(session_id), self._get_user_sessions_key(session_data.user_id)],
+                [session_id, ttl, now, max_concurrent_sessions or 0, get_prefixed_key(self.session_prefix),
+                 *self._flatten(fields)]
+            )
             
-            if not success:
+            if removed is None:
                 logger.error(f"세션 저장 실패: {session_id}")
                 return None
             
-            # 사용자 세션 목록에 추가
-            user_sessions = await self._get_user_sessions_list(session_data.user_id)
-            
-            # 새 세션 정보 추가
-            session_info = {
-                "session_id": session_id,
-                "created_at": session_data.created_at.isoformat(),
-                "ip_address": session_data.ip_address,
-                "user_agent": session_data.user_agent
-            }
-            user_sessions.append(session_info)
-            
-            # 동시 세션 제한 적용
-            if max_concurrent_sessions and len(user_sessions) > max_concurrent_sessions:
-                # 오래된 세션 삭제
-                sessions_to_remove = user_sessions[:-max_concurrent_sessions]
-                for old_session in sessions_to_remove:
-                    await self._delete_session_by_id(old_session["session_id"])
-                user_sessions = user_sessions[-max_concurrent_sessions:]
-            
-            # 사용자 세션 목록 업데이트
-            await redis_manager.set(
-                user_sessions_key, 
-                user_sessions, 
-                ttl=ttl
-            )
-            
+            if removed:
+                logger.info(f"동시 세션 제한으로 삭제된 세션: {removed} (사용자: {session_data.user_id})")
             logger.info(f"세션 생성 성공: {session_id} (사용자: {session_data.user_id})")
             return session_id
             
@@ -108,30 +223,32 @@ class SessionService:
             return None
     
     async def get_session(self, session_id: str) -> Optional[SessionData]:
-        """세션 조회"""
+        """세션 조회 (마지막 활동 시간은 갱신 간격마다 한 번만 기록)"""
         redis_manager = await get_redis_manager()
         
         if not await redis_manager.is_connected():
             return None
         
         try:
-            session_key = self._get_session_key(session_id)
-            session_dict = await redis_manager.get(session_key)
+            now = datetime.now()
+            fields = await redis_manager.eval_script(
+                GET_SESSION_SCRIPT,
+                [self._get_session_key(session_id)],
+                [session_id, time.time(), now.isoformat(), self.settings.session_touch_interval,
+                 get_prefixed_key(self.user_sessions_prefix)]
+            )
             
-            if not session_dict:
+            if not fields:
                 return None
             
             # 세션 만료 확인
-            session_data = SessionData(**session_dict)
-            if session_data.expires_at < datetime.now():
+            session_data = self._to_session_data(fields)
+            if session_data.expires_at < now:
                 # 만료된 세션 삭제
                 await self.delete_session(session_id)
                 return None
             
-            # 마지막 활동 시간 업데이트
-            session_data.last_activity = datetime.now()
-            await self.update_session(session_id, session_data)
-            
+            session_data.last_activity = now
             return session_data
             
         except Exception as e:
@@ -139,29 +256,27 @@ class SessionService:
             return None
     
     async def update_session(self, session_id: str, session_data: SessionData) -> bool:
-        """세션 업데이트"""
+        """세션 업데이트 (존재하는 세션만)"""
         redis_manager = await get_redis_manager()
         
         if not await redis_manager.is_connected():
             return False
         
         try:
-            session_key = self._get_session_key(session_id)
-            
-            # 현재 TTL 확인
-            current_data = await redis_manager.get(session_key)
-            if not current_data:
-                return False
-            
             # TTL 계산
             ttl = int((session_data.expires_at - datetime.now()).total_seconds())
             if ttl <= 0:
                 await self.delete_session(session_id)
                 return False
             
-            # 세션 데이터 업데이트
-            session_dict = session_data.model_dump(mode='json')
-            success = await redis_manager.set(session_key, session_dict, ttl=ttl)
+            now = time.time()
+            fields = {**session_data.model_dump(mode='json'), "last_seen": now}
+            result = await redis_manager.eval_script(
+                UPDATE_SESSION_SCRIPT,
+                [self._get_session_key(session_id)],
+                [session_id, ttl, get_prefixed_key(self.user_sessions_prefix), now, *self._flatten(fields)]
+            )
+            success = bool(result)
             
             if success:
                 logger.debug(f"세션 업데이트 성공: {session_id}")
@@ -175,50 +290,41 @@ class SessionService:
             return False
     
     async def delete_session(self, session_id: str) -> bool:
-        """세션 삭제"""
+        """세션 삭제 (사용자 세션 목록에서도 제거)"""
         redis_manager = await get_redis_manager()
         
         if not await redis_manager.is_connected():
             return False
         
         try:
-            # 세션 데이터 조회 (사용자 정보 얻기 위함)
-            session_data = await self.get_session(session_id)
-            
-            # 세션 삭제
-            success = await self._delete_session_by_id(session_id)
-            
-            # 사용자 세션 목록에서 제거
-            if session_data:
-                await self._remove_from_user_sessions(session_data.user_id, session_id)
-            
-            return success
+            deleted = await redis_manager.eval_script(
+                DELETE_SESSION_SCRIPT,
+                [self._get_session_key(session_id)],
+                [session_id, get_prefixed_key(self.user_sessions_prefix)]
+            )
+            return bool(deleted)
             
         except Exception as e:
             logger.error(f"세션 삭제 오류: {e}")
             return False
     
-    async def _delete_session_by_id(self, session_id: str) -> bool:
-        """세션 ID로 직접 삭제 (내부 메서드)"""
-        redis_manager = await get_redis_manager()
-        session_key = self._get_session_key(session_id)
-        return await redis_manager.delete(session_key)
-    
     async def get_user_sessions(self, user_id: str) -> List[Dict[str, Any]]:
-        """사용자의 모든 세션 조회"""
-        return await self._get_user_sessions_list(user_id)
-    
-    async def _get_user_sessions_list(self, user_id: str) -> List[Dict[str, Any]]:
-        """사용자 세션 목록 조회 (내부 메서드)"""
+        """사용자의 모든 세션 조회 (최근 활동 순)"""
         redis_manager = await get_redis_manager()
         
         if not await redis_manager.is_connected():
             return []
         
         try:
-            user_sessions_key = self._get_user_sessions_key(user_id)
-            sessions = await redis_manager.get(user_sessions_key)
-            return sessions or []
+            rows = await redis_manager.eval_script(
+                LIST_USER_SESSIONS_SCRIPT,
+                [self._get_user_sessions_key(user_id)],
+                [get_prefixed_key(self.session_prefix), *SESSION_SUMMARY_FIELDS]
+            )
+            return [
+                {"session_id": row[0], **dict(zip(SESSION_SUMMARY_FIELDS, row[1:]))}
+                for row in rows or []
+            ]
             
         except Exception as e:
             logger.error(f"사용자 세션 목록 조회 오류: {e}")
@@ -232,20 +338,11 @@ class SessionService:
             return 0
         
         try:
-            # 사용자 세션 목록 조회
-            user_sessions = await self.get_user_sessions(user_id)
-            
-            deleted_count = 0
-            for session_info in user_sessions:
-                session_id = session_info.get("session_id")
-                if session_id:
-                    success = await self._delete_session_by_id(session_id)
-                    if success:
-                        deleted_count += 1
-            
-            # 사용자 세션 목록 삭제
-            user_sessions_key = self._get_user_sessions_key(user_id)
-            await redis_manager.delete(user_sessions_key)
+            deleted_count = await redis_manager.eval_script(
+                DELETE_USER_SESSIONS_SCRIPT,
+                [self._get_user_sessions_key(user_id)],
+                [get_prefixed_key(self.session_prefix)]
+            ) or 0
             
             logger.info(f"사용자 세션 삭제 완료: {user_id}, 삭제된 세션 수: {deleted_count}")
             return deleted_count
@@ -254,31 +351,11 @@ class SessionService:
             logger.error(f"사용자 세션 삭제 오류: {e}")
             return 0
     
-    async def _remove_from_user_sessions(self, user_id: str, session_id: str):
-        """사용자 세션 목록에서 특정 세션 제거"""
-        redis_manager = await get_redis_manager()
-        
-        try:
-            user_sessions = await self._get_user_sessions_list(user_id)
-            updated_sessions = [
-                session for session in user_sessions 
-                if session.get("session_id") != session_id
-            ]
-            
-            user_sessions_key = self._get_user_sessions_key(user_id)
-            if updated_sessions:
-                await redis_manager.set(user_sessions_key, updated_sessions)
-            else:
-                await redis_manager.delete(user_sessions_key)
-                
-        except Exception as e:
-            logger.error(f"사용자 세션 목록 업데이트 오류: {e}")
-    
     async def cleanup_expired_sessions(self) -> int:
         """만료된 세션 정리 (배치 작업용)"""
-        # Redis TTL에 의해 자동으로 정리되므로 별도 구현 불필요
-        # 필요시 사용자 세션 목록의 유효하지 않은 항목 정리 가능
-        pass
+        # 세션 해시는 TTL로 자동 만료되고, 사용자 세션 집합의 사라진 항목은
+        # 세션 생성/목록 조회 스크립트가 정리하므로 별도 구현 불필요
+        return 0
 
 # 글로벌 세션 서비스 인스턴스
 session_service = SessionService()
@@ -1,13 +1,99 @@
-from typing import Optional, Dict, Any, List
+"""Redis 기반 토큰 블랙리스트 + 워커별 로컬 폐기 필터
+
+폐기 확인은 인증된 요청마다 실행되므로, 각 워커가 폐기된 토큰 해시와 사용자별
+"이 시각 이전 발급 토큰 폐기" 시각을 메모리에 유지합니다.
+
+- 시작 시 Redis 정렬 집합(폐기 저널, 점수 = 만료 시각)에서 로드
+- 이후 변경은 Redis pub/sub으로 모든 워커에 전파
+- 로컬 필터에 없으면 네트워크 호출 없이 "폐기 안 됨" (일반적인 경우)
+- 로컬 필터에 있으면 Redis로 확인 (수동 삭제 등으로 인한 오탐 방지)
+- 필터가 동기화되지 않은 동안(시작 직후, 구독 끊김, Upstash REST)은 기존처럼 Redis 조회
+- 만료된 항목은 로컬 필터와 저널에서 주기적으로 정리
+"""
+
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
+import asyncio
 import hashlib
 import json
 import logging
-from ..database.redis_factory import get_redis_manager, get_prefixed_key
+import time
+from ..database.redis_factory import get_redis_manager, get_prefixed_key, ensure_redis_connection
 from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+REVOCATION_CHANNEL = "blacklist:events"
+REVOCATION_JOURNAL = "blacklist:journal"
+# 구독 시작 후 저널을 다시 읽기까지의 대기 시간 (구독 전 발행된 이벤트 누락 방지)
+RESYNC_DELAY = 1.0
+PRUNE_INTERVAL = 60.0
+
+
+class RevocationFilter:
+    """워커 메모리의 폐기 토큰/사용자 집합 (만료 시각 기준으로 정리)"""
+
+    def __init__(self):
+        self._tokens: Dict[str, float] = {}  # 토큰 해시 -> 만료 시각
+        self._users: Dict[str, Tuple[float, float]] = {}  # 사용자 ID -> (폐기 시각, 만료 시각)
+        self.ready = False
+        self._next_prune = 0.0
+
+    def __len__(self) -> int:
+        return len(self._tokens) + len(self._users)
+
+    def add_token(self, token_hash: str, expires_at: float) -> None:
+        self._tokens[token_hash] = max(expires_at, self._tokens.get(token_hash, 0.0))
+
+    def revoke_user(self, user_id: str, revoked_at: float, expires_at: float) -> None:
+        current = self._users.get(user_id)
+        if current:
+            revoked_at = max(revoked_at, current[0])
+            expires_at = max(expires_at, current[1])
+        self._users[user_id] = (revoked_at, expires_at)
+
+    def contains_token(self, token_hash: str) -> bool:
+        self._maybe_prune()
+        expires_at = self._tokens.get(token_hash)
+        return expires_at is not None and expires_at > time.time()
+
+    def user_revoked_at(self, user_id: str) -> Optional[float]:
+        self._maybe_prune()
+        entry = self._users.get(user_id)
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry[0]
+
+    def apply(self, event: Dict[str, Any]) -> None:
+        """폐기 이벤트 반영 (pub/sub 메시지, 저널 항목 공통 형식)"""
+        if event.get("type") == "token":
+            self.add_token(event["hash"], float(event["exp"]))
+        elif event.get("type") == "user":
+            self.revoke_user(event["user_id"], float(event["revoked_at"]), float(event["exp"]))
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """만료된 항목 제거 - 제거한 항목 수 반환"""
+        now = time.time() if now is None else now
+        expired_tokens = [key for key, expires_at in self._tokens.items() if expires_at <= now]
+        expired_users = [key for key, (_, expires_at) in self._users.items() if expires_at <= now]
+        for key in expired_tokens:
+            del self._tokens[key]
+        for key in expired_users:
+            del self._users[key]
+        return len(expired_tokens) + len(expired_users)
+
+    def _maybe_prune(self) -> None:
+        now = time.monotonic()
+        if now >= self._next_prune:
+            self._next_prune = now + PRUNE_INTERVAL
+            self.prune()
+
+    def clear(self) -> None:
+        self._tokens.clear()
+        self._users.clear()
+        self.ready = False
+
+
 class TokenBlacklistService:
     """Redis 기반 토큰 블랙리스트 서비스"""
     
@@ -17,6 +103,9 @@ class TokenBlacklistService:
         self._blacklist_prefix = "blacklist:token:"
         self._jti_blacklist_prefix = "blacklist:jti:"
         self._user_blacklist_prefix = "blacklist:user:"
+        self.revocations = RevocationFilter()
+        self._listener: Optional[asyncio.Task] = None
+        self._stats = {"local_negative": 0, "redis_checks": 0, "events_received": 0}
         
     def _get_token_hash(self, token: str) -> str:
         """토큰을 해시로 변환 (보안 및 저장 효율성)"""
@@ -50,6 +139,96 @@ class TokenBlacklistService:
         """사용자별 블랙리스트 Redis 키 생성"""
         return f"{self.user_blacklist_prefix}{user_id}"
     
+    @property
+    def channel(self) -> str:
+        """폐기 이벤트 pub/sub 채널 (환경별 프리픽스 적용)"""
+        return get_prefixed_key(REVOCATION_CHANNEL)
+    
+    @property
+    def journal_key(self) -> str:
+        """폐기 저널 정렬 집합 키 (환경별 프리픽스 적용)"""
+        return get_prefixed_key(REVOCATION_JOURNAL)
+    
+    # === 로컬 폐기 필터 동기화 ===
+    
+    async def _record_revocation(self, event: Dict[str, Any]) -> None:
+        """로컬 반영 → 저널 기록 → 다른 워커에 전파"""
+        self.revocations.apply(event)
+        redis_manager = await get_redis_manager()
+        message = json.dumps(event, sort_keys=True)
+        await redis_manager.zadd(self.journal_key, {message: float(event["exp"])})
+        await redis_manager.zremrangebyscore(self.journal_key, "-inf", time.time())
+        await redis_manager.publish(self.channel, message)
+    
+    async def load_revocations(self) -> int:
+        """Redis 폐기 저널에서 만료되지 않은 항목을 로컬 필터로 로드"""
+        redis_manager = await get_redis_manager()
+        now = time.time()
+        await redis_manager.zremrangebyscore(self.journal_key, "-inf", now)
+        entries = await redis_manager.zrangebyscore(self.journal_key, now, "+inf")
+        for message, _ in entries:
+            self.handle_event(message, count=False)
+        return len(entries)
+    
+    def handle_event(self, message: str, count: bool = True) -> None:
+        """pub/sub 또는 저널의 폐기 이벤트 처리"""
+        try:
+            self.revocations.apply(json.loads(message))
+        except (json.JSONDecodeError, TypeError, KeyError, ValueError):
+            logger.warning(f"잘못된 토큰 폐기 이벤트: {message!r}")
+            return
+        if count:
+            self._stats["events_received"] += 1
+    
+    async def _resync(self) -> None:
+        await asyncio.sleep(RESYNC_DELAY)
+        if not await (await get_redis_manager()).is_connected():
+            return
+        loaded = await self.load_revocations()
+        self.revocations.ready = True
+        logger.info(f"토큰 폐기 필터 동기화 완료: 저널 {loaded}건")
+    
+    async def _listen(self) -> None:
+        while True:
+            redis_manager = await get_redis_manager()
+            resync = asyncio.create_task(self._resync())
+            try:
+                async for message in redis_manager.subscribe(self.channel):
+                    self.handle_event(message)
+            except NotImplementedError:
+                logger.info("토큰 폐기 이벤트 구독 미지원 - 매 요청 Redis로 확인합니다.")
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # subscribe()는 유휴 시간 초과를 내부에서 처리하므로 여기는 실제 연결 오류만 도달
+                logger.warning(f"토큰 폐기 이벤트 구독 끊김, 재연결 대기: {e}")
+            finally:
+                # 구독이 끊긴 동안의 이벤트를 놓칠 수 있으므로 재동기화 전까지 Redis로 확인
+                resync.cancel()
+                self.revocations.ready = False
+            
+            await asyncio.sleep(1)
+    
+    async def start(self) -> None:
+        """Redis 연결 확인 후 폐기 이벤트 구독 및 로컬 필터 동기화 시작"""
+        if self._listener is not None and not self._listener.done():
+            return
+        if not await ensure_redis_connection():
+            logger.warning("Redis 미연결 - 토큰 폐기 필터 없이 동작합니다.")
+            return
+        self._listener = asyncio.create_task(self._listen())
+    
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self.revocations.clear()
+    
     async def blacklist_token(
         self, 
         token: str, 
@@ -86,10 +265,11 @@ class TokenBlacklistService:
             
             if success:
                 logger.info(f"토큰 블랙리스트 추가 성공: {token[:20]}... (이유: {reason})")
-                
-                # 사용자별 블랙리스트에도 추가 (선택적)
-                if user_id:
-                    await self._add_to_user_blacklist(user_id, token, expires_at)
+                await self._record_revocation({
+                    "type": "token",
+                    "hash": self._get_token_hash(token),
+                    "exp": expires_at.timestamp()
+                })
             else:
                 logger.error(f"토큰 블랙리스트 추가 실패: {token[:20]}...")
             
@@ -136,20 +316,26 @@ class TokenBlacklistService:
             return False
     
     async def is_blacklisted(self, token: str) -> bool:
-        """토큰이 블랙리스트에 있는지 확인"""
+        """토큰이 블랙리스트에 있는지 확인 (로컬 필터에 없으면 네트워크 호출 없음)"""
+        token_hash = self._get_token_hash(token)
+        locally_revoked = self.revocations.contains_token(token_hash)
+        if self.revocations.ready and not locally_revoked:
+            self._stats["local_negative"] += 1
+            return False
+        
         redis_manager = await get_redis_manager()
         
         if not await redis_manager.is_connected():
-            return False
+            return locally_revoked
         
         try:
-            token_key = self._get_token_key(token)
-            exists = await redis_manager.exists(token_key)
+            self._stats["redis_checks"] += 1
+            exists = await redis_manager.exists(f"{self.blacklist_prefix}{token_hash}")
             return exists
             
         except Exception as e:
             logger.error(f"토큰 블랙리스트 확인 오류: {e}")
-            return False
+            return locally_revoked
     
     async def is_blacklisted_by_jti(self, jti: str) -> bool:
         """JTI가 블랙리스트에 있는지 확인"""
@@ -183,37 +369,6 @@ class TokenBlacklistService:
             logger.error(f"블랙리스트 정보 조회 오류: {e}")
             return None
     
-    async def _add_to_user_blacklist(
-        self, 
-        user_id: str, 
-        token: str, 
-        expires_at: datetime
-    ):
-        """사용자별 블랙리스트에 토큰 추가"""
-        redis_manager = await get_redis_manager()
-        
-        try:
-            user_key = self._get_user_blacklist_key(user_id)
-            
-            # 현재 사용자 블랙리스트 조회
-            user_blacklist = await redis_manager.get(user_key) or []
-            
-            # 새 토큰 정보 추가
-            token_info = {
-                "token_hash": self._get_token_hash(token),
-                "blacklisted_at": datetime.now().isoformat(),
-                "expires_at": expires_at.isoformat()
-            }
-            
-            user_blacklist.append(token_info)
-            
-            # TTL은 가장 늦게 만료되는 토큰 기준
-            ttl = int((expires_at - datetime.now()).total_seconds())
-            await redis_manager.set(user_key, user_blacklist, ttl=max(ttl, 3600))
-            
-        except Exception as e:
-            logger.error(f"사용자 블랙리스트 업데이트 오류: {e}")
-    
     async def blacklist_user_tokens(
         self, 
         user_id: str, 
@@ -230,10 +385,13 @@ class TokenBlacklistService:
             # 사용자별 블랙리스트 키에 마커 추가
             user_key = self._get_user_blacklist_key(user_id)
             
+            # JWT iat은 초 단위 정수 - 같은 초에 재발급된 토큰이 폐기되지 않도록 초 단위로 기록
+            revoked_at = int(time.time())
             blacklist_info = {
                 "reason": reason,
                 "blacklisted_at": datetime.now().isoformat(),
                 "expires_at": expires_at.isoformat(),
+                "revoked_at": revoked_at,  # 이 초보다 앞서 발급된 토큰 무효
                 "all_tokens": True  # 모든 토큰 무효화 마커
             }
             
@@ -245,6 +403,12 @@ class TokenBlacklistService:
             
             if success:
                 logger.info(f"사용자 모든 토큰 블랙리스트: {user_id} (이유: {reason})")
+                await self._record_revocation({
+                    "type": "user",
+                    "user_id": user_id,
+                    "revoked_at": revoked_at,
+                    "exp": revoked_at + ttl
+                })
                 return 1  # 마커 1개 추가
             
             return 0
@@ -253,25 +417,40 @@ class TokenBlacklistService:
             logger.error(f"사용자 토큰 블랙리스트 오류: {e}")
             return 0
     
-    async def is_user_blacklisted(self, user_id: str) -> bool:
-        """사용자의 모든 토큰이 블랙리스트되었는지 확인"""
+    async def is_user_blacklisted(self, user_id: str, issued_at: Optional[float] = None) -> bool:
+        """사용자 토큰 전체 폐기 여부 확인
+        
+        issued_at(토큰 iat)을 주면 폐기 시각 이전에 발급된 토큰만 폐기된 것으로 판단하므로,
+        전체 로그아웃 후 다시 로그인해 받은 토큰은 유효합니다.
+        """
+        locally_revoked_at = self.revocations.user_revoked_at(user_id)
+        if self.revocations.ready and locally_revoked_at is None:
+            self._stats["local_negative"] += 1
+            return False
+        
         redis_manager = await get_redis_manager()
         
         if not await redis_manager.is_connected():
-            return False
+            revoked_at = locally_revoked_at
+        else:
+            try:
+                self._stats["redis_checks"] += 1
+                info = await redis_manager.get(self._get_user_blacklist_key(user_id))
+            except Exception as e:
+                logger.error(f"사용자 블랙리스트 확인 오류: {e}")
+                info = None
+            
+            if not (info and isinstance(info, dict) and info.get("all_tokens", False)):
+                return False
+            revoked_at = info.get("revoked_at")
+            if revoked_at is None:
+                # 폐기 시각이 없는 이전 형식 마커는 모든 토큰 폐기
+                return True
         
-        try:
-            user_key = self._get_user_blacklist_key(user_id)
-            info = await redis_manager.get(user_key)
-            
-            if info and isinstance(info, dict):
-                return info.get("all_tokens", False)
-            
-            return False
-            
-        except Exception as e:
-            logger.error(f"사용자 블랙리스트 확인 오류: {e}")
+        if revoked_at is None:
             return False
+        # 초 단위 비교 (소수점 폐기 시각으로 저장된 이전 마커 포함)
+        return issued_at is None or issued_at < int(revoked_at)
     
     async def get_blacklist_stats(self) -> Dict[str, Any]:
         """블랙리스트 통계 정보"""
@@ -288,6 +467,7 @@ class TokenBlacklistService:
             stats = {
                 "status": "connected",
                 "total_blacklisted": "unavailable",  # 정확한 카운트는 비용이 높음
+                "local_filter": self.filter_stats(),
                 "redis_info": health_info.get("redis_info", {})
             }
             
@@ -297,12 +477,21 @@ class TokenBlacklistService:
             logger.error(f"블랙리스트 통계 조회 오류: {e}")
             return {"status": "error", "error": str(e)}
     
+    def filter_stats(self) -> Dict[str, Any]:
+        """로컬 폐기 필터 상태 및 조회 카운터"""
+        return {
+            **self._stats,
+            "ready": self.revocations.ready,
+            "entries": len(self.revocations),
+            "subscribed": self._listener is not None and not self._listener.done()
+        }
+    
     async def cleanup_expired_tokens(self) -> int:
-        """만료된 토큰 정리 (Redis TTL이 자동 처리하므로 수동 정리 불필요)"""
-        # Redis TTL에 의해 자동 정리되므로 실제 구현 불필요
-        # 메서드는 인터페이스 호환성을 위해 유지
-        logger.info("만료된 토큰은 Redis TTL에 의해 자동 정리됩니다.")
-        return 0
+        """만료된 폐기 항목 정리 (Redis 키는 TTL로 자동 정리, 로컬 필터/저널만 정리)"""
+        pruned = self.revocations.prune()
+        redis_manager = await get_redis_manager()
+        pruned += await redis_manager.zremrangebyscore(self.journal_key, "-inf", time.time())
+        return pruned
     
     async def clear_all_blacklisted_tokens(self) -> int:
         """모든 블랙리스트 토큰 삭제 (테스트용)"""
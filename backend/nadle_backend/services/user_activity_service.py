@@ -6,6 +6,8 @@ from nadle_backend.models.core import Post, Comment, UserReaction
 from nadle_backend.repositories.post_repository import PostRepository
 from nadle_backend.repositories.comment_repository import CommentRepository
 from nadle_backend.repositories.user_reaction_repository import UserReactionRepository
+from nadle_backend.repositories.data_loader import get_request_loaders
+from nadle_backend.exceptions.post import PostNotFoundError
 from beanie import PydanticObjectId
 
 logger = logging.getLogger(__name__)
@@ -305,6 +307,12 @@ class UserActivityService:
         # Group reactions by type and page
         logger.info(f"🔍 ANALYZING {len(reactions)} reactions for user {user_id}")
         
+        # 게시글 반응의 대상 게시글을 한 번의 $in 쿼리로 조회 (요청 범위 로더)
+        post_ids = [
+            reaction.target_id for reaction in reactions
+            if reaction.target_type == "post" and reaction.target_id
+        ]
+        posts_by_id = await get_request_loaders().posts.load_many(post_ids) if post_ids else {}
         
         for i, reaction in enumerate(reactions):
             logger.info(f"Reaction {i+1}/{len(reactions)}: target_type='{reaction.target_type}', liked={reaction.liked}, disliked={reaction.disliked}, bookmarked={reaction.bookmarked}")
@@ -312,7 +320,9 @@ class UserActivityService:
             # For post reactions, get current post information directly
             if reaction.target_type == "post" and reaction.target_id:
                 try:
-                    post = await self.post_repository.get_by_id(reaction.target_id)
+                    post = posts_by_id.get(reaction.target_id)
+                    if post is None:
+                        raise PostNotFoundError(post_id=reaction.target_id)
                     # 삭제된 게시글 스킵
                     if post.status == "deleted":
                         logger.info(f"❌ SKIPPING reaction {reaction.id} - post is deleted")
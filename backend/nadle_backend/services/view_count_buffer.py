@@ -0,0 +1,154 @@
+"""조회수 write-behind 버퍼.
+
+게시글 상세 조회마다 MongoDB에 `$inc`를 보내는 대신 워커 프로세스 메모리에 증가분을
+모아 두었다가 주기적으로 한 번의 unordered bulk_write로 반영합니다.
+
+- 반영 주기: settings.view_count_flush_interval (기본 5초)
+- 버퍼에 쌓인 게시글 수가 settings.view_count_max_pending 이상이면 즉시 반영
+- 종료 시 stop()에서 남은 증가분을 반영하므로 유실은 비정상 종료 시 한 주기 분량으로 제한
+- 반영 실패 시 증가분을 버퍼로 되돌려 다음 주기에 재시도 (unordered bulk_write는 실패한 연산
+  외에는 이미 반영했으므로 BulkWriteError면 writeErrors에 있는 게시글만 되돌림)
+- 조회 응답은 overlay()로 아직 반영되지 않은 증가분을 더해 실시간 값처럼 보여줌
+- 반영 후 조회수가 담긴 캐시 항목(view_count_tag)을 무효화해 캐시된 기준값을 갱신
+  (무효화가 끝날 때까지는 반영한 증가분도 overlay에 포함 - 표시 값이 줄어들지 않도록)
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional
+
+from pymongo.errors import BulkWriteError
+
+from ..config import get_settings
+from ..database.cache_tags import view_count_tag
+from ..database.layered_cache import LayeredCacheManager, layered_cache
+from ..repositories.post_repository import PostRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCountBuffer:
+    """프로세스 내 조회수 증가분 버퍼"""
+
+    def __init__(
+        self,
+        post_repository: Optional[PostRepository] = None,
+        flush_interval: Optional[float] = None,
+        max_pending: Optional[int] = None,
+        cache: Optional[LayeredCacheManager] = None
+    ):
+        settings = get_settings()
+        self.post_repository = post_repository or PostRepository()
+        self.cache = cache or layered_cache
+        self.flush_interval = flush_interval or settings.view_count_flush_interval
+        self.max_pending = max_pending or settings.view_count_max_pending
+        self._pending: Dict[str, int] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._size_flush: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        """주기적 반영 작업 실행 여부"""
+        return self._task is not None and not self._task.done()
+
+    def record(self, post_id: str, count: int = 1) -> None:
+        """조회수 증가분 기록 (DB 쓰기 없음)"""
+        self._pending[post_id] = self._pending.get(post_id, 0) + count
+
+        if len(self._pending) >= self.max_pending and (self._size_flush is None or self._size_flush.done()):
+            self._size_flush = asyncio.create_task(self.flush())
+
+    def pending(self, post_id: str) -> int:
+        """아직 MongoDB에 반영되지 않은 증가분 (반영 중인 값 포함)"""
+        return self._pending.get(post_id, 0) + self._in_flight.get(post_id, 0)
+
+    def overlay(self, post_id: str, view_count: Optional[int]) -> int:
+        """저장된 조회수에 미반영 증가분을 더한 값"""
+        return (view_count or 0) + self.pending(post_id)
+
+    async def flush(self) -> int:
+        """버퍼의 증가분을 MongoDB에 반영
+
+        Returns:
+            반영을 시도한 게시글 수
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            self._in_flight, self._pending = self._pending, {}
+            try:
+                try:
+                    await self.post_repository.apply_view_count_deltas(self._in_flight)
+                except BulkWriteError as e:
+                    failed = self._failed_deltas(e)
+                    logger.error(
+                        f"조회수 일부 반영 실패 ({len(failed)}/{len(self._in_flight)}개 게시글) - 다음 주기에 재시도"
+                    )
+                    for post_id, delta in failed.items():
+                        self._pending[post_id] = self._pending.get(post_id, 0) + delta
+                    await self._refresh_cached_counts(self._in_flight)
+                    return len(self._in_flight) - len(failed)
+                except Exception as e:
+                    logger.error(f"조회수 반영 실패 ({len(self._in_flight)}개 게시글) - 다음 주기에 재시도: {e}")
+                    for post_id, delta in self._in_flight.items():
+                        self._pending[post_id] = self._pending.get(post_id, 0) + delta
+                    return 0
+
+                # 캐시 무효화가 끝날 때까지는 반영한 증가분도 overlay에 포함
+                await self._refresh_cached_counts(self._in_flight)
+                return len(self._in_flight)
+            finally:
+                self._in_flight = {}
+
+    def _failed_deltas(self, error: BulkWriteError) -> Dict[str, int]:
+        """BulkWriteError의 writeErrors에 포함된 게시글의 증가분 (나머지 연산은 이미 반영됨)"""
+        failed: Dict[str, int] = {}
+        for write_error in error.details.get("writeErrors", []):
+            post_id = str(write_error.get("op", {}).get("q", {}).get("_id"))
+            if post_id in self._in_flight:
+                failed[post_id] = self._in_flight[post_id]
+        return failed
+
+    async def _refresh_cached_counts(self, deltas: Dict[str, int]) -> None:
+        """반영한 게시글의 캐시 항목 무효화 - 다음 조회가 갱신된 조회수를 기준값으로 사용"""
+        try:
+            await self.cache.invalidate_tags(*(view_count_tag(post_id) for post_id in deltas))
+        except Exception as e:
+            logger.warning(f"조회수 캐시 무효화 실패 - 캐시 TTL 동안 이전 기준값 사용: {e}")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def start(self) -> None:
+        """주기적 반영 작업 시작"""
+        if self.is_running:
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"조회수 write-behind 버퍼 시작 (주기 {self.flush_interval}초)")
+
+    async def stop(self) -> None:
+        """반영 작업 중지 후 남은 증가분 반영"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        flushed = await self.flush()
+        logger.info(f"조회수 write-behind 버퍼 중지 - 남은 {flushed}개 게시글 반영")
+
+
+# 글로벌 조회수 버퍼 인스턴스 (워커 프로세스당 하나)
+view_count_buffer = ViewCountBuffer()
+
+
+async def get_view_count_buffer() -> ViewCountBuffer:
+    """조회수 버퍼 인스턴스 반환"""
+    return view_count_buffer
@@ -0,0 +1,75 @@
+"""Opaque cursor utilities for keyset pagination."""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from nadle_backend.exceptions.post import PostCursorError
+
+
+# 커서 페이지네이션을 지원하는 정렬 필드 (모두 내림차순, _id로 tie-break)
+CURSOR_SORT_FIELDS = ("created_at", "view_count", "like_count")
+
+
+def encode_cursor(sort_by: str, value: Any, post_id: Any) -> str:
+    """Encode the last item of a page into an opaque cursor token.
+
+    Args:
+        sort_by: Sort field the page was ordered by
+        value: Value of the sort field on the last item (``None`` if null or missing)
+        post_id: ``_id`` of the last item (tie-breaker)
+
+    Returns:
+        URL-safe cursor string
+    """
+    if value is None:
+        # null은 0과 정렬 위치가 다르므로 (내림차순에서 모든 숫자/날짜 뒤) 따로 표시
+        encoded_value = {"t": "null"}
+    elif isinstance(value, datetime):
+        encoded_value = {"t": "dt", "v": value.isoformat()}
+    else:
+        encoded_value = {"t": "n", "v": value}
+
+    payload = {"s": sort_by, "k": encoded_value, "id": str(post_id)}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, sort_by: str) -> Tuple[Any, ObjectId]:
+    """Decode a cursor token produced by :func:`encode_cursor`.
+
+    Args:
+        token: Cursor string received from the client
+        sort_by: Sort field of the current request
+
+    Returns:
+        Tuple of (sort field value or None for null, ObjectId of the last item)
+
+    Raises:
+        PostCursorError: If the token is malformed or was issued for another sort
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+
+        if payload["s"] != sort_by:
+            raise PostCursorError("Cursor was issued for a different sort order")
+
+        encoded_value = payload["k"]
+        if encoded_value["t"] == "null":
+            value = None
+        elif encoded_value["t"] == "dt":
+            value = datetime.fromisoformat(encoded_value["v"])
+        else:
+            value = encoded_value["v"]
+            if not isinstance(value, (int, float)):
+                raise PostCursorError()
+
+        return value, ObjectId(payload["id"])
+    except PostCursorError:
+        raise
+    except (ValueError, KeyError, TypeError, InvalidId, UnicodeError):
+        raise PostCursorError()
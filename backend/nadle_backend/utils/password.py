@@ -3,6 +3,7 @@
 import re
 from passlib.context import CryptContext
 from typing import Optional
+from nadle_backend.utils.password_pool import get_password_pool
 
 
 class PasswordManager:
@@ -92,6 +93,57 @@ class PasswordManager:
             # If verification fails due to invalid hash format, return False
             return False
     
+    async def hash_password_async(self, password: str) -> str:
+        """Hash a password in the password worker pool without blocking the event loop.
+        
+        Args:
+            password: Plain text password to hash
+            
+        Returns:
+            Bcrypt hashed password string
+            
+        Raises:
+            ValueError: If password is None or empty
+            PasswordServiceBusyError: If the worker pool is saturated or timed out
+        """
+        if password is None:
+            raise ValueError("Password cannot be None")
+        
+        if not password:
+            raise ValueError("Password cannot be empty")
+        
+        pool = await get_password_pool()
+        return await pool.hash_password(password, self.bcrypt_rounds)
+    
+    async def verify_password_async(self, password: str, hashed_password: str) -> bool:
+        """Verify a password in the password worker pool without blocking the event loop.
+        
+        Args:
+            password: Plain text password to verify
+            hashed_password: Bcrypt hashed password to verify against
+            
+        Returns:
+            True if password matches hash, False otherwise
+            
+        Raises:
+            ValueError: If password or hash is None or empty
+            PasswordServiceBusyError: If the worker pool is saturated or timed out
+        """
+        if password is None:
+            raise ValueError("Password cannot be None")
+        
+        if not password:
+            raise ValueError("Password cannot be empty")
+        
+        if hashed_password is None:
+            raise ValueError("Hash cannot be None")
+        
+        if not hashed_password:
+            raise ValueError("Hash cannot be empty")
+        
+        pool = await get_password_pool()
+        return await pool.verify_password(password, hashed_password, self.bcrypt_rounds)
+    
     def validate_password_strength(self, password: str) -> bool:
         """Validate password meets strength requirements.
         
@@ -0,0 +1,155 @@
+"""비밀번호 해시 워커 풀 (bcrypt 오프로드 + 수용 제어)
+
+bcrypt 12 라운드는 호출당 약 250ms의 CPU를 사용합니다. 이벤트 루프에서 직접
+실행하면 로그인 한 번이 같은 워커의 다른 모든 요청을 멈추게 하므로, 해시/검증을
+별도 프로세스 풀에서 실행합니다.
+
+- 실행 중 + 대기 중 작업 수가 max_pending 이상이면 큐에 넣지 않고 즉시 거절
+- timeout 안에 결과가 오지 않으면 거절 (아직 시작하지 않은 작업은 취소)
+- 거절은 PasswordServiceBusyError(503)로 전달되어 클라이언트가 재시도
+- 워커 프로세스가 죽으면(BrokenProcessPool - 제출 시점 또는 실행 중) 손상된 풀을 종료하고
+  새로 만들어 한 번 재시도, 재시도도 실패하면 거절 (시간 제한은 재시도까지 포함)
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+from passlib.context import CryptContext
+
+from nadle_backend.config import get_settings
+from nadle_backend.exceptions.auth import PasswordServiceBusyError
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=8)
+def _crypt_context(rounds: int) -> CryptContext:
+    """워커 프로세스별 CryptContext (라운드 수별로 한 번만 생성)"""
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+
+
+def hash_in_worker(password: str, rounds: int) -> str:
+    """워커 프로세스에서 실행되는 bcrypt 해시"""
+    return _crypt_context(rounds).hash(password)
+
+
+def verify_in_worker(password: str, hashed_password: str, rounds: int) -> bool:
+    """워커 프로세스에서 실행되는 bcrypt 검증 (잘못된 해시 형식은 False)"""
+    try:
+        return _crypt_context(rounds).verify(password, hashed_password)
+    except Exception:
+        return False
+
+
+class PasswordWorkerPool:
+    """수용 제어가 있는 비밀번호 작업용 프로세스 풀"""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        timeout: Optional[float] = None,
+        executor_factory: Optional[Callable[[int], Executor]] = None
+    ):
+        settings = get_settings()
+        self.max_workers = max_workers or settings.password_pool_workers
+        self.max_pending = max_pending or settings.password_pool_max_pending
+        self.timeout = timeout or settings.password_pool_timeout
+        self._executor_factory = executor_factory or ProcessPoolExecutor
+        self._executor: Optional[Executor] = None
+        # 완료 콜백은 풀 관리 스레드에서 호출되므로 카운터는 락으로 보호
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.rejected = 0
+
+    @property
+    def pending(self) -> int:
+        """실행 중 + 대기 중인 작업 수"""
+        return self._pending
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = self._executor_factory(self.max_workers)
+        return self._executor
+
+    def _release(self, _future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def _discard_executor(self, executor: Executor) -> None:
+        """손상된 풀 종료 (다른 요청이 이미 새 풀로 바꿨으면 새 풀은 유지)"""
+        if self._executor is executor:
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, executor: Executor, fn: Callable[..., Any], *args: Any) -> Future:
+        """작업 제출 - 호출 전에 늘린 대기 수는 작업이 끝나면 _release가 줄임"""
+        try:
+            future = executor.submit(fn, *args)
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """워커에서 fn(*args) 실행 - 포화/시간 초과/워커 재시작 실패 시 PasswordServiceBusyError"""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise PasswordServiceBusyError()
+            self._pending += 1
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        for attempt in range(2):
+            if attempt:
+                # 이미 수용된 요청의 재시도 - 수용 제한 없이 다시 계산
+                with self._lock:
+                    self._pending += 1
+            executor = self._get_executor()
+            try:
+                future = self._submit(executor, fn, *args)
+                return await asyncio.wait_for(asyncio.wrap_future(future), deadline - loop.time())
+            except BrokenProcessPool:
+                self._discard_executor(executor)
+                if attempt:
+                    self.rejected += 1
+                    logger.error("비밀번호 워커 풀이 다시 손상되어 요청을 거절합니다.")
+                    raise PasswordServiceBusyError()
+                logger.warning("비밀번호 워커 풀이 손상되어 다시 생성합니다.")
+            except asyncio.TimeoutError:
+                # wait_for가 취소하므로 아직 시작하지 않은 작업은 큐에서 빠짐
+                self.rejected += 1
+                logger.warning(f"비밀번호 작업 시간 초과 ({self.timeout}s, 대기 {self._pending}건)")
+                raise PasswordServiceBusyError()
+
+    async def hash_password(self, password: str, rounds: int) -> str:
+        return await self.run(hash_in_worker, password, rounds)
+
+    async def verify_password(self, password: str, hashed_password: str, rounds: int) -> bool:
+        return await self.run(verify_in_worker, password, hashed_password, rounds)
+
+    def shutdown(self) -> None:
+        """워커 종료 (대기 중 작업 취소)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 전역 비밀번호 워커 풀 (워커 프로세스는 첫 작업 때 생성)
+password_pool: Optional[PasswordWorkerPool] = None
+
+
+async def get_password_pool() -> PasswordWorkerPool:
+    """비밀번호 워커 풀 인스턴스 반환"""
+    global password_pool
+    if password_pool is None:
+        password_pool = PasswordWorkerPool()
+    return password_pool
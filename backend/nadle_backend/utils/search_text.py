@@ -0,0 +1,107 @@
+"""Search text utilities for the post full-text index.
+
+MongoDB 텍스트 인덱스는 공백 단위로만 토큰을 나누기 때문에 조사가 붙은 한국어
+("서울에서")를 검색어("서울")로 찾지 못합니다. 그래서 저장 시점에 한글은 음절
+uni-gram/bi-gram으로, 영문/숫자는 단어 단위로 토큰화한 문자열을 별도 필드에 저장하고,
+검색어도 같은 규칙으로 토큰화하여 $text 검색에 사용합니다.
+"""
+
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional
+
+from bs4 import BeautifulSoup
+
+
+# 한글 음절 / CJK / 영문·숫자 연속 구간
+_TOKEN_PATTERN = re.compile(r"[가-힣]+|[぀-ヿ一-鿿]+|[a-z0-9]+")
+_HANGUL_OR_CJK = re.compile(r"[가-힣぀-ヿ一-鿿]")
+_WHITESPACE = re.compile(r"\s+")
+
+# 한 번의 검색에 사용할 최대 토큰 수 (긴 검색어로 인한 과도한 인덱스 조회 방지)
+MAX_QUERY_TOKENS = 16
+
+
+def _normalize(text: str) -> str:
+    return unicodedata.normalize("NFKC", text or "").lower()
+
+
+def extract_search_text(content: Optional[str]) -> str:
+    """본문(HTML/마크다운/텍스트)에서 검색용 순수 텍스트 추출.
+
+    Args:
+        content: 게시글 원본 본문
+
+    Returns:
+        태그를 제거하고 공백을 정규화한 텍스트
+    """
+    if not content:
+        return ""
+    if "<" in content:
+        content = BeautifulSoup(content, "html.parser").get_text(" ")
+    return _WHITESPACE.sub(" ", content).strip()
+
+
+def _run_tokens(run: str, include_unigrams: bool) -> List[str]:
+    if not _HANGUL_OR_CJK.match(run):
+        return [run]
+    if len(run) == 1:
+        return [run]
+    tokens = [run[i:i + 2] for i in range(len(run) - 1)]
+    if include_unigrams:
+        tokens.extend(run)
+    return tokens
+
+
+def tokenize(text: Optional[str], include_unigrams: bool = True) -> List[str]:
+    """텍스트를 검색 토큰 리스트로 변환 (순서 유지, 중복 제거).
+
+    Args:
+        text: 원본 텍스트
+        include_unigrams: 한글 구간의 음절 uni-gram 포함 여부 (저장 시 True, 검색 시 False)
+
+    Returns:
+        토큰 리스트
+    """
+    seen: Dict[str, None] = {}
+    for run in _TOKEN_PATTERN.findall(_normalize(text)):
+        for token in _run_tokens(run, include_unigrams):
+            seen.setdefault(token, None)
+    return list(seen)
+
+
+def build_search_terms(title: str, content_text: str, tags: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    """게시글 텍스트 인덱스 필드(search_terms) 생성.
+
+    Args:
+        title: 제목
+        content_text: extract_search_text()로 추출한 본문 텍스트
+        tags: 태그 리스트
+
+    Returns:
+        {"title": ..., "tags": ..., "body": ...} 공백으로 구분된 토큰 문자열
+    """
+    return {
+        "title": " ".join(tokenize(title)),
+        "tags": " ".join(tokenize(" ".join(tags or []))),
+        "body": " ".join(tokenize(content_text))
+    }
+
+
+def build_text_query(query: str) -> Optional[str]:
+    """사용자 검색어를 $text $search 문자열로 변환.
+
+    각 토큰을 따옴표로 감싸 모든 토큰을 포함하는 문서만 매칭(AND)합니다.
+    토큰에는 한글/영문/숫자만 남으므로 따옴표나 '-' 같은 $text 연산자가
+    사용자 입력으로 주입되지 않습니다.
+
+    Args:
+        query: 사용자 검색어
+
+    Returns:
+        $search 문자열, 검색 가능한 토큰이 없으면 None
+    """
+    tokens = tokenize(query, include_unigrams=False)[:MAX_QUERY_TOKENS]
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"' for token in tokens)
@@ -0,0 +1,119 @@
+"""Explain-plan 회귀 검사 헬퍼.
+
+aggregation 파이프라인을 explain("executionStats")로 실행하고, 컬렉션 스캔이
+있거나 반환 문서 대비 검사한 문서 수가 예산을 넘으면 실패시킵니다.
+
+Example:
+    summary = await explain_pipeline(db, "posts", pipeline)
+    assert_plan_within_budget(summary, max_docs_per_result=2)
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+
+@dataclass
+class PlanSummary:
+    """explain 결과 요약."""
+    n_returned: int
+    docs_examined: int = 0
+    keys_examined: int = 0
+    collection_scans: int = 0
+    scan_locations: List[str] = field(default_factory=list)
+
+
+def summarize_explain(explain: Dict[str, Any], n_returned: int) -> PlanSummary:
+    """explain 출력 전체를 순회하여 스캔/검사 통계를 합산.
+
+    클래식 엔진($cursor + $lookup 스테이지)과 SBE(EQ_LOOKUP) 출력을 모두 처리합니다.
+
+    Args:
+        explain: explain 명령 결과
+        n_returned: 파이프라인이 실제로 반환한 문서 수
+
+    Returns:
+        PlanSummary
+    """
+    summary = PlanSummary(n_returned=n_returned)
+
+    def walk(node: Any, path: str) -> None:
+        if isinstance(node, list):
+            for index, item in enumerate(node):
+                walk(item, f"{path}[{index}]")
+            return
+        if not isinstance(node, dict):
+            return
+
+        if node.get("stage") == "COLLSCAN":
+            summary.collection_scans += 1
+            summary.scan_locations.append(path)
+        if node.get("stage") == "EQ_LOOKUP" and node.get("strategy") == "NestedLoopJoin":
+            # 인덱스 없이 대상 컬렉션을 반복 스캔하는 조인
+            summary.collection_scans += 1
+            summary.scan_locations.append(path)
+        if isinstance(node.get("collectionScans"), int) and node["collectionScans"] > 0:
+            summary.collection_scans += node["collectionScans"]
+            summary.scan_locations.append(path)
+        if isinstance(node.get("totalDocsExamined"), int):
+            summary.docs_examined += node["totalDocsExamined"]
+        if isinstance(node.get("totalKeysExamined"), int):
+            summary.keys_examined += node["totalKeysExamined"]
+
+        for key, value in node.items():
+            # 거부된 플랜은 실행되지 않았으므로 제외
+            if key in ("rejectedPlans", "allPlansExecution"):
+                continue
+            walk(value, f"{path}.{key}" if path else key)
+
+    walk(explain, "")
+    return summary
+
+
+def assert_plan_within_budget(
+    summary: PlanSummary,
+    max_docs_per_result: float = 2.0,
+    slack: int = 0,
+    allow_collscan: bool = False
+) -> None:
+    """컬렉션 스캔 여부와 docsExamined/nReturned 예산 검사.
+
+    Args:
+        summary: summarize_explain() 결과
+        max_docs_per_result: 반환 문서 1건당 허용하는 검사 문서 수
+        slack: 고정 허용치 (skip 등 파이프라인 특성상 추가로 읽는 문서 수)
+        allow_collscan: 작은 컬렉션 등에서 COLLSCAN을 허용할지 여부
+
+    Raises:
+        AssertionError: 예산을 초과한 경우
+    """
+    if not allow_collscan and summary.collection_scans:
+        raise AssertionError(
+            f"Pipeline performed {summary.collection_scans} collection scan(s) at: "
+            f"{', '.join(summary.scan_locations)}"
+        )
+
+    budget = max(summary.n_returned, 1) * max_docs_per_result + slack
+    if summary.docs_examined > budget:
+        raise AssertionError(
+            f"docsExamined={summary.docs_examined} exceeds budget {budget:g} "
+            f"(nReturned={summary.n_returned}, max_docs_per_result={max_docs_per_result}, slack={slack})"
+        )
+
+
+async def explain_pipeline(db, collection_name: str, pipeline: List[Dict[str, Any]]) -> PlanSummary:
+    """파이프라인을 실행하고 executionStats explain 결과를 요약.
+
+    Args:
+        db: Motor 데이터베이스
+        collection_name: aggregate 대상 컬렉션
+        pipeline: aggregation 파이프라인
+
+    Returns:
+        PlanSummary
+    """
+    results = await db[collection_name].aggregate(pipeline).to_list(length=None)
+    explain = await db.command({
+        "explain": {"aggregate": collection_name, "pipeline": pipeline, "cursor": {}},
+        "verbosity": "executionStats"
+    })
+    return summarize_explain(explain, n_returned=len(results))
@@ -0,0 +1,145 @@
+"""Upstash REST API 로컬 대역 서버
+
+Upstash REST 프로토콜(단일 명령 POST /, /pipeline, /multi-exec)을 메모리 저장소로 흉내 내는
+aiohttp 앱입니다. 네트워크 지연(latency)을 주입할 수 있어 테스트와 배치 벤치마크에 사용합니다.
+
+사용 예:
+    stub = UpstashStub(token="test-token", latency=0.01)
+    async with TestServer(stub.app) as server:
+        manager.rest_url = str(server.make_url("/"))
+"""
+
+import asyncio
+import fnmatch
+import time
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+
+class UpstashStub:
+    """메모리 기반 Upstash REST 대역"""
+
+    def __init__(self, token: str = "test-token", latency: float = 0.0):
+        self.token = token
+        self.latency = latency
+        self.store: Dict[str, Any] = {}
+        self.expires: Dict[str, float] = {}
+        self.published: List[List[str]] = []
+        self.requests: List[Dict[str, Any]] = []
+        self.fail_with: Optional[int] = None
+
+        self.app = web.Application()
+        self.app.router.add_post("/", self._single)
+        self.app.router.add_post("/pipeline", self._pipeline)
+        self.app.router.add_post("/multi-exec", self._pipeline)
+
+    # === 요청 처리 ===
+
+    async def _prepare(self, request: web.Request) -> Optional[web.Response]:
+        if request.headers.get("Authorization") != f"Bearer {self.token}":
+            return web.json_response({"error": "Unauthorized"}, status=401)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.fail_with:
+            return web.json_response({"error": "stub failure"}, status=self.fail_with)
+        return None
+
+    async def _single(self, request: web.Request) -> web.Response:
+        error = await self._prepare(request)
+        if error is not None:
+            return error
+        command = await request.json()
+        self.requests.append({"path": "/", "commands": [command]})
+        result = self.execute(command)
+        return web.json_response(result, status=400 if "error" in result else 200)
+
+    async def _pipeline(self, request: web.Request) -> web.Response:
+        error = await self._prepare(request)
+        if error is not None:
+            return error
+        commands = await request.json()
+        self.requests.append({"path": request.path, "commands": commands})
+        return web.json_response([self.execute(command) for command in commands])
+
+    # === 명령 실행 ===
+
+    def _alive(self, key: str) -> bool:
+        expires_at = self.expires.get(key)
+        if expires_at is not None and expires_at <= time.monotonic():
+            self.store.pop(key, None)
+            self.expires.pop(key, None)
+        return key in self.store
+
+    def execute(self, command: List[Any]) -> Dict[str, Any]:
+        name, args = str(command[0]).upper(), [str(arg) for arg in command[1:]]
+        handler = getattr(self, f"_cmd_{name.lower().replace('-', '_')}", None)
+        if handler is None:
+            return {"error": f"ERR unknown command '{name}'"}
+        try:
+            return {"result": handler(*args)}
+        except (TypeError, ValueError) as e:
+            return {"error": f"ERR {e}"}
+
+    def _cmd_ping(self):
+        return "PONG"
+
+    def _cmd_get(self, key):
+        return self.store.get(key) if self._alive(key) else None
+
+    def _cmd_set(self, key, value, *options):
+        self.store[key] = value
+        self.expires.pop(key, None)
+        options = [option.upper() for option in options]
+        if "EX" in options:
+            self.expires[key] = time.monotonic() + int(options[options.index("EX") + 1])
+        return "OK"
+
+    def _cmd_setex(self, key, ttl, value):
+        return self._cmd_set(key, value, "EX", ttl)
+
+    def _cmd_mget(self, *keys):
+        return [self._cmd_get(key) for key in keys]
+
+    def _cmd_del(self, *keys):
+        deleted = 0
+        for key in keys:
+            if self._alive(key):
+                del self.store[key]
+                self.expires.pop(key, None)
+                deleted += 1
+        return deleted
+
+    def _cmd_exists(self, *keys):
+        return sum(1 for key in keys if self._alive(key))
+
+    def _cmd_incr(self, key):
+        return self._cmd_incrby(key, "1")
+
+    def _cmd_incrby(self, key, amount):
+        value = int(self._cmd_get(key) or 0) + int(amount)
+        self.store[key] = str(value)
+        return value
+
+    def _cmd_expire(self, key, ttl):
+        if not self._alive(key):
+            return 0
+        self.expires[key] = time.monotonic() + int(ttl)
+        return 1
+
+    def _cmd_ttl(self, key):
+        if not self._alive(key):
+            return -2
+        if key not in self.expires:
+            return -1
+        return int(self.expires[key] - time.monotonic())
+
+    def _cmd_keys(self, pattern):
+        return [key for key in list(self.store) if self._alive(key) and fnmatch.fnmatchcase(key, pattern)]
+
+    def _cmd_publish(self, channel, message):
+        self.published.append([channel, message])
+        return 0
+
+    def _cmd_info(self):
+        return "# Server\r\nredis_version:7.0.0-stub\r\nuptime_in_seconds:1\r\n"
@@ -8,7 +8,15 @@ from unittest.mock import Mock, patch, AsyncMock
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 import asyncio
-import json
+
+
+def _mock_redis():
+    """파이프라인을 지원하는 Redis 모킹 (파이프라인 명령은 동기 큐잉, execute만 비동기)"""
+    mock_redis = AsyncMock()
+    pipe = Mock()
+    pipe.execute = AsyncMock(return_value=[])
+    mock_redis.pipeline = Mock(return_value=pipe)
+    return mock_redis, pipe
 
 
 class TestMonitoringMetricsIntegration:
@@ -76,7 +84,7 @@ class TestMonitoringMetricsIntegration:
         from nadle_backend.middleware.monitoring import PerformanceTracker
         
         # Given: 모킹된 Redis
-        mock_redis = AsyncMock()
+        mock_redis, pipe = _mock_redis()
         tracker = PerformanceTracker(redis_client=mock_redis)
         
         # When: 동시에 여러 요청 추적
@@ -96,23 +104,26 @@ class TestMonitoringMetricsIntegration:
         )
         
         # Then: 모든 요청이 추적됨
-        assert mock_redis.hincrby.call_count >= 3
-        assert mock_redis.lpush.call_count >= 3
+        assert await tracker.flush() == 3
+        pipe.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_metrics_aggregation_over_time(self):
         """시간별 메트릭 집계 테스트"""
         from nadle_backend.middleware.monitoring import PerformanceTracker
         
-        # Given: 시간별 데이터가 있는 Redis (현재 시간 기준으로 설정)
-        import time
-        current_time = time.time()
-        mock_redis = AsyncMock()
-        mock_redis.lrange.return_value = [
-            json.dumps({"response_time": 0.1, "timestamp": current_time - 600, "endpoint": "GET:/api/posts"}),
-            json.dumps({"response_time": 0.15, "timestamp": current_time - 300, "endpoint": "GET:/api/posts"}),
-            json.dumps({"response_time": 0.08, "timestamp": current_time - 100, "endpoint": "GET:/api/posts"}),
-        ]
+        from nadle_backend.monitoring.latency_histogram import LatencyHistogram
+        
+        # Given: 세 구간(10분 전, 5분 전, 1분 전)에 응답시간 히스토그램이 있는 Redis
+        def window(value):
+            histogram = LatencyHistogram()
+            histogram.add(value)
+            return {**histogram.to_fields(), "sum": str(histogram.sum)}
+        
+        windows = [{} for _ in range(60)]
+        windows[49], windows[54], windows[58] = window(0.1), window(0.15), window(0.08)
+        mock_redis, pipe = _mock_redis()
+        pipe.execute.return_value = windows
         
         tracker = PerformanceTracker(redis_client=mock_redis)
         
@@ -130,7 +141,7 @@ class TestMonitoringMetricsIntegration:
         from nadle_backend.middleware.monitoring import PerformanceTracker
         
         # Given: 알림 임계값 설정
-        mock_redis = AsyncMock()
+        mock_redis, pipe = _mock_redis()
         tracker = PerformanceTracker(
             redis_client=mock_redis,
             slow_request_threshold=0.05,  # 50ms
@@ -150,7 +161,8 @@ class TestMonitoringMetricsIntegration:
         assert alert_triggered == True
         
         # 알림 데이터가 저장되었는지 확인
-        alert_calls = [call for call in mock_redis.lpush.call_args_list 
+        await tracker.flush()
+        alert_calls = [call for call in pipe.lpush.call_args_list 
                       if "alerts" in str(call)]
         assert len(alert_calls) > 0
 
@@ -160,7 +172,7 @@ class TestMonitoringMetricsIntegration:
         from nadle_backend.middleware.monitoring import PerformanceTracker
         
         # Given: 데이터 보존 정책이 있는 추적기
-        mock_redis = AsyncMock()
+        mock_redis, pipe = _mock_redis()
         tracker = PerformanceTracker(
             redis_client=mock_redis,
             max_data_points=100,
@@ -176,9 +188,12 @@ class TestMonitoringMetricsIntegration:
             tracking_data = await tracker.start_tracking(mock_request)
             await tracker.end_tracking(tracking_data, 200)
         
-        # Then: 데이터 정리 메서드 호출됨
-        ltrim_calls = [call for call in mock_redis.ltrim.call_args_list]
-        assert len(ltrim_calls) > 0  # 데이터 제한 적용됨
+        # Then: 버킷 수가 제한된 히스토그램 하나와 보존 기간 만료가 기록됨
+        assert all(len(histogram.buckets) <= 100 for histogram in tracker._latencies.values())
+        await tracker.flush()
+        expire_calls = [call[0] for call in pipe.expire.call_args_list]
+        assert len(expire_calls) == 1
+        assert expire_calls[0][1] == 24 * 3600
 
     @pytest.mark.asyncio
     async def test_health_check_metrics(self):
@@ -9,6 +9,7 @@ import time
 from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
 import redis.asyncio as redis
+from unittest.mock import patch
 from nadle_backend.middleware.monitoring import PerformanceTracker, MonitoringMiddleware
 
 
@@ -62,8 +63,9 @@ class TestMonitoringRedisIntegration:
         await asyncio.sleep(0.1)  # 100ms 시뮬레이션
         is_slow = await tracker.end_tracking(tracking_data, 200)
         
-        # Then: Redis에 실제로 데이터가 저장됨
+        # Then: flush 후 Redis에 실제로 데이터가 저장됨
         assert is_slow == True  # 100ms > 50ms 임계값이므로 느린 요청으로 감지
+        assert await tracker.flush() == 1
         
         # 엔드포인트 통계 확인
         endpoint_stats = await redis_client.hgetall("api:metrics:endpoints")
@@ -143,6 +145,7 @@ class TestMonitoringRedisIntegration:
         assert is_slow == True
         
         # 느린 요청 목록에 저장되었는지 확인
+        await tracker.flush()
         slow_requests = await redis_client.lrange("api:alerts:slow_requests", 0, -1)
         assert len(slow_requests) > 0
 
@@ -152,17 +155,12 @@ class TestMonitoringRedisIntegration:
         # Given: 시간별 데이터
         tracker = PerformanceTracker(redis_client=redis_client)
         
+        # 10분 전, 5분 전, 100초 전 구간에 응답시간 기록
         current_time = time.time()
-        timing_data = [
-            {"response_time": 0.1, "timestamp": current_time - 600, "status_code": 200},
-            {"response_time": 0.15, "timestamp": current_time - 300, "status_code": 200},
-            {"response_time": 0.08, "timestamp": current_time - 100, "status_code": 200},
-        ]
-        
-        # Redis에 타이밍 데이터 저장
-        import json
-        for data in timing_data:
-            await redis_client.lpush("api:timing:GET:/api/posts", json.dumps(data))
+        for offset, response_time in [(600, 0.1), (300, 0.15), (100, 0.08)]:
+            with patch("nadle_backend.middleware.monitoring.time.time", return_value=current_time - offset):
+                tracker.record("GET", "/api/posts", 200, response_time)
+        await tracker.flush()
         
         # When: 시간별 메트릭 조회
         time_series = await tracker.get_time_series_metrics("GET:/api/posts", minutes=60)
@@ -245,9 +243,13 @@ class TestMonitoringRedisIntegration:
             tracking_data = await tracker.start_tracking(request)
             await tracker.end_tracking(tracking_data, 200)
         
-        # Then: 최대 3개까지만 저장됨
-        timing_data = await redis_client.lrange("api:timing:GET:/api/posts", 0, -1)
-        assert len(timing_data) <= 3
+        # Then: 요청 수와 관계없이 버킷 수가 제한된 히스토그램으로 저장되고 만료가 설정됨
+        await tracker.flush()
+        keys = await redis_client.keys("api:latency:GET:/api/posts:*")
+        assert len(keys) >= 1
+        stats = await tracker.get_realtime_stats("GET:/api/posts")
+        assert stats["request_count"] == 5
+        assert 0 < await redis_client.ttl(keys[0]) <= 3600
 
     def test_redis_connection_failure_handling(self):
         """Redis 연결 실패 처리 테스트"""
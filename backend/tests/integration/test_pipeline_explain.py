@@ -0,0 +1,180 @@
+"""게시글 조회 aggregation explain-plan 회귀 테스트.
+
+## 🎯 테스트 목표
+실제 코드가 생성하는 파이프라인을 로컬 mongod에서 explain("executionStats")로 실행하여
+COLLSCAN이 없고 docsExamined/nReturned가 예산 이내인지 검증
+
+## 📋 테스트 범위
+- PostRepository.list_posts_optimized / list_posts_cursor
+- PostsService.get_post_with_author_aggregated / get_post_with_everything_aggregated
+
+## ⚙️ 실행 조건
+EXPLAIN_MONGODB_URL (기본값 mongodb://localhost:27017)의 mongod가 필요하며,
+연결할 수 없으면 건너뜁니다. 인덱스는 IndexManager 정의로 생성합니다.
+"""
+
+import os
+import uuid
+from types import SimpleNamespace
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+from nadle_backend.config import settings
+from nadle_backend.database.manager import IndexManager
+from nadle_backend.models.core import Post
+from nadle_backend.repositories.post_repository import PostRepository
+from nadle_backend.services.posts_service import PostsService
+from nadle_backend.utils.cursor import encode_cursor
+from tests.helpers.explain_plan import explain_pipeline, assert_plan_within_budget
+
+pytestmark = pytest.mark.integration
+
+POST_COUNT = 300
+COMMENTS_PER_POST = 5
+
+
+@pytest.fixture
+async def explain_db():
+    """인덱스와 시드 데이터가 준비된 임시 데이터베이스 (db, posts, users)."""
+    url = os.getenv("EXPLAIN_MONGODB_URL", "mongodb://localhost:27017")
+    client = AsyncIOMotorClient(url, serverSelectionTimeoutMS=1000)
+    try:
+        await client.admin.command("ping")
+    except Exception:
+        client.close()
+        pytest.skip(f"local mongod not available at {url}")
+
+    db = client[f"explain_{uuid.uuid4().hex[:8]}"]
+    await IndexManager.create_all_indexes(db)
+
+    users = [
+        {"_id": ObjectId(), "email": f"user{i}@example.com", "user_handle": f"user{i}",
+         "name": f"User {i}", "password_hash": "x", "created_at": datetime.utcnow()}
+        for i in range(20)
+    ]
+    await db[settings.users_collection].insert_many(users)
+
+    now = datetime.utcnow()
+    types = ["property_information", "expert_tips", "board", None]
+    posts = []
+    for i in range(POST_COUNT):
+        post_id = ObjectId()
+        post = {
+            "_id": post_id,
+            "title": f"게시글 {i}",
+            "content": "본문 " * 200,
+            "content_rendered": "<p>본문</p>" * 200,
+            "slug": f"{post_id}-post-{i}",
+            "service": "residential_community",
+            "author_id": str(users[i % len(users)]["_id"]),
+            "status": "published",
+            "created_at": now - timedelta(minutes=i),
+            "updated_at": now - timedelta(minutes=i),
+            "view_count": i % 50,
+            "like_count": i % 7,
+            "dislike_count": 0,
+            "comment_count": COMMENTS_PER_POST,
+            "bookmark_count": 0,
+        }
+        if types[i % len(types)]:
+            post["metadata"] = {"type": types[i % len(types)]}
+        posts.append(post)
+    await db[settings.posts_collection].insert_many(posts)
+
+    comments = [
+        {"parent_type": "post", "parent_id": str(post["_id"]), "content": f"댓글 {j}",
+         "author_id": str(users[j % len(users)]["_id"]), "status": "active",
+         "created_at": now + timedelta(seconds=j), "updated_at": now}
+        for post in posts for j in range(COMMENTS_PER_POST)
+    ]
+    await db[settings.comments_collection].insert_many(comments)
+    await db[settings.user_reactions_collection].insert_one({
+        "user_id": str(users[0]["_id"]), "target_type": "post",
+        "target_id": str(posts[0]["_id"]), "liked": True
+    })
+
+    yield SimpleNamespace(db=db, posts=posts, users=users)
+
+    await client.drop_database(db.name)
+    client.close()
+
+
+async def _capture_pipeline(call):
+    """Post.aggregate를 가로채 실제 코드가 생성한 파이프라인을 반환."""
+    with patch.object(Post, "aggregate") as mock_aggregate, \
+         patch.object(Post, "get_motor_collection", create=True) as mock_collection:
+        mock_aggregate.return_value.to_list = AsyncMock(return_value=[])
+        mock_collection.return_value.count_documents = AsyncMock(return_value=0)
+        await call()
+        return mock_aggregate.call_args[0][0]
+
+
+class TestPostReadPathExplain:
+    """게시글 조회 파이프라인 explain 예산 테스트."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("metadata_type", ["expert_tips", "board", None])
+    @pytest.mark.parametrize("sort_by", ["created_at", "view_count"])
+    async def test_list_posts_optimized_plan(self, explain_db, metadata_type, sort_by):
+        """목록 조회는 페이지 문서 + 작성자 문서만 검사해야 함."""
+        if metadata_type is None and sort_by != "created_at":
+            pytest.skip("untyped listing is only indexed for created_at")
+
+        repo = PostRepository()
+        pipeline = await _capture_pipeline(
+            lambda: repo.list_posts_optimized(page=3, page_size=10, metadata_type=metadata_type, sort_by=sort_by)
+        )
+
+        summary = await explain_pipeline(explain_db.db, settings.posts_collection, pipeline)
+
+        assert summary.n_returned == 10
+        # 페이지 문서 1건 + 작성자 1건, skip한 20건은 고정 허용치
+        assert_plan_within_budget(summary, max_docs_per_result=2, slack=20)
+
+    @pytest.mark.asyncio
+    async def test_list_posts_cursor_plan(self, explain_db):
+        """커서 페이지는 페이지 깊이와 무관하게 page_size+1건만 검사해야 함."""
+        repo = PostRepository()
+        anchor = [p for p in explain_db.posts if p.get("metadata", {}).get("type") == "expert_tips"][30]
+        after = encode_cursor("created_at", anchor["created_at"], anchor["_id"])
+
+        pipeline = await _capture_pipeline(
+            lambda: repo.list_posts_cursor(page_size=10, metadata_type="expert_tips", after=after)
+        )
+
+        summary = await explain_pipeline(explain_db.db, settings.posts_collection, pipeline)
+
+        assert summary.n_returned == 11
+        assert_plan_within_budget(summary, max_docs_per_result=2)
+
+    @pytest.mark.asyncio
+    async def test_post_with_author_plan(self, explain_db):
+        """상세 조회는 게시글 1건 + 작성자 1건만 검사해야 함."""
+        service = PostsService()
+        slug = explain_db.posts[10]["slug"]
+
+        pipeline = await _capture_pipeline(lambda: service.get_post_with_author_aggregated(slug))
+
+        summary = await explain_pipeline(explain_db.db, settings.posts_collection, pipeline)
+
+        assert summary.n_returned == 1
+        assert_plan_within_budget(summary, max_docs_per_result=2)
+
+    @pytest.mark.asyncio
+    async def test_post_with_everything_plan(self, explain_db):
+        """통합 조회는 게시글/작성자/댓글/댓글 작성자/반응만 인덱스로 검사해야 함."""
+        service = PostsService()
+        post = explain_db.posts[0]
+        user_id = str(explain_db.users[0]["_id"])
+
+        pipeline = await _capture_pipeline(
+            lambda: service.get_post_with_everything_aggregated(post["slug"], user_id)
+        )
+
+        summary = await explain_pipeline(explain_db.db, settings.posts_collection, pipeline)
+
+        assert summary.n_returned == 1
+        # 게시글 + 작성자 + 반응 1건씩, 댓글과 댓글 작성자는 댓글 수만큼
+        assert_plan_within_budget(summary, max_docs_per_result=3, slack=COMMENTS_PER_POST * 2)
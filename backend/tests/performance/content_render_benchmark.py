@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+콘텐츠 렌더링 파이프라인 벤치마크
+게시글 미리보기/저장 시 process_content의 문서 크기별 처리 시간 측정
+
+비교 대상:
+1. legacy: bleach.clean → BeautifulSoup 이미지 검증 → BeautifulSoup 텍스트 추출 →
+   원본 BeautifulSoup 메타데이터 (기존 방식, 세 번 파싱)
+2. single-pass: 새니타이저 토큰 필터에서 이미지 검증/텍스트 수집 (캐시 미스)
+3. cached: 같은 콘텐츠 재요청 (캐시 적중)
+
+출력:
+- 문서 크기(1KB/50KB/500KB)별 평균 처리 시간(ms)
+
+실행:
+    python tests/performance/content_render_benchmark.py --repeat 5
+"""
+
+import argparse
+import re
+import time
+
+import bleach
+from bs4 import BeautifulSoup
+
+from nadle_backend.services import content_service as content_module
+from nadle_backend.services.content_service import ContentService
+
+SIZES = {"1KB": 1_000, "50KB": 50_000, "500KB": 500_000}
+
+PARAGRAPH = (
+    "## 섹션 제목\n\n"
+    "아파트 단지 **공지사항**입니다. Please read the *updated* rules carefully.\n\n"
+    "- 주차 안내\n- 분리수거 요일\n- [관리사무소](https://example.com)\n\n"
+    "![사진](/api/files/0123456789abcdef01234567) ![외부](https://evil.example.com/x.png)\n\n"
+    "```python\nprint('hello')\n```\n\n"
+    "| 항목 | 내용 |\n|---|---|\n| 시간 | 09:00 |\n\n"
+)
+
+
+def _document(size: int) -> str:
+    return (PARAGRAPH * (size // len(PARAGRAPH) + 1))[:size]
+
+
+def _legacy_process(service: ContentService, content: str) -> None:
+    rendered_html = service.render_markdown(content)
+    cleaned = bleach.clean(rendered_html, tags=service.ALLOWED_TAGS,
+                           attributes=service.ALLOWED_ATTRIBUTES, strip=True)
+    soup = BeautifulSoup(cleaned, "html.parser")
+    for img in soup.find_all("img"):
+        src = img.get("src", "")
+        if src and not re.match(service.ALLOWED_IMAGE_PATTERN, src):
+            img.decompose()
+    safe_html = str(soup)
+    BeautifulSoup(safe_html, "html.parser").get_text(strip=True)
+    service._count_words(BeautifulSoup(content, "html.parser").get_text(strip=True))
+    service._extract_inline_images(content)
+
+
+def _measure(func, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="콘텐츠 렌더링 파이프라인 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="크기별 반복 횟수")
+    args = parser.parse_args()
+
+    service = ContentService()
+    print(f"{'size':>6} | {'legacy':>10} | {'single-pass':>11} | {'cached':>8} | speedup")
+    for label, size in SIZES.items():
+        content = _document(size)
+
+        legacy_ms = _measure(lambda: _legacy_process(service, content), args.repeat)
+
+        def cold():
+            content_module._render_cache.clear()
+            service.process_content(content, "markdown")
+
+        cold_ms = _measure(cold, args.repeat)
+        service.process_content(content, "markdown")
+        cached_ms = _measure(lambda: service.process_content(content, "markdown"), args.repeat)
+
+        print(f"{label:>6} | {legacy_ms:>8.2f}ms | {cold_ms:>9.2f}ms | {cached_ms:>6.3f}ms | "
+              f"{legacy_ms / cold_ms:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
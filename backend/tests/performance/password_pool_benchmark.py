@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+비밀번호 워커 풀 벤치마크
+로그인(bcrypt 검증)이 동시에 몰리는 동안 무관한 엔드포인트의 지연을 측정
+
+비교 대상:
+1. inline: 이벤트 루프에서 PasswordManager.verify_password 직접 실행 (기존 방식)
+2. pool: PasswordWorkerPool 프로세스 풀에서 실행 (포화 시 503)
+
+출력:
+- 로그인 처리량 (성공/초)과 503 거절 수
+- 로그인 부하 중 /ping p50/p99
+
+실행:
+    python tests/performance/password_pool_benchmark.py --logins 40 --rounds 12 --workers 2
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from fastapi import FastAPI, HTTPException
+
+from nadle_backend.exceptions.auth import PasswordServiceBusyError
+from nadle_backend.utils.password import PasswordManager
+from nadle_backend.utils.password_pool import PasswordWorkerPool
+
+PASSWORD = "Benchmark123!"
+
+
+def _build_app(mode: str, manager: PasswordManager, pool: PasswordWorkerPool, hashed: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/login")
+    async def login():
+        try:
+            if mode == "inline":
+                valid = manager.verify_password(PASSWORD, hashed)
+            else:
+                valid = await pool.verify_password(PASSWORD, hashed, manager.bcrypt_rounds)
+        except PasswordServiceBusyError as e:
+            raise HTTPException(status_code=503, detail=str(e))
+        return {"valid": valid}
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+async def _run_mode(mode: str, logins: int, pings: int, manager: PasswordManager, pool: PasswordWorkerPool, hashed: str) -> None:
+    app = _build_app(mode, manager, pool, hashed)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        ping_times = []
+
+        async def ping_loop():
+            for _ in range(pings):
+                start = time.perf_counter()
+                await client.get("/ping")
+                ping_times.append((time.perf_counter() - start) * 1000)
+                await asyncio.sleep(0.01)
+
+        start = time.perf_counter()
+        login_results, _ = await asyncio.gather(
+            asyncio.gather(*(client.post("/login") for _ in range(logins))),
+            ping_loop()
+        )
+        elapsed = time.perf_counter() - start
+
+    ok = sum(1 for response in login_results if response.status_code == 200)
+    rejected = sum(1 for response in login_results if response.status_code == 503)
+    ping_times.sort()
+    p99 = ping_times[min(len(ping_times) - 1, int(len(ping_times) * 0.99))]
+    print(
+        f"{mode:<7} logins ok {ok:4d} rejected {rejected:4d}  "
+        f"throughput {ok / elapsed:6.1f}/s  "
+        f"/ping p50 {statistics.median(ping_times):8.1f}ms  p99 {p99:8.1f}ms"
+    )
+
+
+async def run(logins: int, pings: int, rounds: int, workers: int, max_pending: int) -> None:
+    manager = PasswordManager(bcrypt_rounds=rounds)
+    hashed = manager.hash_password(PASSWORD)
+    pool = PasswordWorkerPool(max_workers=workers, max_pending=max_pending, timeout=30)
+    # 워커 프로세스 기동 비용은 측정에서 제외
+    await asyncio.gather(*(pool.verify_password(PASSWORD, hashed, rounds) for _ in range(workers)))
+
+    print(f"\n{logins} concurrent logins, bcrypt rounds {rounds}, {workers} workers, max pending {max_pending}")
+    try:
+        await _run_mode("inline", logins, pings, manager, pool, hashed)
+        await _run_mode("pool", logins, pings, manager, pool, hashed)
+    finally:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Password worker pool benchmark")
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--pings", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-pending", type=int, default=32)
+    args = parser.parse_args()
+    asyncio.run(run(args.logins, args.pings, args.rounds, args.workers, args.max_pending))
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+게시글 검색 성능 비교 벤치마크
+로컬 mongod에 합성 게시글을 적재한 뒤 두 검색 경로를 비교
+
+비교 대상:
+1. 정규식 검색: PostRepository._search_posts_regex (title/content/tags 비고정 $regex + count)
+2. 텍스트 인덱스 검색: PostRepository.search_posts (search_terms $text + textScore 정렬)
+
+실행:
+    python tests/performance/search_benchmark.py --posts 100000 --iterations 20
+    (BENCHMARK_MONGODB_URL 기본값: mongodb://localhost:27017)
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from beanie import init_beanie
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from nadle_backend.config import settings
+from nadle_backend.database.backfill import ensure_post_search_index
+from nadle_backend.database.manager import IndexManager
+from nadle_backend.models.core import Post
+from nadle_backend.repositories.post_repository import PostRepository
+from nadle_backend.utils.search_text import extract_search_text, build_search_terms
+
+
+WORDS = [
+    "서울", "부산", "아파트", "입주", "이사", "포장이사", "청소", "인테리어", "관리비", "주차",
+    "분리수거", "엘리베이터", "공사", "소음", "택배", "헬스장", "커뮤니티", "놀이터", "학교", "학원",
+    "전세", "월세", "매매", "대출", "보증금", "계약", "하자", "보수", "에어컨", "보일러",
+    "fastapi", "python", "review", "tip", "guide"
+]
+PARTICLES = ["", "에서", "으로", "은", "는", "이", "가", "을", "를", "도"]
+QUERIES = ["포장이사", "관리비", "서울 아파트", "하자 보수", "에어컨 청소", "fastapi", "놀이터", "전세 대출"]
+
+
+def _sentence(rng: random.Random, length: int) -> str:
+    return " ".join(rng.choice(WORDS) + rng.choice(PARTICLES) for _ in range(length))
+
+
+def _make_posts(count: int, seed: int = 42) -> List[Dict]:
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    posts = []
+    for i in range(count):
+        title = _sentence(rng, 4)
+        content = "<p>" + "</p><p>".join(_sentence(rng, 20) for _ in range(rng.randint(2, 8))) + "</p>"
+        tags = rng.sample(WORDS, 2)
+        content_text = extract_search_text(content)
+        posts.append({
+            "title": title,
+            "content": content,
+            "content_text": content_text,
+            "search_terms": build_search_terms(title, content_text, tags),
+            "slug": f"bench-{i}-{uuid.uuid4().hex[:6]}",
+            "service": "residential_community",
+            "author_id": "000000000000000000000001",
+            "status": "published",
+            "metadata": {"type": "board", "tags": tags},
+            "created_at": now - timedelta(minutes=i),
+            "updated_at": now - timedelta(minutes=i),
+            "view_count": rng.randint(0, 1000),
+            "like_count": 0,
+            "dislike_count": 0,
+            "comment_count": 0,
+            "bookmark_count": 0,
+        })
+    return posts
+
+
+async def _time_call(coro_factory, iterations: int) -> Dict[str, float]:
+    times = []
+    totals = set()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        _, total = await coro_factory()
+        times.append((time.perf_counter() - start) * 1000)
+        totals.add(total)
+    times.sort()
+    return {
+        "p50": statistics.median(times),
+        "p95": times[max(0, int(len(times) * 0.95) - 1)],
+        "total": max(totals),
+    }
+
+
+async def run(post_count: int, iterations: int, keep: bool) -> None:
+    url = os.getenv("BENCHMARK_MONGODB_URL", "mongodb://localhost:27017")
+    client = AsyncIOMotorClient(url)
+    db = client[f"search_bench_{post_count}"]
+    collection = db[settings.posts_collection]
+
+    if await collection.estimated_document_count() != post_count:
+        print(f"📦 {post_count}개 게시글 적재 중...")
+        await collection.drop()
+        batch = 5000
+        for offset in range(0, post_count, batch):
+            await collection.insert_many(_make_posts(min(batch, post_count - offset), seed=offset))
+        await collection.create_indexes(IndexManager.get_post_indexes())
+    await ensure_post_search_index(db)
+
+    await init_beanie(database=db, document_models=[Post])
+    repo = PostRepository()
+    base_filter = repo._build_search_filter(None, "board")
+
+    print(f"\n{'query':<14} {'regex p50':>10} {'regex p95':>10} {'text p50':>10} {'text p95':>10} {'regex hits':>11} {'text hits':>10}")
+    for query in QUERIES:
+        regex = await _time_call(
+            lambda: repo._search_posts_regex(query, base_filter, "created_at", 1, 20), iterations
+        )
+        text = await _time_call(
+            lambda: repo.search_posts(query, metadata_type="board", page=1, page_size=20), iterations
+        )
+        print(
+            f"{query:<14} {regex['p50']:>8.1f}ms {regex['p95']:>8.1f}ms "
+            f"{text['p50']:>8.1f}ms {text['p95']:>8.1f}ms {regex['total']:>11} {text['total']:>10}"
+        )
+
+    if not keep:
+        await client.drop_database(db.name)
+    client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Regex vs text-index post search benchmark")
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded database for reruns")
+    args = parser.parse_args()
+    asyncio.run(run(args.posts, args.iterations, args.keep))
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Upstash REST 배치 성능 비교 벤치마크
+로컬 Upstash 대역 서버(tests/helpers/upstash_stub.py)에 네트워크 지연을 주입하고
+작성자 30명 조회 같은 다중 키 읽기를 세 가지 방식으로 비교
+
+비교 대상:
+1. 순차 요청: 키마다 HTTP 요청 (기존 방식)
+2. 자동 배치: asyncio.gather로 동시에 발생한 명령을 /pipeline 하나로 합침
+3. 일괄 조회: UpstashRedisManager.mget() (MGET 한 번)
+
+실행:
+    python tests/performance/upstash_batch_benchmark.py --keys 30 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from aiohttp.test_utils import TestServer
+
+from nadle_backend.database.upstash_redis import UpstashRedisManager
+from tests.helpers.upstash_stub import UpstashStub
+
+
+async def _measure(label: str, stub: UpstashStub, runs: int, func) -> None:
+    times = []
+    stub.requests.clear()
+    for _ in range(runs):
+        start = time.perf_counter()
+        await func()
+        times.append((time.perf_counter() - start) * 1000)
+    print(
+        f"{label:<18} p50 {statistics.median(times):8.1f}ms  "
+        f"max {max(times):8.1f}ms  HTTP requests/run {len(stub.requests) / runs:5.1f}"
+    )
+
+
+async def run(key_count: int, latency: float, runs: int) -> None:
+    stub = UpstashStub(token="bench-token", latency=latency)
+    keys = [f"author_info:{i}" for i in range(key_count)]
+    stub.store.update({key: '{"display_name": "user"}' for key in keys})
+
+    async with TestServer(stub.app) as server:
+        manager = UpstashRedisManager()
+        manager.rest_url = str(server.make_url("/"))
+        manager.rest_token = "bench-token"
+        await manager.connect()
+
+        async def sequential():
+            manager.auto_batch = False
+            for key in keys:
+                await manager.get(key)
+
+        async def auto_batched():
+            manager.auto_batch = True
+            await asyncio.gather(*(manager.get(key) for key in keys))
+
+        async def bulk_get():
+            await manager.mget(keys)
+
+        print(f"\n{key_count} keys, {latency * 1000:.0f}ms simulated latency, {runs} runs")
+        await _measure("sequential", stub, runs, sequential)
+        await _measure("auto-batch", stub, runs, auto_batched)
+        await _measure("mget", stub, runs, bulk_get)
+
+        await manager.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Upstash REST batching benchmark")
+    parser.add_argument("--keys", type=int, default=30)
+    parser.add_argument("--latency", type=float, default=0.02, help="Simulated round-trip latency in seconds")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run(args.keys, args.latency, args.runs))
@@ -0,0 +1,172 @@
+"""인증 주체(principal) 캐시 테스트.
+
+## 🎯 테스트 목표
+인증된 요청이 매번 MongoDB에서 사용자를 읽지 않고 캐시된 권한 필드로 처리되며,
+프로필/상태/비밀번호 변경 시 캐시가 즉시 무효화되는지 검증
+
+## 📋 테스트 범위
+- get_current_user / get_optional_current_user 캐시 적중 시 DB 미조회
+- 캐시 미스 시 DB 조회 후 권한 필드만 저장 (비밀번호 해시 제외)
+- 캐시된 상태값으로 비활성/정지 사용자 차단
+- suspend/deactivate/change_password/update_profile 시 무효화
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from beanie import PydanticObjectId
+from fastapi import HTTPException
+from nadle_backend.dependencies.auth import (
+    get_current_active_user,
+    get_current_user,
+    get_optional_current_user,
+)
+from nadle_backend.services.cache_service import CacheService, PRINCIPAL_FIELDS
+
+USER_ID = "507f1f77bcf86cd799439011"
+DEPS = "nadle_backend.dependencies.auth"
+
+
+def _principal(**overrides):
+    principal = {
+        "id": USER_ID, "email": "test@example.com", "user_handle": "tester",
+        "display_name": "Tester", "name": "Test", "status": "active", "is_admin": False
+    }
+    principal.update(overrides)
+    return principal
+
+
+def _jwt_manager():
+    manager = MagicMock()
+    manager.verify_token.return_value = {"sub": USER_ID}
+    return manager
+
+
+def _cache_service(principal=None):
+    cache_service = MagicMock()
+    cache_service.get_principal = AsyncMock(return_value=principal)
+    cache_service.set_principal = AsyncMock(return_value=True)
+    return cache_service
+
+
+class TestPrincipalLookup:
+    """인증 의존성 캐시 조회 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_database(self):
+        """캐시 적중 시 저장소를 호출하지 않고 권한 필드를 가진 User를 반환해야 함."""
+        repo = MagicMock()
+        repo.get_by_id = AsyncMock()
+        cache_service = _cache_service(_principal(is_admin=True))
+
+        with patch(f"{DEPS}.get_cache_service", AsyncMock(return_value=cache_service)):
+            user = await get_current_user("token", _jwt_manager(), repo)
+
+        repo.get_by_id.assert_not_awaited()
+        assert user.id == PydanticObjectId(USER_ID)
+        assert user.is_admin is True
+        assert user.status == "active"
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_loads_and_caches(self):
+        """캐시 미스 시 DB에서 읽고 주체 캐시를 채워야 함."""
+        db_user = SimpleNamespace(id=PydanticObjectId(USER_ID), status="active")
+        repo = MagicMock()
+        repo.get_by_id = AsyncMock(return_value=db_user)
+        cache_service = _cache_service(None)
+
+        with patch(f"{DEPS}.get_cache_service", AsyncMock(return_value=cache_service)):
+            user = await get_optional_current_user("token", _jwt_manager(), repo)
+
+        assert user is db_user
+        repo.get_by_id.assert_awaited_once_with(USER_ID)
+        cache_service.set_principal.assert_awaited_once_with(db_user)
+
+    @pytest.mark.asyncio
+    async def test_cached_suspended_status_is_enforced(self):
+        """캐시된 상태가 정지면 활성 사용자 의존성에서 차단되어야 함."""
+        cache_service = _cache_service(_principal(status="suspended"))
+
+        with patch(f"{DEPS}.get_cache_service", AsyncMock(return_value=cache_service)):
+            user = await get_current_user("token", _jwt_manager(), MagicMock())
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_active_user(user)
+        assert exc_info.value.status_code == 400
+
+
+class TestPrincipalCacheService:
+    """CacheService 주체 캐시 저장/무효화 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_set_principal_keeps_only_authorization_fields(self):
+        """주체 캐시는 권한 확인 필드만 저장하고 비밀번호 해시는 제외해야 함."""
+        user = SimpleNamespace(
+            id=PydanticObjectId(USER_ID), email="test@example.com", user_handle="tester",
+            display_name="Tester", name="Test", status="active", is_admin=False,
+            password_hash="$2b$12$secret", bio="bio"
+        )
+        with patch("nadle_backend.services.cache_service.layered_cache") as cache:
+            cache.set = AsyncMock(return_value=True)
+            assert await CacheService().set_principal(user) is True
+
+        key, stored = cache.set.call_args.args
+        assert key.endswith(f"principal:{USER_ID}")
+        assert set(stored) == set(PRINCIPAL_FIELDS)
+        assert stored["id"] == USER_ID
+        assert cache.set.call_args.kwargs["ttl"] > 0
+
+    @pytest.mark.asyncio
+    async def test_delete_user_cache_invalidates_principal(self):
+        """사용자 캐시 삭제는 다른 워커까지 주체 캐시를 무효화해야 함."""
+        redis_manager = MagicMock()
+        redis_manager.delete = AsyncMock(return_value=True)
+        with patch("nadle_backend.services.cache_service.layered_cache") as cache, \
+             patch("nadle_backend.services.cache_service.get_redis_manager", AsyncMock(return_value=redis_manager)):
+            cache.invalidate = AsyncMock(return_value=1)
+            cache.invalidate_tags = AsyncMock(return_value=2)
+            await CacheService().delete_user_cache(USER_ID)
+
+        cache.invalidate.assert_awaited_once()
+        assert cache.invalidate.call_args.args[0].endswith(f"principal:{USER_ID}")
+        cache.invalidate_tags.assert_awaited_once_with(f"author:{USER_ID}", f"user:{USER_ID}")
+
+
+class TestInvalidationOnChange:
+    """사용자 변경 시 무효화 테스트."""
+
+    @pytest.fixture
+    def service_and_cache(self):
+        from nadle_backend.services.auth_service import AuthService
+
+        repo = MagicMock()
+        repo.get_by_id = AsyncMock(return_value=SimpleNamespace(id=USER_ID, password_hash="hash"))
+        repo.update_status = AsyncMock(return_value="updated")
+        repo.update_password = AsyncMock(return_value="updated")
+        manager = MagicMock()
+        manager.verify_password_async = AsyncMock(return_value=True)
+        manager.hash_password_async = AsyncMock(return_value="new-hash")
+        cache_service = MagicMock()
+        cache_service.delete_user_cache = AsyncMock(return_value=True)
+        service = AuthService(user_repository=repo, password_manager=manager, email_service=MagicMock())
+        with patch("nadle_backend.services.auth_service.get_cache_service", AsyncMock(return_value=cache_service)):
+            yield service, cache_service
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", ["suspend_user", "deactivate_user", "activate_user"])
+    async def test_status_change_invalidates(self, service_and_cache, method):
+        """상태 변경은 사용자/주체 캐시를 무효화해야 함."""
+        service, cache_service = service_and_cache
+
+        assert await getattr(service, method)(USER_ID) == "updated"
+
+        cache_service.delete_user_cache.assert_awaited_once_with(USER_ID)
+
+    @pytest.mark.asyncio
+    async def test_password_change_invalidates(self, service_and_cache):
+        """비밀번호 변경은 사용자/주체 캐시를 무효화해야 함."""
+        service, cache_service = service_and_cache
+
+        await service.change_password(USER_ID, "Old123!", "New123!")
+
+        cache_service.delete_user_cache.assert_awaited_once_with(USER_ID)
@@ -30,6 +30,7 @@ def mock_jwt_manager():
 def mock_password_manager():
     """Create mock password manager."""
     manager = MagicMock(spec=PasswordManager)
+    manager.needs_rehash.return_value = False
     return manager
 
 
@@ -91,7 +92,7 @@ class TestUserRegistration:
         mock_user_repository.get_by_handle = AsyncMock(side_effect=UserNotFoundError("testuser"))
         
         # Mock password hashing
-        mock_password_manager.hash_password.return_value = "hashed_password"
+        mock_password_manager.hash_password_async.return_value = "hashed_password"
         
         # Mock user creation
         mock_user_repository.create = AsyncMock(return_value=sample_user)
@@ -100,7 +101,7 @@ class TestUserRegistration:
         result = await auth_service.register_user(user_create_data)
         
         assert result == sample_user
-        mock_password_manager.hash_password.assert_called_once_with("TestPassword123!")
+        mock_password_manager.hash_password_async.assert_called_once_with("TestPassword123!")
         mock_user_repository.create.assert_called_once()
     
     @pytest.mark.asyncio
@@ -138,7 +139,7 @@ class TestUserRegistration:
         mock_user_repository.get_by_email = AsyncMock(side_effect=UserNotFoundError("test@example.com"))
         
         # Mock password hashing
-        mock_password_manager.hash_password.return_value = "hashed_password"
+        mock_password_manager.hash_password_async.return_value = "hashed_password"
         
         # Mock user creation
         mock_user_repository.create = AsyncMock(return_value=sample_user)
@@ -162,13 +163,13 @@ class TestUserAuthentication:
         mock_user_repository.get_by_email = AsyncMock(return_value=sample_user)
         
         # Mock password verification
-        mock_password_manager.verify_password.return_value = True
+        mock_password_manager.verify_password_async.return_value = True
         
         # Test authentication
         result = await auth_service.authenticate_user("test@example.com", "password")
         
         assert result == sample_user
-        mock_password_manager.verify_password.assert_called_once_with("password", "hashed_password")
+        mock_password_manager.verify_password_async.assert_called_once_with("password", "hashed_password")
     
     @pytest.mark.asyncio
     async def test_authenticate_user_not_found(self, auth_service, mock_user_repository):
@@ -187,7 +188,7 @@ class TestUserAuthentication:
         mock_user_repository.get_by_email = AsyncMock(return_value=sample_user)
         
         # Mock password verification failure
-        mock_password_manager.verify_password.return_value = False
+        mock_password_manager.verify_password_async.return_value = False
         
         with pytest.raises(InvalidCredentialsError):
             await auth_service.authenticate_user("test@example.com", "wrong_password")
@@ -203,7 +204,7 @@ class TestUserAuthentication:
         mock_user_repository.get_by_email = AsyncMock(return_value=sample_user)
         
         # Mock password verification
-        mock_password_manager.verify_password.return_value = True
+        mock_password_manager.verify_password_async.return_value = True
         
         with pytest.raises(InvalidCredentialsError):
             await auth_service.authenticate_user("test@example.com", "password")
@@ -248,7 +249,7 @@ class TestTokenManagement:
         """Test successful login with token creation."""
         # Mock authentication
         mock_user_repository.get_by_email = AsyncMock(return_value=sample_user)
-        mock_password_manager.verify_password.return_value = True
+        mock_password_manager.verify_password_async.return_value = True
         
         # Mock token creation
         mock_jwt_manager.create_token.side_effect = ["access_token", "refresh_token"]
@@ -347,8 +348,8 @@ class TestProfileManagement:
         mock_user_repository.get_by_id = AsyncMock(return_value=sample_user)
         
         # Mock password verification and hashing
-        mock_password_manager.verify_password.return_value = True
-        mock_password_manager.hash_password.return_value = "new_hashed_password"
+        mock_password_manager.verify_password_async.return_value = True
+        mock_password_manager.hash_password_async.return_value = "new_hashed_password"
         
         # Mock user update
         updated_user = MagicMock()
@@ -359,8 +360,8 @@ class TestProfileManagement:
         result = await auth_service.change_password(sample_user.id, "old_password", "new_password")
         
         assert result == updated_user
-        mock_password_manager.verify_password.assert_called_once_with("old_password", sample_user.password_hash)
-        mock_password_manager.hash_password.assert_called_once_with("new_password")
+        mock_password_manager.verify_password_async.assert_called_once_with("old_password", sample_user.password_hash)
+        mock_password_manager.hash_password_async.assert_called_once_with("new_password")
         mock_user_repository.update_password.assert_called_once_with(sample_user.id, "new_hashed_password")
     
     @pytest.mark.asyncio
@@ -371,7 +372,7 @@ class TestProfileManagement:
         mock_user_repository.get_by_id = AsyncMock(return_value=sample_user)
         
         # Mock password verification failure
-        mock_password_manager.verify_password.return_value = False
+        mock_password_manager.verify_password_async.return_value = False
         
         with pytest.raises(InvalidCredentialsError):
             await auth_service.change_password(sample_user.id, "wrong_old_password", "new_password")
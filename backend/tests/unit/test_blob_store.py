@@ -0,0 +1,198 @@
+"""
+Blob Store Unit Tests
+
+Tests for content-addressed upload storage including:
+- New content committed to uploads/blobs/ab/cd/<sha256> with a blob reference
+- Duplicate content reusing the existing blob (no second copy on disk)
+- Upload endpoint referencing the shared blob and releasing it on failure
+- Migration of existing uploads into the blob store
+"""
+
+import hashlib
+import io
+import os
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from bson import ObjectId
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from nadle_backend.routers.file_upload import router
+from nadle_backend.services.blob_store import store_upload
+from nadle_backend.services.file_storage import generate_blob_path
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 8 + b"image-bytes" * 100
+BLOB_STORE = "nadle_backend.services.blob_store"
+
+
+class FakeUpload:
+    """Async reader over in-memory bytes"""
+
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+
+def _files(root):
+    return sorted(
+        os.path.relpath(os.path.join(directory, name), root)
+        for directory, _, names in os.walk(root) for name in names
+    )
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestStoreUpload:
+    """Test cases for store_upload"""
+
+    @pytest.mark.asyncio
+    async def test_new_content_stored_at_blob_path(self, workdir):
+        """Test first upload is committed to its content address and referenced"""
+        sha256 = hashlib.sha256(PNG).hexdigest()
+        acquire = AsyncMock()
+
+        with patch(f"{BLOB_STORE}.find_blob", AsyncMock(return_value=None)), \
+             patch(f"{BLOB_STORE}.acquire_blob", acquire):
+            stored = await store_upload(FakeUpload(PNG), "image/png")
+
+        assert stored.file_path == generate_blob_path(sha256)
+        assert stored.file_path.startswith(os.path.join("uploads", "blobs", sha256[:2], sha256[2:4]))
+        assert stored.deduplicated is False
+        assert (workdir / stored.file_path).read_bytes() == PNG
+        acquire.assert_awaited_once_with(sha256, stored.file_path, len(PNG), "image/png")
+        assert _files(workdir) == [stored.file_path]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_content_reuses_blob(self, workdir):
+        """Test identical upload is not written again and adds a reference"""
+        sha256 = hashlib.sha256(PNG).hexdigest()
+        blob_path = generate_blob_path(sha256)
+        os.makedirs(os.path.dirname(blob_path))
+        with open(blob_path, "wb") as f:
+            f.write(PNG)
+        acquire = AsyncMock()
+
+        with patch(f"{BLOB_STORE}.find_blob", AsyncMock(return_value={"sha256": sha256, "file_path": blob_path})), \
+             patch(f"{BLOB_STORE}.acquire_blob", acquire):
+            stored = await store_upload(FakeUpload(PNG), "image/png")
+
+        assert stored.deduplicated is True
+        assert stored.file_path == blob_path
+        acquire.assert_awaited_once()
+        assert _files(workdir) == [blob_path]
+
+    @pytest.mark.asyncio
+    async def test_blob_with_missing_file_is_rewritten(self, workdir):
+        """Test blob document without its file on disk gets the content again"""
+        sha256 = hashlib.sha256(PNG).hexdigest()
+        blob_path = generate_blob_path(sha256)
+
+        with patch(f"{BLOB_STORE}.find_blob", AsyncMock(return_value={"sha256": sha256, "file_path": blob_path})), \
+             patch(f"{BLOB_STORE}.acquire_blob", AsyncMock()):
+            stored = await store_upload(FakeUpload(PNG), "image/png")
+
+        assert stored.deduplicated is False
+        assert (workdir / blob_path).read_bytes() == PNG
+
+
+class TestUploadEndpointDedup:
+    """Test cases for the upload endpoint with the blob store"""
+
+    @pytest.fixture
+    def client(self, workdir):
+        app = FastAPI()
+        app.include_router(router, prefix="/api/files")
+        return TestClient(app)
+
+    def test_same_image_uploaded_twice_shares_blob(self, client, workdir):
+        """Test two uploads of the same image create two records and one file"""
+        blobs = {}
+
+        async def find_blob(sha256):
+            return blobs.get(sha256)
+
+        async def acquire_blob(sha256, file_path, file_size, content_type):
+            blob = blobs.setdefault(sha256, {"sha256": sha256, "file_path": file_path, "ref_count": 0})
+            blob["ref_count"] += 1
+            return blob
+
+        save_record = AsyncMock(return_value=True)
+        with patch(f"{BLOB_STORE}.find_blob", find_blob), \
+             patch(f"{BLOB_STORE}.acquire_blob", acquire_blob), \
+             patch("nadle_backend.routers.file_upload.save_file_record", save_record):
+            for name in ("a.png", "b.png"):
+                response = client.post("/api/files/upload", files={"file": (name, PNG, "image/png")})
+                assert response.status_code == 200
+
+        first, second = [call.args[0] for call in save_record.call_args_list]
+        assert first["file_id"] != second["file_id"]
+        assert first["file_path"] == second["file_path"]
+        assert first["sha256"] == second["sha256"]
+        assert blobs[first["sha256"]]["ref_count"] == 2
+        assert _files(workdir) == [first["file_path"]]
+
+    def test_failed_record_save_releases_blob(self, client):
+        """Test blob reference is released when the file record cannot be saved"""
+        release = AsyncMock(return_value=0)
+
+        with patch(f"{BLOB_STORE}.find_blob", AsyncMock(return_value=None)), \
+             patch(f"{BLOB_STORE}.acquire_blob", AsyncMock()), \
+             patch("nadle_backend.routers.file_upload.save_file_record", AsyncMock(return_value=False)), \
+             patch("nadle_backend.routers.file_upload.release_blob", release):
+            response = client.post("/api/files/upload", files={"file": ("a.png", PNG, "image/png")})
+
+        assert response.status_code == 500
+        release.assert_awaited_once_with(hashlib.sha256(PNG).hexdigest())
+
+
+class TestUploadMigration:
+    """Test cases for migrate_uploads_to_blobs"""
+
+    @pytest.mark.asyncio
+    async def test_existing_uploads_collapsed_into_blobs(self, workdir):
+        """Test duplicates collapse into one blob and records are repointed"""
+        from nadle_backend.database.backfill import migrate_uploads_to_blobs
+
+        os.makedirs("uploads/2025/06")
+        contents = {"uploads/2025/06/a.png": PNG, "uploads/2025/06/b.png": PNG, "uploads/2025/06/c.png": PNG + b"x"}
+        for path, data in contents.items():
+            with open(path, "wb") as f:
+                f.write(data)
+        docs = [{"_id": ObjectId(), "file_path": path, "content_type": "image/png"} for path in contents]
+        docs.append({"_id": ObjectId(), "file_path": "uploads/2025/06/missing.png", "content_type": "image/png"})
+
+        class _Cursor:
+            def __init__(self, items):
+                self.items = items
+
+            def sort(self, *args):
+                return self
+
+            def __aiter__(self):
+                async def gen():
+                    for item in self.items:
+                        yield item
+                return gen()
+
+        files = MagicMock()
+        files.find.return_value = _Cursor(docs)
+        files.bulk_write = AsyncMock(return_value=Mock(modified_count=3))
+        blobs = MagicMock()
+        blobs.find.return_value = _Cursor([])
+        blobs.bulk_write = AsyncMock()
+        db = MagicMock()
+        db.__getitem__.side_effect = lambda name: blobs if name == "file_blobs" else files
+
+        stats = await migrate_uploads_to_blobs(db, batch_size=10)
+
+        assert stats == {"scanned": 4, "migrated": 3, "deduplicated": 1, "missing": 1, "bytes_reclaimed": len(PNG)}
+        blob_ops = {op._filter["sha256"]: op._doc["$inc"]["ref_count"] for op in blobs.bulk_write.call_args.args[0]}
+        assert blob_ops == {hashlib.sha256(PNG).hexdigest(): 2, hashlib.sha256(PNG + b"x").hexdigest(): 1}
+        record_paths = [op._doc["$set"]["file_path"] for op in files.bulk_write.call_args.args[0]]
+        assert record_paths[0] == record_paths[1] == generate_blob_path(hashlib.sha256(PNG).hexdigest())
+        assert _files(workdir) == sorted(set(record_paths))
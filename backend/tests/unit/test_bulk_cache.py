@@ -0,0 +1,287 @@
+"""일괄 캐시 API(mget/mset_with_ttl/delete_many/pipeline) 테스트.
+
+## 🎯 테스트 목표
+여러 키를 다루는 캐시 작업이 항목 수와 관계없이 캐시 왕복 한 번으로 끝나는지 검증
+
+## 📋 테스트 범위
+- Upstash: MGET/DEL 단일 요청, SET EX /pipeline 요청, 파이프라인 결과 변환
+- 로컬 Redis: redis-py MGET/파이프라인 호출 및 연결 오류 처리
+- 2단 캐시: 로컬 적중분을 제외한 원격 일괄 조회, 파이프라인 삭제 시 무효화 전파
+- 배치 조회 메서드(작성자 정보, 사용자 반응, 인기 게시글)의 캐시 왕복 횟수
+"""
+
+import json
+import pytest
+import redis.asyncio as redis
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from aiohttp.test_utils import TestServer
+from nadle_backend.database.layered_cache import LayeredCacheManager
+from nadle_backend.database.redis import RedisManager
+from nadle_backend.database.upstash_redis import UpstashRedisManager
+from nadle_backend.services.popular_posts_cache_service import PopularPostsCacheService
+from nadle_backend.services.posts_service import PostsService
+from tests.helpers.upstash_stub import UpstashStub
+
+
+@pytest.fixture
+async def upstash():
+    stub = UpstashStub(token="test-token")
+    server = TestServer(stub.app)
+    await server.start_server()
+
+    manager = UpstashRedisManager()
+    manager.rest_url = str(server.make_url("/"))
+    manager.rest_token = "test-token"
+    manager.auto_batch = False
+    assert await manager.connect() is True
+    stub.requests.clear()
+
+    yield manager, stub
+
+    await manager.disconnect()
+    await server.close()
+
+
+@pytest.fixture
+def local_redis():
+    manager = RedisManager()
+    manager.redis_client = MagicMock()
+    manager._connected = True
+    return manager
+
+
+class TestUpstashBulk:
+    """Upstash 일괄 명령 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_mget_single_request(self, upstash):
+        """MGET 한 번으로 조회하고 존재하는 키만 디코딩해 반환해야 함."""
+        manager, stub = upstash
+        stub.store.update({"a": '{"n": 1}', "b": "plain"})
+
+        assert await manager.mget(["a", "b", "missing", "a"]) == {"a": {"n": 1}, "b": "plain"}
+        assert stub.requests == [{"path": "/", "commands": [["MGET", "a", "b", "missing"]]}]
+
+    @pytest.mark.asyncio
+    async def test_mset_with_ttl_uses_pipeline(self, upstash):
+        """TTL 포함 일괄 저장은 /pipeline 요청 하나여야 함."""
+        manager, stub = upstash
+
+        assert await manager.mset_with_ttl({"a": {"n": 1}, "b": "x"}, ttl=60) is True
+
+        assert len(stub.requests) == 1
+        assert stub.requests[0]["path"] == "/pipeline"
+        assert stub.requests[0]["commands"] == [["SET", "a", '{"n": 1}', "EX", "60"], ["SET", "b", "x", "EX", "60"]]
+        assert set(stub.expires) == {"a", "b"}
+
+    @pytest.mark.asyncio
+    async def test_delete_many_single_request(self, upstash):
+        """DEL 한 번으로 삭제하고 삭제된 키 수를 반환해야 함."""
+        manager, stub = upstash
+        stub.store.update({"a": "1", "b": "2"})
+
+        assert await manager.delete_many(["a", "b", "c"]) == 2
+        assert len(stub.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_pipeline_context_manager(self, upstash):
+        """파이프라인 블록의 명령은 한 요청으로 실행되고 단일 키 메서드와 같은 결과를 반환해야 함."""
+        manager, stub = upstash
+        stub.store["old"] = "1"
+
+        async with manager.pipeline() as pipe:
+            pipe.set("k", {"a": 1}, ttl=30)
+            pipe.get("k")
+            pipe.exists("missing")
+            pipe.delete("old")
+
+        assert pipe.results == [True, {"a": 1}, False, True]
+        assert [request["path"] for request in stub.requests] == ["/pipeline"]
+
+    @pytest.mark.asyncio
+    async def test_pipeline_server_failure_returns_fallbacks(self, upstash):
+        """요청 실패 시 명령별 실패 값으로 채워야 함."""
+        manager, stub = upstash
+        stub.fail_with = 503
+
+        async with manager.pipeline() as pipe:
+            pipe.get("a")
+            pipe.set("b", 1)
+
+        assert pipe.results == [None, False]
+
+
+class TestLocalRedisBulk:
+    """로컬 Redis 일괄 명령 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_mget(self, local_redis):
+        """redis-py MGET 결과를 키별로 디코딩해야 함."""
+        local_redis.redis_client.mget = AsyncMock(return_value=['{"n": 1}', None])
+
+        assert await local_redis.mget(["a", "b"]) == {"a": {"n": 1}}
+        local_redis.redis_client.mget.assert_awaited_once_with(["a", "b"])
+
+    @pytest.mark.asyncio
+    async def test_mset_with_ttl_single_pipeline(self, local_redis):
+        """SETEX 명령을 비트랜잭션 파이프라인으로 한 번에 실행해야 함."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[True, True])
+        local_redis.redis_client.pipeline.return_value = pipe
+
+        assert await local_redis.mset_with_ttl({"a": {"n": 1}, "b": "x"}, ttl=60) is True
+
+        local_redis.redis_client.pipeline.assert_called_once_with(transaction=False)
+        pipe.setex.assert_any_call("a", 60, '{"n": 1}')
+        pipe.setex.assert_any_call("b", 60, "x")
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_pipeline_converts_results(self, local_redis):
+        """명령별 오류는 해당 명령의 실패 값으로 바뀌어야 함."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=['"v"', 1, redis.ResponseError("WRONGTYPE")])
+        local_redis.redis_client.pipeline.return_value = pipe
+
+        async with local_redis.pipeline() as cache_pipe:
+            cache_pipe.get("a").delete("b").get("c")
+
+        assert cache_pipe.results == ["v", True, None]
+        pipe.execute.assert_awaited_once_with(raise_on_error=False)
+
+    @pytest.mark.asyncio
+    async def test_connection_error_records_failure(self, local_redis):
+        """연결 오류는 빈 결과를 반환하고 서킷 브레이커 실패로 기록해야 함."""
+        local_redis.redis_client.mget = AsyncMock(side_effect=redis.ConnectionError("down"))
+
+        assert await local_redis.mget(["a"]) == {}
+        assert local_redis.health.consecutive_failures == 1
+
+
+class TestLayeredBulk:
+    """2단 캐시 일괄 명령 테스트."""
+
+    @pytest.fixture
+    def remote(self):
+        manager = Mock()
+        manager.mget = AsyncMock(return_value={"b": {"n": 2}})
+        manager.mset_with_ttl = AsyncMock(return_value=True)
+        manager.delete_many = AsyncMock(return_value=1)
+        manager.publish = AsyncMock(return_value=1)
+        return manager
+
+    @pytest.fixture
+    def cache(self, remote):
+        layered = LayeredCacheManager(max_entries=10, local_ttl=30)
+        with patch("nadle_backend.database.redis_factory.get_redis_manager", AsyncMock(return_value=remote)):
+            yield layered
+
+    @pytest.mark.asyncio
+    async def test_mget_fetches_only_local_misses(self, cache, remote):
+        """로컬 적중 키는 제외하고 나머지만 원격에서 한 번에 조회해야 함."""
+        cache.local.set("a", {"n": 1})
+
+        assert await cache.mget(["a", "b", "c"]) == {"a": {"n": 1}, "b": {"n": 2}}
+        remote.mget.assert_awaited_once_with(["b", "c"])
+        assert cache.local.get("b") == (True, {"n": 2})
+
+        # 두 번째 조회는 원격 왕복 없이 로컬에서 처리
+        remote.mget.reset_mock()
+        await cache.mget(["a", "b"])
+        remote.mget.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_mset_populates_local(self, cache, remote):
+        """원격 일괄 저장 성공 시 로컬에도 저장해야 함."""
+        assert await cache.mset_with_ttl({"x": {"v": 1}}, ttl=60) is True
+        assert cache.local.get("x") == (True, {"v": 1})
+
+    @pytest.mark.asyncio
+    async def test_pipeline_delete_broadcasts_once(self, cache, remote):
+        """파이프라인 삭제는 로컬 제거 후 무효화 메시지를 한 번 발행해야 함."""
+        remote_pipe = Mock()
+        remote_pipe.ops = []
+        remote_pipe.execute = AsyncMock(return_value=[True, True])
+        remote.pipeline = Mock(return_value=remote_pipe)
+        cache.local.set("a", 1)
+        cache.local.set("hit", "cached")
+
+        async with cache.pipeline() as pipe:
+            pipe.get("hit").delete("a").delete("b")
+
+        assert pipe.results == ["cached", True, True]
+        assert remote_pipe.ops == [("delete", ("a",)), ("delete", ("b",))]
+        assert cache.local.get("a") == (False, None)
+        channel, message = remote.publish.call_args[0]
+        assert json.loads(message)["keys"] == ["a", "b"]
+
+
+class TestBatchReaders:
+    """배치 조회 메서드의 캐시 왕복 횟수 테스트."""
+
+    @pytest.fixture
+    def post_cache(self):
+        cache = Mock()
+        cache.mget = AsyncMock(return_value={})
+        cache.mset_with_ttl = AsyncMock(return_value=True)
+        cache.get = AsyncMock()
+        cache.set = AsyncMock()
+        return cache
+
+    @pytest.mark.asyncio
+    async def test_authors_info_batch(self, post_cache):
+        """작성자 정보는 MGET 한 번, 미스분 저장 한 번이어야 함."""
+        service = PostsService(post_repository=Mock())
+        cached_id, missing_id = "507f1f77bcf86cd799439011", "507f1f77bcf86cd799439012"
+        post_cache.mget.return_value = {service._get_author_info_key(cached_id): {"id": cached_id}}
+        author = Mock(id=missing_id, user_handle="h", display_name="d", email="e@x.com")
+        author.name = "n"
+        query = Mock()
+        query.to_list = AsyncMock(return_value=[author])
+
+        with patch("nadle_backend.services.posts_service.get_layered_cache", AsyncMock(return_value=post_cache)), \
+             patch("nadle_backend.models.core.User.find", return_value=query):
+            result = await service.get_authors_info_batch([cached_id, missing_id])
+
+        assert set(result) == {cached_id, missing_id}
+        post_cache.mget.assert_awaited_once()
+        post_cache.mset_with_ttl.assert_awaited_once()
+        assert list(post_cache.mset_with_ttl.await_args.args[0]) == [service._get_author_info_key(missing_id)]
+        post_cache.get.assert_not_called()
+        post_cache.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_user_reactions_batch(self, post_cache):
+        """사용자 반응은 기본값까지 포함해 저장 한 번이어야 함."""
+        service = PostsService(post_repository=Mock())
+        reaction = Mock(target_id="p1", liked=True, disliked=False, bookmarked=False)
+        query = Mock()
+        query.to_list = AsyncMock(return_value=[reaction])
+
+        with patch("nadle_backend.services.posts_service.get_layered_cache", AsyncMock(return_value=post_cache)), \
+             patch("nadle_backend.models.core.UserReaction.find", return_value=query, create=True):
+            result = await service.get_user_reactions_batch("u1", ["p1", "p2", "p3"])
+
+        assert result["p1"]["liked"] is True
+        assert result["p3"] == {"liked": False, "disliked": False, "bookmarked": False}
+        post_cache.mget.assert_awaited_once()
+        post_cache.mset_with_ttl.assert_awaited_once()
+        assert len(post_cache.mset_with_ttl.await_args.args[0]) == 3
+        post_cache.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_popular_posts_single_mget(self):
+        """인기 게시글 상세는 ZREVRANGE 결과에 대해 MGET 한 번이어야 함."""
+        manager = Mock()
+        manager.is_connected = AsyncMock(return_value=True)
+        manager.zrevrange = AsyncMock(return_value=[("p1", 10.0), ("p2", 5.0)])
+        service = PopularPostsCacheService()
+        manager.mget = AsyncMock(return_value={service._get_detail_key("p1"): {"post_id": "p1"}})
+        manager.get = AsyncMock()
+
+        with patch("nadle_backend.services.popular_posts_cache_service.get_redis_manager", AsyncMock(return_value=manager)):
+            result = await service.get_popular_posts_by_views(limit=2)
+
+        assert result == [{"post_id": "p1", "score": 10.0}]
+        manager.mget.assert_awaited_once()
+        manager.get.assert_not_called()
@@ -0,0 +1,201 @@
+"""캐시 태그 무효화 테스트.
+
+## 🎯 테스트 목표
+캐시 항목이 태그(post/reactions/author/user)별 Set에 등록되고, 태그 무효화가 KEYS/SCAN 없이
+Lua 스크립트 한 번으로 의존 항목을 삭제하며 다른 워커의 로컬 캐시까지 전파되는지 검증
+
+## 📋 테스트 범위
+- set/mset_with_ttl 태그 등록 인자 (태그 Set 키, TTL, 태그별 멤버)
+- invalidate_tags 로컬 캐시 삭제 및 무효화 전파
+- 게시글 삭제 시 모든 사용자의 반응 캐시 무효화, 반응 변경 시 해당 사용자 반응만 무효화
+- 사용자 반응 배치 태그 등록
+- 댓글 작성 시 게시글 태그 무효화
+- 인기 게시글 전체 삭제 시 KEYS 미사용
+"""
+
+import json
+import pytest
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
+from nadle_backend.database.cache_tags import (
+    INVALIDATE_TAGS_SCRIPT,
+    TAG_KEYS_SCRIPT,
+    post_reactions_tag,
+    post_tag,
+    tag_key,
+    user_tag,
+)
+from nadle_backend.database.layered_cache import LayeredCacheManager
+from nadle_backend.services.comments_service import CommentsService
+from nadle_backend.services.popular_posts_cache_service import POPULAR_DETAIL_TAG, PopularPostsCacheService
+from nadle_backend.services.posts_service import PostsService
+
+POST_ID = "507f1f77bcf86cd799439011"
+
+
+@pytest.fixture
+def remote():
+    manager = Mock()
+    manager.set = AsyncMock(return_value=True)
+    manager.mset_with_ttl = AsyncMock(return_value=True)
+    manager.delete_many = AsyncMock(return_value=0)
+    manager.publish = AsyncMock(return_value=1)
+    manager.eval_script = AsyncMock(return_value=1)
+    return manager
+
+
+@pytest.fixture
+def cache(remote):
+    layered = LayeredCacheManager(max_entries=10, local_ttl=30)
+    with patch("nadle_backend.database.redis_factory.get_redis_manager", AsyncMock(return_value=remote)):
+        yield layered
+
+
+class TestTagRegistration:
+    """태그 등록 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_set_registers_key_under_each_tag(self, cache, remote):
+        """저장 성공 시 태그마다 키를 등록하고 태그 Set TTL을 항목 TTL로 맞춰야 함."""
+        assert await cache.set("k", {"v": 1}, ttl=60, tags=[post_tag("p1"), user_tag("u1")]) is True
+
+        remote.eval_script.assert_awaited_once_with(
+            TAG_KEYS_SCRIPT, [tag_key("post:p1"), tag_key("user:u1")], [60, 1, "k", 1, "k"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_set_is_not_tagged(self, cache, remote):
+        """Redis 저장 실패 시 태그를 등록하지 않아야 함."""
+        remote.set = AsyncMock(return_value=False)
+
+        assert await cache.set("k", 1, tags=[post_tag("p1")]) is False
+
+        remote.eval_script.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_mset_registers_tag_members_in_one_script(self, cache, remote):
+        """일괄 저장은 태그별 멤버를 스크립트 한 번으로 등록해야 함."""
+        await cache.mset_with_ttl({"a": 1, "b": 2}, ttl=30, tags={"user:u1": ["a", "b"], "post:p1": ["a"]})
+
+        remote.eval_script.assert_awaited_once_with(
+            TAG_KEYS_SCRIPT, [tag_key("user:u1"), tag_key("post:p1")], [30, 2, "a", "b", 1, "a"]
+        )
+
+
+class TestTagInvalidation:
+    """태그 무효화 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_drops_local_and_broadcasts(self, cache, remote):
+        """태그에 등록된 키를 로컬에서 지우고 다른 워커에 전파해야 함 (KEYS/SCAN 없음)."""
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        remote.eval_script = AsyncMock(return_value=[b"a"])
+
+        assert await cache.invalidate_tags(post_tag("p1")) == 1
+
+        remote.eval_script.assert_awaited_once_with(INVALIDATE_TAGS_SCRIPT, [tag_key("post:p1")], [])
+        assert cache.local.get("a") == (False, None)
+        assert cache.local.get("b") == (True, 2)
+        assert json.loads(remote.publish.await_args.args[1])["keys"] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_empty_tag_not_broadcast(self, cache, remote):
+        """등록된 키가 없으면 무효화 메시지를 보내지 않아야 함."""
+        remote.eval_script = AsyncMock(return_value=[])
+
+        assert await cache.invalidate_tags(user_tag("u1")) == 0
+
+        remote.publish.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_delete_post_invalidates_all_reactions(self, cache, remote):
+        """게시글 삭제는 게시글 태그와 반응 태그로 모든 사용자의 반응 캐시까지 무효화해야 함."""
+        post = Mock(id=POST_ID, slug="post-slug", author_id="user1")
+        post_repository = Mock()
+        post_repository.get_by_slug = AsyncMock(return_value=post)
+        post_repository.delete = AsyncMock(return_value=True)
+        service = PostsService(post_repository=post_repository)
+        reactions = [service._get_user_reaction_key(user_id, POST_ID) for user_id in ("u1", "u2")]
+        remote.eval_script = AsyncMock(return_value=reactions)
+
+        with patch("nadle_backend.services.posts_service.get_layered_cache", AsyncMock(return_value=cache)), \
+             patch("nadle_backend.services.posts_service.check_post_permission", return_value=True):
+            assert await service.delete_post("post-slug", Mock(id="user1")) is True
+
+        remote.eval_script.assert_awaited_once_with(
+            INVALIDATE_TAGS_SCRIPT, [tag_key(post_tag(POST_ID)), tag_key(post_reactions_tag(POST_ID))], []
+        )
+        assert json.loads(remote.publish.await_args.args[1])["keys"] == reactions
+
+    @pytest.mark.asyncio
+    async def test_toggle_reaction_keeps_other_users_reactions(self, cache, remote):
+        """반응 변경은 해당 사용자의 반응 키만 지우고, 게시글 태그 무효화는 다른 사용자의 반응에 닿지 않아야 함."""
+        service = PostsService(post_repository=Mock())
+        own, other = (service._get_user_reaction_key(user_id, POST_ID) for user_id in ("u1", "u2"))
+        await cache.set(own, {"liked": False})
+        await cache.set(other, {"liked": True})
+        remote.eval_script = AsyncMock(return_value=[])
+
+        with patch("nadle_backend.services.posts_service.get_layered_cache", AsyncMock(return_value=cache)):
+            await service.invalidate_user_reaction_cache("u1", POST_ID)
+            await service.invalidate_post_cache(Mock(id=POST_ID))
+
+        remote.eval_script.assert_awaited_once_with(INVALIDATE_TAGS_SCRIPT, [tag_key(post_tag(POST_ID))], [])
+        remote.delete_many.assert_awaited_once_with((own,))
+        assert cache.local.get(own) == (False, None)
+        assert cache.local.get(other) == (True, {"liked": True})
+
+    @pytest.mark.asyncio
+    async def test_reaction_batch_tagged_by_post_and_user(self):
+        """사용자 반응 배치는 게시글별 반응 태그와 사용자 태그에 등록해야 함 (게시글 태그 아님)."""
+        post_cache = MagicMock()
+        post_cache.mget = AsyncMock(return_value={})
+        post_cache.mset_with_ttl = AsyncMock(return_value=True)
+        service = PostsService(post_repository=Mock())
+        find = MagicMock()
+        find.return_value.to_list = AsyncMock(return_value=[])
+
+        with patch("nadle_backend.services.posts_service.get_layered_cache", AsyncMock(return_value=post_cache)), \
+             patch("nadle_backend.models.core.UserReaction.find", find):
+            await service.get_user_reactions_batch("u1", ["p1", "p2"])
+
+        keys = [service._get_user_reaction_key("u1", post_id) for post_id in ("p1", "p2")]
+        assert post_cache.mset_with_ttl.await_args.kwargs["tags"] == {
+            "reactions:p1": [keys[0]], "reactions:p2": [keys[1]], "user:u1": keys
+        }
+
+    @pytest.mark.asyncio
+    async def test_new_comment_invalidates_post_tag(self):
+        """댓글 작성으로 댓글 수가 바뀌면 게시글 태그(상세, 댓글 배치)를 무효화해야 함."""
+        post_cache = MagicMock()
+        post_cache.invalidate_tags = AsyncMock(return_value=2)
+        service = CommentsService(comment_repo=Mock(), post_repo=Mock())
+
+        with patch("nadle_backend.services.comments_service.get_layered_cache", AsyncMock(return_value=post_cache)), \
+             patch("nadle_backend.models.core.Post.find_one", MagicMock()):
+            await service._increment_post_comment_count(POST_ID)
+
+        post_cache.invalidate_tags.assert_awaited_once_with(post_tag(POST_ID))
+
+
+class TestPopularDetailTag:
+    """인기 게시글 요약 태그 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_clear_all_uses_tag_not_keys(self):
+        """전체 삭제는 KEYS 대신 요약 태그로 요약 키를 삭제해야 함."""
+        service = PopularPostsCacheService()
+        redis_manager = MagicMock()
+        redis_manager.is_connected = AsyncMock(return_value=True)
+        redis_manager.delete_many = AsyncMock(return_value=3)
+        # 등록된 랭킹 보드 2개 삭제 → 태그에 등록된 요약 키 1개 삭제
+        redis_manager.eval_script = AsyncMock(side_effect=[2, [service._get_detail_key("p1")]])
+
+        with patch("nadle_backend.services.popular_posts_cache_service.get_redis_manager",
+                   AsyncMock(return_value=redis_manager)):
+            assert await service.clear_all_popular_cache() == 6
+
+        redis_manager.eval_script.assert_any_await(
+            INVALIDATE_TAGS_SCRIPT, [tag_key(POPULAR_DETAIL_TAG)], []
+        )
+        redis_manager.redis_client.keys.assert_not_called()
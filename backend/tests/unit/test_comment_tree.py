@@ -0,0 +1,231 @@
+"""댓글 트리(root_id/depth/path) 저장 및 단일 쿼리 조회 테스트.
+
+## 🎯 테스트 목표
+댓글 작성 시 조상 정보를 저장하고, 한 페이지의 스레드를 쿼리 한 번으로 불러와
+메모리에서 트리로 조립하는지 검증
+
+## 📋 테스트 범위
+- 최상위 댓글/답글 작성 시 root_id, depth, path 기록
+- 답글 깊이 검사 (추가 조회 없음, 기존 댓글은 부모 체인 탐색)
+- get_comments_with_replies / get_replies_recursive 쿼리 횟수와 트리 구조
+- 기존 댓글 backfill
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+from beanie import PydanticObjectId
+from nadle_backend.config import settings
+from nadle_backend.database.backfill import backfill_comment_tree
+from nadle_backend.exceptions.comment import CommentDepthExceededError
+from nadle_backend.models.core import CommentCreate
+from nadle_backend.repositories.comment_repository import CommentRepository
+
+REPO = "nadle_backend.repositories.comment_repository"
+
+
+def _comment(comment_id, parent=None, status="active"):
+    """트리 필드를 가진 댓글 대역"""
+    if parent is None:
+        root_id, path = comment_id, []
+    else:
+        root_id, path = parent.root_id, parent.path + [parent.id]
+    return SimpleNamespace(
+        id=comment_id, parent_comment_id=parent.id if parent else None,
+        root_id=root_id, depth=len(path), path=path, status=status
+    )
+
+
+def _find_returning(comments):
+    query = Mock()
+    query.sort.return_value = query
+    query.to_list = AsyncMock(return_value=comments)
+    return Mock(return_value=query)
+
+
+@pytest.fixture
+def repo():
+    return CommentRepository()
+
+
+class TestCommentTreeWrite:
+    """작성 시 트리 필드 기록 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_top_level_comment_is_its_own_root(self, repo):
+        """최상위 댓글은 자기 ID를 root_id로, depth 0으로 저장해야 함."""
+        with patch(f"{REPO}.Comment") as MockComment:
+            MockComment.return_value.save = AsyncMock()
+            await repo.create(CommentCreate(content="top"), "user1", "post1")
+
+        kwargs = MockComment.call_args.kwargs
+        assert kwargs["root_id"] == str(kwargs["id"])
+        assert kwargs["depth"] == 0
+        assert kwargs["path"] == []
+
+    @pytest.mark.asyncio
+    async def test_reply_uses_parent_path_without_reads(self, repo):
+        """부모의 path로 답글 위치를 계산하고 추가 조회를 하지 않아야 함."""
+        root = _comment("c1")
+        parent = _comment("c2", parent=root)
+
+        with patch(f"{REPO}.Comment") as MockComment, \
+             patch.object(repo, "get_by_id", new_callable=AsyncMock) as mock_get:
+            MockComment.return_value.save = AsyncMock()
+            await repo.create(
+                CommentCreate(content="reply", parent_comment_id="c2"), "user1", "post1",
+                parent_comment=parent
+            )
+
+        mock_get.assert_not_called()
+        kwargs = MockComment.call_args.kwargs
+        assert (kwargs["root_id"], kwargs["depth"], kwargs["path"]) == ("c1", 2, ["c1", "c2"])
+
+    @pytest.mark.asyncio
+    async def test_reply_depth_exceeded(self, repo):
+        """최대 깊이에 도달한 부모에는 답글을 달 수 없어야 함."""
+        parent = _comment("c3", parent=_comment("c2", parent=_comment("c1")))
+
+        with patch.object(repo, "get_by_id", new_callable=AsyncMock, return_value=parent):
+            with pytest.raises(CommentDepthExceededError):
+                await repo._validate_reply_depth("c3", max_depth=3)
+
+    @pytest.mark.asyncio
+    async def test_legacy_parent_walks_chain(self, repo):
+        """트리 필드가 없는 기존 댓글은 부모 체인을 따라 path를 계산해야 함."""
+        legacy_root = SimpleNamespace(id="c1", parent_comment_id=None, root_id=None, path=[])
+        legacy_parent = SimpleNamespace(id="c2", parent_comment_id="c1", root_id=None, path=[])
+        lookup = {"c1": legacy_root, "c2": legacy_parent}
+
+        with patch.object(repo, "get_by_id", new_callable=AsyncMock, side_effect=lookup.get):
+            tree = await repo._validate_reply_depth("c2", max_depth=3)
+
+        assert tree == {"root_id": "c1", "depth": 2, "path": ["c1", "c2"]}
+
+
+class TestCommentTreeRead:
+    """단일 쿼리 트리 조회 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_page_of_threads_in_one_query(self, repo):
+        """페이지의 모든 답글을 root_id 쿼리 한 번으로 불러와 트리로 조립해야 함."""
+        top1, top2 = _comment("t1"), _comment("t2")
+        r1 = _comment("r1", parent=top1)
+        r2 = _comment("r2", parent=r1)
+        r3 = _comment("r3", parent=top2)
+        find = _find_returning([r1, r3, r2])
+
+        with patch.object(repo, "list_by_post", new_callable=AsyncMock, return_value=([top1, top2], 2)), \
+             patch(f"{REPO}.Comment") as MockComment:
+            MockComment.find = find
+            result, total = await repo.get_comments_with_replies("post1", max_depth=3)
+
+        find.assert_called_once()
+        query = find.call_args.args[0]
+        assert query["root_id"] == {"$in": ["t1", "t2"]}
+        assert query["depth"] == {"$gt": 0, "$lte": 3}
+        assert total == 2
+        assert result[0]["replies"][0]["comment"] is r1
+        assert result[0]["replies"][0]["replies"][0]["comment"] is r2
+        assert result[1]["replies"] == [{"comment": r3, "replies": []}]
+
+    @pytest.mark.asyncio
+    async def test_replies_recursive_uses_path_query(self, repo):
+        """하위 답글은 path 쿼리 한 번으로 불러오고 남은 깊이만큼만 조립해야 함."""
+        top = _comment("t1")
+        r1 = _comment("r1", parent=top)
+        r2 = _comment("r2", parent=r1)
+        find = _find_returning([r1, r2])
+
+        with patch(f"{REPO}.Comment") as MockComment:
+            MockComment.find = find
+            replies = await repo.get_replies_recursive("t1", max_depth=2, current_depth=1)
+
+        assert find.call_args.args[0] == {"path": "t1", "status": "active"}
+        assert replies == [{"comment": r1, "replies": []}]
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def limit(self, n):
+        return _Cursor(self.docs[:n])
+
+    async def to_list(self, length=None):
+        return list(self.docs)
+
+    def __aiter__(self):
+        self._iter = iter(self.docs)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _FakeCollection:
+    """backfill에 필요한 최소한의 motor 컬렉션 대역"""
+
+    def __init__(self, docs):
+        self.docs = {doc["_id"]: doc for doc in docs}
+
+    def _match(self, doc, query):
+        for key, cond in query.items():
+            value = doc.get(key)
+            if isinstance(cond, dict):
+                if "$ne" in cond and value == cond["$ne"]:
+                    return False
+                if "$in" in cond and value not in cond["$in"]:
+                    return False
+                if "$nin" in cond and value in cond["$nin"]:
+                    return False
+            elif value != cond:
+                return False
+        return True
+
+    async def update_many(self, query, pipeline):
+        matched = [doc for doc in self.docs.values() if self._match(doc, query)]
+        for doc in matched:
+            doc.update(root_id=str(doc["_id"]), depth=0, path=[])
+        return SimpleNamespace(modified_count=len(matched))
+
+    def find(self, query, projection=None):
+        return _Cursor([dict(doc) for doc in self.docs.values() if self._match(doc, query)])
+
+    async def bulk_write(self, operations, ordered=True):
+        for op in operations:
+            self.docs[op._filter["_id"]].update(op._doc["$set"])
+        return SimpleNamespace(modified_count=len(operations))
+
+    async def count_documents(self, query):
+        return sum(1 for doc in self.docs.values() if self._match(doc, query))
+
+
+class TestCommentTreeBackfill:
+    """기존 댓글 backfill 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_backfill_resolves_all_levels(self):
+        """깊이에 관계없이 모든 답글의 트리 필드를 채우고, 부모가 없는 답글은 남겨야 함."""
+        ids = [PydanticObjectId() for _ in range(4)]
+        docs = [
+            # 자식이 부모보다 먼저 조회되도록 역순 배치
+            {"_id": ids[2], "parent_comment_id": str(ids[1])},
+            {"_id": ids[1], "parent_comment_id": str(ids[0])},
+            {"_id": ids[0], "parent_comment_id": None},
+            {"_id": ids[3], "parent_comment_id": str(PydanticObjectId())},
+        ]
+        collection = _FakeCollection(docs)
+
+        db = {settings.comments_collection: collection}
+
+        stats = await backfill_comment_tree(db, batch_size=1)
+
+        assert stats == {"top_level": 1, "replies": 2, "unresolved": 1}
+        deepest = collection.docs[ids[2]]
+        assert deepest["root_id"] == str(ids[0])
+        assert deepest["depth"] == 2
+        assert deepest["path"] == [str(ids[0]), str(ids[1])]
@@ -0,0 +1,102 @@
+"""콘텐츠 단일 패스 렌더링 파이프라인 테스트.
+
+## 🎯 테스트 목표
+process_content가 렌더링된 HTML을 한 번만 파싱해 새니타이징/이미지 검증/텍스트 추출을
+처리하고, 같은 콘텐츠는 캐시된 결과를 재사용하는지 검증
+
+## 📋 테스트 범위
+- BeautifulSoup 재파싱 없이 처리
+- 허용되지 않은 이미지 제거, 스크립트 제거
+- 검색용 텍스트와 단어 수
+- 콘텐츠 해시 + 타입 기준 캐시 적중/미스, 캐시 결과 격리
+"""
+
+import pytest
+from unittest.mock import patch
+from nadle_backend.services import content_service as content_module
+from nadle_backend.services.content_service import ContentService
+
+SERVICE = "nadle_backend.services.content_service"
+
+
+@pytest.fixture(autouse=True)
+def clear_render_cache():
+    content_module._render_cache.clear()
+    yield
+    content_module._render_cache.clear()
+
+
+class TestSinglePass:
+    """단일 패스 처리 테스트."""
+
+    def test_processes_without_beautifulsoup(self):
+        """렌더링 결과를 BeautifulSoup으로 다시 파싱하지 않아야 함."""
+        with patch(f"{SERVICE}.BeautifulSoup", side_effect=AssertionError("reparsed")):
+            processed = ContentService().process_content("# 제목\n\n본문 **굵게**", "markdown")
+
+        assert "<h1>" in processed.rendered_html
+        assert processed.content_text == "제목 본문 굵게"
+
+    def test_disallowed_images_and_scripts_removed(self):
+        """외부 이미지와 스크립트는 제거되고 내부 파일 이미지는 유지되어야 함."""
+        content = (
+            '<p>안녕 &amp; hello</p><script>alert(1)</script>'
+            '<img src="https://evil.example.com/x.png">'
+            '<img src="/api/files/abc123" alt="내부">'
+        )
+
+        processed = ContentService().process_content(content, "html")
+
+        assert "evil.example.com" not in processed.rendered_html
+        assert "<script>" not in processed.rendered_html
+        assert 'src="/api/files/abc123"' in processed.rendered_html
+        assert processed.content_text.startswith("안녕 & hello")
+
+    def test_word_count_from_rendered_text(self):
+        """단어 수는 렌더링된 텍스트 기준이어야 함 (마크다운 문법 제외)."""
+        processed = ContentService().process_content("**hello** _world_ 안녕하세요", "markdown")
+
+        # 영어 2단어 + 한글 5글자 // 2
+        assert processed.metadata.word_count == 4
+        assert processed.metadata.reading_time == 1
+
+    def test_sanitize_html_keeps_api(self):
+        """sanitize_html은 같은 파이프라인으로 안전한 HTML을 반환해야 함."""
+        result = ContentService().sanitize_html('<p onclick="x()">글</p><img src="http://evil.example.com/a.png">')
+
+        assert result == "<p>글</p>"
+
+
+class TestRenderCache:
+    """렌더링 결과 캐시 테스트."""
+
+    def test_same_content_served_from_cache(self):
+        """같은 콘텐츠/타입은 다시 렌더링하지 않아야 함."""
+        service = ContentService()
+        first = service.process_content("캐시 **테스트**", "markdown")
+
+        with patch.object(ContentService, "_process_content_uncached") as uncached:
+            second = ContentService().process_content("캐시 **테스트**", "markdown")
+
+        uncached.assert_not_called()
+        assert second == first
+        assert second is not first
+
+    def test_content_type_is_part_of_key(self):
+        """같은 원문이라도 타입이 다르면 따로 렌더링해야 함."""
+        service = ContentService()
+        markdown_result = service.process_content("**굵게**", "markdown")
+        text_result = service.process_content("**굵게**", "text")
+
+        assert "<strong>" in markdown_result.rendered_html
+        assert "<strong>" not in text_result.rendered_html
+
+    def test_cached_result_isolated_from_caller_mutation(self):
+        """호출자가 결과를 수정해도 캐시된 값은 바뀌지 않아야 함."""
+        service = ContentService()
+        first = service.process_content("![a](/api/files/abc123)", "markdown")
+        first.metadata.inline_images.append("mutated")
+
+        second = service.process_content("![a](/api/files/abc123)", "markdown")
+
+        assert second.metadata.inline_images == ["abc123"]
@@ -0,0 +1,290 @@
+"""요청 범위 배치 로더(DataLoader) 테스트.
+
+## 🎯 테스트 목표
+같은 이벤트 루프 틱에 들어온 ID 조회가 한 번의 `$in` 쿼리로 묶이고,
+서비스가 댓글/게시글 수와 무관하게 고정된 횟수의 쿼리만 실행하는지 검증
+
+## 📋 테스트 범위
+- DataLoader 배치/메모이즈/실패 처리
+- users/posts/authors/reactions 로더의 쿼리 형태와 작성자 캐시 사용
+- 요청 범위 바인딩 (provide_request_loaders)
+- CommentsService 댓글 목록, UserActivityService 반응 목록의 쿼리 횟수
+"""
+
+import asyncio
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+from bson import ObjectId
+from nadle_backend.dependencies.data_loaders import provide_request_loaders
+from nadle_backend.repositories.data_loader import (
+    DataLoader,
+    RequestLoaders,
+    author_info_key,
+    get_request_loaders,
+)
+
+LOADER = "nadle_backend.repositories.data_loader"
+
+
+def _find_returning(documents):
+    query = Mock()
+    query.to_list = AsyncMock(return_value=documents)
+    return Mock(return_value=query)
+
+
+def _user(user_id):
+    return SimpleNamespace(
+        id=ObjectId(user_id), name="홍길동", email="hong@example.com",
+        user_handle=f"handle_{user_id[-2:]}", display_name="길동", bio=None,
+        avatar_url=None, status="active",
+        created_at=datetime.utcnow(), updated_at=datetime.utcnow()
+    )
+
+
+def _fake_cache(initial=None):
+    cache = Mock()
+    store = dict(initial or {})
+    cache.mget = AsyncMock(side_effect=lambda keys: {k: store[k] for k in keys if k in store})
+    cache.mset_with_ttl = AsyncMock(return_value=True)
+    return cache
+
+
+USER_IDS = [str(ObjectId()) for _ in range(3)]
+
+
+class TestDataLoader:
+    """DataLoader 기본 동작 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_loads_in_same_tick_are_batched(self):
+        """같은 틱의 load 호출은 batch_fn 한 번으로 처리되어야 함."""
+        batch_fn = AsyncMock(side_effect=lambda keys: {k: k.upper() for k in keys})
+        loader = DataLoader(batch_fn)
+
+        results = await asyncio.gather(loader.load("a"), loader.load("b"), loader.load("a"))
+
+        assert results == ["A", "B", "A"]
+        batch_fn.assert_awaited_once_with(["a", "b"])
+
+    @pytest.mark.asyncio
+    async def test_memoized_keys_are_not_refetched(self):
+        """이미 조회한 키는 다시 조회하지 않고, 결과에 없는 키는 None이어야 함."""
+        batch_fn = AsyncMock(side_effect=lambda keys: {k: k for k in keys if k != "missing"})
+        loader = DataLoader(batch_fn)
+
+        first = await loader.load_many(["a", "missing"])
+        second = await loader.load("a")
+
+        assert first == {"a": "a", "missing": None}
+        assert second == "a"
+        assert batch_fn.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_batches_are_split_by_max_batch_size(self):
+        """max_batch_size를 넘는 키는 여러 배치로 나눠 조회해야 함."""
+        batch_fn = AsyncMock(side_effect=lambda keys: {k: k for k in keys})
+        loader = DataLoader(batch_fn, max_batch_size=2)
+
+        await loader.load_many(["a", "b", "c"])
+
+        assert [call.args[0] for call in batch_fn.await_args_list] == [["a", "b"], ["c"]]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried_on_next_load(self):
+        """배치가 실패하면 예외를 전달하고 메모에 남기지 않아야 함."""
+        batch_fn = AsyncMock(side_effect=[RuntimeError("db down"), {"a": 1}])
+        loader = DataLoader(batch_fn)
+
+        with pytest.raises(RuntimeError):
+            await loader.load("a")
+        assert await loader.load("a") == 1
+
+    @pytest.mark.asyncio
+    async def test_prime_skips_query(self):
+        """prime으로 등록한 값은 조회 없이 반환되어야 함."""
+        batch_fn = AsyncMock(return_value={})
+        loader = DataLoader(batch_fn)
+
+        loader.prime("a", "known")
+
+        assert await loader.load("a") == "known"
+        batch_fn.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_batch_tasks_are_referenced_until_done(self):
+        """배치 태스크는 실행 중에 로더가 참조를 보관하고, 완료되면 놓아야 함."""
+        release = asyncio.Event()
+
+        async def batch_fn(keys):
+            await release.wait()
+            return {k: k for k in keys}
+
+        loader = DataLoader(batch_fn, max_batch_size=1)
+        pending = asyncio.gather(loader.load("a"), loader.load("b"))
+        await asyncio.sleep(0)
+
+        assert len(loader._tasks) == 2
+        release.set()
+        assert await pending == ["a", "b"]
+        await asyncio.sleep(0)
+        assert not loader._tasks
+
+
+class TestRequestLoaders:
+    """모델별 로더 쿼리 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_users_loaded_with_single_in_query(self):
+        """사용자 조회는 유효한 ID만 모아 $in 쿼리 한 번으로 처리해야 함."""
+        loaders = RequestLoaders()
+        with patch(f"{LOADER}.User") as MockUser:
+            MockUser.find = _find_returning([_user(USER_IDS[0]), _user(USER_IDS[1])])
+            result = await loaders.users.load_many(USER_IDS + ["not-an-id"])
+
+        MockUser.find.assert_called_once()
+        query = MockUser.find.call_args.args[0]
+        assert set(query["_id"]["$in"]) == {ObjectId(user_id) for user_id in USER_IDS}
+        assert result[USER_IDS[0]].user_handle == "handle_" + USER_IDS[0][-2:]
+        assert result[USER_IDS[2]] is None
+        assert result["not-an-id"] is None
+
+    @pytest.mark.asyncio
+    async def test_posts_exclude_deleted(self):
+        """게시글 로더는 삭제된 게시글을 제외하고 조회해야 함."""
+        post_id = str(ObjectId())
+        loaders = RequestLoaders()
+        with patch(f"{LOADER}.Post") as MockPost:
+            MockPost.find = _find_returning([SimpleNamespace(id=ObjectId(post_id), status="published")])
+            post = await loaders.posts.load(post_id)
+
+        assert post.status == "published"
+        assert MockPost.find.call_args.args[0]["status"] == {"$ne": "deleted"}
+
+    @pytest.mark.asyncio
+    async def test_authors_use_cache_and_fill_misses(self):
+        """작성자 정보는 캐시 적중분을 쓰고 미스만 DB 조회 후 일괄 캐싱해야 함."""
+        cached_author = {"id": USER_IDS[0], "user_handle": "cached", "display_name": "c", "name": "c", "email": ""}
+        cache = _fake_cache({author_info_key(USER_IDS[0]): cached_author})
+        loaders = RequestLoaders()
+        with patch(f"{LOADER}.get_layered_cache", AsyncMock(return_value=cache)), \
+             patch(f"{LOADER}.User") as MockUser:
+            MockUser.find = _find_returning([_user(USER_IDS[1])])
+            authors = await loaders.authors.load_many(USER_IDS[:2])
+
+        assert authors[USER_IDS[0]] == cached_author
+        assert authors[USER_IDS[1]]["id"] == USER_IDS[1]
+        assert MockUser.find.call_args.args[0]["_id"]["$in"] == [ObjectId(USER_IDS[1])]
+        cache.mset_with_ttl.assert_awaited_once()
+        assert list(cache.mset_with_ttl.call_args.args[0]) == [author_info_key(USER_IDS[1])]
+
+    @pytest.mark.asyncio
+    async def test_reactions_grouped_by_user_and_target_type(self):
+        """반응 로더는 (사용자, 대상 타입)별로 target_id $in 쿼리를 실행해야 함."""
+        reactions = [SimpleNamespace(target_id="p1", liked=True), SimpleNamespace(target_id="p2", liked=False)]
+        loaders = RequestLoaders()
+        with patch(f"{LOADER}.UserReaction") as MockReaction:
+            MockReaction.find = _find_returning(reactions)
+            result = await loaders.reactions.load_many([("u1", "post", "p1"), ("u1", "post", "p2"), ("u1", "post", "p3")])
+
+        MockReaction.find.assert_called_once_with({
+            "user_id": "u1", "target_type": "post", "target_id": {"$in": ["p1", "p2", "p3"]}
+        })
+        assert result[("u1", "post", "p1")].liked is True
+        assert result[("u1", "post", "p3")] is None
+
+
+class TestRequestScope:
+    """요청 범위 바인딩 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_dependency_binds_loaders_for_request(self):
+        """의존성이 바인딩한 로더를 요청 안에서 공유하고, 요청이 끝나면 해제해야 함."""
+        dependency = provide_request_loaders()
+        loaders = await dependency.__anext__()
+
+        assert get_request_loaders() is loaders
+        assert get_request_loaders() is loaders
+
+        with pytest.raises(StopAsyncIteration):
+            await dependency.__anext__()
+        assert get_request_loaders() is not loaders
+
+    @pytest.mark.asyncio
+    async def test_outside_request_gets_fresh_loaders(self):
+        """요청 범위 밖에서는 호출마다 새 로더를 반환해 메모가 새지 않아야 함."""
+        assert get_request_loaders() is not get_request_loaders()
+
+
+class TestServiceQueryCounts:
+    """서비스 쿼리 횟수 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_comment_page_loads_authors_once(self):
+        """댓글 50개(+답글) 페이지의 작성자 조회는 $in 쿼리 한 번이어야 함."""
+        from nadle_backend.services.comments_service import CommentsService
+
+        def comment(index, author_id):
+            return SimpleNamespace(
+                id=ObjectId(), author_id=author_id, content=f"댓글 {index}",
+                parent_comment_id=None, status="active", like_count=0, dislike_count=0,
+                reply_count=0, metadata={}, created_at=datetime.utcnow(), updated_at=datetime.utcnow()
+            )
+
+        items = [
+            {"comment": comment(i, USER_IDS[i % 3]), "replies": [
+                {"comment": comment(i, USER_IDS[(i + 1) % 3]), "replies": []}
+            ]}
+            for i in range(50)
+        ]
+        comment_repo = Mock()
+        comment_repo.get_comments_with_replies = AsyncMock(return_value=(items, 50))
+        post_repo = Mock()
+        post_repo.get_by_slug = AsyncMock(return_value=SimpleNamespace(id=ObjectId()))
+        service = CommentsService(comment_repo, post_repo)
+
+        with patch(f"{LOADER}.User") as MockUser, \
+             patch("nadle_backend.services.comments_service.CommentDetail", side_effect=lambda **kw: SimpleNamespace(**kw)):
+            MockUser.find = _find_returning([_user(user_id) for user_id in USER_IDS])
+            details, total = await service.get_comments_with_user_data("slug")
+
+        assert total == 50
+        assert len(details) == 50
+        MockUser.find.assert_called_once()
+        assert details[0].author.id == USER_IDS[0]
+        assert details[0].replies[0].author.id == USER_IDS[1]
+
+    @pytest.mark.asyncio
+    async def test_reaction_list_loads_posts_once(self):
+        """반응 목록의 대상 게시글은 $in 쿼리 한 번으로 조회해야 함."""
+        from nadle_backend.services.user_activity_service import UserActivityService
+
+        post_ids = [str(ObjectId()) for _ in range(10)]
+        reactions = [
+            SimpleNamespace(
+                id=ObjectId(), target_type="post", target_id=post_id, liked=True,
+                disliked=False, bookmarked=False, created_at=datetime.utcnow(), metadata={}
+            )
+            for post_id in post_ids
+        ]
+        posts = [
+            SimpleNamespace(id=ObjectId(post_id), status="published", slug=f"slug-{i}",
+                            title=f"제목 {i}", metadata=SimpleNamespace(type="board"))
+            for i, post_id in enumerate(post_ids[:-1])  # 마지막 게시글은 삭제됨
+        ]
+        reaction_repo = Mock()
+        reaction_repo.find_by_user_paginated = AsyncMock(return_value=reactions)
+        post_repo = Mock()
+        post_repo.get_by_id = AsyncMock()
+        service = UserActivityService(
+            post_repository=post_repo, comment_repository=Mock(), user_reaction_repository=reaction_repo
+        )
+
+        with patch(f"{LOADER}.Post") as MockPost:
+            MockPost.find = _find_returning(posts)
+            result = await service._get_user_reactions_grouped_paginated("user1", 10, 0)
+
+        MockPost.find.assert_called_once()
+        post_repo.get_by_id.assert_not_awaited()
+        assert len(result["reaction-likes"]["board"]) == 9
@@ -60,6 +60,7 @@ class TestIndexManager:
         mock_db = MagicMock()
         mock_collection = MagicMock()
         mock_collection.create_indexes = AsyncMock(return_value=["index1", "index2"])
+        mock_collection.index_information = AsyncMock(return_value={"_id_": {}})
         mock_db.__getitem__.return_value = mock_collection
         
         # Act
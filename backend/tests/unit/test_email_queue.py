@@ -0,0 +1,172 @@
+"""이메일 발송 대기열 테스트.
+
+## 🎯 테스트 목표
+API 요청이 SMTP 발송을 기다리지 않고 대기열에 넣은 뒤 바로 반환하며,
+백그라운드 워커가 재사용 SMTP 연결로 발송하고 실패 시 백오프 재시도하는지 검증
+
+## 📋 테스트 범위
+- 로컬 SMTP 싱크로 실제 SMTP 대화 발송 및 연결 재사용
+- 서버가 끊은 연결 재연결
+- 실패 재시도/최대 시도 후 포기, 대기열 가득 참 거절
+- 처리량/대기열 지표
+"""
+
+import asyncio
+import smtplib
+import pytest
+from unittest.mock import Mock
+from nadle_backend.config import get_settings
+from nadle_backend.services.email_queue import EmailDeliveryQueue, SMTPConnection
+
+
+class SMTPSink:
+    """테스트용 로컬 SMTP 서버 - 받은 메시지를 메모리에 저장"""
+
+    def __init__(self, close_after_message: bool = False):
+        self.messages = []
+        self.connections = 0
+        self.close_after_message = close_after_message
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        writer.write(b"220 sink ESMTP\r\n")
+        data, in_data = [], False
+        while line := await reader.readline():
+            if in_data:
+                if line == b".\r\n":
+                    self.messages.append(b"".join(data))
+                    data, in_data = [], False
+                    writer.write(b"250 OK\r\n")
+                    if self.close_after_message:
+                        break
+                else:
+                    data.append(line)
+                continue
+            command = line[:4].upper()
+            if command in (b"EHLO", b"HELO"):
+                writer.write(b"250 sink\r\n")
+            elif command == b"DATA":
+                in_data = True
+                writer.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+            elif command == b"QUIT":
+                writer.write(b"221 Bye\r\n")
+                break
+            else:
+                writer.write(b"250 OK\r\n")
+            await writer.drain()
+        await writer.drain()
+        writer.close()
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc):
+        self.server.close()
+        await self.server.wait_closed()
+
+    def connection_factory(self):
+        def factory():
+            connection = SMTPConnection()
+            connection.settings = get_settings().model_copy(update={
+                "smtp_server": "127.0.0.1", "smtp_port": self.port,
+                "smtp_use_tls": False, "smtp_username": "", "smtp_password": ""
+            })
+            return connection
+        return factory
+
+
+def _failing_connection(failures):
+    connection = Mock()
+    connection.connects = 0
+    connection.send.side_effect = [smtplib.SMTPException("temporary")] * failures + [None] * 5
+    return connection
+
+
+class TestDeliveryWithSink:
+    """로컬 SMTP 싱크 발송 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_messages_delivered_over_reused_connection(self):
+        """여러 메시지가 워커의 SMTP 연결 하나로 발송되어야 함."""
+        async with SMTPSink() as sink:
+            queue = EmailDeliveryQueue(workers=1, max_size=10, connection_factory=sink.connection_factory())
+            for i in range(5):
+                assert queue.enqueue(f"user{i}@example.com", f"제목 {i}", "<p>본문</p>") is True
+            await queue.drain()
+            stats = queue.stats()
+            await queue.stop()
+
+        assert len(sink.messages) == 5
+        assert sink.connections == 1
+        assert b"To: user0@example.com" in sink.messages[0]
+        assert stats["sent"] == 5
+        assert stats["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_reconnects_when_server_drops_connection(self):
+        """서버가 유휴 연결을 끊으면 재연결해서 발송해야 함."""
+        async with SMTPSink(close_after_message=True) as sink:
+            queue = EmailDeliveryQueue(workers=1, max_size=10, connection_factory=sink.connection_factory())
+            queue.enqueue("a@example.com", "첫 번째", "<p>1</p>")
+            await queue.drain()
+            queue.enqueue("b@example.com", "두 번째", "<p>2</p>")
+            await queue.drain()
+            await queue.stop()
+
+        assert len(sink.messages) == 2
+        assert sink.connections == 2
+
+
+class TestRetryAndBackpressure:
+    """재시도/거절 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_failed_send_retried_with_backoff(self):
+        """일시적 실패는 백오프 후 재시도되어 발송되어야 함."""
+        connection = _failing_connection(failures=2)
+        queue = EmailDeliveryQueue(workers=1, max_size=10, max_attempts=3, retry_backoff=0.01,
+                                   connection_factory=lambda: connection)
+
+        queue.enqueue("a@example.com", "제목", "<p>본문</p>")
+        await queue.drain()
+        stats = queue.stats()
+        await queue.stop()
+
+        assert connection.send.call_count == 3
+        assert stats["retried"] == 2
+        assert stats["sent"] == 1
+        assert stats["failed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        """최대 시도 횟수를 넘으면 실패로 기록하고 포기해야 함."""
+        connection = _failing_connection(failures=10)
+        queue = EmailDeliveryQueue(workers=1, max_size=10, max_attempts=2, retry_backoff=0.01,
+                                   connection_factory=lambda: connection)
+
+        queue.enqueue("a@example.com", "제목", "<p>본문</p>")
+        await queue.drain()
+        stats = queue.stats()
+        await queue.stop()
+
+        assert connection.send.call_count == 2
+        assert stats["failed"] == 1
+        assert stats["last_error"] == "temporary"
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects(self):
+        """대기열이 가득 차면 기다리지 않고 거절해야 함."""
+        queue = EmailDeliveryQueue(workers=1, max_size=1, connection_factory=lambda: _failing_connection(0))
+        queue.start()
+        queue._tasks[0].cancel()  # 워커가 소비하지 않도록 중지
+        await asyncio.sleep(0)
+        queue._tasks = [asyncio.create_task(asyncio.sleep(10))]
+
+        assert queue.enqueue("a@example.com", "제목", "<p>1</p>") is True
+        assert queue.enqueue("b@example.com", "제목", "<p>2</p>") is False
+        assert queue.stats()["rejected"] == 1
+        assert queue.stats()["queue_depth"] == 1
+
+        await queue.stop(timeout=0.01)
@@ -338,12 +338,10 @@ class TestEmailVerificationService:
     
     @pytest.mark.asyncio
     async def test_send_email_smtp_success(self, email_service):
-        """Test SMTP email sending success."""
-        # Mock SMTP
-        with patch('nadle_backend.services.email_verification_service.smtplib.SMTP') as mock_smtp_class:
-            mock_smtp = Mock()
-            mock_smtp_class.return_value.__enter__.return_value = mock_smtp
-            
+        """Test email is queued for background delivery."""
+        queue = Mock()
+        queue.enqueue.return_value = True
+        with patch('nadle_backend.services.email_verification_service.get_email_queue', new_callable=AsyncMock, return_value=queue):
             # Act
             result = await email_service._send_email_smtp(
                 to_email="test@example.com",
@@ -353,15 +351,14 @@ class TestEmailVerificationService:
             
             # Assert
             assert result is True
-            mock_smtp.send_message.assert_called_once()
+            queue.enqueue.assert_called_once_with("test@example.com", "Test Subject", "<html>Test</html>")
     
     @pytest.mark.asyncio
     async def test_send_email_smtp_failure(self, email_service):
-        """Test SMTP email sending failure."""
-        # Mock SMTP to raise exception
-        with patch('nadle_backend.services.email_verification_service.smtplib.SMTP') as mock_smtp_class:
-            mock_smtp_class.side_effect = Exception("SMTP connection failed")
-            
+        """Test email sending failure when the delivery queue is full."""
+        queue = Mock()
+        queue.enqueue.return_value = False
+        with patch('nadle_backend.services.email_verification_service.get_email_queue', new_callable=AsyncMock, return_value=queue):
             # Act
             result = await email_service._send_email_smtp(
                 to_email="test@example.com",
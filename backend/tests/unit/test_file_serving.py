@@ -0,0 +1,133 @@
+"""
+File Serving Unit Tests
+
+Tests for GET /api/files/{file_id} including:
+- Per-worker record cache (no database round trip on repeated fetches)
+- Strong ETag from the stored digest and immutable Cache-Control
+- If-None-Match -> 304, Range -> 206
+- Stale cached paths and optional X-Accel-Redirect offload
+"""
+
+import os
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from nadle_backend.repositories import file_repository
+from nadle_backend.routers.file_upload import etag_matches, router
+
+SHA256 = "ab" * 32
+DATA = bytes(range(256)) * 4
+REPOSITORY = "nadle_backend.repositories.file_repository"
+
+
+@pytest.fixture
+def stored_file(tmp_path):
+    path = tmp_path / "blob"
+    path.write_bytes(DATA)
+    return {
+        "file_id": "file-1", "file_path": str(path), "content_type": "image/png",
+        "file_size": len(DATA), "sha256": SHA256
+    }
+
+
+@pytest.fixture
+def client():
+    file_repository._record_cache.clear()
+    app = FastAPI()
+    app.include_router(router, prefix="/api/files")
+    yield TestClient(app)
+    file_repository._record_cache.clear()
+
+
+class TestFileServing:
+    """Test cases for cache-friendly file serving"""
+
+    def test_record_cached_and_immutable_headers(self, client, stored_file):
+        """Test repeated fetches hit the record cache and carry immutable caching headers"""
+        find = AsyncMock(return_value=stored_file)
+
+        with patch(f"{REPOSITORY}.find_file_by_id", find):
+            first = client.get("/api/files/file-1")
+            second = client.get("/api/files/file-1")
+
+        assert first.status_code == second.status_code == 200
+        assert first.content == DATA
+        assert first.headers["etag"] == f'"{SHA256}"'
+        assert first.headers["cache-control"] == "public, max-age=31536000, immutable"
+        assert first.headers["accept-ranges"] == "bytes"
+        find.assert_awaited_once_with("file-1")
+
+    @pytest.mark.parametrize("header", [f'"{SHA256}"', f'W/"{SHA256}"', f'"other", "{SHA256}"', "*"])
+    def test_if_none_match_returns_304(self, client, stored_file, header):
+        """Test matching If-None-Match returns 304 without a body"""
+        with patch(f"{REPOSITORY}.find_file_by_id", AsyncMock(return_value=stored_file)):
+            response = client.get("/api/files/file-1", headers={"If-None-Match": header})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == f'"{SHA256}"'
+
+    def test_range_request_returns_partial_content(self, client, stored_file):
+        """Test byte range requests are answered with 206"""
+        with patch(f"{REPOSITORY}.find_file_by_id", AsyncMock(return_value=stored_file)):
+            response = client.get("/api/files/file-1", headers={"Range": "bytes=10-19"})
+
+        assert response.status_code == 206
+        assert response.content == DATA[10:20]
+        assert response.headers["content-range"] == f"bytes 10-19/{len(DATA)}"
+
+    def test_record_without_digest_uses_file_id_etag(self, client, stored_file):
+        """Test records stored before hashing get an ETag from their immutable id"""
+        del stored_file["sha256"]
+
+        with patch(f"{REPOSITORY}.find_file_by_id", AsyncMock(return_value=stored_file)):
+            response = client.get("/api/files/file-1")
+
+        assert response.headers["etag"] == '"file-1"'
+
+    def test_stale_cached_path_reloaded(self, client, stored_file, tmp_path):
+        """Test a cached record whose file moved is reloaded from the database"""
+        moved = dict(stored_file, file_path=str(tmp_path / "moved"))
+        os.rename(stored_file["file_path"], moved["file_path"])
+        file_repository._record_cache.set("file-1", stored_file)
+        find = AsyncMock(return_value=moved)
+
+        with patch(f"{REPOSITORY}.find_file_by_id", find), \
+             patch("nadle_backend.routers.file_upload.find_file_by_id", find):
+            response = client.get("/api/files/file-1")
+
+        assert response.status_code == 200
+        assert response.content == DATA
+
+    def test_missing_record_not_cached(self, client):
+        """Test unknown ids return 404 and are looked up again next time"""
+        find = AsyncMock(return_value=None)
+
+        with patch(f"{REPOSITORY}.find_file_by_id", find):
+            assert client.get("/api/files/missing").status_code == 404
+            assert client.get("/api/files/missing").status_code == 404
+
+        assert find.await_count == 2
+
+    def test_accel_redirect_offload(self, client, stored_file):
+        """Test configured prefix hands the body to nginx via X-Accel-Redirect"""
+        stored_file["file_path"] = os.path.join("uploads", "blobs", "ab", "ab", SHA256)
+
+        with patch(f"{REPOSITORY}.find_file_by_id", AsyncMock(return_value=stored_file)), \
+             patch("nadle_backend.routers.file_upload._stat_served_file",
+                   AsyncMock(return_value=(stored_file, os.stat(__file__)))), \
+             patch("nadle_backend.routers.file_upload.settings.file_accel_redirect_prefix", "/_uploads/"):
+            response = client.get("/api/files/file-1")
+
+        assert response.status_code == 200
+        assert response.content == b""
+        assert response.headers["x-accel-redirect"] == f"/_uploads/blobs/ab/ab/{SHA256}"
+        assert response.headers["etag"] == f'"{SHA256}"'
+
+
+def test_etag_matches():
+    """Test If-None-Match parsing"""
+    assert etag_matches('"a", W/"b"', '"b"') is True
+    assert etag_matches('"a"', '"b"') is False
+    assert etag_matches(None, '"b"') is False
@@ -0,0 +1,158 @@
+"""
+File Upload Streaming Unit Tests
+
+Tests for chunked upload streaming including:
+- Magic-byte detection for allowed image formats
+- Chunked writes with SHA-256 digest and atomic rename
+- Size limit enforced while streaming (no partial files left behind)
+- Upload endpoint using the streamed size and digest
+- Oversized request bodies rejected from Content-Length before form parsing
+"""
+
+import hashlib
+import io
+import os
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from nadle_backend.routers.file_upload import router
+from nadle_backend.services.file_storage import (
+    FileSignatureError,
+    FileTooLargeError,
+    stream_upload_to_disk
+)
+from nadle_backend.services.file_validator import detect_image_type, validate_file_signature
+
+PNG_HEADER = b"\x89PNG\r\n\x1a\n" + b"\x00" * 8
+JPEG_HEADER = b"\xff\xd8\xff\xe0" + b"\x00" * 8
+
+
+class FakeUpload:
+    """Async reader that records requested chunk sizes"""
+
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+        self.requested = []
+
+    async def read(self, size: int = -1) -> bytes:
+        self.requested.append(size)
+        return self._buffer.read(size)
+
+
+class TestSignatureDetection:
+    """Test cases for magic-byte detection"""
+
+    def test_detect_image_type(self):
+        """Test detection of each allowed image format"""
+        assert detect_image_type(JPEG_HEADER) == "image/jpeg"
+        assert detect_image_type(PNG_HEADER) == "image/png"
+        assert detect_image_type(b"GIF89a" + b"\x00" * 6) == "image/gif"
+        assert detect_image_type(b"RIFF\x00\x00\x00\x00WEBP") == "image/webp"
+        assert detect_image_type(b"<html><body>") is None
+
+    def test_validate_file_signature(self):
+        """Test declared type must match content (image/jpg treated as image/jpeg)"""
+        assert validate_file_signature(JPEG_HEADER, "image/jpg") is True
+        assert validate_file_signature(PNG_HEADER, "image/jpeg") is False
+
+
+class TestStreamUploadToDisk:
+    """Test cases for stream_upload_to_disk"""
+
+    @pytest.mark.asyncio
+    async def test_streams_in_chunks_with_digest(self, tmp_path):
+        """Test upload is written chunk by chunk and hashed in the same pass"""
+        data = PNG_HEADER + os.urandom(10_000)
+        upload = FakeUpload(data)
+        target = tmp_path / "2025" / "06" / "image.png"
+
+        stored = await stream_upload_to_disk(upload, str(target), expected_type="image/png", chunk_size=1024)
+
+        assert target.read_bytes() == data
+        assert stored.size == len(data)
+        assert stored.sha256 == hashlib.sha256(data).hexdigest()
+        assert set(upload.requested) == {1024}
+        assert os.listdir(target.parent) == ["image.png"]
+
+    @pytest.mark.asyncio
+    async def test_size_limit_enforced_while_streaming(self, tmp_path):
+        """Test oversized upload stops reading and leaves no file behind"""
+        upload = FakeUpload(PNG_HEADER + b"\x00" * 10_000)
+        target = tmp_path / "image.png"
+
+        with pytest.raises(FileTooLargeError):
+            await stream_upload_to_disk(upload, str(target), max_size=4096, chunk_size=1024)
+
+        assert len(upload.requested) == 4
+        assert os.listdir(tmp_path) == []
+
+    @pytest.mark.asyncio
+    async def test_signature_mismatch_rejected(self, tmp_path):
+        """Test content that does not match the declared type is rejected on the first chunk"""
+        upload = FakeUpload(b"<script>alert(1)</script>" * 100)
+        target = tmp_path / "image.jpg"
+
+        with pytest.raises(FileSignatureError):
+            await stream_upload_to_disk(upload, str(target), expected_type="image/jpeg", chunk_size=1024)
+
+        assert len(upload.requested) == 1
+        assert os.listdir(tmp_path) == []
+
+
+class TestUploadEndpoint:
+    """Test cases for the streaming upload endpoint"""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        app = FastAPI()
+        app.include_router(router, prefix="/api/files")
+        with patch("nadle_backend.services.blob_store.find_blob", AsyncMock(return_value=None)), \
+             patch("nadle_backend.services.blob_store.acquire_blob", AsyncMock()), \
+             patch("nadle_backend.routers.file_upload.generate_variants", AsyncMock()):
+            yield TestClient(app)
+
+    def test_upload_stores_streamed_size_and_digest(self, client, tmp_path):
+        """Test record uses the streamed size and SHA-256"""
+        data = JPEG_HEADER + b"\x01" * 5000
+        save_record = AsyncMock(return_value=True)
+
+        with patch("nadle_backend.routers.file_upload.save_file_record", save_record):
+            response = client.post("/api/files/upload", files={"file": ("photo.jpg", data, "image/jpeg")})
+
+        assert response.status_code == 200
+        assert response.json()["file_size"] == len(data)
+        document = save_record.call_args.args[0]
+        assert document["sha256"] == hashlib.sha256(data).hexdigest()
+        assert (tmp_path / document["file_path"]).read_bytes() == data
+
+    def test_fake_image_rejected(self, client, tmp_path):
+        """Test non-image content with an image type returns 400 and stores nothing"""
+        save_record = AsyncMock(return_value=True)
+
+        with patch("nadle_backend.routers.file_upload.save_file_record", save_record):
+            response = client.post("/api/files/upload", files={"file": ("x.png", b"not an image", "image/png")})
+
+        assert response.status_code == 400
+        save_record.assert_not_awaited()
+        assert [files for _, _, files in os.walk(tmp_path) if files] == []
+
+    def test_oversized_content_length_rejected_before_parsing(self, client):
+        """Test a body larger than the limit is rejected from Content-Length with 413"""
+        save_record = AsyncMock(return_value=True)
+
+        with patch("nadle_backend.routers.file_upload.save_file_record", save_record), \
+             patch("nadle_backend.routers.file_upload.store_upload", AsyncMock()) as store:
+            response = client.post(
+                "/api/files/upload",
+                content=b"x" * 16,
+                headers={
+                    "content-type": "multipart/form-data; boundary=x",
+                    "content-length": str(6 * 1024 * 1024)
+                }
+            )
+
+        assert response.status_code == 413
+        store.assert_not_awaited()
+        save_record.assert_not_awaited()
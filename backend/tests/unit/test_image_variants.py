@@ -0,0 +1,234 @@
+"""
+Image Variants Unit Tests
+
+Tests for resized image variants including:
+- Width snapping and output format selection
+- Resizing without upscaling, EXIF orientation applied and metadata stripped
+- Single-flight creation of missing variants
+- Variants created after upload and served through GET /api/files/{file_id}?w=
+"""
+
+import asyncio
+import io
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from PIL import Image
+from nadle_backend.repositories import file_repository
+from nadle_backend.routers.file_upload import router
+from nadle_backend.services import image_variants
+from nadle_backend.services.image_variants import (
+    ImageVariantPool,
+    generate_variants,
+    get_variant,
+    render_variant,
+    select_variant_format,
+    select_variant_width
+)
+
+SHA256 = "cd" * 32
+SERVICE = "nadle_backend.services.image_variants"
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Thread executor that counts submitted jobs"""
+
+    submitted = 0
+
+    def submit(self, fn, *args, **kwargs):
+        CountingExecutor.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+def _write_image(path, size=(2000, 1000), mode="RGB", orientation=None):
+    image = Image.new(mode, size, "red")
+    exif = Image.Exif()
+    exif[0x010F] = "Camera Maker"
+    if orientation:
+        exif[0x0112] = orientation
+    image.save(path, format="JPEG" if mode == "RGB" else "PNG", exif=exif.tobytes())
+    return str(path)
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    CountingExecutor.submitted = 0
+    pool = ImageVariantPool(max_workers=2, executor_factory=CountingExecutor)
+    monkeypatch.setattr(image_variants, "variant_pool", pool)
+    yield pool
+    pool.shutdown()
+
+
+class TestVariantSelection:
+    """Test cases for width and format selection"""
+
+    def test_select_variant_width(self):
+        """Test requested widths snap to the smallest configured width covering them"""
+        widths = [160, 320, 640]
+        assert select_variant_width(1, widths) == 160
+        assert select_variant_width(161, widths) == 320
+        assert select_variant_width(640, widths) == 640
+        assert select_variant_width(5000, widths) == 640
+
+    def test_select_variant_format(self):
+        """Test WebP only for clients that accept it"""
+        assert select_variant_format("image/avif,image/webp,*/*") == "webp"
+        assert select_variant_format("*/*") == "jpeg"
+        assert select_variant_format(None) == "jpeg"
+
+
+class TestRenderVariant:
+    """Test cases for render_variant"""
+
+    def test_resized_with_orientation_and_no_exif(self, tmp_path):
+        """Test EXIF rotation is applied before the metadata is dropped"""
+        source = _write_image(tmp_path / "photo.jpg", orientation=6)
+        dest = str(tmp_path / "out" / "photo_320.webp")
+
+        info = render_variant(source, dest, 320, "webp", 80)
+
+        with Image.open(dest) as variant:
+            assert variant.format == "WEBP"
+            assert variant.size == (320, 640)
+            assert len(variant.getexif()) == 0
+        assert info["width"] == 320 and info["height"] == 640
+        assert info["content_type"] == "image/webp"
+        assert info["file_size"] < (tmp_path / "photo.jpg").stat().st_size
+
+    def test_small_image_not_upscaled(self, tmp_path):
+        """Test images narrower than the variant keep their size"""
+        source = _write_image(tmp_path / "small.png", size=(100, 50), mode="RGBA")
+        dest = str(tmp_path / "small_320.jpeg")
+
+        info = render_variant(source, dest, 320, "jpeg", 80)
+
+        with Image.open(dest) as variant:
+            assert variant.format == "JPEG"
+            assert variant.mode == "RGB"
+        assert (info["width"], info["height"]) == (100, 50)
+
+    def test_existing_variant_reused(self, tmp_path):
+        """Test an existing variant file is not rendered again"""
+        source = _write_image(tmp_path / "photo.jpg")
+        dest = str(tmp_path / "photo_160.webp")
+        render_variant(source, dest, 160, "webp", 80)
+        (tmp_path / "photo.jpg").unlink()
+
+        assert render_variant(source, dest, 160, "webp", 80)["width"] == 160
+
+
+class TestVariantCreation:
+    """Test cases for lazy and post-upload variant creation"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_job(self, pool, tmp_path):
+        """Test concurrent requests for a missing variant render it once"""
+        record = {"file_id": "file-1", "file_path": _write_image(tmp_path / "photo.jpg"), "sha256": SHA256}
+
+        with patch(f"{SERVICE}.record_file_variants", AsyncMock(return_value=True)) as record_variants:
+            results = await asyncio.gather(*(get_variant(record, 320, "webp") for _ in range(5)))
+
+        assert CountingExecutor.submitted == 1
+        assert all(result["file_path"] == results[0]["file_path"] for result in results)
+        assert SHA256 in results[0]["file_path"]
+        record_variants.assert_awaited_with("file-1", {"webp_320": results[0]})
+
+    @pytest.mark.asyncio
+    async def test_unreadable_original_returns_none(self, pool, tmp_path):
+        """Test originals that cannot be decoded are reported as not resizable"""
+        (tmp_path / "broken.jpg").write_bytes(b"\xff\xd8\xff\xe0 not really a jpeg")
+        record = {"file_id": "file-1", "file_path": str(tmp_path / "broken.jpg"), "sha256": SHA256}
+
+        with patch(f"{SERVICE}.record_file_variants", AsyncMock()) as record_variants:
+            assert await get_variant(record, 320, "webp") is None
+
+        record_variants.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_generate_variants_records_all_widths(self, pool, tmp_path):
+        """Test post-upload generation creates every configured width in one update"""
+        source = _write_image(tmp_path / "photo.jpg")
+
+        with patch(f"{SERVICE}.record_file_variants", AsyncMock(return_value=True)) as record_variants, \
+             patch(f"{SERVICE}.get_settings") as get_settings:
+            get_settings.return_value.image_variant_widths = [640, 160]
+            get_settings.return_value.image_variant_quality = 80
+            variants = await generate_variants("file-1", source, SHA256)
+
+        assert {key: info["width"] for key, info in variants.items()} == {"webp_160": 160, "webp_640": 640}
+        record_variants.assert_awaited_once_with("file-1", variants)
+
+
+class TestVariantEndpoint:
+    """Test cases for GET /api/files/{file_id}?w="""
+
+    @pytest.fixture
+    def client(self, pool):
+        file_repository._record_cache.clear()
+        app = FastAPI()
+        app.include_router(router, prefix="/api/files")
+        yield TestClient(app)
+        file_repository._record_cache.clear()
+
+    @pytest.fixture
+    def stored_image(self, tmp_path):
+        return {
+            "file_id": "file-1", "file_path": _write_image(tmp_path / "photo.jpg"),
+            "content_type": "image/jpeg", "file_size": 1, "sha256": SHA256
+        }
+
+    def test_variant_served_and_revalidated(self, client, stored_image):
+        """Test ?w= serves a cached WebP variant and answers revalidation with 304"""
+        with patch("nadle_backend.repositories.file_repository.find_file_by_id", AsyncMock(return_value=stored_image)), \
+             patch(f"{SERVICE}.record_file_variants", AsyncMock(return_value=True)):
+            response = client.get("/api/files/file-1?w=300", headers={"Accept": "image/webp,*/*"})
+            not_modified = client.get(
+                "/api/files/file-1?w=300",
+                headers={"Accept": "image/webp,*/*", "If-None-Match": response.headers["etag"]}
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/webp"
+        assert response.headers["etag"] == f'"{SHA256}-webp_320"'
+        assert response.headers["vary"] == "Accept"
+        assert Image.open(io.BytesIO(response.content)).size == (320, 160)
+        assert not_modified.status_code == 304
+        assert CountingExecutor.submitted == 1
+
+    def test_jpeg_variant_for_clients_without_webp(self, client, stored_image):
+        """Test clients that do not accept WebP get a JPEG variant"""
+        with patch("nadle_backend.repositories.file_repository.find_file_by_id", AsyncMock(return_value=stored_image)), \
+             patch(f"{SERVICE}.record_file_variants", AsyncMock(return_value=True)):
+            response = client.get("/api/files/file-1?w=160", headers={"Accept": "*/*"})
+
+        assert response.headers["content-type"] == "image/jpeg"
+        assert response.headers["etag"] == f'"{SHA256}-jpeg_160"'
+
+    def test_original_served_when_not_resizable(self, client, stored_image, tmp_path):
+        """Test the original is served if a variant cannot be created"""
+        (tmp_path / "photo.jpg").write_bytes(b"\xff\xd8\xff\xe0 not really a jpeg")
+
+        with patch("nadle_backend.repositories.file_repository.find_file_by_id", AsyncMock(return_value=stored_image)):
+            response = client.get("/api/files/file-1?w=160")
+
+        assert response.status_code == 200
+        assert response.headers["etag"] == f'"{SHA256}"'
+        assert response.content == (tmp_path / "photo.jpg").read_bytes()
+
+    def test_upload_schedules_variants(self, client):
+        """Test upload queues variant generation for after the response"""
+        data = io.BytesIO()
+        Image.new("RGB", (20, 10)).save(data, format="PNG")
+
+        with patch("nadle_backend.services.blob_store.find_blob", AsyncMock(return_value=None)), \
+             patch("nadle_backend.services.blob_store.acquire_blob", AsyncMock()), \
+             patch("nadle_backend.routers.file_upload.save_file_record", AsyncMock(return_value=True)), \
+             patch("nadle_backend.routers.file_upload.generate_variants", AsyncMock()) as generate:
+            response = client.post("/api/files/upload", files={"file": ("x.png", data.getvalue(), "image/png")})
+
+        assert response.status_code == 200
+        generate.assert_awaited_once()
+        assert generate.call_args.args[0] == response.json()["file_id"]
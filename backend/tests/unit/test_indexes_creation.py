@@ -156,7 +156,7 @@ class TestIndexesCreation:
                 assert "user_text_search_idx" in index_names
             elif collection_name == "posts":
                 assert "slug_unique_idx" in index_names
-                assert "post_text_search_idx" in index_names
+                assert "post_search_terms_idx" in index_names
     
     @pytest.mark.asyncio
     async def test_drop_all_indexes(self, db_connection):
@@ -193,14 +193,14 @@ class TestIndexesCreation:
         
         # Check posts text index
         posts_indexes = await IndexManager.get_index_info(db_connection, "posts")
-        text_index = next(idx for idx in posts_indexes if idx["name"] == "post_text_search_idx")
+        text_index = next(idx for idx in posts_indexes if idx["name"] == "post_search_terms_idx")
         
         # Verify weights are set correctly
         assert "weights" in text_index
         weights = text_index["weights"]
-        assert weights.get("title") == 10
-        assert weights.get("tags") == 5
-        assert weights.get("content") == 3
+        assert weights.get("search_terms.title") == 10
+        assert weights.get("search_terms.tags") == 5
+        assert weights.get("search_terms.body") == 3
     
     @pytest.mark.asyncio
     async def test_partial_index_filter(self, db_connection):
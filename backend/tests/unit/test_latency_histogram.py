@@ -0,0 +1,96 @@
+"""병합 가능 응답시간 히스토그램 테스트.
+
+## 🎯 테스트 목표
+로그 버킷 히스토그램이 고정 메모리로 정확한 분위수를 계산하고 병합 가능한지 검증
+
+## 📋 테스트 범위
+- 분위수 상대 오차 (정확한 분위수 대비 1% 이내)
+- 병합 결과와 전체 샘플로 만든 히스토그램의 일치
+- 버킷 수 제한 (낮은 버킷 병합)
+- Redis 해시 필드 변환 및 HINCRBY 누적 병합
+"""
+
+import random
+import pytest
+from nadle_backend.monitoring.latency_histogram import LatencyHistogram
+
+
+def _exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestLatencyHistogram:
+    """LatencyHistogram 테스트."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """p50/p95/p99는 정확한 값과 상대 오차 1% 이내여야 함."""
+        rng = random.Random(42)
+        values = [rng.lognormvariate(-3, 1) for _ in range(20000)]
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.add(value)
+
+        for q in (0.5, 0.95, 0.99):
+            assert histogram.quantile(q) == pytest.approx(_exact_quantile(values, q), rel=0.01)
+        assert histogram.mean == pytest.approx(sum(values) / len(values))
+        assert len(histogram.buckets) < 1000
+
+    def test_merge_equals_single_histogram(self):
+        """워커별 히스토그램을 병합하면 전체를 한 번에 기록한 것과 같아야 함."""
+        rng = random.Random(7)
+        values = [rng.uniform(0.001, 2.0) for _ in range(3000)]
+        whole = LatencyHistogram()
+        parts = [LatencyHistogram() for _ in range(3)]
+        for i, value in enumerate(values):
+            whole.add(value)
+            parts[i % 3].add(value)
+
+        merged = LatencyHistogram.merged(parts)
+
+        assert merged.buckets == whole.buckets
+        assert merged.count == whole.count
+        assert merged.quantile(0.99) == whole.quantile(0.99)
+
+    def test_merge_rejects_different_accuracy(self):
+        """상대 오차가 다른 히스토그램은 병합할 수 없어야 함."""
+        with pytest.raises(ValueError):
+            LatencyHistogram(0.01).merge(LatencyHistogram(0.02))
+
+    def test_bucket_count_is_bounded(self):
+        """버킷 수가 최대치를 넘으면 낮은 버킷을 합쳐 상위 분위수를 유지해야 함."""
+        histogram = LatencyHistogram(max_buckets=50)
+        for exponent in range(-60, 20):
+            histogram.add(1.1 ** exponent)
+
+        assert len(histogram.buckets) == 50
+        assert histogram.count == 80
+        assert histogram.max == pytest.approx(1.1 ** 19, rel=0.01)
+
+    def test_redis_fields_accumulate(self):
+        """HINCRBY로 누적한 필드를 복원하면 병합된 히스토그램이어야 함."""
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.add(0.1)
+        second.add(0.1)
+        second.add(0.5)
+
+        # HINCRBY/HINCRBYFLOAT 누적 흉내 (Redis는 bytes로 반환할 수 있음)
+        stored = {}
+        for histogram in (first, second):
+            for field, count in histogram.to_fields().items():
+                stored[field] = stored.get(field, 0) + count
+            stored["sum"] = stored.get("sum", 0) + histogram.sum
+        raw = {key.encode(): str(value).encode() for key, value in stored.items()}
+
+        restored = LatencyHistogram.from_fields(raw)
+
+        assert restored.count == 3
+        assert restored.sum == pytest.approx(0.7)
+        assert restored.quantile(1.0) == pytest.approx(0.5, rel=0.01)
+
+    def test_empty_summary(self):
+        """비어 있는 히스토그램의 요약은 0이어야 함."""
+        summary = LatencyHistogram().summary()
+
+        assert summary["request_count"] == 0
+        assert summary["p99_response_time"] == 0.0
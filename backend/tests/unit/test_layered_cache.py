@@ -0,0 +1,283 @@
+"""2단 캐시(로컬 LRU/TTL + Redis) 테스트.
+
+## 🎯 테스트 목표
+Redis 왕복 없이 로컬 캐시로 응답하고, 동시 미스를 합치며, 워커 간 무효화가 동작하는지 검증
+
+## 📋 테스트 범위
+- LocalCache LRU 축출 및 TTL 만료
+- 로컬 → Redis 조회 순서, 저장 성공 시에만 로컬 저장
+- 무효화 전파 및 수신 (자기 메시지 무시, 조회 중 무효화 경합)
+- single_flight 동시 미스 합치기 및 예외 공유
+- PostsService.get_post 캐시 미스 합치기 및 수정 시 게시글 태그 무효화
+"""
+
+import asyncio
+import json
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, AsyncMock, patch
+from nadle_backend.database.cache_tags import INVALIDATE_TAGS_SCRIPT, tag_key
+from nadle_backend.database.layered_cache import LocalCache, LayeredCacheManager
+from nadle_backend.services.posts_service import PostsService
+
+
+@pytest.fixture
+def remote():
+    manager = Mock()
+    manager.get = AsyncMock(return_value=None)
+    manager.set = AsyncMock(return_value=True)
+    manager.delete = AsyncMock(return_value=True)
+    manager.delete_many = AsyncMock(side_effect=lambda keys: len(keys))
+    manager.publish = AsyncMock(return_value=1)
+    manager.eval_script = AsyncMock(return_value=[])
+    manager.health_check = AsyncMock(return_value={"status": "connected"})
+    return manager
+
+
+@pytest.fixture
+def cache(remote):
+    layered = LayeredCacheManager(max_entries=10, local_ttl=30)
+    with patch("nadle_backend.database.redis_factory.get_redis_manager", AsyncMock(return_value=remote)):
+        yield layered
+
+
+class TestLocalCache:
+    """LocalCache 테스트."""
+
+    def test_lru_eviction(self):
+        """최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목을 축출해야 함."""
+        local = LocalCache(max_entries=2, ttl=30)
+        local.set("a", 1)
+        local.set("b", 2)
+        local.get("a")
+        local.set("c", 3)
+
+        assert local.get("a") == (True, 1)
+        assert local.get("b") == (False, None)
+        assert local.evictions == 1
+
+    def test_ttl_expiry_and_cap(self):
+        """항목 TTL은 로컬 TTL을 넘지 않으며 만료 후에는 미스여야 함."""
+        local = LocalCache(max_entries=10, ttl=30)
+
+        with patch("nadle_backend.database.layered_cache.time.monotonic", return_value=100.0):
+            local.set("a", 1, ttl=600)
+            local.set("b", 2, ttl=5)
+        with patch("nadle_backend.database.layered_cache.time.monotonic", return_value=110.0):
+            assert local.get("a") == (True, 1)
+            assert local.get("b") == (False, None)
+        with patch("nadle_backend.database.layered_cache.time.monotonic", return_value=131.0):
+            assert local.get("a") == (False, None)
+
+    def test_disabled_when_zero_entries(self):
+        """최대 항목 수가 0이면 저장하지 않아야 함."""
+        local = LocalCache(max_entries=0, ttl=30)
+        local.set("a", 1)
+        assert len(local) == 0
+
+
+class TestLayeredCacheManager:
+    """LayeredCacheManager 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_remote_hit_populates_local(self, cache, remote):
+        """Redis 적중 값은 로컬에 저장되어 다음 조회는 Redis를 거치지 않아야 함."""
+        remote.get.return_value = {"title": "제목"}
+
+        assert await cache.get("k") == {"title": "제목"}
+        assert await cache.get("k") == {"title": "제목"}
+
+        assert remote.get.await_count == 1
+        stats = cache.stats()
+        assert (stats["local_hits"], stats["local_misses"], stats["remote_hits"]) == (1, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_set_stores_locally_only_when_remote_succeeds(self, cache, remote):
+        """Redis 저장이 실패하면 로컬에도 저장하지 않아야 함."""
+        remote.set.return_value = False
+        assert await cache.set("k", {"a": 1}) is False
+        assert cache.local.get("k") == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_set_normalizes_like_redis(self, cache, remote):
+        """로컬 값은 Redis 왕복과 같은 JSON 형태여야 함."""
+        created = datetime(2024, 1, 1, 12, 0)
+        await cache.set("k", {"created_at": created}, ttl=60)
+
+        assert await cache.get("k") == {"created_at": str(created)}
+        remote.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_broadcasts_invalidation(self, cache, remote):
+        """삭제 시 로컬/Redis에서 지우고 다른 워커에 전파해야 함."""
+        await cache.set("k", {"a": 1})
+
+        assert await cache.delete("k") is True
+        assert cache.local.get("k") == (False, None)
+        remote.delete_many.assert_awaited_once_with(("k",))
+        channel, message = remote.publish.call_args[0]
+        assert channel.endswith("cache:invalidate")
+        assert json.loads(message) == {"origin": cache.instance_id, "keys": ["k"]}
+
+    @pytest.mark.asyncio
+    async def test_handle_invalidation_from_other_worker(self, cache):
+        """다른 워커의 무효화는 반영하고 자기 메시지는 무시해야 함."""
+        cache.local.set("a", 1)
+        cache.local.set("b", 2)
+
+        cache.handle_invalidation(json.dumps({"origin": cache.instance_id, "keys": ["a"]}))
+        cache.handle_invalidation(json.dumps({"origin": "other", "keys": ["b"]}))
+        cache.handle_invalidation("not json")
+
+        assert cache.local.get("a") == (True, 1)
+        assert cache.local.get("b") == (False, None)
+        assert cache.stats()["invalidations_received"] == 1
+
+    @pytest.mark.asyncio
+    async def test_listener_clears_local_only_after_disconnect(self, cache, remote):
+        """구독이 유지되는 동안은 로컬 캐시를 유지하고, 연결이 끊긴 뒤에만 비워야 함."""
+        subscribed = asyncio.Event()
+        disconnect = asyncio.Event()
+
+        async def subscribe(channel):
+            subscribed.set()
+            yield json.dumps({"origin": "other", "keys": ["a"]})
+            await disconnect.wait()
+            raise ConnectionError("closed")
+
+        remote.subscribe = subscribe
+        cache.local.set("b", 2)
+        listener = asyncio.create_task(cache._listen())
+        await subscribed.wait()
+        await asyncio.sleep(0)
+
+        assert cache.local.get("b") == (True, 2)
+
+        disconnect.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert cache.local.get("b") == (False, None)
+
+        listener.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await listener
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_remote_get_skips_local_fill(self, cache, remote):
+        """Redis 조회 중 무효화가 도착하면 조회한 값을 로컬에 저장하지 않아야 함."""
+        async def slow_get(key):
+            cache.handle_invalidation(json.dumps({"origin": "other", "keys": [key]}))
+            return {"stale": True}
+
+        remote.get.side_effect = slow_get
+
+        assert await cache.get("k") == {"stale": True}
+        assert cache.local.get("k") == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_single_flight_coalesces(self, cache):
+        """같은 키의 동시 로드는 한 번만 실행되어야 함."""
+        calls = 0
+        release = asyncio.Event()
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "value"
+
+        tasks = [asyncio.create_task(cache.single_flight("k", loader)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == ["value"] * 5
+        assert calls == 1
+        assert cache.stats()["coalesced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_single_flight_shares_exception(self, cache):
+        """로드 실패는 대기 중인 모든 호출에 전달되고 이후 호출은 다시 로드해야 함."""
+        release = asyncio.Event()
+
+        async def failing():
+            await release.wait()
+            raise ValueError("not found")
+
+        tasks = [asyncio.create_task(cache.single_flight("k", failing)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert await cache.single_flight("k", AsyncMock(return_value=1)) == 1
+
+    @pytest.mark.asyncio
+    async def test_health_check_includes_tier_stats(self, cache):
+        """상태 정보에 로컬 계층 통계가 포함되어야 함."""
+        health = await cache.health_check()
+        assert health["status"] == "connected"
+        assert "local_hit_rate" in health["local_tier"]
+
+
+class TestPostsServiceLayeredCache:
+    """PostsService 2단 캐시 사용 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_query_db_once(self, cache):
+        """같은 게시글의 동시 캐시 미스는 DB를 한 번만 조회해야 함."""
+        post = Mock()
+        post.id = "507f1f77bcf86cd799439011"
+        post.slug = "hot-post"
+        post.view_count = 3
+        post.model_dump.return_value = {"id": post.id, "slug": "hot-post", "view_count": 3}
+        release = asyncio.Event()
+
+        async def get_by_slug(slug):
+            await release.wait()
+            return post
+
+        post_repository = Mock()
+        post_repository.get_by_slug = AsyncMock(side_effect=get_by_slug)
+        post_repository.increment_view_count = AsyncMock()
+        service = PostsService(post_repository=post_repository)
+
+        with patch("nadle_backend.services.posts_service.get_layered_cache", AsyncMock(return_value=cache)), \
+             patch("nadle_backend.services.posts_service.Post", side_effect=lambda **data: Mock(**data)):
+            tasks = [asyncio.create_task(service.get_post("hot-post")) for _ in range(3)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks)
+
+        post_repository.get_by_slug.assert_awaited_once_with("hot-post")
+        assert results[0] is post
+        assert [result.view_count for result in results] == [4, 4, 4]
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_post_tag(self, cache, remote):
+        """게시글 수정 시 게시글 태그에 등록된 slug/ID 상세 캐시와 댓글 캐시를 무효화해야 함."""
+        post = Mock()
+        post.id = "507f1f77bcf86cd799439011"
+        post.slug = "post-slug"
+        post.author_id = "user1"
+        post_repository = Mock()
+        post_repository.get_by_slug = AsyncMock(return_value=post)
+        post_repository.update = AsyncMock(return_value=post)
+        service = PostsService(post_repository=post_repository)
+        user = Mock(id="user1", is_admin=False)
+        tagged = [
+            service._get_post_detail_key("post-slug"),
+            service._get_post_detail_key(post.id),
+            service._get_comments_batch_key("post-slug")
+        ]
+        remote.eval_script = AsyncMock(return_value=tagged)
+
+        with patch("nadle_backend.services.posts_service.get_layered_cache", AsyncMock(return_value=cache)), \
+             patch("nadle_backend.services.posts_service.check_post_permission", return_value=True):
+            await service.update_post("post-slug", Mock(), user)
+
+        remote.eval_script.assert_awaited_once_with(
+            INVALIDATE_TAGS_SCRIPT, [tag_key(f"post:{post.id}")], []
+        )
+        remote.delete_many.assert_not_awaited()
+        remote.publish.assert_awaited_once()
+        assert json.loads(remote.publish.await_args.args[1])["keys"] == tagged
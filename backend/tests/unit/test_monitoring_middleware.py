@@ -7,7 +7,17 @@ import pytest
 from unittest.mock import Mock, patch, AsyncMock
 import asyncio
 import time
-from fastapi import Request, Response
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+
+def _mock_redis():
+    """파이프라인을 지원하는 Redis 모킹 (파이프라인 명령은 동기 큐잉, execute만 비동기)"""
+    mock_redis = AsyncMock()
+    pipe = Mock()
+    pipe.execute = AsyncMock(return_value=[])
+    mock_redis.pipeline = Mock(return_value=pipe)
+    return mock_redis, pipe
 
 
 class TestMonitoringMiddleware:
@@ -33,7 +43,7 @@ class TestMonitoringMiddleware:
         from nadle_backend.middleware.monitoring import PerformanceTracker
         
         # Given: 모킹된 Redis와 요청
-        mock_redis = AsyncMock()
+        mock_redis, pipe = _mock_redis()
         tracker = PerformanceTracker(redis_client=mock_redis)
         
         mock_request = Mock()
@@ -45,14 +55,22 @@ class TestMonitoringMiddleware:
         await asyncio.sleep(0.1)  # 100ms 시뮬레이션
         await tracker.end_tracking(tracking_data, 200)
         
-        # Then: Redis에 성능 데이터 저장됨
-        mock_redis.hincrby.assert_called()
-        mock_redis.lpush.assert_called()
-        
-        # 응답시간이 기록되었는지 확인
-        call_args = mock_redis.lpush.call_args[0]
-        assert "response_time" in str(call_args)
-        assert "GET:/api/posts" in str(call_args)
+        # Then: 요청 경로에서는 Redis를 호출하지 않음
+        mock_redis.pipeline.assert_not_called()
+        mock_redis.hincrby.assert_not_called()
+        
+        # flush 시 파이프라인으로 성능 데이터 저장됨
+        assert await tracker.flush() == 1
+        pipe.hincrby.assert_called()
+        pipe.execute.assert_awaited_once()
+        
+        # 응답시간이 라우트별 히스토그램으로 기록되었는지 확인
+        latency_calls = [call[0] for call in pipe.hincrby.call_args_list
+                         if call[0][0].startswith("api:latency:GET:/api/posts:")]
+        assert ("count", 1) in [call[1:] for call in latency_calls]
+        key, field, total = pipe.hincrbyfloat.call_args[0]
+        assert field == "sum"
+        assert total >= 0.1
 
     @pytest.mark.asyncio
     async def test_endpoint_statistics_aggregation(self):
@@ -60,7 +78,7 @@ class TestMonitoringMiddleware:
         from nadle_backend.middleware.monitoring import PerformanceTracker
         
         # Given: 모킹된 Redis
-        mock_redis = AsyncMock()
+        mock_redis, pipe = _mock_redis()
         tracker = PerformanceTracker(redis_client=mock_redis)
         
         # When: 여러 요청 추적
@@ -79,9 +97,24 @@ class TestMonitoringMiddleware:
             tracking_data = await tracker.start_tracking(mock_request)
             await tracker.end_tracking(tracking_data, status)
         
-        # Then: 각 엔드포인트별로 통계가 기록됨
-        assert mock_redis.hincrby.call_count >= 4
-        assert mock_redis.lpush.call_count >= 4
+        await tracker.flush()
+        
+        # Then: 엔드포인트별로 집계된 값이 한 번씩 기록됨
+        endpoint_calls = {
+            call[0][1]: call[0][2] for call in pipe.hincrby.call_args_list
+            if call[0][0] == "api:metrics:endpoints"
+        }
+        assert endpoint_calls == {"GET:/api/posts": 2, "POST:/api/posts": 1, "GET:/api/users": 1}
+        latency_counts = {
+            call[0][0].rsplit(":", 1)[0]: call[0][2] for call in pipe.hincrby.call_args_list
+            if call[0][0].startswith("api:latency:") and call[0][1] == "count"
+        }
+        assert latency_counts == {
+            "api:latency:GET:/api/posts": 2,
+            "api:latency:POST:/api/posts": 1,
+            "api:latency:GET:/api/users": 1
+        }
+        pipe.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_status_code_tracking(self):
@@ -89,7 +122,7 @@ class TestMonitoringMiddleware:
         from nadle_backend.middleware.monitoring import PerformanceTracker
         
         # Given: 모킹된 Redis
-        mock_redis = AsyncMock()
+        mock_redis, pipe = _mock_redis()
         tracker = PerformanceTracker(redis_client=mock_redis)
         
         mock_request = Mock()
@@ -103,8 +136,10 @@ class TestMonitoringMiddleware:
             tracking_data = await tracker.start_tracking(mock_request)
             await tracker.end_tracking(tracking_data, status_code)
         
+        await tracker.flush()
+        
         # Then: 상태코드별 통계가 기록됨
-        hincrby_calls = [call[0] for call in mock_redis.hincrby.call_args_list]
+        hincrby_calls = [call[0] for call in pipe.hincrby.call_args_list]
         
         # Redis의 hincrby 호출에서 해시 키와 필드 분리
         status_calls = [call for call in hincrby_calls if call[0] == "api:metrics:status_codes"]
@@ -119,7 +154,7 @@ class TestMonitoringMiddleware:
         from nadle_backend.middleware.monitoring import PerformanceTracker
         
         # Given: 모킹된 Redis와 느린 요청 시뮬레이션
-        mock_redis = AsyncMock()
+        mock_redis, pipe = _mock_redis()
         tracker = PerformanceTracker(redis_client=mock_redis, slow_request_threshold=0.05)  # 50ms
         
         mock_request = Mock()
@@ -135,7 +170,8 @@ class TestMonitoringMiddleware:
         assert slow_detected == True
         
         # 느린 요청 목록에 추가되었는지 확인
-        slow_request_calls = [call for call in mock_redis.lpush.call_args_list 
+        await tracker.flush()
+        slow_request_calls = [call for call in pipe.lpush.call_args_list 
                              if "slow_requests" in str(call)]
         assert len(slow_request_calls) > 0
 
@@ -149,12 +185,10 @@ class TestMonitoringMiddleware:
         # When: 메트릭 키 생성
         endpoint_key = tracker._generate_endpoint_key("GET", "/api/posts")
         status_key = tracker._generate_status_key(200)
-        timing_key = tracker._generate_timing_key("GET", "/api/posts")
         
         # Then: 올바른 키 형식
         assert endpoint_key == "GET:/api/posts"
         assert status_key == "status:200"
-        assert timing_key == "api:metrics:timing:GET:/api/posts"
 
     @pytest.mark.asyncio
     async def test_metrics_retrieval(self):
@@ -192,27 +226,31 @@ class TestMonitoringMiddleware:
     async def test_realtime_statistics(self):
         """실시간 통계 계산 테스트"""
         from nadle_backend.middleware.monitoring import PerformanceTracker
-        
-        # Given: 응답시간 데이터가 있는 Redis
-        mock_redis = AsyncMock()
-        mock_redis.lrange.return_value = [
-            '{"response_time": 0.1, "timestamp": 1640995200}',
-            '{"response_time": 0.15, "timestamp": 1640995201}',
-            '{"response_time": 0.08, "timestamp": 1640995202}',
+        from nadle_backend.monitoring.latency_histogram import LatencyHistogram
+        
+        # Given: 두 구간에 나뉘어 저장된 응답시간 히스토그램
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.add(0.1)
+        first.add(0.15)
+        second.add(0.08)
+        
+        mock_redis, pipe = _mock_redis()
+        pipe.execute.return_value = [{}] * 58 + [
+            {**first.to_fields(), "sum": str(first.sum)},
+            {**second.to_fields(), "sum": str(second.sum)}
         ]
-        
         tracker = PerformanceTracker(redis_client=mock_redis)
         
         # When: 실시간 통계 계산
         stats = await tracker.get_realtime_stats("GET:/api/posts")
         
-        # Then: 올바른 통계 계산됨
-        assert "avg_response_time" in stats
-        assert "min_response_time" in stats
-        assert "max_response_time" in stats
+        # Then: 구간별 히스토그램을 병합한 통계 (분위수는 상대 오차 1% 이내)
+        assert pipe.hgetall.call_count == 60
+        assert stats["request_count"] == 3
         assert stats["avg_response_time"] == pytest.approx(0.11, rel=1e-2)
-        assert stats["min_response_time"] == 0.08
-        assert stats["max_response_time"] == 0.15
+        assert stats["min_response_time"] == pytest.approx(0.08, rel=1e-2)
+        assert stats["max_response_time"] == pytest.approx(0.15, rel=1e-2)
+        assert stats["p50_response_time"] == pytest.approx(0.1, rel=1e-2)
 
     @pytest.mark.asyncio
     async def test_error_rate_calculation(self):
@@ -234,4 +272,122 @@ class TestMonitoringMiddleware:
         error_rate = await tracker.calculate_error_rate()
         
         # Then: 올바른 에러율 계산됨 (5xx errors / total requests)
-        assert error_rate == pytest.approx(0.02, rel=1e-2)  # 2/100 = 2%
\ No newline at end of file
+        assert error_rate == pytest.approx(0.02, rel=1e-2)  # 2/100 = 2%
+
+    @pytest.mark.asyncio
+    async def test_flush_failure_keeps_counters(self):
+        """flush 실패 시 카운터를 되돌려 다음 flush에 포함해야 함"""
+        from nadle_backend.middleware.monitoring import PerformanceTracker
+        
+        # Given: 파이프라인 실행이 실패하는 Redis
+        mock_redis, pipe = _mock_redis()
+        pipe.execute.side_effect = ConnectionError("down")
+        tracker = PerformanceTracker(redis_client=mock_redis)
+        tracker.record("GET", "/api/posts", 200, 0.01)
+        
+        # When: flush 실패
+        assert await tracker.flush() == 0
+        
+        # Then: 다음 flush에서 다시 기록됨
+        assert tracker.pending() == 1
+        pipe.execute.side_effect = None
+        assert await tracker.flush() == 1
+        assert tracker.pending() == 0
+
+
+class TestMonitoringASGIMiddleware:
+    """순수 ASGI 모니터링 미들웨어 테스트"""
+
+    def _create_app(self, mock_redis):
+        from nadle_backend.middleware.monitoring import MonitoringMiddleware
+        
+        app = FastAPI()
+        
+        @app.get("/api/posts/{slug}")
+        async def get_post(slug: str):
+            return {"slug": slug}
+        
+        @app.get("/api/boom")
+        async def boom():
+            raise RuntimeError("boom")
+        
+        app.add_middleware(MonitoringMiddleware, redis_client=mock_redis, flush_interval=60)
+        return app
+
+    def test_records_route_template_and_flushes_on_shutdown(self):
+        """라우트 템플릿 기준으로 기록하고 lifespan 종료 시 남은 메트릭을 기록해야 함"""
+        # Given: 모니터링 미들웨어가 적용된 앱
+        mock_redis, pipe = _mock_redis()
+        app = self._create_app(mock_redis)
+        
+        # When: 서로 다른 slug로 요청 후 앱 종료
+        with TestClient(app) as client:
+            assert client.get("/api/posts/a").status_code == 200
+            assert client.get("/api/posts/b").status_code == 200
+            assert client.get("/missing").status_code == 404
+            
+            # 요청 처리 중에는 Redis 호출 없음
+            mock_redis.pipeline.assert_not_called()
+        
+        # Then: 종료 시 파이프라인 한 번으로 기록
+        pipe.execute.assert_awaited_once()
+        endpoint_calls = {
+            call[0][1]: call[0][2] for call in pipe.hincrby.call_args_list
+            if call[0][0] == "api:metrics:endpoints"
+        }
+        assert endpoint_calls == {"GET:/api/posts/{slug}": 2, "GET:<unmatched>": 1}
+
+    def test_unmatched_paths_share_one_label(self):
+        """매칭되지 않은 경로(404, 스캐너)는 경로마다 키를 만들지 않고 한 라벨로 기록해야 함"""
+        mock_redis, pipe = _mock_redis()
+        app = self._create_app(mock_redis)
+        
+        with TestClient(app) as client:
+            for path in ("/wp-admin", "/.env", "/phpmyadmin/index.php"):
+                assert client.get(path).status_code == 404
+        
+        endpoint_calls = {
+            call[0][1]: call[0][2] for call in pipe.hincrby.call_args_list
+            if call[0][0] == "api:metrics:endpoints"
+        }
+        assert endpoint_calls == {"GET:<unmatched>": 3}
+
+    @pytest.mark.asyncio
+    async def test_default_uses_shared_redis_manager(self):
+        """클라이언트를 주지 않으면 새 연결 대신 공유 Redis 매니저의 현재 클라이언트를 써야 함"""
+        from nadle_backend.middleware.monitoring import MonitoringMiddleware
+        
+        mock_redis, pipe = _mock_redis()
+        manager = Mock(redis_client=None)
+        with patch("nadle_backend.database.redis_factory.redis_factory.get_redis_manager",
+                   return_value=manager), \
+             patch("nadle_backend.middleware.monitoring.redis.from_url") as from_url:
+            middleware = MonitoringMiddleware(FastAPI(), flush_interval=60)
+        
+        from_url.assert_not_called()
+        middleware.tracker.record("GET", "/api/posts", 200, 0.01)
+        # 연결 전에는 기록하지 않고 버림
+        assert await middleware.tracker.flush() == 0
+        assert middleware.tracker.pending() == 0
+        
+        manager.redis_client = mock_redis
+        middleware.tracker.record("GET", "/api/posts", 200, 0.01)
+        assert await middleware.tracker.flush() == 1
+        pipe.execute.assert_awaited_once()
+
+    def test_unhandled_exception_recorded_as_500(self):
+        """응답 전에 예외가 나면 500으로 기록해야 함"""
+        # Given: 예외를 던지는 엔드포인트
+        mock_redis, pipe = _mock_redis()
+        app = self._create_app(mock_redis)
+        
+        # When: 요청
+        with TestClient(app, raise_server_exceptions=False) as client:
+            assert client.get("/api/boom").status_code == 500
+        
+        # Then: 500 상태코드 기록
+        status_calls = [
+            call[0][1] for call in pipe.hincrby.call_args_list
+            if call[0][0] == "api:metrics:status_codes"
+        ]
+        assert status_calls == ["status:500"]
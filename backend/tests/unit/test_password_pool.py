@@ -0,0 +1,221 @@
+"""비밀번호 해시 워커 풀 테스트.
+
+## 🎯 테스트 목표
+bcrypt 해시/검증이 이벤트 루프 밖(워커 프로세스)에서 실행되고,
+풀이 포화되거나 시간 초과되면 대기열을 늘리지 않고 즉시 503으로 거절하는지 검증
+
+## 📋 테스트 범위
+- 워커 프로세스 실행 및 잘못된 해시 처리
+- 수용 제어 (max_pending 초과 즉시 거절, 시간 초과 거절, 완료 후 슬롯 반환)
+- 작업 중 워커 프로세스가 죽으면 손상된 풀을 종료하고 한 번 재시도
+- PasswordManager 비동기 메서드 입력 검증
+- 로그인 시 오래된 해시의 백그라운드 재해시
+- 라우터의 503 + Retry-After 응답
+"""
+
+import asyncio
+import os
+import threading
+import pytest
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import AsyncMock, MagicMock, patch
+from nadle_backend.exceptions.auth import PasswordServiceBusyError
+from nadle_backend.utils.password import PasswordManager
+from nadle_backend.utils.password_pool import PasswordWorkerPool, verify_in_worker
+
+
+def _thread_pool(max_workers):
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+
+def _broken_pool():
+    """제출한 작업이 실행 중 워커 종료로 실패하는 풀"""
+    future = Future()
+    future.set_exception(BrokenProcessPool("worker died"))
+    executor = MagicMock()
+    executor.submit.return_value = future
+    return executor
+
+
+class TestWorkerFunctions:
+    """워커에서 실행되는 bcrypt 함수 테스트."""
+
+    def test_invalid_hash_returns_false(self):
+        """잘못된 해시 형식은 예외 대신 False를 반환해야 함."""
+        assert verify_in_worker("Secret123!", "not-a-hash", 4) is False
+
+
+class TestPasswordWorkerPool:
+    """수용 제어 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_runs_in_worker_process(self):
+        """기본 풀은 이벤트 루프가 아닌 별도 프로세스에서 작업을 실행해야 함."""
+        pool = PasswordWorkerPool(max_workers=1, max_pending=4, timeout=30)
+        try:
+            worker_pid = await pool.run(os.getpid)
+        finally:
+            pool.shutdown()
+
+        assert worker_pid != os.getpid()
+        assert pool.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_immediately_when_saturated(self):
+        """실행 중 + 대기 중 작업이 max_pending에 도달하면 즉시 거절해야 함."""
+        release = threading.Event()
+        pool = PasswordWorkerPool(max_workers=1, max_pending=2, timeout=5, executor_factory=_thread_pool)
+        try:
+            running = [asyncio.create_task(pool.run(release.wait)) for _ in range(2)]
+            await asyncio.sleep(0)
+
+            with pytest.raises(PasswordServiceBusyError) as exc_info:
+                await pool.run(release.wait)
+            assert exc_info.value.status_code == 503
+            assert pool.rejected == 1
+
+            release.set()
+            await asyncio.gather(*running)
+        finally:
+            release.set()
+            pool.shutdown()
+        assert pool.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_rejects_and_frees_queued_slot(self):
+        """시간 초과된 대기 작업은 거절되고 큐에서 빠져 슬롯을 반환해야 함."""
+        release = threading.Event()
+        pool = PasswordWorkerPool(max_workers=1, max_pending=4, timeout=0.05, executor_factory=_thread_pool)
+        try:
+            blocker = asyncio.create_task(pool.run(release.wait))
+            await asyncio.sleep(0)
+
+            with pytest.raises(PasswordServiceBusyError):
+                await pool.run(release.wait)
+            # 대기 중이던 두 번째 작업은 취소되어 실행 중인 작업만 남음
+            assert pool.pending == 1
+        finally:
+            release.set()
+            with pytest.raises(PasswordServiceBusyError):
+                await blocker
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_worker_death_during_job_retries_on_new_pool(self):
+        """실행 중 워커가 죽으면 손상된 풀을 종료하고 새 풀에서 한 번 재시도해야 함."""
+        broken = _broken_pool()
+        executors = [broken, ThreadPoolExecutor(max_workers=1)]
+        pool = PasswordWorkerPool(max_workers=1, max_pending=4, timeout=5, executor_factory=lambda _: executors.pop(0))
+        try:
+            assert await pool.run(lambda: "ok") == "ok"
+        finally:
+            pool.shutdown()
+
+        broken.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+        assert pool.pending == 0
+        assert pool.rejected == 0
+
+    @pytest.mark.asyncio
+    async def test_repeated_worker_death_rejects(self):
+        """재시도한 풀도 손상되면 500 대신 503으로 거절해야 함."""
+        executors = [_broken_pool(), _broken_pool()]
+        pool = PasswordWorkerPool(max_workers=1, max_pending=4, timeout=5, executor_factory=lambda _: executors.pop(0))
+
+        with pytest.raises(PasswordServiceBusyError):
+            await pool.run(lambda: "ok")
+
+        assert pool.pending == 0
+        assert pool.rejected == 1
+
+
+class TestPasswordManagerAsync:
+    """PasswordManager 비동기 메서드 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_async_methods_use_pool_with_configured_rounds(self):
+        """비동기 메서드는 설정된 라운드 수로 워커 풀에 위임해야 함."""
+        pool = MagicMock()
+        pool.hash_password = AsyncMock(return_value="hashed")
+        pool.verify_password = AsyncMock(return_value=True)
+        manager = PasswordManager(bcrypt_rounds=10)
+
+        with patch("nadle_backend.utils.password.get_password_pool", AsyncMock(return_value=pool)):
+            assert await manager.hash_password_async("Secret123!") == "hashed"
+            assert await manager.verify_password_async("Secret123!", "hashed") is True
+
+        pool.hash_password.assert_awaited_once_with("Secret123!", 10)
+        pool.verify_password.assert_awaited_once_with("Secret123!", "hashed", 10)
+
+    @pytest.mark.asyncio
+    async def test_async_methods_validate_input(self):
+        """빈 비밀번호/해시는 풀에 보내기 전에 ValueError를 발생시켜야 함."""
+        manager = PasswordManager()
+
+        with pytest.raises(ValueError):
+            await manager.hash_password_async("")
+        with pytest.raises(ValueError):
+            await manager.verify_password_async("Secret123!", "")
+
+
+class TestBackgroundRehash:
+    """로그인 시 해시 업그레이드 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_outdated_hash_upgraded_after_login(self):
+        """오래된 해시는 로그인 후 백그라운드에서 재해시되어 조건부로 교체되어야 함."""
+        from nadle_backend.services import auth_service as auth_module
+        from nadle_backend.services.auth_service import AuthService
+
+        user = MagicMock(id="user1", password_hash="old-hash", status="active")
+        repo = MagicMock()
+        repo.get_by_email = AsyncMock(return_value=user)
+        repo.replace_password_hash = AsyncMock(return_value=True)
+        manager = MagicMock(spec=PasswordManager)
+        manager.verify_password_async.return_value = True
+        manager.hash_password_async.return_value = "new-hash"
+        manager.needs_rehash.return_value = True
+        service = AuthService(user_repository=repo, password_manager=manager, email_service=MagicMock())
+
+        assert await service.authenticate_user("a@example.com", "Secret123!") is user
+        await asyncio.gather(*auth_module._background_tasks)
+
+        repo.replace_password_hash.assert_awaited_once_with("user1", "old-hash", "new-hash")
+
+    @pytest.mark.asyncio
+    async def test_rehash_skipped_when_pool_busy(self):
+        """풀이 포화되면 재해시를 건너뛰고 로그인에는 영향이 없어야 함."""
+        from nadle_backend.services.auth_service import AuthService
+
+        repo = MagicMock()
+        repo.replace_password_hash = AsyncMock()
+        manager = MagicMock(spec=PasswordManager)
+        manager.hash_password_async.side_effect = PasswordServiceBusyError()
+        service = AuthService(user_repository=repo, password_manager=manager, email_service=MagicMock())
+
+        await service._rehash_password("user1", "Secret123!", "old-hash")
+
+        repo.replace_password_hash.assert_not_awaited()
+
+
+class TestBusyResponse:
+    """라우터 503 응답 테스트."""
+
+    def test_login_returns_503_with_retry_after(self):
+        """풀 포화 시 로그인은 503과 Retry-After 헤더를 반환해야 함."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from nadle_backend.routers.auth import router, get_auth_service
+
+        service = MagicMock()
+        service.login = AsyncMock(side_effect=PasswordServiceBusyError(retry_after=2))
+        app = FastAPI()
+        app.include_router(router, prefix="/api/auth")
+        app.dependency_overrides[get_auth_service] = lambda: service
+
+        response = TestClient(app).post(
+            "/api/auth/login", data={"username": "a@example.com", "password": "Secret123!"}
+        )
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "2"
@@ -0,0 +1,216 @@
+"""Late-join aggregation 빌더 및 explain 요약 테스트.
+
+## 🎯 테스트 목표
+조인이 항상 필터/정렬/페이지 자르기 뒤에 오는지 검증
+
+## 📋 테스트 범위
+- PipelineBuilder 스테이지 순서
+- 참조 ID 변환 후 localField/foreignField 조인
+- 상세 조회 aggregation 파이프라인 구조
+- 목록 응답 작성자 정보에 이메일 미포함
+- explain 결과 요약 및 예산 검사
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+from bson import ObjectId
+from nadle_backend.models.core import Post
+from nadle_backend.repositories.pipeline_builder import PipelineBuilder, lookup_stages, AUTHOR_SUMMARY_FIELDS
+from nadle_backend.services.posts_service import PostsService
+from tests.helpers.explain_plan import summarize_explain, assert_plan_within_budget
+
+
+def _stage_names(pipeline):
+    return [next(iter(stage)) for stage in pipeline]
+
+
+class TestPipelineBuilder:
+    """PipelineBuilder 테스트."""
+
+    def test_joins_always_after_limit(self):
+        """호출 순서와 관계없이 $lookup이 $match/$sort/$skip/$limit/$project 뒤에 와야 함."""
+        pipeline = (
+            PipelineBuilder({"status": "published"})
+            .join("users", "author_id", "_id", "author", convert_to="objectId", single=True)
+            .then({"$addFields": {"x": 1}})
+            .limit(10)
+            .project({"title": 1, "author_id": 1})
+            .skip(20)
+            .sort({"created_at": -1, "_id": -1})
+            .build()
+        )
+
+        assert _stage_names(pipeline) == [
+            "$match", "$sort", "$skip", "$limit", "$project",
+            "$addFields", "$lookup", "$addFields", "$unset", "$addFields"
+        ]
+
+    def test_skip_zero_omitted(self):
+        """skip이 0이면 $skip 스테이지를 생성하지 않아야 함."""
+        pipeline = PipelineBuilder({"slug": "a"}).skip(0).limit(1).build()
+
+        assert _stage_names(pipeline) == ["$match", "$limit"]
+
+    def test_join_fields_projected_in_lookup(self):
+        """fields 인자는 lookup 내부 $project로 적용되어야 함."""
+        pipeline = (
+            PipelineBuilder({"slug": "a"})
+            .join("users", "author_id", "_id", "author", fields=AUTHOR_SUMMARY_FIELDS)
+            .build()
+        )
+
+        lookup = pipeline[1]["$lookup"]
+        assert lookup["localField"] == "author_id"
+        assert lookup["pipeline"] == [{"$project": AUTHOR_SUMMARY_FIELDS}]
+        assert "password_hash" not in AUTHOR_SUMMARY_FIELDS
+
+    @pytest.mark.asyncio
+    async def test_list_items_exclude_author_email(self):
+        """목록 응답 항목의 작성자 정보에는 이메일이 포함되지 않아야 함."""
+        user = {
+            "_id": ObjectId(), "email": "writer@example.com", "user_handle": "writer",
+            "display_name": "작성자", "name": "홍길동", "password_hash": "hashed"
+        }
+        # 조인 내부 $project 적용 결과
+        author = {key: value for key, value in user.items() if key == "_id" or key in AUTHOR_SUMMARY_FIELDS}
+        post_data = {
+            "_id": ObjectId(), "title": "제목", "content": "본문", "slug": "post-slug",
+            "author_id": str(user["_id"]), "created_at": datetime(2025, 7, 1), "author": author
+        }
+
+        item = await PostsService()._format_post_list_item(post_data, None, {})
+
+        assert item["author"]["user_handle"] == "writer"
+        assert item["author"]["email"] == ""
+        assert "writer@example.com" not in str(item)
+
+    def test_lookup_stages_converts_before_join(self):
+        """문자열 참조는 조인 전에 변환되어 $expr 없이 조인해야 함."""
+        stages = lookup_stages("users", "author_id", "_id", "author", convert_to="objectId", single=True)
+
+        convert = stages[0]["$addFields"]["_join_author"]["$convert"]
+        assert convert["input"] == "$author_id"
+        assert convert["to"] == "objectId"
+        assert convert["onError"] is None
+        assert stages[1]["$lookup"]["localField"] == "_join_author"
+        assert stages[2] == {"$addFields": {"author": {"$arrayElemAt": ["$author", 0]}}}
+        assert stages[3] == {"$unset": "_join_author"}
+        assert "$expr" not in str(stages)
+
+
+class TestPostAggregationPipelines:
+    """PostsService 상세 aggregation 파이프라인 구조 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_post_with_author_limits_before_join(self):
+        """slug로 1건을 자른 뒤 작성자를 조인해야 함."""
+        service = PostsService()
+
+        with patch.object(Post, "aggregate") as mock_aggregate:
+            mock_aggregate.return_value.to_list = AsyncMock(return_value=[])
+
+            await service.get_post_with_author_aggregated("test-slug")
+
+            pipeline = mock_aggregate.call_args[0][0]
+
+        stages = _stage_names(pipeline)
+        assert pipeline[0]["$match"]["slug"] == "test-slug"
+        assert stages.index("$limit") < stages.index("$lookup")
+        projection = pipeline[stages.index("$project")]["$project"]
+        assert "search_terms" not in projection and "content_text" not in projection
+        assert "content_rendered" in projection
+        assert "$expr" not in str(pipeline)
+
+    @pytest.mark.asyncio
+    async def test_post_with_everything_joins_comments_by_parent_id(self):
+        """댓글은 parent_id로, 댓글 작성자는 댓글 lookup 내부에서 조인해야 함."""
+        service = PostsService()
+
+        with patch.object(Post, "aggregate") as mock_aggregate:
+            mock_aggregate.return_value.to_list = AsyncMock(return_value=[])
+
+            await service.get_post_with_everything_aggregated("test-slug", "user123")
+
+            pipeline = mock_aggregate.call_args[0][0]
+
+        lookups = {stage["$lookup"]["as"]: stage["$lookup"] for stage in pipeline if "$lookup" in stage}
+        assert set(lookups) == {"author", "comments_raw", "user_reaction_raw"}
+        assert lookups["comments_raw"]["foreignField"] == "parent_id"
+        assert any("$lookup" in stage for stage in lookups["comments_raw"]["pipeline"])
+        assert lookups["user_reaction_raw"]["foreignField"] == "target_id"
+        assert {"$match": {"target_type": "post", "user_id": "user123"}} in lookups["user_reaction_raw"]["pipeline"]
+        assert "$expr" not in str(pipeline)
+
+        stages = _stage_names(pipeline)
+        assert stages.index("$limit") < stages.index("$lookup")
+
+
+class TestExplainSummary:
+    """explain 결과 요약 및 예산 검사 테스트."""
+
+    @pytest.fixture
+    def classic_explain(self):
+        """클래식 엔진 aggregate explain 샘플 ($cursor + $lookup)."""
+        return {
+            "stages": [
+                {"$cursor": {
+                    "queryPlanner": {
+                        "winningPlan": {"stage": "LIMIT", "inputStage": {"stage": "FETCH", "inputStage": {"stage": "IXSCAN"}}},
+                        "rejectedPlans": [{"stage": "COLLSCAN"}]
+                    },
+                    "executionStats": {"nReturned": 10, "totalKeysExamined": 10, "totalDocsExamined": 10}
+                }},
+                {"$lookup": {"from": "users"}, "totalDocsExamined": 10, "totalKeysExamined": 10,
+                 "collectionScans": 0, "indexesUsed": ["_id_"]}
+            ]
+        }
+
+    def test_summarize_classic_plan(self, classic_explain):
+        """$cursor와 $lookup 통계를 합산하고 거부된 플랜은 무시해야 함."""
+        summary = summarize_explain(classic_explain, n_returned=10)
+
+        assert summary.docs_examined == 20
+        assert summary.keys_examined == 20
+        assert summary.collection_scans == 0
+        assert_plan_within_budget(summary, max_docs_per_result=2)
+
+    def test_collscan_fails(self, classic_explain):
+        """실행된 플랜에 COLLSCAN이 있으면 실패해야 함."""
+        classic_explain["stages"][0]["$cursor"]["queryPlanner"]["winningPlan"] = {"stage": "COLLSCAN"}
+
+        summary = summarize_explain(classic_explain, n_returned=10)
+
+        with pytest.raises(AssertionError, match="collection scan"):
+            assert_plan_within_budget(summary)
+
+    def test_lookup_collection_scan_fails(self, classic_explain):
+        """인덱스 없는 $lookup(collectionScans > 0)도 실패해야 함."""
+        classic_explain["stages"][1]["collectionScans"] = 10
+
+        summary = summarize_explain(classic_explain, n_returned=10)
+
+        assert summary.collection_scans == 10
+        with pytest.raises(AssertionError):
+            assert_plan_within_budget(summary)
+
+    def test_sbe_nested_loop_join_fails(self):
+        """SBE EQ_LOOKUP NestedLoopJoin은 컬렉션 스캔으로 간주해야 함."""
+        explain = {
+            "queryPlanner": {"winningPlan": {"queryPlan": {
+                "stage": "EQ_LOOKUP", "strategy": "NestedLoopJoin",
+                "inputStage": {"stage": "IXSCAN"}
+            }}},
+            "executionStats": {"nReturned": 1, "totalDocsExamined": 1}
+        }
+
+        summary = summarize_explain(explain, n_returned=1)
+
+        assert summary.collection_scans == 1
+
+    def test_docs_examined_budget(self, classic_explain):
+        """docsExamined가 예산을 넘으면 실패해야 함."""
+        summary = summarize_explain(classic_explain, n_returned=10)
+
+        with pytest.raises(AssertionError, match="docsExamined=20"):
+            assert_plan_within_budget(summary, max_docs_per_result=1.5)
@@ -0,0 +1,249 @@
+"""인기 게시글 시간 감쇠 랭킹 테스트.
+
+## 🎯 테스트 목표
+조회/반응/댓글 이벤트가 워커 메모리에 모였다가 Lua 스크립트 한 번으로 HOT/트렌딩/서비스별
+보드에 반영되고, 재정규화와 조회가 각각 한 번의 호출로 처리되는지 검증
+
+## 📋 테스트 범위
+- 게시글별 가중치 누적 및 반영 인자 (모드, 보드 키, 반감기, 게시글 그룹)
+- 취소 이벤트와 실행 중이 아닐 때의 이벤트 무시
+- 반영 실패 시 가중치 복원
+- 재정규화 인자, 초기 적재(seed 모드 - 지정한 보드만, 기존 점수 유지)
+- 좋아요/북마크 토글은 사용자·게시글별 첫 반응만 랭킹에 기록
+- 전체 삭제는 레지스트리에 등록된 보드 기준
+- HOT 보드 조회는 ZREVRANGE 한 번 + MGET 한 번
+"""
+
+import json
+import pytest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from nadle_backend.services.popular_posts_cache_service import (
+    CLEAR_RANKING_SCRIPT,
+    RECORD_RANKING_SCRIPT,
+    RENORMALIZE_RANKING_SCRIPT,
+    PopularPostData,
+    PopularPostsCacheService,
+)
+from nadle_backend.services.popularity_ranking import PopularityRanking
+
+SERVICE = "nadle_backend.services.popular_posts_cache_service"
+CREATED_AT = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def _redis(result=1):
+    redis_manager = MagicMock()
+    redis_manager.is_connected = AsyncMock(return_value=True)
+    redis_manager.eval_script = AsyncMock(return_value=result)
+    return redis_manager
+
+
+def _post(post_id="p1", post_type="expert_tips", **counts):
+    return SimpleNamespace(
+        id=post_id, title=f"게시글 {post_id}", author_id="author1",
+        metadata=SimpleNamespace(type=post_type), created_at=CREATED_AT,
+        view_count=counts.get("view_count", 10), like_count=counts.get("like_count", 2),
+        comment_count=counts.get("comment_count", 1), bookmark_count=counts.get("bookmark_count", 0)
+    )
+
+
+def _groups(args):
+    """스크립트 인자에서 게시글 그룹 (post_id, 가중치, 서비스, 발생 시각, 요약) 추출"""
+    return [tuple(args[i:i + 5]) for i in range(10, len(args), 5)]
+
+
+@pytest.fixture
+async def ranking():
+    ranking = PopularityRanking(cache_service=PopularPostsCacheService(), flush_interval=3600)
+    await ranking.start()
+    yield ranking
+    ranking._task.cancel()
+
+
+class TestEventBuffer:
+    """이벤트 버퍼 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_events_merged_into_one_script_call(self, ranking):
+        """게시글별 가중치를 합쳐 보드 세 개와 요약을 스크립트 한 번으로 반영해야 함."""
+        ranking.record(_post("p1"), "view")
+        ranking.record(_post("p1"), "like")
+        ranking.record(_post("p1", view_count=11), "view")
+        ranking.record(_post("p2", post_type="board"), "comment")
+        redis_manager = _redis()
+        service = ranking.cache_service
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=redis_manager)):
+            assert await ranking.flush() == 2
+
+        redis_manager.eval_script.assert_awaited_once()
+        script, keys, args = redis_manager.eval_script.call_args.args
+        assert script == RECORD_RANKING_SCRIPT
+        assert keys == [service.ranking_epoch_key, service.ranking_boards_key, service.detail_tag_key]
+        assert args[0] == "incr"
+        assert args[3:10] == [
+            service.hot_posts_key, service.settings.popularity_hot_half_life,
+            service.trending_weekly_key, service.settings.popularity_trending_half_life,
+            service._get_service_key(""), service.settings.popularity_trending_half_life,
+            service._get_detail_key("")
+        ]
+        groups = {group[0]: group for group in _groups(args)}
+        assert groups["p1"][1:3] == (7.0, "expert_tips")
+        assert groups["p2"][1:3] == (3.0, "board")
+        assert json.loads(groups["p1"][4])["view_count"] == 11
+
+    @pytest.mark.asyncio
+    async def test_cancelled_reaction_is_dropped(self, ranking):
+        """좋아요/북마크 취소는 감쇠 보드 점수를 음수로 만들 수 있으므로 반영하지 않아야 함."""
+        ranking.record(_post("p1"), "like")
+        ranking.record(_post("p1"), "like", -1)
+        ranking.record(_post("p2"), "bookmark", -1)
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=_redis())) as get_manager:
+            assert await ranking.flush() == 1
+
+        args = (await get_manager()).eval_script.call_args.args[2]
+        assert [group[:2] for group in _groups(args)] == [("p1", 5.0)]
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_restores_weights(self, ranking):
+        """반영 실패 시 가중치를 버퍼로 되돌려 다음 반영에 합쳐야 함."""
+        ranking.record(_post(), "like")
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=_redis(result=None))):
+            assert await ranking.flush() == 0
+
+        ranking.record(_post(), "view")
+        redis_manager = _redis()
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=redis_manager)):
+            assert await ranking.flush() == 1
+
+        assert _groups(redis_manager.eval_script.call_args.args[2])[0][1] == 6.0
+
+    def test_ignored_when_not_running(self):
+        """반영 작업이 없으면(스크립트, 테스트) 이벤트를 쌓지 않아야 함."""
+        ranking = PopularityRanking(cache_service=PopularPostsCacheService())
+
+        ranking.record(_post(), "like")
+
+        assert ranking._pending == {}
+
+
+class TestBoards:
+    """보드 재정규화/적재/조회 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_renormalize_single_script(self):
+        """재정규화는 현재 시각과 정리 기준으로 스크립트 한 번이어야 함."""
+        redis_manager = _redis(result=4)
+        service = PopularPostsCacheService()
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=redis_manager)):
+            assert await service.renormalize_rankings() == 4
+
+        script, keys, args = redis_manager.eval_script.call_args.args
+        assert script == RENORMALIZE_RANKING_SCRIPT
+        assert keys == [service.ranking_epoch_key, service.ranking_boards_key]
+        assert args[1] == service.settings.popularity_prune_score
+
+    @pytest.mark.asyncio
+    async def test_seed_sets_scores_at_creation_time(self):
+        """초기 적재는 seed 모드로 누적 카운트를 작성 시각(UTC) 이벤트로 서비스 보드에만 추가해야 함."""
+        redis_manager = _redis()
+        post = PopularPostData.from_post(_post())
+        service = PopularPostsCacheService()
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=redis_manager)):
+            assert await service.cache_popular_posts_by_service("tips", [post]) is True
+
+        args = redis_manager.eval_script.call_args.args[2]
+        assert args[0] == "seed"
+        assert (args[3], args[5], args[7]) == ("", "", service._get_service_key(""))
+        [(post_id, weight, service_type, occurred_at, _)] = _groups(args)
+        assert (post_id, weight, service_type) == ("p1", 23.0, "tips")
+        assert occurred_at == CREATED_AT.replace(tzinfo=timezone.utc).timestamp()
+
+    @pytest.mark.asyncio
+    async def test_seed_only_touches_named_board(self):
+        """HOT/트렌딩 적재는 자기 보드만 ZADD NX로 적재해야 함 (다른 보드의 감쇠 점수 유지)."""
+        redis_manager = _redis()
+        post = PopularPostData.from_post(_post())
+        service = PopularPostsCacheService()
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=redis_manager)):
+            assert await service.cache_hot_posts_realtime([post]) is True
+            hot_args = redis_manager.eval_script.call_args.args[2]
+            assert await service.cache_trending_posts_weekly([post]) is True
+            trending_args = redis_manager.eval_script.call_args.args[2]
+
+        assert (hot_args[3], hot_args[5], hot_args[7]) == (service.hot_posts_key, "", "")
+        assert (trending_args[3], trending_args[5], trending_args[7]) == ("", service.trending_weekly_key, "")
+        assert "'ZADD', board, 'NX'" in RECORD_RANKING_SCRIPT
+
+    @pytest.mark.asyncio
+    async def test_clear_all_deletes_registered_boards(self):
+        """전체 삭제는 하드코딩된 서비스 목록이 아니라 레지스트리에 등록된 보드를 지워야 함."""
+        service = PopularPostsCacheService()
+        redis_manager = _redis(result=3)
+        redis_manager.delete_many = AsyncMock(return_value=2)
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=redis_manager)), \
+             patch(f"{SERVICE}.cache_tags.invalidate_tags", AsyncMock(return_value=[])):
+            assert await service.clear_all_popular_cache() == 5
+
+        redis_manager.eval_script.assert_awaited_once_with(
+            CLEAR_RANKING_SCRIPT, [service.ranking_boards_key], []
+        )
+
+    @pytest.mark.asyncio
+    async def test_hot_read_is_single_zrevrange(self):
+        """HOT 조회는 ZREVRANGE 한 번과 요약 MGET 한 번이어야 함."""
+        service = PopularPostsCacheService()
+        redis_manager = _redis()
+        redis_manager.zrevrange = AsyncMock(return_value=[("p2", 9.5), ("p1", 3.0)])
+        redis_manager.mget = AsyncMock(return_value={
+            service._get_detail_key("p1"): {"post_id": "p1"},
+            service._get_detail_key("p2"): {"post_id": "p2"}
+        })
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=redis_manager)):
+            result = await service.get_hot_posts_realtime(limit=2)
+
+        assert [post["post_id"] for post in result] == ["p2", "p1"]
+        redis_manager.zrevrange.assert_awaited_once_with(service.hot_posts_key, 0, 1)
+        redis_manager.eval_script.assert_not_awaited()
+
+
+class TestReactionToggleRanking:
+    """좋아요/북마크 토글의 랭킹 반영 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_toggling_like_ranks_only_first_like(self):
+        """좋아요 → 취소 → 좋아요를 반복해도 랭킹에는 첫 좋아요만 기록되어야 함."""
+        from nadle_backend.services.posts_service import PostsService
+
+        post = _post()
+        post.dislike_count = 0
+        post_repository = MagicMock()
+        post_repository.get_by_slug = AsyncMock(return_value=post)
+        post_repository.get_by_id = AsyncMock(return_value=post)
+        post_repository.update_post_counts = AsyncMock()
+        service = PostsService(post_repository=post_repository, comment_repository=MagicMock())
+        service.invalidate_user_reaction_cache = AsyncMock()
+        service.invalidate_post_cache = AsyncMock()
+        reaction = SimpleNamespace(
+            liked=False, disliked=False, bookmarked=False, metadata={}, save=AsyncMock()
+        )
+        user = SimpleNamespace(id="user1")
+        ranking = MagicMock()
+
+        with patch("nadle_backend.services.posts_service.UserReaction.find_one",
+                   AsyncMock(return_value=reaction)), \
+             patch("nadle_backend.services.posts_service.popularity_ranking", ranking):
+            for _ in range(3):
+                await service.toggle_post_reaction("p1", "like", user)
+
+        ranking.record.assert_called_once_with(post, "like")
+        assert reaction.liked is True
+        assert reaction.metadata["ranked_events"] == ["like"]
@@ -0,0 +1,227 @@
+"""커서(keyset) 페이지네이션 테스트.
+
+## 🎯 테스트 목표
+$skip 없는 게시글 목록 조회 검증
+
+## 📋 테스트 범위
+- 커서 인코딩/디코딩 (null 정렬값 포함) 및 잘못된 커서 처리
+- $match → $sort → $limit → $lookup 순서 (작성자 조인은 페이지에만)
+- next_cursor 생성 및 다음 페이지 조건
+- 선택적 총 개수 계산
+- _id를 포함하도록 바뀐 정렬 인덱스의 기존 이름 인덱스 삭제
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
+from bson import ObjectId
+from nadle_backend.models.core import Post
+from nadle_backend.repositories.post_repository import PostRepository
+from nadle_backend.exceptions.post import PostCursorError
+from nadle_backend.utils.cursor import encode_cursor, decode_cursor
+from nadle_backend.database.manager import IndexManager
+
+
+def _make_posts(count: int):
+    """created_at 내림차순 게시글 문서 생성."""
+    return [
+        {
+            "_id": ObjectId(),
+            "title": f"게시글 {i}",
+            "author_id": str(ObjectId()),
+            "created_at": datetime(2025, 7, 1, 12, 0, 0 + i),
+            "view_count": 100 - i,
+        }
+        for i in range(count, 0, -1)
+    ]
+
+
+class TestCursorEncoding:
+    """커서 토큰 인코딩 테스트."""
+
+    def test_roundtrip_datetime(self):
+        """created_at 커서가 원래 값으로 복원되는지 검증."""
+        post_id = ObjectId()
+        created_at = datetime(2025, 7, 1, 9, 30, 15, 123000)
+
+        token = encode_cursor("created_at", created_at, post_id)
+        value, decoded_id = decode_cursor(token, "created_at")
+
+        assert value == created_at
+        assert decoded_id == post_id
+        assert "=" not in token
+
+    def test_roundtrip_counter(self):
+        """view_count 커서가 원래 값으로 복원되는지 검증."""
+        post_id = ObjectId()
+
+        token = encode_cursor("view_count", 42, post_id)
+        value, decoded_id = decode_cursor(token, "view_count")
+
+        assert value == 42
+        assert decoded_id == post_id
+
+    def test_null_value_not_encoded_as_zero(self):
+        """null 정렬값은 0이 아닌 null로 복원되어야 함 (0과 정렬 위치가 다름)."""
+        post_id = ObjectId()
+
+        assert decode_cursor(encode_cursor("like_count", None, post_id), "like_count") == (None, post_id)
+        assert decode_cursor(encode_cursor("like_count", 0, post_id), "like_count") == (0, post_id)
+
+    def test_sort_mismatch_rejected(self):
+        """다른 정렬로 발급된 커서는 거부되어야 함."""
+        token = encode_cursor("view_count", 42, ObjectId())
+
+        with pytest.raises(PostCursorError):
+            decode_cursor(token, "created_at")
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "e30", "eyJzIjoiY3JlYXRlZF9hdCJ9"])
+    def test_malformed_cursor_rejected(self, token):
+        """손상된 커서는 PostCursorError(400)를 발생시켜야 함."""
+        with pytest.raises(PostCursorError) as exc_info:
+            decode_cursor(token, "created_at")
+
+        assert exc_info.value.status_code == 400
+
+
+class TestListPostsCursor:
+    """PostRepository.list_posts_cursor 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_pipeline_limits_before_lookup(self):
+        """$limit이 $lookup보다 먼저 실행되어 페이지 항목만 조인하는지 검증."""
+        repo = PostRepository()
+
+        with patch.object(Post, "aggregate") as mock_aggregate:
+            mock_aggregate.return_value.to_list = AsyncMock(return_value=_make_posts(3))
+
+            await repo.list_posts_cursor(page_size=10, metadata_type="expert_tips")
+
+            pipeline = mock_aggregate.call_args[0][0]
+            stages = [next(iter(stage)) for stage in pipeline]
+
+            assert stages.index("$limit") < stages.index("$lookup")
+            assert "$skip" not in stages
+            assert "$facet" not in stages
+            assert pipeline[0]["$match"]["metadata.type"] == "expert_tips"
+            assert "deleted" not in pipeline[0]["$match"]["status"]["$in"]
+            assert pipeline[1]["$sort"] == {"created_at": -1, "_id": -1}
+            assert pipeline[2]["$limit"] == 11
+
+    @pytest.mark.asyncio
+    async def test_next_cursor_when_more_pages(self):
+        """page_size보다 많이 조회되면 잘라내고 next_cursor를 생성해야 함."""
+        repo = PostRepository()
+        docs = _make_posts(4)
+
+        with patch.object(Post, "aggregate") as mock_aggregate:
+            mock_aggregate.return_value.to_list = AsyncMock(return_value=docs)
+
+            posts, next_cursor, total = await repo.list_posts_cursor(page_size=3)
+
+        assert len(posts) == 3
+        assert total is None
+        value, last_id = decode_cursor(next_cursor, "created_at")
+        assert value == docs[2]["created_at"]
+        assert last_id == docs[2]["_id"]
+
+    @pytest.mark.asyncio
+    async def test_last_page_has_no_cursor(self):
+        """마지막 페이지에서는 next_cursor가 None이어야 함."""
+        repo = PostRepository()
+
+        with patch.object(Post, "aggregate") as mock_aggregate:
+            mock_aggregate.return_value.to_list = AsyncMock(return_value=_make_posts(2))
+
+            posts, next_cursor, _ = await repo.list_posts_cursor(page_size=3)
+
+        assert len(posts) == 2
+        assert next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_after_cursor_adds_keyset_condition(self):
+        """after 커서가 (정렬값, _id) 기준 keyset 조건으로 변환되는지 검증."""
+        repo = PostRepository()
+        last_id = ObjectId()
+        token = encode_cursor("view_count", 7, last_id)
+
+        with patch.object(Post, "aggregate") as mock_aggregate:
+            mock_aggregate.return_value.to_list = AsyncMock(return_value=[])
+
+            await repo.list_posts_cursor(page_size=5, metadata_type="board", sort_by="view_count", after=token)
+
+            match = mock_aggregate.call_args[0][0][0]["$match"]
+
+        assert match["metadata.type"] == {"$in": [None, "board"]}
+        assert match["$or"] == [
+            {"view_count": {"$lt": 7}},
+            {"view_count": 7, "_id": {"$lt": last_id}},
+            {"view_count": None}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_null_sort_value_cursor_stays_in_null_range(self):
+        """정렬값이 null/누락인 마지막 항목의 커서는 null 구간에서 _id로만 이어가야 함."""
+        repo = PostRepository()
+        docs = _make_posts(3)
+        del docs[1]["view_count"]
+
+        with patch.object(Post, "aggregate") as mock_aggregate:
+            mock_aggregate.return_value.to_list = AsyncMock(return_value=docs)
+            _, next_cursor, _ = await repo.list_posts_cursor(page_size=2, sort_by="view_count")
+
+            assert decode_cursor(next_cursor, "view_count") == (None, docs[1]["_id"])
+
+            mock_aggregate.return_value.to_list = AsyncMock(return_value=[])
+            await repo.list_posts_cursor(page_size=2, sort_by="view_count", after=next_cursor)
+            match = mock_aggregate.call_args[0][0][0]["$match"]
+
+        assert match["$or"] == [{"view_count": None, "_id": {"$lt": docs[1]["_id"]}}]
+
+    @pytest.mark.asyncio
+    async def test_include_total_counts_without_cursor_condition(self):
+        """총 개수는 keyset 조건 없이 필터 기준으로 계산되어야 함."""
+        repo = PostRepository()
+        token = encode_cursor("created_at", datetime(2025, 7, 1), ObjectId())
+        collection = Mock()
+        collection.count_documents = AsyncMock(return_value=1234)
+
+        with patch.object(Post, "aggregate") as mock_aggregate, \
+             patch.object(Post, "get_motor_collection", return_value=collection, create=True):
+            mock_aggregate.return_value.to_list = AsyncMock(return_value=[])
+
+            _, _, total = await repo.list_posts_cursor(after=token, include_total=True)
+
+        assert total == 1234
+        count_filter = collection.count_documents.call_args[0][0]
+        assert "$or" not in count_filter
+
+    @pytest.mark.asyncio
+    async def test_unsupported_sort_rejected(self):
+        """커서 모드에서 지원하지 않는 정렬 필드는 거부되어야 함."""
+        repo = PostRepository()
+
+        with pytest.raises(PostCursorError):
+            await repo.list_posts_cursor(sort_by="title")
+
+
+class TestCursorIndexes:
+    """커서 정렬 인덱스 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_superseded_sort_indexes_dropped(self):
+        """키가 바뀌어 이름을 바꾼 기존 인덱스는 새 인덱스 생성 전에 삭제해야 함."""
+        collection = MagicMock()
+        collection.index_information = AsyncMock(return_value={
+            "_id_": {}, "metadata_type_status_created_idx": {}, "metadata_type_status_views_id_idx": {}
+        })
+        collection.drop_index = AsyncMock()
+        collection.create_indexes = AsyncMock(return_value=[])
+        db = MagicMock()
+        db.__getitem__.return_value = collection
+
+        await IndexManager.create_all_indexes(db)
+
+        collection.drop_index.assert_awaited_once_with("metadata_type_status_created_idx")
+        post_indexes = [idx.document["name"] for idx in IndexManager.get_post_indexes()]
+        assert not set(IndexManager.SUPERSEDED_POST_INDEXES) & set(post_indexes)
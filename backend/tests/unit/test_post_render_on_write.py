@@ -0,0 +1,197 @@
+"""게시글 작성 시 렌더링(render-on-write) 테스트.
+
+## 🎯 테스트 목표
+게시글 본문을 작성/수정 시 한 번만 렌더링해 content_rendered, content_text,
+word_count, reading_time으로 저장하고, 조회 시에는 저장된 HTML을 그대로 사용하는지 검증
+
+## 📋 테스트 범위
+- 콘텐츠 타입 추정 (HTML/일반 텍스트)
+- 생성 시 렌더링 필드 저장, 지정된 타입 사용
+- 수정 시 재렌더링 조건 (본문/타입 변경, 기존 타입 유지)
+- 기존 게시글 렌더링 백필 (배치, 재시작 가능)
+- 상세 조회 캐시/집계 필드에 저장된 HTML 포함
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from bson import ObjectId
+from nadle_backend.models.core import PostCreate, PostUpdate, PostMetadata
+from nadle_backend.repositories.post_repository import PostRepository, POST_DETAIL_FIELDS
+from nadle_backend.services.content_service import ContentService
+from nadle_backend.services.posts_service import POST_DETAIL_CACHE_FIELDS, POST_DETAIL_OUTPUT
+
+RENDER_FIELDS = ("content_type", "content_rendered", "content_text", "word_count", "reading_time")
+
+
+def _post(**overrides):
+    post = MagicMock()
+    post.id = ObjectId()
+    post.slug = f"{post.id}-제목"
+    post.title = "제목"
+    post.content = "예전 본문"
+    post.content_type = "text"
+    post.content_text = "예전 본문"
+    post.content_rendered = "예전 본문"
+    post.metadata = PostMetadata(tags=["태그"])
+    post.update = AsyncMock()
+    for key, value in overrides.items():
+        setattr(post, key, value)
+    return post
+
+
+class TestContentTypeDetection:
+    """콘텐츠 타입 추정 테스트."""
+
+    @pytest.mark.parametrize("content, expected", [
+        ("<p>문단</p>", "html"),
+        ("줄1<br/>줄2", "html"),
+        ("a < b 그리고 c > d", "text"),
+        ("그냥 텍스트\n두 번째 줄", "text"),
+    ])
+    def test_detect_content_type(self, content, expected):
+        """태그가 있으면 html, 없으면 text로 추정해야 함."""
+        assert ContentService.detect_content_type(content) == expected
+
+
+class TestRenderOnCreate:
+    """생성 시 렌더링 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_create_stores_rendered_fields(self):
+        """생성 시 새니타이징된 HTML과 텍스트/단어 수를 함께 저장해야 함."""
+        post_data = PostCreate(
+            title="공지",
+            content='<p>hello world</p><script>alert(1)</script>',
+            service="residential_community",
+            metadata=PostMetadata(type="board")
+        )
+
+        with patch("nadle_backend.repositories.post_repository.Post") as mock_post_cls:
+            mock_post_cls.return_value.save = AsyncMock()
+            mock_post_cls.return_value.id = ObjectId()
+            await PostRepository().create(post_data, author_id=str(ObjectId()))
+
+        kwargs = mock_post_cls.call_args.kwargs
+        assert kwargs["content_type"] == "html"
+        assert kwargs["content_rendered"] == "<p>hello world</p>alert(1)"
+        assert kwargs["content_text"] == "hello world alert(1)"
+        assert kwargs["word_count"] == 3
+        assert kwargs["reading_time"] == 1
+
+    @pytest.mark.asyncio
+    async def test_create_uses_requested_content_type(self):
+        """지정된 콘텐츠 타입으로 렌더링해야 함."""
+        post_data = PostCreate(
+            title="마크다운", content="**굵게**", content_type="markdown",
+            service="residential_community", metadata=PostMetadata(type="board")
+        )
+
+        with patch("nadle_backend.repositories.post_repository.Post") as mock_post_cls:
+            mock_post_cls.return_value.save = AsyncMock()
+            mock_post_cls.return_value.id = ObjectId()
+            await PostRepository().create(post_data, author_id=str(ObjectId()))
+
+        kwargs = mock_post_cls.call_args.kwargs
+        assert kwargs["content_type"] == "markdown"
+        assert "<strong>굵게</strong>" in kwargs["content_rendered"]
+
+
+class TestRenderOnUpdate:
+    """수정 시 렌더링 테스트."""
+
+    async def _update(self, post, update):
+        repo = PostRepository()
+        with patch.object(repo, "get_by_id", AsyncMock(return_value=post)):
+            await repo.update(str(post.id), update)
+        return post.update.call_args[0][0]["$set"]
+
+    @pytest.mark.asyncio
+    async def test_content_change_rerenders_with_stored_type(self):
+        """본문 수정 시 기존 마크다운 타입을 유지해서 다시 렌더링해야 함."""
+        post = _post(content_type="markdown")
+
+        update_set = await self._update(post, PostUpdate(content="# 새 제목"))
+
+        assert update_set["content_type"] == "markdown"
+        assert update_set["content_rendered"] == "<h1>새 제목</h1>"
+        assert update_set["content_text"] == "새 제목"
+        assert "새제" not in update_set["search_terms"]["body"].split()
+
+    @pytest.mark.asyncio
+    async def test_title_change_reuses_stored_text(self):
+        """제목만 수정하면 다시 렌더링하지 않고 저장된 텍스트로 검색 필드를 만들어야 함."""
+        post = _post()
+
+        with patch.object(ContentService, "render_for_storage") as render:
+            update_set = await self._update(post, PostUpdate(title="바뀐 제목"))
+
+        render.assert_not_called()
+        assert "content_rendered" not in update_set
+        assert update_set["content_text"] == "예전 본문"
+
+    @pytest.mark.asyncio
+    async def test_unrendered_post_filled_on_search_field_change(self):
+        """렌더링 필드가 없는 기존 게시글은 검색 필드 갱신 시 함께 채워야 함."""
+        post = _post(content="<strong>예전</strong> 본문", content_rendered=None, content_text=None)
+
+        update_set = await self._update(post, PostUpdate(title="바뀐 제목"))
+
+        assert update_set["content_rendered"] == "<strong>예전</strong> 본문"
+        assert update_set["content_text"] == "예전 본문"
+
+
+class TestRenderBackfill:
+    """기존 게시글 렌더링 백필 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_backfill_renders_missing_in_batches(self):
+        """렌더링 필드가 없는 게시글만 _id 순서로 배치 저장해야 함."""
+        from nadle_backend.database.backfill import backfill_post_rendering
+
+        docs = [
+            {"_id": ObjectId(), "title": "하나", "content": "<p>본문</p>", "content_type": "text"},
+            {"_id": ObjectId(), "title": "둘", "content": "**굵게**", "content_type": "markdown"},
+            {"_id": ObjectId(), "title": "셋", "content": "일반\n텍스트"},
+        ]
+
+        class _Cursor:
+            def sort(self, *args):
+                self.sort_args = args
+                return self
+
+            def __aiter__(self):
+                async def gen():
+                    for doc in docs:
+                        yield doc
+                return gen()
+
+        cursor = _Cursor()
+        collection = MagicMock()
+        collection.find.return_value = cursor
+        collection.bulk_write = AsyncMock(return_value=Mock(modified_count=2))
+        db = MagicMock()
+        db.__getitem__.return_value = collection
+
+        result = await backfill_post_rendering(db, batch_size=2)
+
+        # 모델 기본값으로 저장된 null도 대상이어야 함 ($exists: False는 null 필드와 매칭되지 않음)
+        assert collection.find.call_args[0][0] == {"content_rendered": None}
+        assert cursor.sort_args == ("_id", 1)
+        assert collection.bulk_write.await_count == 2
+        first, second = collection.bulk_write.call_args_list[0][0][0]
+        assert first._doc["$set"]["content_type"] == "html"
+        assert first._doc["$set"]["content_rendered"] == "<p>본문</p>"
+        assert "<strong>굵게</strong>" in second._doc["$set"]["content_rendered"]
+        third = collection.bulk_write.call_args_list[1][0][0][0]
+        assert third._doc["$set"]["content_rendered"] == "일반<br>텍스트"
+        assert set(RENDER_FIELDS) | {"search_terms"} == set(third._doc["$set"])
+        assert result == {"scanned": 3, "updated": 4}
+
+
+class TestStoredHtmlOnRead:
+    """조회 경로 테스트."""
+
+    def test_detail_paths_include_stored_html(self):
+        """상세 캐시/집계 조회가 저장된 HTML과 메타데이터를 포함해야 함."""
+        for fields in (POST_DETAIL_FIELDS, POST_DETAIL_OUTPUT, POST_DETAIL_CACHE_FIELDS):
+            assert {"content_type", "content_rendered", "word_count", "reading_time"} <= set(fields)
@@ -23,61 +23,64 @@ class TestPostRepositoryOptimized:
     
     @pytest.fixture
     def sample_aggregation_result(self):
-        """MongoDB aggregation 결과 샘플."""
+        """MongoDB aggregation 결과 샘플 (페이지 항목 리스트)."""
         return [
             {
-                "posts": [
-                    {
-                        "_id": "507f1f77bcf86cd799439020",
-                        "title": "정보 게시글 1",
-                        "content": "유용한 정보입니다",
-                        "slug": "507f1f77bcf86cd799439020-정보-게시글-1",
-                        "author_id": "507f1f77bcf86cd799439011",
-                        "metadata": {"type": "property-info", "category": "입주 정보"},
-                        "created_at": datetime.utcnow(),
-                        "updated_at": datetime.utcnow(),
-                        "view_count": 100,
-                        "like_count": 50,
-                        "dislike_count": 5,
-                        "comment_count": 10,
-                        "author": {
-                            "_id": "507f1f77bcf86cd799439011",
-                            "email": "test@example.com",
-                            "user_handle": "testuser",
-                            "display_name": "Test User",
-                            "created_at": datetime.utcnow(),
-                            "updated_at": datetime.utcnow()
-                        }
-                    },
-                    {
-                        "_id": "507f1f77bcf86cd799439021",
-                        "title": "정보 게시글 2",
-                        "content": "또 다른 유용한 정보",
-                        "slug": "507f1f77bcf86cd799439021-정보-게시글-2",
-                        "author_id": "507f1f77bcf86cd799439012",
-                        "metadata": {"type": "property-info", "category": "생활 정보"},
-                        "created_at": datetime.utcnow(),
-                        "updated_at": datetime.utcnow(),
-                        "view_count": 200,
-                        "like_count": 80,
-                        "dislike_count": 3,
-                        "comment_count": 15,
-                        "author": {
-                            "_id": "507f1f77bcf86cd799439012",
-                            "email": "author2@example.com",
-                            "user_handle": "author2",
-                            "display_name": "Author 2",
-                            "created_at": datetime.utcnow(),
-                            "updated_at": datetime.utcnow()
-                        }
-                    }
-                ],
-                "total": [{"count": 2}]
+                "_id": "507f1f77bcf86cd799439020",
+                "title": "정보 게시글 1",
+                "content": "유용한 정보입니다",
+                "slug": "507f1f77bcf86cd799439020-정보-게시글-1",
+                "author_id": "507f1f77bcf86cd799439011",
+                "metadata": {"type": "property-info", "category": "입주 정보"},
+                "created_at": datetime.utcnow(),
+                "updated_at": datetime.utcnow(),
+                "view_count": 100,
+                "like_count": 50,
+                "dislike_count": 5,
+                "comment_count": 10,
+                "author": {
+                    "_id": "507f1f77bcf86cd799439011",
+                    "email": "test@example.com",
+                    "user_handle": "testuser",
+                    "display_name": "Test User",
+                    "created_at": datetime.utcnow(),
+                    "updated_at": datetime.utcnow()
+                }
+            },
+            {
+                "_id": "507f1f77bcf86cd799439021",
+                "title": "정보 게시글 2",
+                "content": "또 다른 유용한 정보",
+                "slug": "507f1f77bcf86cd799439021-정보-게시글-2",
+                "author_id": "507f1f77bcf86cd799439012",
+                "metadata": {"type": "property-info", "category": "생활 정보"},
+                "created_at": datetime.utcnow(),
+                "updated_at": datetime.utcnow(),
+                "view_count": 200,
+                "like_count": 80,
+                "dislike_count": 3,
+                "comment_count": 15,
+                "author": {
+                    "_id": "507f1f77bcf86cd799439012",
+                    "email": "author2@example.com",
+                    "user_handle": "author2",
+                    "display_name": "Author 2",
+                    "created_at": datetime.utcnow(),
+                    "updated_at": datetime.utcnow()
+                }
             }
         ]
     
+    @pytest.fixture
+    def mock_count(self):
+        """count_documents를 mock한 컬렉션 (총 2건)."""
+        collection = Mock()
+        collection.count_documents = AsyncMock(return_value=2)
+        with patch.object(Post, 'get_motor_collection', return_value=collection, create=True):
+            yield collection
+    
     @pytest.mark.asyncio
-    async def test_list_posts_optimized_aggregation_pipeline(self, sample_aggregation_result):
+    async def test_list_posts_optimized_aggregation_pipeline(self, sample_aggregation_result, mock_count):
         """list_posts_optimized가 올바른 aggregation 파이프라인을 생성하는지 검증."""
         # Given: PostRepository 인스턴스
         repo = PostRepository()
@@ -99,41 +102,35 @@ class TestPostRepositoryOptimized:
             
             # 파이프라인 구조 검증
             called_pipeline = mock_aggregate.call_args[0][0]
+            stages = [next(iter(stage)) for stage in called_pipeline]
             
-            # $match 단계 확인
+            # $match 단계 확인 (인덱스 친화적인 $in 조건)
             match_stage = called_pipeline[0]
             assert "$match" in match_stage
-            assert match_stage["$match"]["status"]["$ne"] == "deleted"
+            assert "deleted" not in match_stage["$match"]["status"]["$in"]
             assert match_stage["$match"]["metadata.type"] == "property-info"
             
-            # $lookup 단계 확인 (작성자 정보 조인)
-            lookup_stage = called_pipeline[1]
-            assert "$lookup" in lookup_stage
-            lookup_config = lookup_stage["$lookup"]
+            # $sort 단계 확인 (_id tie-breaker 포함)
+            assert called_pipeline[1]["$sort"] == {"created_at": -1, "_id": -1}
+            
+            # 페이지를 자른 뒤에만 작성자 조인 ($facet 없음)
+            assert "$facet" not in stages
+            assert stages.index("$limit") < stages.index("$lookup")
+            assert stages.index("$project") < stages.index("$lookup")
+            
+            # $lookup 단계 확인 (ObjectId로 변환된 필드로 users._id 조인)
+            lookup_config = called_pipeline[stages.index("$lookup")]["$lookup"]
             assert lookup_config["from"] == "users"
-            assert lookup_config["localField"] == "author_id"
             assert lookup_config["foreignField"] == "_id"
             assert lookup_config["as"] == "author"
+            assert "$expr" not in str(lookup_config)
+            assert "password_hash" not in lookup_config["pipeline"][-1]["$project"]
             
-            # $unwind 단계 확인
-            unwind_stage = called_pipeline[2]
-            assert "$unwind" in unwind_stage
-            assert unwind_stage["$unwind"]["path"] == "$author"
-            assert unwind_stage["$unwind"]["preserveNullAndEmptyArrays"] == True
-            
-            # $sort 단계 확인
-            sort_stage = called_pipeline[3]
-            assert "$sort" in sort_stage
-            assert sort_stage["$sort"]["created_at"] == -1
-            
-            # $facet 단계 확인 (페이지네이션)
-            facet_stage = called_pipeline[4]
-            assert "$facet" in facet_stage
-            assert "posts" in facet_stage["$facet"]
-            assert "total" in facet_stage["$facet"]
+            # 총 개수는 같은 필터로 count_documents 사용
+            mock_count.count_documents.assert_awaited_once_with(match_stage["$match"])
     
     @pytest.mark.asyncio
-    async def test_list_posts_optimized_returns_correct_data(self, sample_aggregation_result):
+    async def test_list_posts_optimized_returns_correct_data(self, sample_aggregation_result, mock_count):
         """list_posts_optimized가 올바른 데이터를 반환하는지 검증."""
         # Given: PostRepository와 mock 데이터
         repo = PostRepository()
@@ -170,7 +167,7 @@ class TestPostRepositoryOptimized:
             assert second_post["author"]["user_handle"] == "author2"
     
     @pytest.mark.asyncio
-    async def test_list_posts_optimized_pagination(self, sample_aggregation_result):
+    async def test_list_posts_optimized_pagination(self, sample_aggregation_result, mock_count):
         """페이지네이션이 올바르게 적용되는지 검증."""
         # Given: PostRepository
         repo = PostRepository()
@@ -188,18 +185,15 @@ class TestPostRepositoryOptimized:
             
             # Then: 올바른 파이프라인이 생성되었는지 확인
             called_pipeline = mock_aggregate.call_args[0][0]
-            facet_stage = called_pipeline[4]
+            skip_stage = called_pipeline[2]
+            limit_stage = called_pipeline[3]
             
             # 페이지네이션 확인: (2-1) * 5 = 5 skip
-            posts_pipeline = facet_stage["$facet"]["posts"]
-            skip_stage = posts_pipeline[0]
-            limit_stage = posts_pipeline[1]
-            
             assert skip_stage["$skip"] == 5  # (page-1) * page_size
             assert limit_stage["$limit"] == 5  # page_size
     
     @pytest.mark.asyncio
-    async def test_list_posts_optimized_without_metadata_type(self, sample_aggregation_result):
+    async def test_list_posts_optimized_without_metadata_type(self, sample_aggregation_result, mock_count):
         """metadata_type 없이 호출시 필터 없음 확인."""
         # Given: PostRepository
         repo = PostRepository()
@@ -224,11 +218,12 @@ class TestPostRepositoryOptimized:
             assert "metadata.type" not in match_stage["$match"]
     
     @pytest.mark.asyncio
-    async def test_list_posts_optimized_empty_result(self):
+    async def test_list_posts_optimized_empty_result(self, mock_count):
         """빈 결과 처리 확인."""
         # Given: PostRepository와 빈 결과
         repo = PostRepository()
         empty_result = []
+        mock_count.count_documents.return_value = 0
         
         with patch.object(Post, 'aggregate') as mock_aggregate:
             mock_aggregate.return_value.to_list = AsyncMock(return_value=empty_result)
@@ -246,7 +241,7 @@ class TestPostRepositoryOptimized:
             assert total == 0
     
     @pytest.mark.asyncio
-    async def test_list_posts_optimized_different_sort_fields(self, sample_aggregation_result):
+    async def test_list_posts_optimized_different_sort_fields(self, sample_aggregation_result, mock_count):
         """다양한 정렬 필드 테스트."""
         # Given: PostRepository
         repo = PostRepository()
@@ -264,7 +259,7 @@ class TestPostRepositoryOptimized:
             
             # Then: view_count 내림차순 정렬 확인
             called_pipeline = mock_aggregate.call_args[0][0]
-            sort_stage = called_pipeline[3]
+            sort_stage = called_pipeline[1]
             assert sort_stage["$sort"]["view_count"] == -1
     
     def test_list_posts_optimized_method_exists(self):
@@ -0,0 +1,266 @@
+"""게시글 전문 검색 테스트.
+
+## 🎯 테스트 목표
+정규식 전체 스캔 대신 토큰화된 텍스트 인덱스 검색 검증
+
+## 📋 테스트 범위
+- 한국어 n-gram 토큰화 및 검색어 변환 (사용자 입력 이스케이프)
+- 게시글 생성/수정 시 content_text, search_terms 저장
+- $text 검색, 관련도 정렬, 페이지네이션
+- 텍스트 인덱스가 없을 때 이스케이프된 정규식 대체 경로
+- 백필 작업
+"""
+
+import re
+import pytest
+from unittest.mock import Mock, AsyncMock, MagicMock, patch
+from bson import ObjectId
+from pymongo.errors import OperationFailure
+from nadle_backend.models.core import Post, PostCreate, PostUpdate, PostMetadata
+from nadle_backend.repositories.post_repository import PostRepository
+from nadle_backend.utils.search_text import (
+    tokenize, build_search_terms, build_text_query, extract_search_text
+)
+
+
+class TestSearchTokenizer:
+    """검색 토큰화 테스트."""
+
+    def test_korean_bigrams_match_inflected_words(self):
+        """조사가 붙은 단어도 검색어 bi-gram을 모두 포함해야 함."""
+        stored = set(tokenize("서울에서 이사했어요"))
+        query = tokenize("서울", include_unigrams=False)
+
+        assert query == ["서울"]
+        assert set(query) <= stored
+
+    def test_single_syllable_query_uses_unigram(self):
+        """한 글자 검색어는 저장된 uni-gram과 매칭되어야 함."""
+        assert "집" in tokenize("우리집 이야기")
+        assert tokenize("집", include_unigrams=False) == ["집"]
+
+    def test_latin_words_lowercased(self):
+        """영문은 소문자 단어 단위로 토큰화되어야 함."""
+        assert tokenize("FastAPI 튜토리얼 v2") == ["fastapi", "튜토", "토리", "리얼", "튜", "토", "리", "얼", "v2"]
+
+    def test_extract_search_text_strips_html(self):
+        """HTML 태그를 제거하고 블록 사이를 공백으로 구분해야 함."""
+        assert extract_search_text("<p>첫 문단</p><p>둘째</p>") == "첫 문단 둘째"
+        assert extract_search_text(None) == ""
+
+    def test_build_search_terms_fields(self):
+        """제목/태그/본문별 토큰 문자열을 생성해야 함."""
+        terms = build_search_terms("이사 후기", "포장이사 추천", ["이사"])
+
+        assert set(terms) == {"title", "tags", "body"}
+        assert "이사" in terms["title"].split()
+        assert "포장" in terms["body"].split()
+
+    @pytest.mark.parametrize("query", ['"-서울" OR', '.*(a+)+$', '{"$ne": 1}'])
+    def test_text_query_escapes_operators(self, query):
+        """따옴표/부정/정규식 문자는 검색 문자열에 남지 않아야 함."""
+        text_query = build_text_query(query)
+
+        for token in re.findall(r'"([^"]*)"', text_query):
+            assert re.fullmatch(r"[0-9a-z가-힣]+", token)
+        assert "-" not in text_query.replace('"', "")
+
+    def test_text_query_empty(self):
+        """토큰이 없는 검색어는 None을 반환해야 함."""
+        assert build_text_query("   !!! ") is None
+
+
+def _aggregate_mock(result):
+    cursor = Mock()
+    cursor.to_list = AsyncMock(return_value=result)
+    return cursor
+
+
+class TestSearchPosts:
+    """PostRepository.search_posts 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_text_search_sorted_by_score(self):
+        """기본 정렬은 textScore이며 $text 조건으로 검색해야 함."""
+        repo = PostRepository()
+        find_result = Mock()
+        find_result.count = AsyncMock(return_value=42)
+
+        with patch.object(Post, "aggregate", return_value=_aggregate_mock(["p1"])) as mock_aggregate, \
+             patch.object(Post, "find", return_value=find_result) as mock_find:
+            posts, total = await repo.search_posts("서울 이사", metadata_type="board", page=3, page_size=10)
+
+        assert posts == ["p1"]
+        assert total == 42
+
+        pipeline = mock_aggregate.call_args[0][0]
+        match = pipeline[0]["$match"]
+        assert match["$text"]["$search"] == '"서울" "이사"'
+        assert match["metadata.type"] == {"$in": [None, "board"]}
+        assert pipeline[1]["$sort"] == {"score": {"$meta": "textScore"}, "_id": -1}
+        assert pipeline[2] == {"$skip": 20}
+        assert pipeline[3] == {"$limit": 10}
+        assert mock_aggregate.call_args.kwargs["projection_model"] is Post
+        assert mock_find.call_args[0][0] == match
+
+    @pytest.mark.asyncio
+    async def test_explicit_sort_field(self):
+        """정렬 필드를 지정하면 해당 필드 내림차순으로 정렬해야 함."""
+        repo = PostRepository()
+        find_result = Mock()
+        find_result.count = AsyncMock(return_value=0)
+
+        with patch.object(Post, "aggregate", return_value=_aggregate_mock([])) as mock_aggregate, \
+             patch.object(Post, "find", return_value=find_result):
+            await repo.search_posts("이사", sort_by="view_count")
+
+        assert mock_aggregate.call_args[0][0][1]["$sort"] == {"view_count": -1, "_id": -1}
+
+    @pytest.mark.asyncio
+    async def test_empty_query_returns_nothing(self):
+        """검색 가능한 토큰이 없으면 DB를 조회하지 않아야 함."""
+        repo = PostRepository()
+
+        with patch.object(Post, "aggregate") as mock_aggregate:
+            posts, total = await repo.search_posts("  ")
+
+        assert (posts, total) == ([], 0)
+        mock_aggregate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_escaped_regex_without_index(self):
+        """텍스트 인덱스가 없으면 이스케이프된 정규식으로 검색해야 함."""
+        repo = PostRepository()
+        failing = Mock()
+        failing.to_list = AsyncMock(side_effect=OperationFailure("text index required for $text query", code=27))
+        regex_find = MagicMock()
+        regex_find.count = AsyncMock(return_value=1)
+        regex_find.sort.return_value.skip.return_value.limit.return_value.to_list = AsyncMock(return_value=["p"])
+
+        with patch.object(Post, "aggregate", return_value=failing), \
+             patch.object(Post, "find", return_value=regex_find) as mock_find:
+            posts, total = await repo.search_posts("a+b (c)")
+
+        assert (posts, total) == (["p"], 1)
+        regex_filter = mock_find.call_args[0][0]
+        assert regex_filter["$or"][0]["title"]["$regex"] == re.escape("a+b (c)")
+
+    @pytest.mark.asyncio
+    async def test_other_operation_failures_propagate(self):
+        """인덱스 없음 이외의 DB 오류는 그대로 전파되어야 함."""
+        repo = PostRepository()
+        failing = Mock()
+        failing.to_list = AsyncMock(side_effect=OperationFailure("boom", code=2))
+        find_result = Mock()
+        find_result.count = AsyncMock(return_value=0)
+
+        with patch.object(Post, "aggregate", return_value=failing), \
+             patch.object(Post, "find", return_value=find_result):
+            with pytest.raises(OperationFailure):
+                await repo.search_posts("이사")
+
+
+class TestSearchFieldsOnWrite:
+    """게시글 생성/수정 시 검색 필드 저장 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_create_fills_search_fields(self):
+        """생성 시 content_text와 search_terms를 저장해야 함."""
+        repo = PostRepository()
+        post_data = PostCreate(
+            title="포장이사 후기",
+            content="<p>서울에서 부산으로</p>",
+            service="residential_community",
+            metadata=PostMetadata(type="board", tags=["이사"])
+        )
+
+        with patch("nadle_backend.repositories.post_repository.Post") as mock_post_cls:
+            mock_post_cls.return_value.save = AsyncMock()
+            mock_post_cls.return_value.id = ObjectId()
+            await repo.create(post_data, author_id=str(ObjectId()))
+
+        kwargs = mock_post_cls.call_args.kwargs
+        assert kwargs["content_text"] == "서울에서 부산으로"
+        assert "부산" in kwargs["search_terms"]["body"].split()
+        assert "포장" in kwargs["search_terms"]["title"].split()
+        assert kwargs["search_terms"]["tags"].split()[0] == "이사"
+
+    @pytest.mark.asyncio
+    async def test_update_refreshes_search_fields(self):
+        """본문 수정 시 검색 필드를 다시 계산해야 함."""
+        repo = PostRepository()
+        post = MagicMock()
+        post.id = ObjectId()
+        post.slug = f"{post.id}-제목"
+        post.title = "제목"
+        post.content = "예전 본문"
+        post.metadata = PostMetadata(tags=["태그"])
+        post.update = AsyncMock()
+
+        with patch.object(repo, "get_by_id", AsyncMock(return_value=post)):
+            await repo.update(str(post.id), PostUpdate(content="새로운 본문"))
+
+        update_set = post.update.call_args[0][0]["$set"]
+        assert update_set["content_text"] == "새로운 본문"
+        assert "새로" in update_set["search_terms"]["body"].split()
+        assert update_set["search_terms"]["tags"] == "태그 태 그"
+
+    @pytest.mark.asyncio
+    async def test_update_without_text_change_skips(self):
+        """검색 대상이 아닌 필드만 수정하면 검색 필드를 건드리지 않아야 함."""
+        repo = PostRepository()
+        post = MagicMock()
+        post.id = ObjectId()
+        post.update = AsyncMock()
+
+        with patch.object(repo, "get_by_id", AsyncMock(return_value=post)):
+            await repo.update(str(post.id), PostUpdate(status="archived"))
+
+        update_set = post.update.call_args[0][0]["$set"]
+        assert "search_terms" not in update_set
+
+
+class TestSearchBackfill:
+    """검색 필드 백필 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_backfill_updates_missing_and_swaps_index(self):
+        """누락된 문서만 배치 업데이트하고 기존 텍스트 인덱스를 교체해야 함."""
+        from nadle_backend.database.backfill import backfill_post_search_terms
+
+        docs = [
+            {"_id": ObjectId(), "title": "제목 하나", "content": "<b>본문</b>", "metadata": {"tags": ["태그"]}},
+            {"_id": ObjectId(), "title": "제목 둘", "content": "본문 둘"},
+            {"_id": ObjectId(), "title": "제목 셋", "content": "본문 셋"},
+        ]
+
+        class _Cursor:
+            def sort(self, *args):
+                return self
+
+            def __aiter__(self):
+                async def gen():
+                    for doc in docs:
+                        yield doc
+                return gen()
+
+        collection = MagicMock()
+        collection.find.return_value = _Cursor()
+        collection.bulk_write = AsyncMock(return_value=Mock(modified_count=2))
+        collection.index_information = AsyncMock(return_value={"_id_": {}, "post_text_search_idx": {}})
+        collection.drop_index = AsyncMock()
+        collection.create_indexes = AsyncMock()
+        db = MagicMock()
+        db.__getitem__.return_value = collection
+
+        result = await backfill_post_search_terms(db, batch_size=2)
+
+        assert collection.find.call_args[0][0] == {"search_terms": {"$exists": False}}
+        assert collection.bulk_write.await_count == 2
+        first_batch = collection.bulk_write.call_args_list[0][0][0]
+        assert first_batch[0]._doc["$set"]["content_text"] == "본문"
+        assert collection.bulk_write.call_args_list[0].kwargs["ordered"] is False
+        assert result == {"scanned": 3, "updated": 4}
+        collection.drop_index.assert_awaited_once_with("post_text_search_idx")
+        created = collection.create_indexes.call_args[0][0][0]
+        assert created.document["name"] == "post_search_terms_idx"
@@ -90,6 +90,7 @@ class TestPostsServiceEnhanced:
         post.author_id = "user123"
         post.service = "residential_community"
         post.status = "published"
+        post.view_count = 0
         post.created_at = datetime.utcnow()
         post.updated_at = datetime.utcnow()
         post.metadata = PostMetadata(type="자유게시판")
@@ -0,0 +1,202 @@
+"""Redis 상태 머신 및 서킷 브레이커 테스트.
+
+## 🎯 테스트 목표
+캐시 명령마다 PING을 보내지 않고, 장애 시 서킷 브레이커가 캐시 호출을 즉시 건너뛰는지 검증
+
+## 📋 테스트 범위
+- CLOSED → OPEN → HALF_OPEN → CLOSED 상태 전이
+- RedisManager / UpstashRedisManager: PING 없는 is_connected, 명령 결과 기록
+- 연결 오류와 명령 오류 구분
+- 백그라운드 프로브
+"""
+
+import asyncio
+import pytest
+import redis.asyncio as redis
+from unittest.mock import AsyncMock, MagicMock, patch
+from nadle_backend.database.redis_health import RedisHealth, CircuitState
+from nadle_backend.database.redis import RedisManager
+from nadle_backend.database.upstash_redis import UpstashRedisManager
+
+
+class TestRedisHealth:
+    """RedisHealth 상태 전이 테스트."""
+
+    def test_opens_after_consecutive_failures(self):
+        """연속 실패가 임계값에 도달하면 OPEN으로 전환하고 호출을 차단해야 함."""
+        health = RedisHealth("test", failure_threshold=3, cooldown=30)
+
+        health.record_failure("timeout")
+        health.record_failure("timeout")
+        assert health.allow() is True
+
+        health.record_failure("timeout")
+        assert health.state is CircuitState.OPEN
+        assert health.allow() is False
+        assert health.snapshot()["short_circuited"] == 1
+
+    def test_success_resets_failure_count(self):
+        """성공하면 연속 실패 횟수를 초기화해야 함."""
+        health = RedisHealth("test", failure_threshold=2, cooldown=30)
+
+        health.record_failure("timeout")
+        health.record_success()
+        health.record_failure("timeout")
+
+        assert health.state is CircuitState.CLOSED
+
+    def test_half_open_after_cooldown(self):
+        """쿨다운이 지나면 HALF_OPEN이 되고 결과에 따라 닫히거나 다시 열려야 함."""
+        health = RedisHealth("test", failure_threshold=1, cooldown=30)
+
+        with patch("nadle_backend.database.redis_health.time.monotonic", return_value=100.0):
+            health.record_failure("down")
+        with patch("nadle_backend.database.redis_health.time.monotonic", return_value=131.0):
+            assert health.state is CircuitState.HALF_OPEN
+            assert health.allow() is True
+            health.record_failure("still down")
+            assert health.state is CircuitState.OPEN
+
+        with patch("nadle_backend.database.redis_health.time.monotonic", return_value=162.0):
+            assert health.state is CircuitState.HALF_OPEN
+            health.record_success()
+            assert health.state is CircuitState.CLOSED
+            assert health.snapshot()["state"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_probe_runs_periodically(self):
+        """프로브가 주기적으로 실행되고 중지되어야 함."""
+        health = RedisHealth("test", probe_interval=0.01)
+        probe = AsyncMock(return_value=True)
+
+        health.start_probe(probe)
+        await asyncio.sleep(0.05)
+        await health.stop_probe()
+
+        assert probe.await_count >= 2
+        assert health.snapshot()["probe_running"] is False
+
+
+@pytest.fixture
+def redis_manager():
+    manager = RedisManager()
+    manager.redis_client = MagicMock()
+    manager.redis_client.ping = AsyncMock()
+    manager._connected = True
+    manager.health = RedisHealth("local", failure_threshold=2, cooldown=30)
+    return manager
+
+
+class TestRedisManagerHealth:
+    """RedisManager 서킷 브레이커 연동 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_get_does_not_ping(self, redis_manager):
+        """조회 시 PING 없이 한 번의 명령만 보내야 함."""
+        redis_manager.redis_client.get = AsyncMock(return_value='{"a": 1}')
+
+        assert await redis_manager.get("k") == {"a": 1}
+        redis_manager.redis_client.ping.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_connection_errors_open_circuit(self, redis_manager):
+        """연결 오류가 반복되면 이후 호출은 Redis를 건드리지 않아야 함."""
+        redis_manager.redis_client.get = AsyncMock(side_effect=redis.ConnectionError("refused"))
+
+        assert await redis_manager.get("a") is None
+        assert await redis_manager.get("b") is None
+        assert await redis_manager.get("c") is None
+
+        assert redis_manager.redis_client.get.await_count == 2
+        assert redis_manager.health.state is CircuitState.OPEN
+        assert await redis_manager.is_connected() is False
+
+    @pytest.mark.asyncio
+    async def test_command_errors_do_not_open_circuit(self, redis_manager):
+        """명령 오류는 서버가 응답한 것이므로 장애로 기록하지 않아야 함."""
+        redis_manager.redis_client.get = AsyncMock(side_effect=redis.ResponseError("WRONGTYPE"))
+
+        for _ in range(3):
+            await redis_manager.get("k")
+
+        assert redis_manager.health.state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_ping_records_result(self, redis_manager):
+        """프로브 PING 결과가 상태에 기록되어야 함."""
+        redis_manager.redis_client.ping.side_effect = redis.TimeoutError("timeout")
+
+        assert await redis_manager.ping() is False
+        assert redis_manager.health.consecutive_failures == 1
+
+    @pytest.mark.asyncio
+    async def test_health_check_reports_circuit(self, redis_manager):
+        """상태 확인 응답에 서킷 상태가 포함되어야 함."""
+        redis_manager.health.record_failure("down")
+        redis_manager.health.record_failure("down")
+
+        health = await redis_manager.health_check()
+
+        assert health["status"] == "circuit_open"
+        assert health["circuit"]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_subscribe_survives_idle_timeouts(self, redis_manager):
+        """조용한 채널의 대기 시간 초과(None)는 구독을 끊지 않고 연결 오류만 전달해야 함."""
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock()
+        pubsub.aclose = AsyncMock()
+        pubsub.get_message = AsyncMock(side_effect=[
+            None,
+            None,
+            {"type": "message", "data": "hello"},
+            redis.ConnectionError("closed"),
+        ])
+        redis_manager.redis_client.pubsub = MagicMock(return_value=pubsub)
+
+        received = []
+        with pytest.raises(redis.ConnectionError):
+            async for message in redis_manager.subscribe("events"):
+                received.append(message)
+
+        assert received == ["hello"]
+        for call in pubsub.get_message.await_args_list:
+            assert call.kwargs["timeout"] is not None
+        pubsub.aclose.assert_awaited_once()
+
+
+class TestUpstashManagerHealth:
+    """UpstashRedisManager 서킷 브레이커 연동 테스트."""
+
+    def _response(self, status, body):
+        response = MagicMock()
+        response.status = status
+        response.json = AsyncMock(return_value=body)
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=response)
+        context.__aexit__ = AsyncMock(return_value=False)
+        return context
+
+    @pytest.mark.asyncio
+    async def test_single_request_per_get_and_5xx_opens_circuit(self):
+        """조회마다 HTTPS 요청은 한 번이며 5xx 응답은 장애로 기록해야 함."""
+        manager = UpstashRedisManager()
+        manager.rest_url = "https://upstash.example"
+        manager._connected = True
+        manager.session = MagicMock()
+        manager.health = RedisHealth("upstash", failure_threshold=2, cooldown=30)
+        manager.session.post.side_effect = [
+            self._response(200, {"result": "value"}),
+            self._response(502, {"error": "bad gateway"}),
+            self._response(503, {"error": "unavailable"}),
+        ]
+
+        assert await manager.get("k") == "value"
+        assert manager.session.post.call_count == 1
+
+        await manager.get("k")
+        await manager.get("k")
+        assert manager.health.state is CircuitState.OPEN
+
+        assert await manager.get("k") is None
+        assert manager.session.post.call_count == 3
@@ -0,0 +1,202 @@
+"""Redis 세션 저장소 테스트.
+
+## 🎯 테스트 목표
+세션 생성/조회/삭제가 각각 Lua 스크립트 한 번(왕복 한 번)으로 원자적으로 처리되고,
+JSON 목록을 읽고-수정-쓰는 경쟁 조건 없이 동작하는지 검증
+
+## 📋 테스트 범위
+- 세션 생성 (해시 필드, 동시 세션 제한 인자, 저장 실패)
+- 세션 조회 (해시 → SessionData 변환, 활동 갱신 간격, 만료 세션 삭제)
+- 사용자 세션 목록/전체 삭제
+- 이전 형식(JSON 문자열) 키와 분리된 키 네임스페이스
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from redis.exceptions import ResponseError
+from nadle_backend.database.redis_factory import get_prefixed_key
+from nadle_backend.services.session_service import (
+    CREATE_SESSION_SCRIPT,
+    DELETE_SESSION_SCRIPT,
+    DELETE_USER_SESSIONS_SCRIPT,
+    GET_SESSION_SCRIPT,
+    SessionData,
+    SessionService,
+)
+
+SERVICE = "nadle_backend.services.session_service"
+
+
+def _redis(result=None):
+    redis_manager = MagicMock()
+    redis_manager.is_connected = AsyncMock(return_value=True)
+    redis_manager.eval_script = AsyncMock(return_value=result)
+    return redis_manager
+
+
+def _session_data(**overrides):
+    data = {
+        "user_id": "user1", "email": "user@example.com", "access_token": "access",
+        "refresh_token": "refresh", "ip_address": "127.0.0.1", "user_agent": "pytest",
+        "expires_at": datetime.now() + timedelta(days=7)
+    }
+    data.update(overrides)
+    return SessionData(**data)
+
+
+def _hash_fields(session_data):
+    fields = []
+    for key, value in session_data.model_dump(mode="json").items():
+        fields.extend([key, str(value)])
+    return fields + ["last_seen", "1700000000.0"]
+
+
+class TestCreateSession:
+    """세션 생성 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_create_runs_single_script(self):
+        """세션 저장, 목록 추가, 동시 세션 제한을 스크립트 하나로 처리해야 함."""
+        redis_manager = _redis(result=["old-session"])
+        service = SessionService()
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=redis_manager)):
+            session_id = await service.create_session(_session_data(), ttl=600, max_concurrent_sessions=3)
+
+        assert session_id
+        redis_manager.eval_script.assert_awaited_once()
+        script, keys, args = redis_manager.eval_script.call_args.args
+        assert script == CREATE_SESSION_SCRIPT
+        assert keys == [service._get_session_key(session_id), service._get_user_sessions_key("user1")]
+        assert args[0] == session_id
+        assert args[1] == 600
+        assert args[3] == 3
+        fields = dict(zip(args[5::2], args[6::2]))
+        assert fields["user_id"] == "user1"
+        assert "last_seen" in fields
+
+    @pytest.mark.asyncio
+    async def test_create_fails_when_script_fails(self):
+        """스크립트 실행이 실패하면 세션 ID 대신 None을 반환해야 함."""
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=_redis(result=None))):
+            assert await SessionService().create_session(_session_data()) is None
+
+
+class TestGetSession:
+    """세션 조회 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_get_returns_session_with_touch_interval(self):
+        """조회는 해시를 SessionData로 변환하고 활동 갱신 간격을 스크립트에 전달해야 함."""
+        stored = _session_data()
+        redis_manager = _redis(result=_hash_fields(stored))
+        service = SessionService()
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=redis_manager)):
+            session = await service.get_session("sid")
+
+        assert session.user_id == "user1"
+        assert session.expires_at == stored.expires_at
+        script, keys, args = redis_manager.eval_script.call_args.args
+        assert script == GET_SESSION_SCRIPT
+        assert keys == [service._get_session_key("sid")]
+        assert args[3] == service.settings.session_touch_interval
+
+    @pytest.mark.asyncio
+    async def test_missing_session_returns_none(self):
+        """없는 세션은 None을 반환해야 함."""
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=_redis(result=[]))):
+            assert await SessionService().get_session("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_session_is_deleted(self):
+        """만료 시각이 지난 세션은 삭제하고 None을 반환해야 함."""
+        expired = _session_data(expires_at=datetime.now() - timedelta(seconds=1))
+        redis_manager = _redis()
+        redis_manager.eval_script.side_effect = [_hash_fields(expired), 1]
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=redis_manager)):
+            assert await SessionService().get_session("sid") is None
+
+        assert redis_manager.eval_script.call_args.args[0] == DELETE_SESSION_SCRIPT
+
+
+class TestUserSessions:
+    """사용자 세션 목록/삭제 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_list_maps_rows(self):
+        """목록 스크립트 결과를 세션 요약 딕셔너리로 변환해야 함."""
+        rows = [["sid1", "2025-01-01T00:00:00", "2025-01-02T00:00:00", "127.0.0.1", "pytest"]]
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=_redis(result=rows))):
+            sessions = await SessionService().get_user_sessions("user1")
+
+        assert sessions == [{
+            "session_id": "sid1", "created_at": "2025-01-01T00:00:00",
+            "last_activity": "2025-01-02T00:00:00", "ip_address": "127.0.0.1", "user_agent": "pytest"
+        }]
+
+    @pytest.mark.asyncio
+    async def test_delete_user_sessions_in_one_call(self):
+        """사용자 세션 전체 삭제는 세션 수와 무관하게 스크립트 한 번이어야 함."""
+        redis_manager = _redis(result=4)
+        service = SessionService()
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=redis_manager)):
+            assert await service.delete_user_sessions("user1") == 4
+
+        redis_manager.eval_script.assert_awaited_once()
+        script, keys, _ = redis_manager.eval_script.call_args.args
+        assert script == DELETE_USER_SESSIONS_SCRIPT
+        assert keys == [service._get_user_sessions_key("user1")]
+
+
+class TestLegacyKeys:
+    """이전 형식 세션 키 공존 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_legacy_string_keys_do_not_collide(self):
+        """이전 형식의 문자열 세션/목록 키가 남아 있어도 WRONGTYPE 없이 동작해야 함."""
+        legacy_strings = {get_prefixed_key("session:legacy-sid"), get_prefixed_key("user_sessions:user1")}
+        touched = []
+
+        async def eval_script(script, keys, args):
+            # 해시/정렬 집합 명령이 문자열 키에 닿으면 Redis는 WRONGTYPE 오류를 반환
+            touched.extend(keys)
+            if legacy_strings.intersection(keys):
+                raise ResponseError("WRONGTYPE Operation against a key holding the wrong kind of value")
+            return 1 if script == DELETE_USER_SESSIONS_SCRIPT else []
+
+        redis_manager = _redis()
+        redis_manager.eval_script = AsyncMock(side_effect=eval_script)
+        service = SessionService()
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=redis_manager)):
+            assert await service.create_session(_session_data(), ttl=600)
+            assert await service.get_session("legacy-sid") is None
+            assert await service.delete_user_sessions("user1") == 1
+
+        assert touched and not legacy_strings.intersection(touched)
+
+
+class TestEvalScript:
+    """Redis 스크립트 실행 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_script_registered_once_and_reused(self):
+        """같은 스크립트는 한 번만 등록하고 이후 EVALSHA로 재사용해야 함."""
+        from nadle_backend.database.redis import RedisManager
+
+        manager = RedisManager()
+        manager._connected = True
+        runner = AsyncMock(return_value=1)
+        manager.redis_client = MagicMock()
+        manager.redis_client.register_script.return_value = runner
+
+        assert await manager.eval_script(DELETE_SESSION_SCRIPT, ["k"], ["sid", "p:"]) == 1
+        assert await manager.eval_script(DELETE_SESSION_SCRIPT, ["k"], ["sid", "p:"]) == 1
+
+        manager.redis_client.register_script.assert_called_once_with(DELETE_SESSION_SCRIPT)
+        runner.assert_awaited_with(keys=["k"], args=["sid", "p:"])
@@ -0,0 +1,199 @@
+"""토큰 폐기 로컬 필터 테스트.
+
+## 🎯 테스트 목표
+폐기되지 않은 토큰(일반적인 경우)은 Redis 호출 없이 워커 메모리에서 확인되고,
+폐기 이벤트가 저널/pub-sub으로 모든 워커에 반영되는지 검증
+
+## 📋 테스트 범위
+- 동기화된 필터의 음성 응답은 네트워크 호출 없음
+- 로컬 적중 시 Redis 확인 (오탐 방지), 미동기화 시 Redis 조회
+- 폐기 기록 (로컬 반영 + 저널 + 발행) 및 다른 워커 이벤트 처리
+- 저널 로드, 만료 항목 정리
+- 사용자 전체 폐기 시각 이전 발급 토큰만 무효
+"""
+
+import json
+import time
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from nadle_backend.services.token_blacklist_service import RevocationFilter, TokenBlacklistService
+
+SERVICE = "nadle_backend.services.token_blacklist_service"
+TOKEN = "header.payload.signature"
+
+
+def _redis(connected=True):
+    redis_manager = MagicMock()
+    redis_manager.is_connected = AsyncMock(return_value=connected)
+    redis_manager.exists = AsyncMock(return_value=True)
+    redis_manager.get = AsyncMock(return_value=None)
+    redis_manager.set = AsyncMock(return_value=True)
+    redis_manager.zadd = AsyncMock(return_value=1)
+    redis_manager.zrangebyscore = AsyncMock(return_value=[])
+    redis_manager.zremrangebyscore = AsyncMock(return_value=0)
+    redis_manager.publish = AsyncMock(return_value=1)
+    return redis_manager
+
+
+@pytest.fixture
+def service():
+    service = TokenBlacklistService()
+    service.revocations.ready = True
+    return service
+
+
+class TestLocalLookup:
+    """로컬 필터 조회 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_unrevoked_token_checked_without_network(self, service):
+        """동기화된 필터에 없는 토큰은 Redis 호출 없이 유효해야 함."""
+        get_manager = AsyncMock()
+        with patch(f"{SERVICE}.get_redis_manager", get_manager):
+            assert await service.is_blacklisted(TOKEN) is False
+            assert await service.is_user_blacklisted("user1", issued_at=time.time()) is False
+
+        get_manager.assert_not_awaited()
+        assert service.filter_stats()["local_negative"] == 2
+
+    @pytest.mark.asyncio
+    async def test_local_hit_confirmed_by_redis(self, service):
+        """로컬 적중은 Redis로 확인하고, Redis에 없으면 폐기되지 않은 것으로 판단해야 함."""
+        service.revocations.add_token(service._get_token_hash(TOKEN), time.time() + 60)
+        redis_manager = _redis()
+        redis_manager.exists.return_value = False
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=redis_manager)):
+            assert await service.is_blacklisted(TOKEN) is False
+
+        redis_manager.exists.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_local_hit_trusted_when_redis_down(self, service):
+        """Redis를 사용할 수 없으면 로컬 필터의 폐기 정보를 따라야 함."""
+        service.revocations.add_token(service._get_token_hash(TOKEN), time.time() + 60)
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=_redis(connected=False))):
+            assert await service.is_blacklisted(TOKEN) is True
+
+    @pytest.mark.asyncio
+    async def test_unsynced_filter_falls_back_to_redis(self):
+        """동기화 전에는 모든 확인을 Redis로 처리해야 함."""
+        service = TokenBlacklistService()
+        redis_manager = _redis()
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=redis_manager)):
+            assert await service.is_blacklisted(TOKEN) is True
+
+        redis_manager.exists.assert_awaited_once()
+
+
+class TestRevocationSync:
+    """폐기 기록 및 워커 간 동기화 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_blacklist_token_records_and_publishes(self, service):
+        """토큰 폐기는 로컬 반영 후 저널 기록과 이벤트 발행을 해야 함."""
+        redis_manager = _redis()
+        expires_at = datetime.now() + timedelta(minutes=30)
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=redis_manager)):
+            assert await service.blacklist_token(TOKEN, expires_at, "user_logout", "user1") is True
+
+        assert service.revocations.contains_token(service._get_token_hash(TOKEN))
+        (journal_key, entries), _ = redis_manager.zadd.call_args
+        assert journal_key == service.journal_key
+        [(member, score)] = entries.items()
+        assert score == pytest.approx(expires_at.timestamp())
+        redis_manager.publish.assert_awaited_once_with(service.channel, member)
+        # 사용자별 JSON 목록을 읽고 다시 쓰지 않음
+        redis_manager.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_event_from_other_worker_applied(self, service):
+        """다른 워커가 발행한 폐기 이벤트는 로컬 필터에 반영되어야 함."""
+        token_hash = service._get_token_hash(TOKEN)
+        service.handle_event(json.dumps({"type": "token", "hash": token_hash, "exp": time.time() + 60}))
+        service.handle_event("not-json")
+
+        assert service.revocations.contains_token(token_hash)
+        assert service.filter_stats()["events_received"] == 1
+
+    @pytest.mark.asyncio
+    async def test_load_revocations_prunes_and_loads_journal(self):
+        """저널 로드는 만료 항목을 지우고 남은 항목을 필터에 채워야 함."""
+        service = TokenBlacklistService()
+        event = {"type": "user", "user_id": "user1", "revoked_at": time.time(), "exp": time.time() + 60}
+        redis_manager = _redis()
+        redis_manager.zrangebyscore.return_value = [(json.dumps(event), event["exp"])]
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=redis_manager)):
+            assert await service.load_revocations() == 1
+
+        assert redis_manager.zremrangebyscore.call_args.args[1] == "-inf"
+        assert service.revocations.user_revoked_at("user1") == event["revoked_at"]
+
+
+class TestRevocationFilter:
+    """필터 만료/정리 테스트."""
+
+    def test_expired_entries_are_ignored_and_pruned(self):
+        """만료된 항목은 조회되지 않고 prune으로 제거되어야 함."""
+        revocations = RevocationFilter()
+        revocations.add_token("expired", time.time() - 1)
+        revocations.add_token("live", time.time() + 60)
+        revocations.revoke_user("user1", time.time() - 10, time.time() - 1)
+
+        assert revocations.contains_token("expired") is False
+        assert revocations.user_revoked_at("user1") is None
+        revocations.prune()
+        assert len(revocations) == 1
+
+
+class TestUserRevocation:
+    """사용자 전체 폐기 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_only_tokens_issued_before_revocation_are_rejected(self, service):
+        """전체 로그아웃 이전에 발급된 토큰만 무효이고 재로그인 토큰은 유효해야 함."""
+        revoked_at = time.time()
+        service.revocations.revoke_user("user1", revoked_at, revoked_at + 60)
+        redis_manager = _redis()
+        redis_manager.get.return_value = {"all_tokens": True, "revoked_at": revoked_at}
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=redis_manager)):
+            assert await service.is_user_blacklisted("user1", issued_at=revoked_at - 5) is True
+            assert await service.is_user_blacklisted("user1", issued_at=revoked_at + 5) is False
+
+    @pytest.mark.asyncio
+    async def test_token_issued_in_logout_second_stays_valid(self, service):
+        """전체 로그아웃과 같은 초에 재발급된 토큰(iat 초 단위)은 유효해야 함."""
+        logout_second = int(time.time())
+        redis_manager = _redis()
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=redis_manager)), \
+             patch(f"{SERVICE}.time.time", return_value=logout_second + 0.6):
+            await service.blacklist_user_tokens("user1", datetime.now() + timedelta(hours=1))
+        redis_manager.get.return_value = redis_manager.set.await_args.args[1]
+
+        with patch(f"{SERVICE}.get_redis_manager", AsyncMock(return_value=redis_manager)):
+            assert await service.is_user_blacklisted("user1", issued_at=logout_second - 1) is True
+            assert await service.is_user_blacklisted("user1", issued_at=logout_second) is False
+
+    @pytest.mark.asyncio
+    async def test_verify_token_validity_passes_issued_at(self):
+        """토큰 검증은 iat을 사용자 폐기 확인에 전달해야 함."""
+        from nadle_backend.services.auth_service import AuthService
+
+        jwt_manager = MagicMock()
+        jwt_manager.verify_token.return_value = {"sub": "user1", "iat": 1700000000}
+        blacklist = MagicMock()
+        blacklist.is_blacklisted = AsyncMock(return_value=False)
+        blacklist.is_user_blacklisted = AsyncMock(return_value=False)
+        service = AuthService(user_repository=MagicMock(), jwt_manager=jwt_manager, email_service=MagicMock())
+
+        with patch("nadle_backend.services.auth_service.get_token_blacklist_service", AsyncMock(return_value=blacklist)):
+            assert await service.verify_token_validity(TOKEN) is True
+
+        blacklist.is_user_blacklisted.assert_awaited_once_with("user1", issued_at=1700000000)
@@ -0,0 +1,127 @@
+"""Upstash REST 파이프라인/자동 배치 테스트.
+
+## 🎯 테스트 목표
+여러 Redis 명령을 HTTP 요청 하나로 전송하는지 로컬 Upstash 대역 서버로 검증
+
+## 📋 테스트 범위
+- /pipeline, /multi-exec 요청 및 명령별 결과/오류
+- 같은 이벤트 루프 틱의 명령 자동 배치
+- 자동 배치 비활성화 시 명령별 요청
+- 배치 요청 실패 시 모든 대기 명령에 오류 전달
+"""
+
+import asyncio
+import pytest
+from aiohttp.test_utils import TestServer
+from nadle_backend.database.upstash_redis import UpstashRedisManager
+from tests.helpers.upstash_stub import UpstashStub
+
+
+@pytest.fixture
+async def upstash():
+    stub = UpstashStub(token="test-token")
+    server = TestServer(stub.app)
+    await server.start_server()
+
+    manager = UpstashRedisManager()
+    manager.rest_url = str(server.make_url("/"))
+    manager.rest_token = "test-token"
+    manager.auto_batch = True
+    assert await manager.connect() is True
+    stub.requests.clear()
+
+    yield manager, stub
+
+    await manager.disconnect()
+    await server.close()
+
+
+class TestUpstashPipeline:
+    """명시적 파이프라인 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_execute_pipeline_single_request(self, upstash):
+        """여러 명령을 /pipeline 요청 하나로 실행하고 순서대로 결과를 반환해야 함."""
+        manager, stub = upstash
+
+        results = await manager.execute_pipeline([["SET", "a", "1"], ["GET", "a"], ["NOPE"]])
+
+        assert results[0] == {"result": "OK"}
+        assert results[1] == {"result": "1"}
+        assert "error" in results[2]
+        assert [request["path"] for request in stub.requests] == ["/pipeline"]
+
+    @pytest.mark.asyncio
+    async def test_multi_exec(self, upstash):
+        """트랜잭션은 /multi-exec 엔드포인트를 사용해야 함."""
+        manager, stub = upstash
+
+        results = await manager.multi_exec([["INCR", "counter"], ["INCR", "counter"]])
+
+        assert results == [{"result": 1}, {"result": 2}]
+        assert stub.requests[-1]["path"] == "/multi-exec"
+
+
+class TestUpstashAutoBatch:
+    """자동 배치 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_same_tick_commands_share_one_request(self, upstash):
+        """동시에 발생한 조회는 HTTP 요청 하나로 합쳐져야 함."""
+        manager, stub = upstash
+        stub.store.update({"k1": '{"n": 1}', "k2": "plain"})
+
+        values = await asyncio.gather(*(manager.get(key) for key in ["k1", "k2", "missing"]))
+
+        assert values == [{"n": 1}, "plain", None]
+        assert len(stub.requests) == 1
+        assert stub.requests[0]["path"] == "/pipeline"
+        assert len(stub.requests[0]["commands"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_single_command_uses_plain_endpoint(self, upstash):
+        """단독 명령은 기존 단일 명령 엔드포인트로 전송해야 함."""
+        manager, stub = upstash
+
+        assert await manager.set("k", {"a": 1}, ttl=60) is True
+        assert stub.requests[0]["path"] == "/"
+        assert stub.requests[0]["commands"][0][-2:] == ["EX", "60"]
+
+    @pytest.mark.asyncio
+    async def test_command_error_only_fails_that_command(self, upstash):
+        """배치 안의 명령 오류는 해당 명령에만 전달되어야 함."""
+        manager, stub = upstash
+
+        results = await asyncio.gather(
+            manager._request(["GET", "a"]),
+            manager._request(["NOPE"]),
+            return_exceptions=True
+        )
+
+        assert results[0] == {"result": None}
+        assert isinstance(results[1], Exception)
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_propagates_to_all(self, upstash):
+        """배치 요청 자체가 실패하면 대기 중인 모든 명령이 실패해야 함."""
+        manager, stub = upstash
+        stub.fail_with = 503
+
+        results = await asyncio.gather(
+            manager._request(["GET", "a"]),
+            manager._request(["GET", "b"]),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(result, Exception) for result in results)
+        assert manager.health.consecutive_failures == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_auto_batch_sends_each_command(self, upstash):
+        """자동 배치를 끄면 명령마다 요청을 보내야 함."""
+        manager, stub = upstash
+        manager.auto_batch = False
+
+        await asyncio.gather(manager.get("a"), manager.get("b"))
+
+        assert [request["path"] for request in stub.requests] == ["/", "/"]
@@ -0,0 +1,277 @@
+"""조회수 write-behind 버퍼 테스트.
+
+## 🎯 테스트 목표
+게시글 조회마다 발생하던 동기 $inc 쓰기를 버퍼링 후 일괄 반영하는지 검증
+
+## 📋 테스트 범위
+- 증가분 누적 및 미반영 증가분 overlay
+- unordered bulk_write 일괄 반영 및 실패 시 재시도
+- 버퍼 크기 초과 시 즉시 반영, 종료 시 남은 증가분 반영
+- 반영 후 캐시된 조회수 기준값 갱신 (표시 값이 줄어들지 않음)
+- PostsService 조회 경로의 버퍼 사용
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+from nadle_backend.database.cache_tags import TAG_KEYS_SCRIPT
+from nadle_backend.database.layered_cache import LayeredCacheManager
+from nadle_backend.repositories.post_repository import PostRepository
+from nadle_backend.services.view_count_buffer import ViewCountBuffer
+from nadle_backend.services.posts_service import PostsService
+
+
+@pytest.fixture
+def repository():
+    repo = Mock()
+    repo.apply_view_count_deltas = AsyncMock(return_value=0)
+    return repo
+
+
+@pytest.fixture(autouse=True)
+def cache():
+    cache = Mock()
+    cache.invalidate_tags = AsyncMock(return_value=0)
+    with patch("nadle_backend.services.view_count_buffer.layered_cache", cache):
+        yield cache
+
+
+class _FakeRedis:
+    """값과 태그 Set만 흉내 내는 Redis 매니저"""
+
+    def __init__(self):
+        self.values = {}
+        self.tags = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ttl=3600):
+        self.values[key] = json.loads(json.dumps(value, default=str))
+        return True
+
+    async def publish(self, channel, message):
+        return 1
+
+    async def eval_script(self, script, keys, args):
+        if script == TAG_KEYS_SCRIPT:
+            index = 1
+            for key in keys:
+                count = args[index]
+                self.tags.setdefault(key, set()).update(args[index + 1:index + 1 + count])
+                index += count + 1
+            return len(keys)
+        dropped = [member for key in keys for member in self.tags.pop(key, ())]
+        for member in dropped:
+            self.values.pop(member, None)
+        return dropped
+
+
+class TestViewCountBuffer:
+    """ViewCountBuffer 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_record_accumulates_without_db_write(self, repository):
+        """기록만으로는 DB에 쓰지 않고 증가분을 누적해야 함."""
+        buffer = ViewCountBuffer(repository, flush_interval=60, max_pending=100)
+
+        buffer.record("a")
+        buffer.record("a")
+        buffer.record("b")
+
+        assert buffer.pending("a") == 2
+        assert buffer.overlay("a", 10) == 12
+        assert buffer.overlay("c", None) == 0
+        repository.apply_view_count_deltas.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_flush_applies_deltas_once(self, repository):
+        """반영 시 누적된 증가분을 한 번에 전달하고 버퍼를 비워야 함."""
+        buffer = ViewCountBuffer(repository, flush_interval=60, max_pending=100)
+        buffer.record("a")
+        buffer.record("a")
+        buffer.record("b")
+
+        assert await buffer.flush() == 2
+        repository.apply_view_count_deltas.assert_awaited_once_with({"a": 2, "b": 1})
+        assert buffer.pending("a") == 0
+        assert await buffer.flush() == 0
+
+    @pytest.mark.asyncio
+    async def test_overlay_includes_in_flight_deltas(self, repository):
+        """반영 중인 증가분도 overlay에 포함되어야 함."""
+        buffer = ViewCountBuffer(repository, flush_interval=60, max_pending=100)
+        seen = {}
+
+        async def apply(deltas):
+            seen["during"] = buffer.overlay("a", 5)
+
+        repository.apply_view_count_deltas.side_effect = apply
+        buffer.record("a")
+        await buffer.flush()
+
+        assert seen["during"] == 6
+        assert buffer.overlay("a", 6) == 6
+
+    @pytest.mark.asyncio
+    async def test_flush_invalidates_cached_counts(self, repository, cache):
+        """반영한 게시글의 조회수 캐시 태그를 한 번에 무효화하고, 그동안은 반영분도 overlay에 포함해야 함."""
+        buffer = ViewCountBuffer(repository, flush_interval=60, max_pending=100)
+        seen = {}
+
+        async def invalidate(*tags):
+            seen["during"] = buffer.overlay("a", 5)
+            return 0
+
+        cache.invalidate_tags.side_effect = invalidate
+        buffer.record("a")
+        buffer.record("b")
+        await buffer.flush()
+
+        cache.invalidate_tags.assert_awaited_once_with("views:a", "views:b")
+        assert seen["during"] == 6
+        assert buffer.pending("a") == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_requeues(self, repository):
+        """반영 실패 시 증가분을 버퍼로 되돌려야 함."""
+        buffer = ViewCountBuffer(repository, flush_interval=60, max_pending=100)
+        repository.apply_view_count_deltas.side_effect = Exception("mongo down")
+        buffer.record("a", 3)
+
+        assert await buffer.flush() == 0
+        buffer.record("a")
+        assert buffer.pending("a") == 4
+
+    @pytest.mark.asyncio
+    async def test_partial_bulk_write_requeues_only_failed(self, repository):
+        """BulkWriteError면 이미 반영된 연산은 두고 writeErrors의 게시글만 되돌려야 함."""
+        failed_id, applied_id = str(ObjectId()), str(ObjectId())
+        buffer = ViewCountBuffer(repository, flush_interval=60, max_pending=100)
+        repository.apply_view_count_deltas.side_effect = BulkWriteError({
+            "writeErrors": [{
+                "index": 0, "code": 2, "errmsg": "bad update",
+                "op": {"q": {"_id": ObjectId(failed_id)}, "u": {"$inc": {"view_count": 2}}}
+            }],
+            "nModified": 1
+        })
+        buffer.record(failed_id, 2)
+        buffer.record(applied_id, 5)
+
+        assert await buffer.flush() == 1
+        assert buffer.pending(failed_id) == 2
+        assert buffer.pending(applied_id) == 0
+
+    @pytest.mark.asyncio
+    async def test_max_pending_triggers_flush(self, repository):
+        """버퍼 크기 상한에 도달하면 주기와 관계없이 반영해야 함."""
+        buffer = ViewCountBuffer(repository, flush_interval=60, max_pending=2)
+
+        buffer.record("a")
+        buffer.record("b")
+        await asyncio.sleep(0)
+
+        repository.apply_view_count_deltas.assert_awaited_once_with({"a": 1, "b": 1})
+
+    @pytest.mark.asyncio
+    async def test_periodic_flush_and_stop(self, repository):
+        """주기적으로 반영하고 종료 시 남은 증가분을 반영해야 함."""
+        buffer = ViewCountBuffer(repository, flush_interval=0.01, max_pending=100)
+        await buffer.start()
+        assert buffer.is_running
+
+        buffer.record("a")
+        await asyncio.sleep(0.05)
+        repository.apply_view_count_deltas.assert_awaited_with({"a": 1})
+
+        buffer.record("b")
+        await buffer.stop()
+
+        assert not buffer.is_running
+        repository.apply_view_count_deltas.assert_awaited_with({"b": 1})
+
+
+class TestApplyViewCountDeltas:
+    """PostRepository.apply_view_count_deltas 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_single_unordered_bulk_write(self):
+        """유효한 게시글 ID만 $inc 연산으로 묶어 unordered bulk_write 해야 함."""
+        post_id = str(ObjectId())
+        collection = Mock()
+        collection.bulk_write = AsyncMock(return_value=Mock(modified_count=1))
+
+        with patch("nadle_backend.repositories.post_repository.Post.get_motor_collection",
+                   return_value=collection, create=True):
+            modified = await PostRepository().apply_view_count_deltas({post_id: 3, "not-an-id": 1, str(ObjectId()): 0})
+
+        assert modified == 1
+        operations = collection.bulk_write.call_args[0][0]
+        assert len(operations) == 1
+        assert operations[0]._doc == {"$inc": {"view_count": 3}}
+        assert collection.bulk_write.call_args.kwargs["ordered"] is False
+
+
+class TestPostsServiceViewRecording:
+    """PostsService 조회수 기록 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_uses_buffer_when_running(self):
+        """버퍼 실행 중에는 $inc 대신 버퍼에 기록하고 overlay 값을 반환해야 함."""
+        post_repository = Mock()
+        post_repository.increment_view_count = AsyncMock()
+        service = PostsService(post_repository=post_repository)
+        buffer = ViewCountBuffer(Mock(), flush_interval=60, max_pending=100)
+        buffer._task = Mock(done=Mock(return_value=False))
+
+        with patch("nadle_backend.services.posts_service.view_count_buffer", buffer):
+            assert await service._record_view("p1", 10) == 11
+            assert await service._record_view("p1", 10) == 12
+
+        post_repository.increment_view_count.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_displayed_count_never_drops_after_flush(self):
+        """기록 → 반영 → 조회 순서에서 캐시된 상세 조회수가 이전 값으로 돌아가지 않아야 함."""
+        stored = {"view_count": 10}
+
+        def load_post(slug):
+            post = Mock(id="p1", slug=slug, view_count=stored["view_count"])
+            post.model_dump = Mock(return_value={"id": "p1", "slug": slug, "view_count": stored["view_count"]})
+            return post
+
+        async def apply(deltas):
+            stored["view_count"] += deltas["p1"]
+
+        post_repository = Mock()
+        post_repository.get_by_slug = AsyncMock(side_effect=load_post)
+        post_repository.apply_view_count_deltas = AsyncMock(side_effect=apply)
+        service = PostsService(post_repository=post_repository)
+        redis = _FakeRedis()
+        layered = LayeredCacheManager(max_entries=10, local_ttl=30)
+        buffer = ViewCountBuffer(post_repository, flush_interval=60, max_pending=100, cache=layered)
+        buffer._task = Mock(done=Mock(return_value=False))
+
+        with patch("nadle_backend.database.redis_factory.get_redis_manager", AsyncMock(return_value=redis)), \
+             patch("nadle_backend.services.posts_service.get_layered_cache", AsyncMock(return_value=layered)), \
+             patch("nadle_backend.services.posts_service.view_count_buffer", buffer), \
+             patch("nadle_backend.services.posts_service.Post", side_effect=lambda **data: Mock(**data)):
+            counts = [(await service.get_post("post-slug")).view_count for _ in range(2)]
+            await buffer.flush()
+            counts.append((await service.get_post("post-slug")).view_count)
+
+        assert stored["view_count"] == 12
+        assert counts == [11, 12, 13]
+
+    @pytest.mark.asyncio
+    async def test_direct_increment_without_buffer(self):
+        """버퍼가 없으면 즉시 $inc로 반영해야 함."""
+        post_repository = Mock()
+        post_repository.increment_view_count = AsyncMock(return_value=True)
+        service = PostsService(post_repository=post_repository)
+
+        assert await service._record_view("p1", 10) == 11
+        post_repository.increment_view_count.assert_awaited_once_with("p1")